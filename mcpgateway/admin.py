@@ -113,6 +113,7 @@ from mcpgateway.services.gateway_service import GatewayConnectionError, GatewayD
 from mcpgateway.services.import_service import ConflictStrategy
 from mcpgateway.services.import_service import ImportError as ImportServiceError
 from mcpgateway.services.import_service import ImportService, ImportValidationError
+from mcpgateway.services.latency_sketch_service import get_latency_sketch_service, LatencyBucket
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.oauth_manager import OAuthManager
 from mcpgateway.services.plugin_service import get_plugin_service
@@ -9836,8 +9837,9 @@ async def admin_events(request: Request, _user=Depends(get_current_user_with_per
         >>> print("SSE Stream Test Passed")
         SSE Stream Test Passed
     """
-    # Create a shared queue to aggregate events from all services
-    event_queue = asyncio.Queue()
+    # Hand-off queue merging the service streams; each stream buffers its own
+    # backlog in a bounded subscription, so this only holds one event at a time
+    event_queue = asyncio.Queue(maxsize=1)
 
     # Define a generic producer that feeds a specific stream into the queue
     async def stream_to_queue(generator, source_name: str):
@@ -13407,6 +13409,44 @@ async def track_query_usage(request: Request, query_id: int, user=Depends(get_cu
         db.close()
 
 
+def _interval_bucket(timestamp: datetime, interval_minutes: int) -> datetime:
+    """Round a timestamp down to its aggregation interval for time-series views.
+
+    Args:
+        timestamp: Trace start time or sketch bucket start
+        interval_minutes: Aggregation interval in minutes
+
+    Returns:
+        datetime: Start of the interval the timestamp falls into.
+
+    Examples:
+        >>> _interval_bucket(datetime(2025, 1, 1, 10, 47, 12, 5), 15).isoformat()
+        '2025-01-01T10:45:00'
+    """
+    bucket_time = timestamp.replace(second=0, microsecond=0)
+    return bucket_time - timedelta(minutes=bucket_time.minute % interval_minutes)
+
+
+def _sketch_intervals(db: Session, cutoff_time: datetime, interval_minutes: int) -> Dict[datetime, Any]:
+    """Merge stored latency sketches into aggregation intervals.
+
+    Args:
+        db: Database session
+        cutoff_time: Start of the time window
+        interval_minutes: Aggregation interval in minutes
+
+    Returns:
+        Dict[datetime, Any]: One merged ``LatencyBucket`` per interval start.
+    """
+    intervals: Dict[datetime, Any] = {}
+    for bucket_start, bucket in get_latency_sketch_service().query(db, cutoff_time).items():
+        interval = _interval_bucket(bucket_start, interval_minutes)
+        if interval not in intervals:
+            intervals[interval] = LatencyBucket()
+        intervals[interval].merge(bucket)
+    return intervals
+
+
 @admin_router.get("/observability/metrics/percentiles", response_model=dict)
 async def get_latency_percentiles(
     request: Request,  # pylint: disable=unused-argument
@@ -13432,6 +13472,17 @@ async def get_latency_percentiles(
     try:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
 
+        if settings.observability_latency_sketches_enabled:
+            # Merge per-bucket sketches instead of loading every trace in the window
+            result: Dict[str, List[Any]] = {"timestamps": [], "p50": [], "p90": [], "p95": [], "p99": []}
+            for interval, bucket in sorted(_sketch_intervals(db, cutoff_time, interval_minutes).items()):
+                if not bucket.count:
+                    continue
+                result["timestamps"].append(interval.isoformat())
+                for key, q in (("p50", 0.50), ("p90", 0.90), ("p95", 0.95), ("p99", 0.99)):
+                    result[key].append(round(bucket.sketch.quantile(q), 2))
+            return result
+
         # Query all traces with duration in time range
         traces = (
             db.query(ObservabilityTrace.start_time, ObservabilityTrace.duration_ms)
@@ -13447,9 +13498,7 @@ async def get_latency_percentiles(
         buckets: Dict[datetime, List[float]] = defaultdict(list)
         for trace in traces:
             # Round down to nearest interval
-            bucket_time = trace.start_time.replace(second=0, microsecond=0)
-            bucket_time = bucket_time - timedelta(minutes=bucket_time.minute % interval_minutes, seconds=bucket_time.second, microseconds=bucket_time.microsecond)
-            buckets[bucket_time].append(trace.duration_ms)
+            buckets[_interval_bucket(trace.start_time, interval_minutes)].append(trace.duration_ms)
 
         # Calculate percentiles for each bucket
         timestamps = []
@@ -13508,6 +13557,17 @@ async def get_timeseries_metrics(
     try:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
 
+        if settings.observability_latency_sketches_enabled:
+            # Counts come from the sketch buckets, which include traces dropped by tail sampling
+            series: Dict[str, List[Any]] = {"timestamps": [], "request_count": [], "success_count": [], "error_count": [], "error_rate": []}
+            for interval, bucket in sorted(_sketch_intervals(db, cutoff_time, interval_minutes).items()):
+                series["timestamps"].append(interval.isoformat())
+                series["request_count"].append(bucket.count)
+                series["success_count"].append(bucket.success_count)
+                series["error_count"].append(bucket.error_count)
+                series["error_rate"].append(round(bucket.error_count / bucket.count * 100, 2) if bucket.count else 0)
+            return series
+
         # Query traces grouped by time bucket
         traces = db.query(ObservabilityTrace.start_time, ObservabilityTrace.status).filter(ObservabilityTrace.start_time >= cutoff_time).order_by(ObservabilityTrace.start_time).all()
 
@@ -13518,8 +13578,7 @@ async def get_timeseries_metrics(
         buckets: Dict[datetime, Dict[str, int]] = defaultdict(lambda: {"total": 0, "success": 0, "error": 0})
         for trace in traces:
             # Round down to nearest interval
-            bucket_time = trace.start_time.replace(second=0, microsecond=0)
-            bucket_time = bucket_time - timedelta(minutes=bucket_time.minute % interval_minutes, seconds=bucket_time.second, microseconds=bucket_time.microsecond)
+            bucket_time = _interval_bucket(trace.start_time, interval_minutes)
 
             buckets[bucket_time]["total"] += 1
             if trace.status == "ok":
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""add metric rollup tables
+
+Revision ID: k5e6f7g8h9i0
+Revises: z1a2b3c4d5e6
+Create Date: 2025-11-24 10:00:00.000000
+
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "k5e6f7g8h9i0"
+down_revision: Union[str, Sequence[str], None] = "z1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# rollup table -> (raw metric table, entity table, foreign key column, foreign key type)
+ROLLUP_TABLES = {
+    "tool_metric_rollups": ("tool_metrics", "tools", "tool_id", sa.String(length=36)),
+    "resource_metric_rollups": ("resource_metrics", "resources", "resource_id", sa.Integer()),
+    "server_metric_rollups": ("server_metrics", "servers", "server_id", sa.String(length=36)),
+    "prompt_metric_rollups": ("prompt_metrics", "prompts", "prompt_id", sa.Integer()),
+    "a2a_agent_metric_rollups": ("a2a_agent_metrics", "a2a_agents", "a2a_agent_id", sa.String(length=36)),
+}
+
+
+def _counter_columns() -> list:
+    """Build the aggregate columns of a rollup table.
+
+    Returns:
+        list: Fresh column objects for one table.
+    """
+    return [
+        sa.Column("total_executions", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("successful_executions", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("failed_executions", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("total_response_time", sa.Float(), nullable=False, server_default=sa.text("0")),
+        sa.Column("min_response_time", sa.Float(), nullable=True),
+        sa.Column("max_response_time", sa.Float(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Create per-entity metric rollups, backfilled from the raw metric tables."""
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    for rollup_table, (raw_table, entity_table, key, key_type) in ROLLUP_TABLES.items():
+        if rollup_table in existing or entity_table not in existing:
+            continue
+        op.create_table(
+            rollup_table,
+            sa.Column(key, key_type, sa.ForeignKey(f"{entity_table}.id", ondelete="CASCADE"), nullable=False),
+            *_counter_columns(),
+            sa.Column("last_execution_time", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.text("CURRENT_TIMESTAMP")),
+            sa.PrimaryKeyConstraint(key),
+        )
+        if raw_table in existing:
+            # Backfill lifetime totals so existing deployments keep their history
+            op.execute(
+                f"INSERT INTO {rollup_table} ({key}, total_executions, successful_executions, failed_executions, total_response_time, "
+                "min_response_time, max_response_time, last_execution_time) "
+                f"SELECT m.{key}, COUNT(*), SUM(CASE WHEN m.is_success THEN 1 ELSE 0 END), SUM(CASE WHEN m.is_success THEN 0 ELSE 1 END), "
+                "SUM(m.response_time), MIN(m.response_time), MAX(m.response_time), MAX(m.timestamp) "
+                f"FROM {raw_table} m JOIN {entity_table} e ON e.id = m.{key} GROUP BY m.{key}"
+            )
+
+
+def downgrade() -> None:
+    """Drop metric rollup tables."""
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    for rollup_table in ROLLUP_TABLES:
+        if rollup_table in existing:
+            op.drop_table(rollup_table)
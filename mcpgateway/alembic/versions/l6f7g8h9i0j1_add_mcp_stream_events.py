@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""add mcp_stream_events table for streamable http resumability
+
+Revision ID: l6f7g8h9i0j1
+Revises: k5e6f7g8h9i0
+Create Date: 2025-11-26 10:00:00.000000
+
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "l6f7g8h9i0j1"
+down_revision: Union[str, Sequence[str], None] = "k5e6f7g8h9i0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the durable Streamable HTTP event store table."""
+    inspector = sa.inspect(op.get_bind())
+    if "mcp_stream_events" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "mcp_stream_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("scope", sa.String(length=64), nullable=False),
+        sa.Column("stream_id", sa.String(length=255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("idx_mcp_stream_events_stream", "mcp_stream_events", ["scope", "stream_id", "id"])
+    op.create_index("ix_mcp_stream_events_created_at", "mcp_stream_events", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop the durable Streamable HTTP event store table."""
+    inspector = sa.inspect(op.get_bind())
+    if "mcp_stream_events" not in inspector.get_table_names():
+        return
+
+    op.drop_index("ix_mcp_stream_events_created_at", table_name="mcp_stream_events")
+    op.drop_index("idx_mcp_stream_events_stream", table_name="mcp_stream_events")
+    op.drop_table("mcp_stream_events")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""add observability_latency_sketches table for percentile dashboards
+
+Revision ID: m7g8h9i0j1k2
+Revises: l6f7g8h9i0j1
+Create Date: 2025-11-28 10:00:00.000000
+
+Traces already stored are folded into sketch rows, so the percentile and
+time-series dashboards keep the history from before the upgrade.
+"""
+
+# Standard
+from datetime import datetime, timezone
+from typing import Dict, Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "m7g8h9i0j1k2"
+down_revision: Union[str, Sequence[str], None] = "l6f7g8h9i0j1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-bucket latency sketch table."""
+    inspector = sa.inspect(op.get_bind())
+    if "observability_latency_sketches" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "observability_latency_sketches",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.String(length=255), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("success_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("sketch", sa.JSON(), nullable=False),
+    )
+    op.create_index("idx_observability_latency_sketches_entity_bucket", "observability_latency_sketches", ["entity_type", "entity_id", "bucket_start"])
+    op.create_index("idx_observability_latency_sketches_bucket_start", "observability_latency_sketches", ["bucket_start"])
+    _backfill_from_traces()
+
+
+def _backfill_from_traces() -> None:
+    """Write one sketch row per time bucket for the traces stored before this revision."""
+    bind = op.get_bind()
+    if "observability_traces" not in sa.inspect(bind).get_table_names():
+        return
+
+    # First-Party
+    from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+    from mcpgateway.services.latency_sketch_service import ALL_TRACES, LatencyBucket  # pylint: disable=import-outside-toplevel
+
+    width = settings.observability_sketch_bucket_seconds
+    traces = sa.table("observability_traces", sa.column("start_time", sa.DateTime(timezone=True)), sa.column("duration_ms", sa.Float()), sa.column("status", sa.String()))
+    rows = bind.execution_options(yield_per=10000).execute(sa.select(traces.c.start_time, traces.c.duration_ms, traces.c.status).where(traces.c.duration_ms.isnot(None)))
+
+    buckets: Dict[datetime, LatencyBucket] = {}
+    for start_time, duration_ms, status in rows:
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        epoch = int(start_time.timestamp())
+        bucket_start = datetime.fromtimestamp(epoch - epoch % width, tz=timezone.utc)
+        bucket = buckets.get(bucket_start)
+        if bucket is None:
+            bucket = buckets[bucket_start] = LatencyBucket()
+        bucket.add(duration_ms, status)
+    if not buckets:
+        return
+
+    sketches = sa.table(
+        "observability_latency_sketches",
+        sa.column("entity_type", sa.String()),
+        sa.column("entity_id", sa.String()),
+        sa.column("bucket_start", sa.DateTime(timezone=True)),
+        sa.column("count", sa.Integer()),
+        sa.column("success_count", sa.Integer()),
+        sa.column("error_count", sa.Integer()),
+        sa.column("sketch", sa.JSON()),
+    )
+    values = [
+        {
+            "entity_type": ALL_TRACES[0],
+            "entity_id": ALL_TRACES[1],
+            "bucket_start": bucket_start,
+            "count": bucket.count,
+            "success_count": bucket.success_count,
+            "error_count": bucket.error_count,
+            "sketch": bucket.sketch.to_dict(),
+        }
+        for bucket_start, bucket in sorted(buckets.items())
+    ]
+    for offset in range(0, len(values), 1000):
+        op.bulk_insert(sketches, values[offset : offset + 1000])
+
+
+def downgrade() -> None:
+    """Drop the per-bucket latency sketch table."""
+    inspector = sa.inspect(op.get_bind())
+    if "observability_latency_sketches" not in inspector.get_table_names():
+        return
+
+    op.drop_index("idx_observability_latency_sketches_bucket_start", table_name="observability_latency_sketches")
+    op.drop_index("idx_observability_latency_sketches_entity_bucket", table_name="observability_latency_sketches")
+    op.drop_table("observability_latency_sketches")
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""add entity_tags index table for tag filtering
+
+Revision ID: n8h9i0j1k2l3
+Revises: m7g8h9i0j1k2
+Create Date: 2025-12-01 10:00:00.000000
+
+"""
+
+# Standard
+import json
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "n8h9i0j1k2l3"
+down_revision: Union[str, Sequence[str], None] = "m7g8h9i0j1k2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tagged tables and the entity type recorded for their rows
+TAGGED_TABLES = {"tools": "tool", "resources": "resource", "prompts": "prompt", "servers": "server", "gateways": "gateway"}
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Create the entity_tags table and backfill it from each entity's tags column."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "entity_tags" in inspector.get_table_names():
+        return
+
+    entity_tags = op.create_table(
+        "entity_tags",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.String(length=36), nullable=False),
+        sa.Column("tag", sa.String(length=255), nullable=False),
+        sa.UniqueConstraint("entity_type", "entity_id", "tag", name="uq_entity_tags_entity_tag"),
+    )
+    op.create_index("idx_entity_tags_tag_type", "entity_tags", ["tag", "entity_type", "entity_id"])
+
+    existing = set(inspector.get_table_names())
+    for table_name, entity_type in TAGGED_TABLES.items():
+        if table_name not in existing:
+            continue
+        table = sa.table(table_name, sa.column("id"), sa.column("tags", sa.JSON))
+        rows = []
+        for entity_id, tags in bind.execute(sa.select(table.c.id, table.c.tags)).fetchall():
+            if isinstance(tags, str):
+                try:
+                    tags = json.loads(tags)
+                except ValueError:
+                    tags = []
+            for tag in dict.fromkeys(tag for tag in tags or [] if isinstance(tag, str) and tag):
+                rows.append({"entity_type": entity_type, "entity_id": str(entity_id), "tag": tag})
+            if len(rows) >= BATCH_SIZE:
+                op.bulk_insert(entity_tags, rows)
+                rows = []
+        if rows:
+            op.bulk_insert(entity_tags, rows)
+
+
+def downgrade() -> None:
+    """Drop the entity_tags table."""
+    inspector = sa.inspect(op.get_bind())
+    if "entity_tags" not in inspector.get_table_names():
+        return
+
+    op.drop_index("idx_entity_tags_tag_type", table_name="entity_tags")
+    op.drop_table("entity_tags")
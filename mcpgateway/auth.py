@@ -14,7 +14,7 @@ across different parts of the application without creating circular imports.
 from datetime import datetime, timezone
 import hashlib
 import logging
-from typing import Any, Dict, Generator, Never, Optional
+from typing import Any, Dict, Generator, Never, Optional, Tuple
 import uuid
 
 # Third-Party
@@ -23,6 +23,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import AuthDecision, get_auth_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailUser, SessionLocal
 from mcpgateway.plugins.framework import get_plugin_manager, GlobalContext, HttpAuthResolveUserPayload, HttpHeaderPayload, HttpHookType, PluginViolationError
@@ -118,6 +119,151 @@ async def get_team_from_token(payload: Dict[str, Any], db: Session) -> Optional[
     return team_id
 
 
+async def _verify_token(token: str, db: Session) -> Tuple[AuthDecision, bool]:
+    """Verify a bearer token as a JWT, falling back to a database API token.
+
+    Args:
+        token: Bearer token
+        db: Database session
+
+    Returns:
+        Tuple[AuthDecision, bool]: The verified identity, and whether it may be cached
+        (False when the revocation check could not be completed).
+
+    Raises:
+        HTTPException: If the token is invalid, expired or revoked
+    """
+    logger = logging.getLogger(__name__)
+    email = None
+
+    try:
+        # Try JWT token first using the centralized verify_jwt_token function
+        logger.debug("Attempting JWT token validation")
+        payload = await verify_jwt_token(token)
+
+        logger.debug("JWT token validated successfully")
+        # Extract user identifier (support both new and legacy token formats)
+        email = payload.get("sub")
+        if email is None:
+            # Try legacy format
+            email = payload.get("email")
+
+        if email is None:
+            logger.debug("No email/sub found in JWT payload")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        logger.debug("JWT authentication successful for email: %s", email)
+
+        # Check for token revocation if JTI is present (new format)
+        jti = payload.get("jti")
+        revocation_checked = True
+        if jti:
+            try:
+                # First-Party
+                from mcpgateway.services.token_catalog_service import TokenCatalogService  # pylint: disable=import-outside-toplevel
+
+                token_service = TokenCatalogService(db)
+                is_revoked = await token_service.is_token_revoked(jti)
+                if is_revoked:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Token has been revoked",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+            except HTTPException:
+                raise
+            except Exception as revoke_check_error:
+                # Log the error but don't fail authentication for admin tokens; never cache such a decision
+                logger.warning(f"Token revocation check failed for JTI {jti}: {revoke_check_error}")
+                revocation_checked = False
+
+        # Check team level token, if applicable. If public token, then will be defaulted to personal team.
+        team_id = await get_team_from_token(payload, db)
+        exp = payload.get("exp")
+        return AuthDecision(email=email, jti=jti, team_id=team_id, payload=payload, token_expires_at=float(exp) if exp else None), revocation_checked
+
+    except HTTPException:
+        # Re-raise HTTPException from verify_jwt_token (handles expired/invalid tokens)
+        raise
+    except Exception as jwt_error:
+        # JWT validation failed, try database API token
+        logger.debug("JWT validation failed with error: %s, trying database API token", jwt_error)
+        try:
+            # First-Party
+            from mcpgateway.services.token_catalog_service import TokenCatalogService  # pylint: disable=import-outside-toplevel
+
+            token_service = TokenCatalogService(db)
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            logger.debug("Generated token hash: %s", token_hash)
+
+            # Find active API token by hash
+            # Third-Party
+            from sqlalchemy import select
+
+            # First-Party
+            from mcpgateway.db import EmailApiToken
+
+            result = db.execute(select(EmailApiToken).where(EmailApiToken.token_hash == token_hash, EmailApiToken.is_active.is_(True)))
+            api_token = result.scalar_one_or_none()
+            logger.debug(f"Database lookup result: {api_token is not None}")
+
+            if api_token:
+                logger.debug(f"Found API token for user: {api_token.user_email}")
+                # Check if token is expired
+                if api_token.expires_at and api_token.expires_at < datetime.now(timezone.utc):
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="API token expired",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+
+                # Check if token is revoked
+                is_revoked = await token_service.is_token_revoked(api_token.jti)
+                if is_revoked:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="API token has been revoked",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+
+                # Use the email from the API token
+                email = api_token.user_email
+                logger.debug(f"API token authentication successful for email: {email}")
+
+                # Update last_used timestamp
+                # First-Party
+                from mcpgateway.db import utc_now
+
+                api_token.last_used = utc_now()
+                db.commit()
+                expires_at = api_token.expires_at.timestamp() if api_token.expires_at else None
+                return AuthDecision(email=email, jti=api_token.jti, token_expires_at=expires_at), True
+            else:
+                logger.debug("API token not found in database")
+                logger.debug("No valid authentication method found")
+                # Neither JWT nor API token worked
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid authentication credentials",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            # Neither JWT nor API token validation worked
+            logger.debug(f"Database API token validation failed with exception: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: Session = Depends(get_db),
@@ -257,128 +403,17 @@ async def get_current_user(
         )
 
     logger.debug("Attempting authentication with token: %s...", credentials.credentials[:20])
-    email = None
-
-    try:
-        # Try JWT token first using the centralized verify_jwt_token function
-        logger.debug("Attempting JWT token validation")
-        payload = await verify_jwt_token(credentials.credentials)
-
-        logger.debug("JWT token validated successfully")
-        # Extract user identifier (support both new and legacy token formats)
-        email = payload.get("sub")
-        if email is None:
-            # Try legacy format
-            email = payload.get("email")
-
-        if email is None:
-            logger.debug("No email/sub found in JWT payload")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        logger.debug("JWT authentication successful for email: %s", email)
-
-        # Check for token revocation if JTI is present (new format)
-        jti = payload.get("jti")
-        if jti:
-            try:
-                # First-Party
-                from mcpgateway.services.token_catalog_service import TokenCatalogService  # pylint: disable=import-outside-toplevel
-
-                token_service = TokenCatalogService(db)
-                is_revoked = await token_service.is_token_revoked(jti)
-                if is_revoked:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Token has been revoked",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-            except Exception as revoke_check_error:
-                # Log the error but don't fail authentication for admin tokens
-                logger.warning(f"Token revocation check failed for JTI {jti}: {revoke_check_error}")
-
-        # Check team level token, if applicable. If public token, then will be defaulted to personal team.
-        team_id = await get_team_from_token(payload, db)
-        if request:
-            request.state.team_id = team_id
-
-    except HTTPException:
-        # Re-raise HTTPException from verify_jwt_token (handles expired/invalid tokens)
-        raise
-    except Exception as jwt_error:
-        # JWT validation failed, try database API token
-        logger.debug("JWT validation failed with error: %s, trying database API token", jwt_error)
-        try:
-            # First-Party
-            from mcpgateway.services.token_catalog_service import TokenCatalogService  # pylint: disable=import-outside-toplevel
-
-            token_service = TokenCatalogService(db)
-            token_hash = hashlib.sha256(credentials.credentials.encode()).hexdigest()
-            logger.debug("Generated token hash: %s", token_hash)
-
-            # Find active API token by hash
-            # Third-Party
-            from sqlalchemy import select
-
-            # First-Party
-            from mcpgateway.db import EmailApiToken
-
-            result = db.execute(select(EmailApiToken).where(EmailApiToken.token_hash == token_hash, EmailApiToken.is_active.is_(True)))
-            api_token = result.scalar_one_or_none()
-            logger.debug(f"Database lookup result: {api_token is not None}")
-
-            if api_token:
-                logger.debug(f"Found API token for user: {api_token.user_email}")
-                # Check if token is expired
-                if api_token.expires_at and api_token.expires_at < datetime.now(timezone.utc):
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="API token expired",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-
-                # Check if token is revoked
-                is_revoked = await token_service.is_token_revoked(api_token.jti)
-                if is_revoked:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="API token has been revoked",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-
-                # Use the email from the API token
-                email = api_token.user_email
-                logger.debug(f"API token authentication successful for email: {email}")
-
-                # Update last_used timestamp
-                # First-Party
-                from mcpgateway.db import utc_now
-
-                api_token.last_used = utc_now()
-                db.commit()
-            else:
-                logger.debug("API token not found in database")
-                logger.debug("No valid authentication method found")
-                # Neither JWT nor API token worked
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid authentication credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        except HTTPException:
-            # Re-raise HTTP exceptions
-            raise
-        except Exception as e:
-            # Neither JWT nor API token validation worked
-            logger.debug(f"Database API token validation failed with exception: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    auth_cache = get_auth_cache()
+    decision = auth_cache.get(credentials.credentials)
+    if decision is None:
+        decision, cacheable = await _verify_token(credentials.credentials, db)
+        if cacheable:
+            auth_cache.put(credentials.credentials, decision)
+    else:
+        logger.debug("Authentication decision served from cache")
+    email = decision.email
+    if request and decision.payload is not None:
+        request.state.team_id = decision.team_id
 
     # Get user from database
     # First-Party
@@ -7,9 +7,19 @@ Authors: Mihai Criveti
 Cache Package.
 Provides caching components for the MCP Gateway including:
 - Resource content caching
+- Authentication decision caching
+- Resolved tool caching for invocation
+- RBAC permission resolution caching
+- Completion indexes for resource URIs and prompt arguments
+- Pre-serialized catalog list snapshots
 """
 
+from mcpgateway.cache.auth_cache import AuthCache
+from mcpgateway.cache.catalog_snapshot import CatalogSnapshotCache
+from mcpgateway.cache.completion_index import CompletionIndex
+from mcpgateway.cache.permission_cache import PermissionCache
 from mcpgateway.cache.resource_cache import ResourceCache
 from mcpgateway.cache.session_registry import SessionRegistry
+from mcpgateway.cache.tool_lookup_cache import ToolLookupCache
 
-__all__ = ["ResourceCache", "SessionRegistry"]
+__all__ = ["AuthCache", "CatalogSnapshotCache", "CompletionIndex", "PermissionCache", "ResourceCache", "SessionRegistry", "ToolLookupCache"]
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/auth_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Authentication Decision Cache.
+Clients typically reuse one bearer token for many requests. Verifying it costs a
+JWT decode, a revocation lookup, a personal-team lookup and, for API tokens, a
+token-table query. This module caches the outcome of a successful verification,
+keyed by a SHA-256 digest of the token, so repeat requests skip that work:
+
+- Entries expire after ``auth_cache_ttl`` seconds, or when the token itself
+  expires, whichever comes first; the cache holds at most ``auth_cache_max_size``
+  entries and evicts the least recently used.
+- Revoking a token or changing a user drops the affected entries at once; with
+  ``cache_type=redis`` the invalidation is published so every worker drops them.
+- Only successful, fully checked verifications are cached; failures always take
+  the full path.
+- A cache hit does not update an API token's ``last_used``. Entries do not slide,
+  so a token in use is re-verified (and ``last_used`` written) at least once per
+  TTL, and ``last_used`` lags actual use by at most ``auth_cache_ttl`` seconds.
+
+Examples:
+    >>> cache = AuthCache(max_size=2, ttl=60)
+    >>> cache.get("token-a") is None
+    True
+    >>> cache.put("token-a", AuthDecision(email="a@example.com", jti="j1", team_id="t1"))
+    >>> cache.get("token-a").email
+    'a@example.com'
+    >>> cache.invalidate_local("jti", "j1")
+    1
+    >>> cache.get("token-a") is None
+    True
+    >>> cache.stats()["hits"], cache.stats()["misses"]
+    (1, 2)
+"""
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
+import time
+from typing import Any, Dict, Optional, Set
+
+# First-Party
+from mcpgateway.cache.invalidation import InvalidationChannel
+from mcpgateway.config import settings
+
+
+@dataclass
+class AuthDecision:
+    """Outcome of a successful token verification.
+
+    Attributes:
+        email: Authenticated user's email
+        jti: Token id checked against the revocation list, if any
+        team_id: Team resolved for the token
+        payload: Verified JWT claims (None for database API tokens)
+        token_expires_at: Token expiry as a UNIX timestamp, if the token has one
+    """
+
+    email: str
+    jti: Optional[str] = None
+    team_id: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
+    token_expires_at: Optional[float] = None
+
+
+@dataclass
+class _Entry:
+    """Cached decision and its expiry."""
+
+    decision: AuthDecision
+    expires_at: float
+    keys: Dict[str, str] = field(default_factory=dict)
+
+
+class AuthCache:
+    """
+    Bounded TTL cache of authentication decisions keyed by token digest.
+
+    Secondary indexes by JTI and by user email make revocation and user changes
+    O(affected entries).
+
+    Attributes:
+        max_size: Maximum number of cached decisions
+        ttl: Seconds a decision is reused
+
+    Examples:
+        >>> cache = AuthCache(max_size=1, ttl=60)
+        >>> cache.put("t1", AuthDecision(email="a@example.com"))
+        >>> cache.put("t2", AuthDecision(email="b@example.com"))
+        >>> cache.get("t1") is None
+        True
+        >>> cache.stats()["evictions"]
+        1
+        >>> cache.put("t3", AuthDecision(email="c@example.com", token_expires_at=time.time() - 1))
+        >>> cache.get("t3") is None
+        True
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (defaults to ``auth_cache_max_size``)
+            ttl: Seconds a decision is reused (defaults to ``auth_cache_ttl``)
+        """
+        self.max_size = max_size if max_size is not None else settings.auth_cache_max_size
+        self.ttl = ttl if ttl is not None else settings.auth_cache_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._index: Dict[str, Dict[str, Set[str]]] = {"jti": {}, "email": {}}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._channel = InvalidationChannel("auth_invalidate", self.invalidate_local)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether decisions are cached.
+
+        Returns:
+            bool: True when caching is enabled and the TTL is positive.
+
+        Examples:
+            >>> AuthCache(ttl=0).enabled
+            False
+        """
+        return settings.auth_cache_enabled and self.ttl > 0
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        """Return the cache key for a token; raw tokens are never stored.
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            str: SHA-256 hex digest.
+
+        Examples:
+            >>> len(AuthCache._digest("abc"))
+            64
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[AuthDecision]:
+        """Return the cached decision for a token, if still valid.
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            Optional[AuthDecision]: The decision, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.decision
+
+    def put(self, token: str, decision: AuthDecision) -> None:
+        """Cache a successful verification.
+
+        Args:
+            token: Bearer token
+            decision: Verified identity for the token
+        """
+        if not self.enabled:
+            return
+        expires_at = time.time() + self.ttl
+        if decision.token_expires_at is not None:
+            expires_at = min(expires_at, decision.token_expires_at)
+        key = self._digest(token)
+        self._remove(key)
+
+        keys = {"email": decision.email}
+        if decision.jti:
+            keys["jti"] = decision.jti
+        self._entries[key] = _Entry(decision=decision, expires_at=expires_at, keys=keys)
+        for kind, value in keys.items():
+            self._index[kind].setdefault(value, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop one entry and its index references.
+
+        Args:
+            key: Token digest
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for kind, value in entry.keys.items():
+            keys = self._index[kind].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[kind][value]
+
+    def invalidate_local(self, kind: str, value: Optional[str] = None) -> int:
+        """Drop entries in this process only.
+
+        Args:
+            kind: ``"jti"``, ``"email"`` or ``"all"``
+            value: JTI or email to drop (ignored for ``"all"``)
+
+        Returns:
+            int: Number of entries dropped.
+
+        Examples:
+            >>> cache = AuthCache(ttl=60)
+            >>> cache.put("t1", AuthDecision(email="a@example.com"))
+            >>> cache.put("t2", AuthDecision(email="a@example.com"))
+            >>> cache.invalidate_local("email", "a@example.com")
+            2
+            >>> cache.invalidate_local("all")
+            0
+        """
+        if kind == "all":
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._index = {"jti": {}, "email": {}}
+        else:
+            keys = list(self._index.get(kind, {}).get(value, ()))
+            for key in keys:
+                self._remove(key)
+            dropped = len(keys)
+        self._invalidations += dropped
+        return dropped
+
+    async def invalidate_token(self, jti: str) -> None:
+        """Drop decisions for a revoked token on every worker.
+
+        Args:
+            jti: Revoked token id
+        """
+        self.invalidate_local("jti", jti)
+        await self._publish("jti", jti)
+
+    async def invalidate_user(self, email: str) -> None:
+        """Drop decisions for a user whose account changed, on every worker.
+
+        Args:
+            email: User email
+        """
+        self.invalidate_local("email", email)
+        await self._publish("email", email)
+
+    async def _publish(self, kind: str, value: str) -> None:
+        """Broadcast an invalidation to other workers when Redis is in use.
+
+        Args:
+            kind: ``"jti"`` or ``"email"``
+            value: JTI or email
+        """
+        await self._channel.publish(kind, value)
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations when the Redis cache backend is configured."""
+        if self.enabled:
+            await self._channel.start()
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and close Redis connections."""
+        await self._channel.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, evictions, invalidations and size.
+
+        Examples:
+            >>> AuthCache(ttl=60).stats()["hit_rate"]
+            0.0
+        """
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "cross_worker": self._channel.active,
+        }
+
+
+_auth_cache: Optional[AuthCache] = None
+
+
+def get_auth_cache() -> AuthCache:
+    """Get the global AuthCache singleton instance.
+
+    Returns:
+        The global AuthCache instance
+
+    Examples:
+        >>> get_auth_cache() is get_auth_cache()
+        True
+    """
+    global _auth_cache  # pylint: disable=global-statement
+    if _auth_cache is None:
+        _auth_cache = AuthCache()
+    return _auth_cache
+
+
+def set_auth_cache(cache: Optional[AuthCache]) -> None:
+    """Set the global AuthCache instance.
+
+    This is primarily used for testing to inject a fresh cache.
+
+    Args:
+        cache: The AuthCache instance to use globally
+    """
+    global _auth_cache  # pylint: disable=global-statement
+    _auth_cache = cache
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/catalog_snapshot.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Catalog Snapshot Cache.
+Agents call ``tools/list`` (and often ``resources/list`` and ``prompts/list``)
+at the start of every session. Each call used to query the database, validate
+every row into a read model and serialize the result, although the catalog
+rarely changes between calls. This module keeps one snapshot per list page:
+
+- ``CatalogSnapshot`` holds the read models of a page and, once requested, the
+  ready-to-send JSON bytes of the MCP list result, its ETag and other derived
+  forms (such as the ``mcp.types`` objects used by Streamable HTTP).
+- Snapshots are keyed by kind, server id and cursor. The MCP list methods are
+  not filtered by user, team or visibility, so every caller shares them.
+- Tool, resource and prompt events drop the snapshots of that kind; server
+  events drop the snapshots of that server; gateway events drop everything.
+  The next request rebuilds only the pages it asks for, and concurrent requests
+  for the same page share one rebuild. With ``cache_type=redis`` the
+  invalidation is published so every worker drops them.
+- ``catalog_snapshot_ttl`` bounds staleness for changes made outside the
+  services and for derived fields such as metrics and team names.
+
+Examples:
+    >>> import asyncio
+    >>> from types import SimpleNamespace
+    >>> class Tools:
+    ...     async def list_tools(self, db, cursor=None):
+    ...         return [SimpleNamespace(model_dump=lambda **kw: {"name": "echo"})], None
+    >>> cache = CatalogSnapshotCache(max_entries=10, ttl=60)
+    >>> snapshot = asyncio.run(cache.get(None, "tools", None, None, Tools()))
+    >>> snapshot.body
+    b'{"tools":[{"name":"echo"}]}'
+    >>> snapshot.envelope(1)
+    b'{"jsonrpc":"2.0","result":{"tools":[{"name":"echo"}]},"id":1}'
+    >>> asyncio.run(cache.get(None, "tools", None, None, Tools())) is snapshot
+    True
+    >>> cache.invalidate_local("tools")
+    1
+"""
+
+# Standard
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Third-Party
+import orjson
+
+# First-Party
+from mcpgateway.cache.invalidation import InvalidationChannel
+from mcpgateway.config import settings
+
+# JSON-RPC list methods served from snapshots, and the catalog kind each lists
+CATALOG_METHODS = {"tools/list": "tools", "list_tools": "tools", "resources/list": "resources", "prompts/list": "prompts"}
+CATALOG_KINDS = ("tools", "resources", "prompts")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag.
+
+    Args:
+        if_none_match: Header value (a list of entity tags, or ``*``)
+        etag: Current entity tag, quoted
+
+    Returns:
+        bool: True if the client already holds this version.
+
+    Examples:
+        >>> etag_matches('"a", W/"b"', '"b"')
+        True
+        >>> etag_matches('*', '"b"')
+        True
+        >>> etag_matches(None, '"b"') or etag_matches('"a"', '"b"')
+        False
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+@dataclass
+class CatalogSnapshot:
+    """One page of a catalog list and the forms derived from it.
+
+    Derived forms are computed on first use and shared by every request served
+    from this snapshot, so callers must not mutate them.
+
+    Attributes:
+        kind: ``"tools"``, ``"resources"`` or ``"prompts"``
+        items: Read models of the page, as returned by the service
+        next_cursor: Cursor of the next page, if any
+        expires_at: Time after which the snapshot is rebuilt
+    """
+
+    kind: str
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    expires_at: float = 0.0
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def derive(self, name: str, build: Callable[[List[Any]], Any]) -> Any:
+        """Return a derived form of the items, building it on first use.
+
+        Args:
+            name: Name of the derived form
+            build: Called with the items to build it
+
+        Returns:
+            Any: The derived form.
+
+        Examples:
+            >>> snapshot = CatalogSnapshot("tools", [1, 2])
+            >>> snapshot.derive("count", len)
+            2
+            >>> snapshot.derive("count", lambda items: 0)
+            2
+        """
+        if name not in self._derived:
+            self._derived[name] = build(self.items)
+        return self._derived[name]
+
+    def _serialize(self, items: List[Any]) -> bytes:
+        """Serialize the MCP list result.
+
+        Args:
+            items: Read models of the page
+
+        Returns:
+            bytes: JSON of ``{kind: [...], "nextCursor": ...}``.
+        """
+        result: Dict[str, Any] = {self.kind: [item.model_dump(mode="json", by_alias=True, exclude_none=True) for item in items]}
+        if self.next_cursor:
+            result["nextCursor"] = self.next_cursor
+        return orjson.dumps(result)
+
+    @property
+    def body(self) -> bytes:
+        """JSON bytes of the MCP list result.
+
+        Returns:
+            bytes: Serialized result.
+        """
+        return self.derive("body", self._serialize)
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag of the list result, derived from its content.
+
+        Identical catalogs get identical tags on every worker.
+
+        Returns:
+            str: Quoted entity tag.
+
+        Examples:
+            >>> CatalogSnapshot("tools", []).etag == CatalogSnapshot("tools", []).etag
+            True
+        """
+        return self.derive("etag", lambda _: f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"')
+
+    def payload(self) -> Dict[str, Any]:
+        """Return a fresh copy of the list result as a dict.
+
+        Returns:
+            Dict[str, Any]: Decoded result, safe for the caller to modify.
+
+        Examples:
+            >>> CatalogSnapshot("prompts", [], next_cursor="c").payload()
+            {'prompts': [], 'nextCursor': 'c'}
+        """
+        return orjson.loads(self.body)
+
+    def envelope(self, request_id: Any) -> bytes:
+        """Return the JSON-RPC response for a request, without re-serializing the result.
+
+        Args:
+            request_id: JSON-RPC request id
+
+        Returns:
+            bytes: Serialized JSON-RPC response.
+
+        Examples:
+            >>> CatalogSnapshot("prompts", []).envelope("a")
+            b'{"jsonrpc":"2.0","result":{"prompts":[]},"id":"a"}'
+        """
+        return b'{"jsonrpc":"2.0","result":' + self.body + b',"id":' + orjson.dumps(request_id) + b"}"
+
+
+async def _load_page(db: Any, kind: str, server_id: Optional[str], cursor: Optional[str], service: Any) -> Tuple[List[Any], Optional[str]]:
+    """Load one page of a catalog through its service.
+
+    Args:
+        db: Database session
+        kind: ``"tools"``, ``"resources"`` or ``"prompts"``
+        server_id: Virtual server id, or None for the whole catalog
+        cursor: Pagination cursor
+        service: ToolService, ResourceService or PromptService
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: Read models and the next cursor.
+    """
+    if kind == "tools":
+        if server_id:
+            return await service.list_server_tools(db, server_id, cursor=cursor), None
+        return await service.list_tools(db, cursor=cursor)
+    if kind == "resources":
+        if server_id:
+            return await service.list_server_resources(db, server_id), None
+        return await service.list_resources(db, cursor=cursor)
+    if server_id:
+        return await service.list_server_prompts(db, server_id, cursor=cursor), None
+    return await service.list_prompts(db, cursor=cursor)
+
+
+class CatalogSnapshotCache:
+    """
+    Bounded TTL cache of catalog list snapshots keyed by kind, server id and cursor.
+
+    Attributes:
+        max_entries: Maximum number of cached pages
+        ttl: Seconds a snapshot is reused
+
+    Examples:
+        >>> cache = CatalogSnapshotCache(max_entries=1, ttl=60)
+        >>> cache.put(("tools", "", ""), CatalogSnapshot("tools", []))
+        >>> cache.put(("prompts", "", ""), CatalogSnapshot("prompts", []))
+        >>> cache.stats()["size"], cache.stats()["evictions"]
+        (1, 1)
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of pages (defaults to ``catalog_snapshot_max_entries``)
+            ttl: Seconds a snapshot is reused (defaults to ``catalog_snapshot_ttl``)
+        """
+        self.max_entries = max_entries if max_entries is not None else settings.catalog_snapshot_max_entries
+        self.ttl = ttl if ttl is not None else settings.catalog_snapshot_ttl
+        self._entries: "OrderedDict[Tuple[str, str, str], CatalogSnapshot]" = OrderedDict()
+        self._building: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        # Bumped by every invalidation so a build that raced one is not stored
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._shared_builds = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._channel = InvalidationChannel("catalog_snapshot_invalidate", self.invalidate_local)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether list results are cached.
+
+        Returns:
+            bool: True when caching is enabled and the TTL is positive.
+
+        Examples:
+            >>> CatalogSnapshotCache(ttl=0).enabled
+            False
+        """
+        return settings.catalog_snapshot_enabled and self.ttl > 0
+
+    async def get(self, db: Any, kind: str, server_id: Optional[str], cursor: Optional[str], service: Any) -> CatalogSnapshot:
+        """Return the snapshot of a list page, building it through the service on a miss.
+
+        Args:
+            db: Database session used if the page has to be built
+            kind: ``"tools"``, ``"resources"`` or ``"prompts"``
+            server_id: Virtual server id, or None for the whole catalog
+            cursor: Pagination cursor
+            service: ToolService, ResourceService or PromptService for ``kind``
+
+        Returns:
+            CatalogSnapshot: Snapshot of the page.
+
+        Raises:
+            Exception: Whatever the service raised while building the page.
+        """
+        key = (kind, server_id or "", cursor or "")
+        if not self.enabled:
+            items, next_cursor = await _load_page(db, kind, server_id, cursor, service)
+            return CatalogSnapshot(kind, items, next_cursor)
+
+        snapshot = self._entries.get(key)
+        if snapshot is not None and snapshot.expires_at > time.time():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return snapshot
+        pending = self._building.get(key)
+        if pending is not None:
+            self._shared_builds += 1
+            return await asyncio.shield(pending)
+
+        self._misses += 1
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._building[key] = future
+        try:
+            items, next_cursor = await _load_page(db, kind, server_id, cursor, service)
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError(f"Listing {kind} was cancelled"))
+            future.exception()  # Mark retrieved: there may be no other waiter
+            raise
+        finally:
+            self._building.pop(key, None)
+
+        snapshot = CatalogSnapshot(kind, items, next_cursor, expires_at=time.time() + self.ttl)
+        future.set_result(snapshot)
+        if generation == self._generation:
+            self.put(key, snapshot)
+        return snapshot
+
+    def put(self, key: Tuple[str, str, str], snapshot: CatalogSnapshot) -> None:
+        """Cache a snapshot, evicting the least recently used pages beyond ``max_entries``.
+
+        Args:
+            key: ``(kind, server_id, cursor)``, with empty strings for None
+            snapshot: Snapshot of the page
+        """
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate_local(self, kind: str, value: Optional[str] = None) -> int:
+        """Drop snapshots in this process only.
+
+        Args:
+            kind: A catalog kind (drops every page of it), ``"server"`` (drops the pages of server ``value``) or ``"all"``
+            value: Server id for ``"server"``, otherwise ignored
+
+        Returns:
+            int: Number of snapshots dropped.
+
+        Examples:
+            >>> cache = CatalogSnapshotCache(ttl=60)
+            >>> cache.put(("tools", "s1", ""), CatalogSnapshot("tools", []))
+            >>> cache.put(("prompts", "", ""), CatalogSnapshot("prompts", []))
+            >>> cache.invalidate_local("server", "s1")
+            1
+            >>> cache.invalidate_local("all")
+            1
+        """
+        self._generation += 1
+        if kind == "all":
+            keys = list(self._entries)
+        elif kind == "server":
+            keys = [key for key in self._entries if key[1] == str(value)]
+        else:
+            keys = [key for key in self._entries if key[0] == kind]
+        for key in keys:
+            del self._entries[key]
+        self._invalidations += len(keys)
+        return len(keys)
+
+    async def invalidate(self, kind: str, value: Optional[str] = None) -> None:
+        """Drop snapshots on every worker.
+
+        Args:
+            kind: A catalog kind, ``"server"`` or ``"all"``
+            value: Server id for ``"server"``
+        """
+        self.invalidate_local(kind, value)
+        await self._channel.publish(kind, value)
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations when the Redis cache backend is configured."""
+        if self.enabled:
+            await self._channel.start()
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and close Redis connections."""
+        await self._channel.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, shared builds, evictions, invalidations and size.
+
+        Examples:
+            >>> CatalogSnapshotCache(ttl=60).stats()["hit_rate"]
+            0.0
+        """
+        lookups = self._hits + self._misses + self._shared_builds
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "shared_builds": self._shared_builds,
+            "hit_rate": (self._hits + self._shared_builds) / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "cross_worker": self._channel.active,
+        }
+
+
+_catalog_snapshot_cache: Optional[CatalogSnapshotCache] = None
+
+
+def get_catalog_snapshot_cache() -> CatalogSnapshotCache:
+    """Get the global CatalogSnapshotCache singleton instance.
+
+    Returns:
+        The global CatalogSnapshotCache instance
+
+    Examples:
+        >>> get_catalog_snapshot_cache() is get_catalog_snapshot_cache()
+        True
+    """
+    global _catalog_snapshot_cache  # pylint: disable=global-statement
+    if _catalog_snapshot_cache is None:
+        _catalog_snapshot_cache = CatalogSnapshotCache()
+    return _catalog_snapshot_cache
+
+
+def set_catalog_snapshot_cache(cache: Optional[CatalogSnapshotCache]) -> None:
+    """Set the global CatalogSnapshotCache instance.
+
+    This is primarily used for testing to inject a fresh cache.
+
+    Args:
+        cache: The CatalogSnapshotCache instance to use globally
+    """
+    global _catalog_snapshot_cache  # pylint: disable=global-statement
+    _catalog_snapshot_cache = cache
@@ -0,0 +1,647 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/completion_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Completion Index.
+``completion/complete`` is called on every keystroke while a client fills in a
+resource URI or prompt argument. Answering it from the database means loading
+every active resource (or the prompt row) and scanning it linearly, so this
+module keeps the candidate values in memory instead:
+
+- ``TermIndex`` holds a set of values sorted by their lowercase form for prefix
+  lookups by bisection, plus n-gram postings (1 to 3 characters, bucketed by
+  position) for substring lookups. Results are ranked exact match, then prefix,
+  then substring (earliest match first) and cut to the MCP limit of 100 values.
+- ``CompletionIndex`` keeps one ``TermIndex`` of active resource URIs, updated
+  incrementally from resource events, and the enum values of each completed
+  prompt argument, dropped on prompt events. With ``cache_type=redis`` changes
+  are published so other workers reload. ``completion_index_ttl`` bounds
+  staleness for changes made outside the services.
+
+Examples:
+    >>> terms = TermIndex(["red", "green", "blue", "Reddish"])
+    >>> terms.complete("red")
+    {'values': ['red', 'Reddish'], 'total': 2, 'hasMore': False}
+    >>> terms.complete("e")["values"]
+    ['red', 'Reddish', 'green', 'blue']
+    >>> terms.complete("")["values"]
+    ['red', 'green', 'blue', 'Reddish']
+"""
+
+# Standard
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import chain, compress, islice, repeat
+from operator import and_, itemgetter
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# First-Party
+from mcpgateway.cache.invalidation import InvalidationChannel
+from mcpgateway.config import settings
+
+# MCP caps completion/complete results at 100 values
+MAX_COMPLETIONS = 100
+
+# Longest n-gram indexed; longer queries are answered from their rarest trigram
+NGRAM_SIZE = 3
+
+# N-gram postings kept per index; the least recently queried are dropped first
+MAX_NGRAMS = 4096
+
+# Sorts after any lowercase key starting with a given prefix
+_PREFIX_END = "\U0010ffff"
+
+
+class TermIndex:
+    """
+    Case-insensitive prefix and substring index over a set of strings.
+
+    Values are kept sorted by lowercase form, so the values starting with a
+    query are one bisected slice. For substrings, each n-gram (up to
+    ``NGRAM_SIZE`` characters) that has been queried gets a posting of the
+    values containing it past their first character, bucketed by the position
+    where it first occurs. Postings are built from one scan the first time an
+    n-gram is typed and then maintained on every add and discard, so loading
+    the index stays a sort and later keystrokes read their matches
+    earliest-first without scanning.
+
+    Values are reference counted so the same value can be added for several
+    owners (for example two resources with the same URI) and disappears only
+    when the last one is discarded.
+
+    Examples:
+        >>> terms = TermIndex()
+        >>> terms.add("file://a.txt"); terms.add("file://a.txt"); terms.add("http://b")
+        >>> len(terms)
+        2
+        >>> terms.search("a.t")
+        (['file://a.txt'], 1)
+        >>> terms.discard("file://a.txt")
+        >>> terms.search("a.t")
+        (['file://a.txt'], 1)
+        >>> terms.discard("file://a.txt")
+        >>> terms.search("a.t")
+        ([], 0)
+    """
+
+    def __init__(self, values: Iterable[str] = (), max_ngrams: int = MAX_NGRAMS):
+        """Initialize the index.
+
+        Args:
+            values: Initial values
+            max_ngrams: Maximum number of n-gram postings kept
+        """
+        self.max_ngrams = max_ngrams
+        self._keys: Dict[str, str] = {}
+        self._counts: Dict[str, int] = {}
+        self._sorted: List[Tuple[str, str]] = []
+        self._postings: "OrderedDict[str, Dict[int, Dict[str, str]]]" = OrderedDict()
+        self._posting_sizes: Dict[str, int] = {}
+        for value in values:
+            if self._reference(value):
+                self._sorted.append((self._keys[value], value))
+        self._sorted.sort()
+
+    def __len__(self) -> int:
+        """Return the number of distinct values.
+
+        Returns:
+            int: Indexed values.
+        """
+        return len(self._keys)
+
+    def _reference(self, value: str) -> bool:
+        """Count a reference to a value.
+
+        Args:
+            value: Value
+
+        Returns:
+            bool: True if the value is new.
+        """
+        count = self._counts.get(value, 0)
+        self._counts[value] = count + 1
+        if not count:
+            self._keys[value] = value.lower()
+        return not count
+
+    def _matching_postings(self, key: str) -> Iterable[Tuple[str, int]]:
+        """Return the postings a key belongs to and its position in each.
+
+        Args:
+            key: Lowercase value
+
+        Returns:
+            Iterable[Tuple[str, int]]: ``(n-gram, first position)`` for each posting holding the key.
+        """
+        grams = list(self._postings)
+        positions = list(map(key.find, grams))
+        return compress(zip(grams, positions), map((0).__lt__, positions))
+
+    def add(self, value: str) -> None:
+        """Index a value, or add a reference to an indexed one.
+
+        Args:
+            value: Value to index
+        """
+        if not self._reference(value):
+            return
+        key = self._keys[value]
+        insort(self._sorted, (key, value))
+        for gram, position in self._matching_postings(key):
+            self._postings[gram].setdefault(position, {})[value] = key
+            self._posting_sizes[gram] += 1
+
+    def discard(self, value: str) -> None:
+        """Drop one reference to a value, removing it with the last one.
+
+        Args:
+            value: Indexed value
+        """
+        count = self._counts.get(value)
+        if count is None:
+            return
+        if count > 1:
+            self._counts[value] = count - 1
+            return
+        del self._counts[value]
+        key = self._keys.pop(value)
+        del self._sorted[bisect_left(self._sorted, (key, value))]
+        for gram, position in list(self._matching_postings(key)):
+            buckets = self._postings[gram]
+            del buckets[position][value]
+            if not buckets[position]:
+                del buckets[position]
+            self._posting_sizes[gram] -= 1
+
+    def _posting(self, gram: str) -> Dict[int, Dict[str, str]]:
+        """Return the posting of an n-gram, building it on first use.
+
+        Args:
+            gram: Lowercase n-gram
+
+        Returns:
+            Dict[int, Dict[str, str]]: First position to the values (and keys) containing the n-gram there.
+
+        Examples:
+            >>> TermIndex(["abab", "xab", "yyab"])._posting("ab")
+            {1: {'xab': 'xab'}, 2: {'yyab': 'yyab'}}
+        """
+        buckets = self._postings.get(gram)
+        if buckets is not None:
+            self._postings.move_to_end(gram)
+            return buckets
+
+        values = list(self._keys)
+        keys = list(self._keys.values())
+        positions = list(map(str.find, keys, repeat(gram)))
+        matched = list(map((0).__lt__, positions))
+        buckets = {}
+        for position, value, key in zip(compress(positions, matched), compress(values, matched), compress(keys, matched)):
+            buckets.setdefault(position, {})[value] = key
+        self._postings[gram] = buckets
+        self._posting_sizes[gram] = len(positions) - positions.count(-1) - positions.count(0)
+        while len(self._postings) > self.max_ngrams:
+            evicted, _ = self._postings.popitem(last=False)
+            del self._posting_sizes[evicted]
+        return buckets
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Return the slice of sorted keys starting with ``prefix``.
+
+        Args:
+            prefix: Lowercase prefix
+
+        Returns:
+            Tuple[int, int]: Start and end index into the sorted keys.
+        """
+        return bisect_left(self._sorted, (prefix,)), bisect_left(self._sorted, (prefix + _PREFIX_END,))
+
+    def search(self, query: str, limit: int = MAX_COMPLETIONS) -> Tuple[List[str], int]:
+        """Return the best matches for a query and the number of matches.
+
+        An empty query matches everything in insertion order. Otherwise exact
+        and prefix matches come first in lexical order, followed by values
+        containing the query elsewhere, earliest occurrence first.
+
+        Args:
+            query: Text typed so far (matched case-insensitively)
+            limit: Maximum number of values returned
+
+        Returns:
+            Tuple[List[str], int]: Up to ``limit`` ranked values and the total match count.
+
+        Examples:
+            >>> terms = TermIndex(["xab", "ab", "abc", "zzab", "xxabcd"])
+            >>> terms.search("ab", limit=3)
+            (['ab', 'abc', 'xab'], 5)
+            >>> terms.search("abcd")
+            (['xxabcd'], 1)
+        """
+        query = query.lower()
+        if not query:
+            return list(islice(self._keys, limit)), len(self._keys)
+
+        start, end = self._prefix_range(query)
+        values = [value for _, value in self._sorted[start : min(end, start + limit)]]
+
+        if len(query) <= NGRAM_SIZE:
+            buckets = self._posting(query)
+            for position in sorted(buckets):
+                if len(values) >= limit:
+                    break
+                values.extend(islice(buckets[position], limit - len(values)))
+            return values, end - start + self._posting_sizes[query]
+
+        # Longer queries: every match contains each of the query's trigrams, so
+        # check the values holding the rarest one. The trailing trigram is
+        # indexed now, earlier ones were indexed as they were typed. Values
+        # starting with the query are already counted, which makes the leading
+        # trigram cheap.
+        lead = query[:NGRAM_SIZE]
+        self._posting(query[-NGRAM_SIZE:])
+        grams = [gram for gram in (query[i : i + NGRAM_SIZE] for i in range(len(query) - NGRAM_SIZE + 1)) if gram in self._postings]
+
+        def cost(gram: str) -> int:
+            gram_start, gram_end = self._prefix_range(gram)
+            return self._posting_sizes.get(gram, 0) + gram_end - gram_start - (end - start if gram == lead else 0)
+
+        gram = min(grams, key=cost)
+        buckets = self._posting(gram).values()
+        gram_start, gram_end = self._prefix_range(gram)
+        leading = self._sorted[gram_start:start] + self._sorted[end:gram_end] if gram == lead else self._sorted[gram_start:gram_end]
+        candidates = list(chain(map(itemgetter(1), leading), *buckets))
+        keys = chain(map(itemgetter(0), leading), *(bucket.values() for bucket in buckets))
+        positions = list(map(str.find, keys, repeat(query)))
+        # -1 is a false candidate and 0 a prefix match, already counted above
+        total = end - start + len(positions) - positions.count(-1) - positions.count(0)
+
+        need = limit - len(values)
+        if need > 0 and total > len(values):
+            infix_positions = [position for position in positions if position > 0]
+            cutoff = sorted(infix_positions)[min(need, len(infix_positions)) - 1]
+            # Only the values at or before the cutoff position can make the cut
+            selected = list(map(and_, map(cutoff.__ge__, positions), map((0).__lt__, positions)))
+            ranked = sorted(zip(compress(positions, selected), compress(candidates, selected)), key=itemgetter(0))
+            values.extend(value for _, value in ranked[:need])
+        return values, total
+
+    def complete(self, query: str, limit: int = MAX_COMPLETIONS) -> Dict[str, Any]:
+        """Return the ``completion`` payload of a ``completion/complete`` result.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of values returned
+
+        Returns:
+            Dict[str, Any]: ``values``, ``total`` and ``hasMore``.
+
+        Examples:
+            >>> TermIndex(["a1", "a2", "b"]).complete("a", limit=1)
+            {'values': ['a1'], 'total': 2, 'hasMore': True}
+        """
+        values, total = self.search(query, limit)
+        return {"values": values, "total": total, "hasMore": total > len(values)}
+
+
+@dataclass
+class PromptCompletions:
+    """Completion sources of one active prompt.
+
+    Attributes:
+        prompt_id: Prompt id, used to drop the entry on prompt events
+        arguments: Argument name to its enum values index, or None when the argument has no enum
+        expires_at: When the entry must be reloaded from the database
+    """
+
+    prompt_id: str
+    arguments: Dict[str, Optional[TermIndex]] = field(default_factory=dict)
+    expires_at: float = 0.0
+
+    @classmethod
+    def from_schema(cls, prompt_id: Any, argument_schema: Dict[str, Any], expires_at: float = 0.0) -> "PromptCompletions":
+        """Index the enum values of each argument in a prompt's schema.
+
+        Args:
+            prompt_id: Prompt id
+            argument_schema: Prompt argument JSON schema
+            expires_at: Entry expiry time
+
+        Returns:
+            PromptCompletions: Indexed arguments.
+
+        Examples:
+            >>> entry = PromptCompletions.from_schema(1, {"properties": {"c": {"name": "color", "enum": ["red", 1]}, "n": {"name": "note"}}})
+            >>> entry.arguments["color"].search("")
+            (['red', '1'], 2)
+            >>> entry.arguments["note"] is None
+            True
+        """
+        arguments: Dict[str, Optional[TermIndex]] = {}
+        for arg in argument_schema.get("properties", {}).values():
+            name = arg.get("name")
+            if name not in arguments:
+                arguments[name] = TermIndex(str(value) for value in arg["enum"]) if "enum" in arg else None
+        return cls(prompt_id=str(prompt_id), arguments=arguments, expires_at=expires_at)
+
+
+class CompletionIndex:
+    """
+    Per-worker completion sources for resource URIs and prompt arguments.
+
+    Attributes:
+        ttl: Seconds loaded data is reused before it is reloaded from the database
+
+    Examples:
+        >>> index = CompletionIndex(ttl=60)
+        >>> index.resources_expired()
+        True
+        >>> index.load_resources([(1, "file://readme.md"), (2, "file://notes.md")])
+        >>> index.complete_resource_uri("notes")
+        {'values': ['file://notes.md'], 'total': 1, 'hasMore': False}
+        >>> index.update_resource_local(2, None, active=False)
+        >>> index.complete_resource_uri("")["values"]
+        ['file://readme.md']
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """Initialize the index.
+
+        Args:
+            ttl: Seconds loaded data is reused (defaults to ``completion_index_ttl``)
+        """
+        self.ttl = ttl if ttl is not None else settings.completion_index_ttl
+        self._resources = TermIndex()
+        self._resource_uris: Dict[str, str] = {}
+        self._resources_expire_at = 0.0
+        self._prompts: Dict[str, PromptCompletions] = {}
+        self._prompt_names: Dict[str, str] = {}
+        self._queries = 0
+        self._reloads = 0
+        self._invalidations = 0
+        self._channel = InvalidationChannel("completion_index_invalidate", self.invalidate_local)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether loaded data is kept between requests.
+
+        Returns:
+            bool: True when the index is enabled and the TTL is positive.
+
+        Examples:
+            >>> CompletionIndex(ttl=0).enabled
+            False
+        """
+        return settings.completion_index_enabled and self.ttl > 0
+
+    # --- Resources ---
+
+    def resources_expired(self) -> bool:
+        """Whether resource URIs must be (re)loaded before completing.
+
+        Returns:
+            bool: True if never loaded, expired, invalidated or the index is disabled.
+        """
+        return not self.enabled or self._resources_expire_at <= time.time()
+
+    def load_resources(self, resources: Iterable[Tuple[Any, str]]) -> None:
+        """Replace the indexed resource URIs.
+
+        The first load builds the index in bulk; later reloads only apply the
+        resources that changed, unless most of them did.
+
+        Args:
+            resources: ``(id, uri)`` of every active resource
+
+        Examples:
+            >>> index = CompletionIndex(ttl=60)
+            >>> index.load_resources([(1, "a://one"), (2, "a://two")])
+            >>> index.load_resources([(1, "a://one"), (3, "a://three")])
+            >>> index.complete_resource_uri("a://t")["values"]
+            ['a://three']
+        """
+        fresh = {str(resource_id): uri for resource_id, uri in resources if uri}
+        changed = [resource_id for resource_id in fresh.keys() | self._resource_uris.keys() if fresh.get(resource_id) != self._resource_uris.get(resource_id)]
+        if len(changed) * 4 > len(fresh):
+            self._resource_uris = fresh
+            self._resources = TermIndex(fresh.values())
+        else:
+            for resource_id in changed:
+                self._set_resource(resource_id, fresh.get(resource_id))
+        self._resources_expire_at = time.time() + self.ttl
+        self._reloads += 1
+
+    def _set_resource(self, resource_id: str, uri: Optional[str]) -> None:
+        """Point a resource id at a URI, or drop it when ``uri`` is None.
+
+        Args:
+            resource_id: Resource id
+            uri: Current URI of the active resource, or None
+        """
+        previous = self._resource_uris.pop(resource_id, None)
+        if previous is not None:
+            self._resources.discard(previous)
+        if uri:
+            self._resource_uris[resource_id] = uri
+            self._resources.add(uri)
+
+    def complete_resource_uri(self, query: str) -> Dict[str, Any]:
+        """Complete a resource URI from the loaded index.
+
+        Args:
+            query: URI typed so far
+
+        Returns:
+            Dict[str, Any]: ``completion`` payload.
+        """
+        self._queries += 1
+        return self._resources.complete(query)
+
+    def update_resource_local(self, resource_id: Any, uri: Optional[str], active: bool) -> None:
+        """Apply a resource change made by this process.
+
+        Args:
+            resource_id: Resource id
+            uri: Resource URI after the change
+            active: Whether the resource is active after the change
+        """
+        if self._resources_expire_at:
+            self._set_resource(str(resource_id), uri if active else None)
+
+    async def update_resource(self, resource_id: Any, uri: Optional[str], active: bool) -> None:
+        """Apply a resource change here and make other workers reload.
+
+        Args:
+            resource_id: Resource id
+            uri: Resource URI after the change
+            active: Whether the resource is active after the change
+        """
+        self.update_resource_local(resource_id, uri, active)
+        await self._channel.publish("resource", str(resource_id))
+
+    # --- Prompts ---
+
+    def get_prompt(self, name: str) -> Optional[PromptCompletions]:
+        """Return the indexed arguments of an active prompt, if loaded and fresh.
+
+        Args:
+            name: Prompt name
+
+        Returns:
+            Optional[PromptCompletions]: Indexed arguments, or None on a miss.
+        """
+        self._queries += 1
+        entry = self._prompts.get(name)
+        if entry is None or not self.enabled or entry.expires_at <= time.time():
+            return None
+        return entry
+
+    def put_prompt(self, name: str, prompt_id: Any, argument_schema: Dict[str, Any]) -> PromptCompletions:
+        """Index the arguments of an active prompt loaded from the database.
+
+        Args:
+            name: Prompt name
+            prompt_id: Prompt id
+            argument_schema: Prompt argument JSON schema
+
+        Returns:
+            PromptCompletions: Indexed arguments.
+
+        Examples:
+            >>> index = CompletionIndex(ttl=60)
+            >>> _ = index.put_prompt("p", 7, {"properties": {"a": {"name": "a", "enum": ["x"]}}})
+            >>> index.get_prompt("p").arguments["a"].search("x")
+            (['x'], 1)
+            >>> index.invalidate_local("prompt", "7")
+            1
+            >>> index.get_prompt("p") is None
+            True
+        """
+        entry = PromptCompletions.from_schema(prompt_id, argument_schema, expires_at=time.time() + self.ttl)
+        if self.enabled:
+            self._drop_prompt(entry.prompt_id)
+            self._prompts[name] = entry
+            self._prompt_names[entry.prompt_id] = name
+            self._reloads += 1
+        return entry
+
+    def _drop_prompt(self, prompt_id: str) -> int:
+        """Drop the entry of a prompt by id.
+
+        Args:
+            prompt_id: Prompt id
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        name = self._prompt_names.pop(prompt_id, None)
+        if name is None:
+            return 0
+        self._prompts.pop(name, None)
+        return 1
+
+    async def invalidate_prompt(self, prompt_id: Any) -> None:
+        """Drop a changed prompt on every worker.
+
+        Args:
+            prompt_id: Prompt id
+        """
+        self.invalidate_local("prompt", str(prompt_id))
+        await self._channel.publish("prompt", str(prompt_id))
+
+    # --- Invalidation and lifecycle ---
+
+    def invalidate_local(self, kind: str, value: Optional[str] = None) -> int:
+        """Drop data in this process only.
+
+        Args:
+            kind: ``"resource"`` (reload all resource URIs), ``"prompt"`` (by prompt id) or ``"all"``
+            value: Resource or prompt id (ignored for ``"all"``)
+
+        Returns:
+            int: Number of entries dropped.
+
+        Examples:
+            >>> index = CompletionIndex(ttl=60)
+            >>> index.load_resources([(1, "a")])
+            >>> index.invalidate_local("resource", "1")
+            1
+            >>> index.resources_expired()
+            True
+        """
+        dropped = 0
+        if kind in ("resource", "all") and self._resources_expire_at:
+            self._resources_expire_at = 0.0
+            dropped += 1
+        if kind == "prompt":
+            dropped += self._drop_prompt(str(value))
+        elif kind == "all":
+            dropped += len(self._prompts)
+            self._prompts.clear()
+            self._prompt_names.clear()
+        self._invalidations += dropped
+        return dropped
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations when the Redis cache backend is configured."""
+        if self.enabled:
+            await self._channel.start()
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and close Redis connections."""
+        await self._channel.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index counters.
+
+        Returns:
+            Dict[str, Any]: Sizes, queries, reloads and invalidations.
+
+        Examples:
+            >>> CompletionIndex(ttl=60).stats()["resources"]
+            0
+        """
+        return {
+            "enabled": self.enabled,
+            "resources": len(self._resources),
+            "prompts": len(self._prompts),
+            "queries": self._queries,
+            "reloads": self._reloads,
+            "invalidations": self._invalidations,
+            "cross_worker": self._channel.active,
+        }
+
+
+_completion_index: Optional[CompletionIndex] = None
+
+
+def get_completion_index() -> CompletionIndex:
+    """Get the global CompletionIndex singleton instance.
+
+    Returns:
+        The global CompletionIndex instance
+
+    Examples:
+        >>> get_completion_index() is get_completion_index()
+        True
+    """
+    global _completion_index  # pylint: disable=global-statement
+    if _completion_index is None:
+        _completion_index = CompletionIndex()
+    return _completion_index
+
+
+def set_completion_index(index: Optional[CompletionIndex]) -> None:
+    """Set the global CompletionIndex instance.
+
+    This is primarily used for testing to inject a fresh index.
+
+    Args:
+        index: The CompletionIndex instance to use, or None to reset
+    """
+    global _completion_index  # pylint: disable=global-statement
+    _completion_index = index
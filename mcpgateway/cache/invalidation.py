@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/invalidation.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Cross-Worker Cache Invalidation.
+In-process caches drop stale entries locally as soon as the owning service
+changes something, but other workers only see that change once their own entry
+expires. With ``cache_type=redis``, an ``InvalidationChannel`` publishes each
+invalidation on a Redis pub/sub channel and applies the ones published by other
+workers, so every process drops the entry within milliseconds.
+
+Examples:
+    >>> dropped = []
+    >>> channel = InvalidationChannel("example_invalidate", lambda kind, value: dropped.append((kind, value)))
+    >>> channel.channel.endswith("example_invalidate")
+    True
+    >>> channel.active
+    False
+    >>> channel.apply({"origin": "another-worker", "kind": "id", "value": "42"})
+    True
+    >>> dropped
+    [('id', '42')]
+"""
+
+# Standard
+import asyncio
+import json
+from typing import Any, Callable, Dict, Optional
+import uuid
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.services.logging_service import LoggingService
+
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+
+class InvalidationChannel:
+    """
+    Redis pub/sub channel carrying ``(kind, value)`` invalidations between workers.
+
+    Messages published by this process are ignored on receipt; the publisher has
+    already invalidated locally.
+
+    Attributes:
+        channel: Redis channel name, prefixed with ``cache_prefix``
+    """
+
+    def __init__(self, name: str, handler: Callable[[str, Optional[str]], Any]):
+        """Initialize the channel.
+
+        Args:
+            name: Channel name, without the cache prefix
+            handler: Called with ``(kind, value)`` for each remote invalidation
+        """
+        self.channel = f"{settings.cache_prefix}{name}"
+        self._handler = handler
+        self._origin = uuid.uuid4().hex
+        self._redis: Any = None
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether remote invalidations are being received.
+
+        Returns:
+            bool: True while the listener task is running.
+        """
+        return self._listener is not None
+
+    def apply(self, data: Dict[str, Any]) -> bool:
+        """Apply a decoded invalidation message unless this process sent it.
+
+        Args:
+            data: Message with ``origin``, ``kind`` and ``value`` keys
+
+        Returns:
+            bool: True if the handler was called.
+
+        Examples:
+            >>> channel = InvalidationChannel("example_invalidate", lambda kind, value: None)
+            >>> channel.apply({"origin": channel._origin, "kind": "id", "value": "1"})
+            False
+        """
+        if data.get("origin") == self._origin:
+            return False
+        self._handler(data.get("kind", ""), data.get("value"))
+        return True
+
+    async def publish(self, kind: str, value: Optional[str]) -> None:
+        """Broadcast an invalidation to other workers when connected.
+
+        Args:
+            kind: Kind of key being invalidated
+            value: Key value
+        """
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(self.channel, json.dumps({"origin": self._origin, "kind": kind, "value": value}))
+        except Exception as e:
+            logger.warning(f"Failed to publish invalidation on {self.channel}: {e}")
+
+    async def start(self) -> None:
+        """Subscribe to the channel when the Redis cache backend is configured."""
+        if settings.cache_type != "redis" or not REDIS_AVAILABLE or not settings.redis_url or self._listener is not None:
+            return
+        try:
+            self._redis = Redis.from_url(settings.redis_url, decode_responses=True)
+            self._pubsub = self._redis.pubsub()
+            await self._pubsub.subscribe(self.channel)
+        except Exception as e:
+            logger.warning(f"Invalidation channel {self.channel} unavailable, falling back to TTL expiry across workers: {e}")
+            self._redis = self._pubsub = None
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Apply invalidations published by other workers."""
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                self.apply(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Without the channel, remote changes still take effect within the TTL
+            logger.warning(f"Invalidation listener for {self.channel} stopped: {e}")
+
+    async def shutdown(self) -> None:
+        """Stop the listener and close Redis connections."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        for conn in (self._pubsub, self._redis):
+            if conn is not None:
+                try:
+                    await conn.aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing invalidation channel connection: {e}")
+        self._pubsub = self._redis = None
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/permission_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+RBAC Permission Cache.
+``PermissionService`` is constructed per request, so its own cache never
+survives long enough to be hit and every check re-runs the role, admin and team
+membership queries. This module keeps those answers for the whole process:
+
+- ``ResolvedPermissions`` holds the effective permissions a user has in one team
+  context (global and personal roles included), plus the role summary written
+  to the permission audit log.
+- The admin flag and the team role used by the team fallback rules are cached
+  per user and per (user, team).
+- Role assignment, admin flag and team membership changes drop the entries of
+  that user; role definition changes drop everything, since inheritance lets a
+  role change reach any user. With ``cache_type=redis`` the invalidation is
+  published so every worker drops them.
+- Entries never outlive the earliest expiry of the role assignments they were
+  computed from, and ``permission_cache_ttl`` bounds staleness for changes made
+  outside the services.
+
+Examples:
+    >>> cache = PermissionCache(max_size=10, ttl=60)
+    >>> key = cache.permissions_key("alice@example.com", "team-1")
+    >>> cache.put(key, ResolvedPermissions(frozenset({"tools.read"})), user="alice@example.com", team="team-1")
+    >>> cache.get(key).permissions
+    frozenset({'tools.read'})
+    >>> cache.invalidate_local("team", "team-1")
+    1
+    >>> cache.get(key) is MISSING
+    True
+"""
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+# First-Party
+from mcpgateway.cache.invalidation import InvalidationChannel
+from mcpgateway.config import settings
+
+# Returned by ``PermissionCache.get`` on a miss; cached values may legitimately be None or False
+MISSING: Any = object()
+
+
+@dataclass
+class ResolvedPermissions:
+    """Effective permissions of a user in one team context.
+
+    Attributes:
+        permissions: Permissions granted by the user's active roles
+        roles: Role summary recorded in permission audit logs
+    """
+
+    permissions: FrozenSet[str]
+    roles: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _Entry:
+    """Cached value and its expiry."""
+
+    value: Any
+    expires_at: float
+    keys: Dict[str, str] = field(default_factory=dict)
+
+
+class PermissionCache:
+    """
+    Bounded TTL cache of RBAC lookups shared by every ``PermissionService``.
+
+    Secondary indexes by user email and team id let membership and assignment
+    events drop exactly the affected entries.
+
+    Attributes:
+        max_size: Maximum number of cached lookups
+        ttl: Seconds a lookup is reused
+
+    Examples:
+        >>> cache = PermissionCache(max_size=1, ttl=60)
+        >>> cache.put(cache.admin_key("a"), True, user="a")
+        >>> cache.put(cache.admin_key("b"), False, user="b")
+        >>> cache.get(cache.admin_key("a")) is MISSING
+        True
+        >>> cache.get(cache.admin_key("b"))
+        False
+        >>> cache.stats()["evictions"]
+        1
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (defaults to ``permission_cache_max_size``)
+            ttl: Seconds an entry is reused (defaults to ``permission_cache_ttl``)
+        """
+        self.max_size = max_size if max_size is not None else settings.permission_cache_max_size
+        self.ttl = ttl if ttl is not None else settings.permission_cache_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._index: Dict[str, Dict[str, Set[str]]] = {"user": {}, "team": {}}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._channel = InvalidationChannel("permission_invalidate", self.invalidate_local)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether RBAC lookups are cached.
+
+        Returns:
+            bool: True when caching is enabled and the TTL is positive.
+
+        Examples:
+            >>> PermissionCache(ttl=0).enabled
+            False
+        """
+        return settings.permission_cache_enabled and self.ttl > 0
+
+    @staticmethod
+    def permissions_key(user_email: str, team_id: Optional[str] = None) -> str:
+        """Key of a user's effective permissions in a team context.
+
+        Args:
+            user_email: User email
+            team_id: Team context, or None for global
+
+        Returns:
+            str: Cache key.
+
+        Examples:
+            >>> PermissionCache.permissions_key("a@example.com")
+            'perm:a@example.com:global'
+        """
+        return f"perm:{user_email}:{team_id or 'global'}"
+
+    @staticmethod
+    def admin_key(user_email: str) -> str:
+        """Key of a user's platform admin flag.
+
+        Args:
+            user_email: User email
+
+        Returns:
+            str: Cache key.
+        """
+        return f"admin:{user_email}"
+
+    @staticmethod
+    def team_role_key(user_email: str, team_id: str) -> str:
+        """Key of a user's membership role in a team.
+
+        Args:
+            user_email: User email
+            team_id: Team id
+
+        Returns:
+            str: Cache key.
+        """
+        return f"team_role:{user_email}:{team_id}"
+
+    def get(self, key: str) -> Any:
+        """Return a cached value, if still valid.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Any: The cached value, or ``MISSING`` on a miss.
+        """
+        if not self.enabled:
+            return MISSING
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def put(self, key: str, value: Any, user: str, team: Optional[str] = None, expires_at: Optional[float] = None) -> None:
+        """Cache a lookup.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            user: User the value belongs to
+            team: Team the value depends on, if any
+            expires_at: Epoch seconds after which the value is wrong regardless of events
+        """
+        if not self.enabled:
+            return
+        self._remove(key)
+        keys = {"user": user}
+        if team:
+            keys["team"] = team
+        deadline = time.time() + self.ttl
+        self._entries[key] = _Entry(value=value, expires_at=min(deadline, expires_at) if expires_at is not None else deadline, keys=keys)
+        for kind, index_value in keys.items():
+            self._index[kind].setdefault(index_value, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop one entry and its index references.
+
+        Args:
+            key: Cache key
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for kind, value in entry.keys.items():
+            keys = self._index[kind].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[kind][value]
+
+    def invalidate_local(self, kind: str, value: Optional[str] = None) -> int:
+        """Drop entries in this process only.
+
+        Args:
+            kind: ``"user"`` (by email), ``"team"`` (by team id) or ``"all"``
+            value: User email or team id (ignored for ``"all"``)
+
+        Returns:
+            int: Number of entries dropped.
+
+        Examples:
+            >>> cache = PermissionCache(ttl=60)
+            >>> cache.put(cache.admin_key("a"), False, user="a")
+            >>> cache.invalidate_local("user", "a")
+            1
+            >>> cache.invalidate_local("all")
+            0
+        """
+        if kind == "all":
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._index = {"user": {}, "team": {}}
+        else:
+            keys = list(self._index.get(kind, {}).get(str(value), ()))
+            for key in keys:
+                self._remove(key)
+            dropped = len(keys)
+        self._invalidations += dropped
+        return dropped
+
+    async def invalidate_user(self, user_email: str) -> None:
+        """Drop a user's lookups on every worker after their roles, admin flag or memberships change.
+
+        Args:
+            user_email: User email
+        """
+        self.invalidate_local("user", user_email)
+        await self._channel.publish("user", user_email)
+
+    async def invalidate_team(self, team_id: Any) -> None:
+        """Drop every lookup that depends on a team on every worker.
+
+        Args:
+            team_id: Team id
+        """
+        self.invalidate_local("team", str(team_id))
+        await self._channel.publish("team", str(team_id))
+
+    async def invalidate_all(self) -> None:
+        """Drop every lookup on every worker after a role definition changes."""
+        self.invalidate_local("all")
+        await self._channel.publish("all", None)
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations when the Redis cache backend is configured."""
+        if self.enabled:
+            await self._channel.start()
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and close Redis connections."""
+        await self._channel.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, evictions, invalidations and size.
+
+        Examples:
+            >>> PermissionCache(ttl=60).stats()["size"]
+            0
+        """
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "cross_worker": self._channel.active,
+        }
+
+
+_permission_cache: Optional[PermissionCache] = None
+
+
+def get_permission_cache() -> PermissionCache:
+    """Get the global PermissionCache singleton instance.
+
+    Returns:
+        The global PermissionCache instance
+
+    Examples:
+        >>> get_permission_cache() is get_permission_cache()
+        True
+    """
+    global _permission_cache  # pylint: disable=global-statement
+    if _permission_cache is None:
+        _permission_cache = PermissionCache()
+    return _permission_cache
+
+
+def set_permission_cache(cache: Optional[PermissionCache]) -> None:
+    """Set the global PermissionCache instance.
+
+    This is primarily used for testing to inject a fresh cache.
+
+    Args:
+        cache: The PermissionCache instance to use globally
+    """
+    global _permission_cache  # pylint: disable=global-statement
+    _permission_cache = cache
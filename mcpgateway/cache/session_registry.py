@@ -43,9 +43,10 @@ Examples:
     Broadcasting messages:
 
     >>> reg = SessionRegistry(backend='memory')
+    >>> asyncio.run(reg.add_session('sid123', transport))
     >>> asyncio.run(reg.broadcast('sid123', {'method': 'ping', 'id': 1}))
-    >>> reg._session_message is not None
-    True
+    >>> reg._session_queues['sid123'].qsize()
+    1
 """
 
 # Standard
@@ -56,7 +57,7 @@ import json
 import logging
 import time
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 from urllib.parse import urlparse
 import uuid
 
@@ -93,13 +94,17 @@ except ImportError:
 
 try:
     # Third-Party
-    from sqlalchemy import func
+    from sqlalchemy import delete, func, select
 
     SQLALCHEMY_AVAILABLE = True
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
 
 
+# Sentinel telling a memory-backend consumer that its session was removed
+_QUEUE_CLOSED = object()
+
+
 class SessionBackend:
     """Base class for session registry backend configuration.
 
@@ -113,7 +118,7 @@ class SessionBackend:
         _message_ttl: Time-to-live for messages in seconds
         _redis: Redis connection instance (redis backend only)
         _pubsub: Redis pubsub instance (redis backend only)
-        _session_message: Temporary message storage (memory backend only)
+        _session_queues: Bounded per-session message queues (memory backend only)
 
     Examples:
         >>> backend = SessionBackend(backend='memory')
@@ -184,8 +189,9 @@ class SessionBackend:
 
         # Set up backend-specific components
         if self._backend == "memory":
-            # Nothing special needed for memory backend
-            self._session_message: dict[str, Any] | None = None
+            # Bounded message queue per local session, consumed by respond()
+            self._session_queues: Dict[str, asyncio.Queue] = {}
+            self._dropped_messages = 0
 
         elif self._backend == "none":
             # No session tracking - this is just a dummy registry
@@ -298,6 +304,34 @@ class SessionRegistry(SessionBackend):
         self._client_capabilities: Dict[str, Dict[str, Any]] = {}  # Client capabilities by session_id
         self._lock = asyncio.Lock()
         self._cleanup_task: Task | None = None
+        self._rpc_dispatcher: Optional[Callable[[Any, Any], Awaitable[Any]]] = None
+        # Database backend delivery: one poller per worker for every local session awaiting messages
+        self._db_listeners: Dict[str, Dict[str, Any]] = {}
+        self._db_poll_task: Task | None = None
+        self._db_poll_wakeup = asyncio.Event()
+        self._db_deliveries: Dict[str, Task] = {}
+
+    def set_rpc_dispatcher(self, dispatcher: Optional[Callable[[Any, Any], Awaitable[Any]]]) -> None:
+        """Route SSE messages through an in-process JSON-RPC dispatcher.
+
+        When set, ``generate_response`` hands each message to ``dispatcher(message, user)``
+        (a single request or a batch) and sends back the JSON-RPC response it returns,
+        instead of minting a token and POSTing the message to the gateway's own ``/rpc``
+        endpoint.
+
+        Args:
+            dispatcher: Coroutine function returning a JSON-RPC response envelope, or None
+                to fall back to the ``/rpc`` loopback call.
+
+        Examples:
+            >>> async def dispatch(message, user):
+            ...     return {"jsonrpc": "2.0", "result": {}, "id": message["id"]}
+            >>> reg = SessionRegistry()
+            >>> reg.set_rpc_dispatcher(dispatch)
+            >>> reg._rpc_dispatcher is dispatch
+            True
+        """
+        self._rpc_dispatcher = dispatcher
 
     async def initialize(self) -> None:
         """Initialize the registry with async setup.
@@ -355,13 +389,14 @@ class SessionRegistry(SessionBackend):
         """
         logger.info("Shutting down session registry")
 
-        # Cancel cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel cleanup task and the database message poller
+        for task in (self._cleanup_task, self._db_poll_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Close Redis connections
         if self._backend == "redis":
@@ -417,6 +452,8 @@ class SessionRegistry(SessionBackend):
 
         async with self._lock:
             self._sessions[session_id] = transport
+            if self._backend == "memory":
+                self._session_queues.setdefault(session_id, asyncio.Queue(maxsize=settings.session_queue_maxsize))
 
         if self._backend == "redis":
             # Store session marker in Redis
@@ -606,6 +643,9 @@ class SessionRegistry(SessionBackend):
             if session_id in self._client_capabilities:
                 self._client_capabilities.pop(session_id)
                 logger.debug(f"Removed capabilities for session {session_id}")
+            self._db_listeners.pop(session_id, None)
+            if self._backend == "memory":
+                self._close_queue(self._session_queues.pop(session_id, None))
 
         # Disconnect transport if found
         if transport:
@@ -666,7 +706,7 @@ class SessionRegistry(SessionBackend):
 
         Sends a message to the specified session. The behavior depends on the backend:
 
-        - **memory**: Stores message temporarily for local delivery
+        - **memory**: Enqueues message on the session's bounded queue, applying ``session_queue_overflow`` when full
         - **redis**: Publishes message to Redis channel for the session
         - **database**: Stores message in database for polling by worker with session
         - **none**: No operation
@@ -681,16 +721,16 @@ class SessionRegistry(SessionBackend):
             >>> import asyncio
             >>> from mcpgateway.cache.session_registry import SessionRegistry
             >>>
+            >>> class MockTransport:
+            ...     async def disconnect(self):
+            ...         pass
             >>> reg = SessionRegistry(backend='memory')
+            >>> asyncio.run(reg.add_session('session-789', MockTransport()))
             >>> message = {'method': 'tools/list', 'id': 1}
             >>> asyncio.run(reg.broadcast('session-789', message))
             >>>
-            >>> # Message stored for memory backend
-            >>> reg._session_message is not None
-            True
-            >>> reg._session_message['session_id']
-            'session-789'
-            >>> json.loads(reg._session_message['message']) == message
+            >>> # Message queued for the session's consumer
+            >>> reg._session_queues['session-789'].get_nowait() == message
             True
         """
         # Skip for none backend only
@@ -698,12 +738,11 @@ class SessionRegistry(SessionBackend):
             return
 
         if self._backend == "memory":
-            if isinstance(message, (dict, list)):
-                msg_json = json.dumps(message)
-            else:
-                msg_json = json.dumps(str(message))
-
-            self._session_message: Dict[str, Any] | None = {"session_id": session_id, "message": msg_json}
+            queue = self._session_queues.get(session_id)
+            if queue is None:
+                logger.warning(f"Dropping message for unknown session {session_id}")
+                return
+            await self._enqueue(session_id, queue, message if isinstance(message, (dict, list)) else str(message))
 
         elif self._backend == "redis":
             try:
@@ -758,6 +797,9 @@ class SessionRegistry(SessionBackend):
                         db_session.close()
 
                 await asyncio.to_thread(_db_add)
+                if session_id in self._db_listeners:
+                    # The session lives on this worker: deliver now instead of on the next poll
+                    self._db_poll_wakeup.set()
             except Exception as e:
                 logger.error(f"Database error during broadcast: {e}")
 
@@ -812,9 +854,9 @@ class SessionRegistry(SessionBackend):
         This method listens for messages directed to the specified session and
         generates appropriate responses. The listening mechanism depends on the backend:
 
-        - **memory**: Checks the temporary message storage
+        - **memory**: Consumes the session's message queue until the session is removed
         - **redis**: Subscribes to Redis pubsub channel
-        - **database**: Polls database for new messages
+        - **database**: Registers the session with the worker's message poller
 
         When a message is received and the transport exists locally, it processes
         the message and sends the response through the transport.
@@ -839,11 +881,18 @@ class SessionRegistry(SessionBackend):
             pass
 
         elif self._backend == "memory":
-            # if self._session_message:
-            transport = self.get_session_sync(session_id)
-            if transport and self._session_message:
-                message = json.loads(str(self._session_message.get("message")))
-                await self.generate_response(message=message, transport=transport, server_id=server_id, user=user, base_url=base_url)
+            queue = self._session_queues.get(session_id)
+            if queue is None:
+                return
+            while True:
+                message = await queue.get()
+                transport = self.get_session_sync(session_id)
+                if message is _QUEUE_CLOSED or not transport:
+                    break
+                try:
+                    await self.generate_response(message=message, transport=transport, server_id=server_id, user=user, base_url=base_url)
+                except Exception as e:
+                    logger.error(f"Error responding to message for session {session_id}: {e}")
 
         elif self._backend == "redis":
             pubsub = self._redis.pubsub()
@@ -868,150 +917,177 @@ class SessionRegistry(SessionBackend):
                 logger.info(f"Cleaned up pubsub for session {session_id}")
 
         elif self._backend == "database":
+            self._db_listeners[session_id] = {"server_id": server_id, "user": user, "base_url": base_url}
+            if self._db_poll_task is None or self._db_poll_task.done():
+                self._db_poll_task = asyncio.create_task(self._db_message_poller())
+            self._db_poll_wakeup.set()
 
-            def _db_read_session(session_id: str) -> SessionRecord | None:
-                """Check if session still exists in the database.
+    async def _enqueue(self, session_id: str, queue: asyncio.Queue, message: Any) -> None:
+        """Put a message on a session queue, applying the configured overflow policy.
 
-                Queries the SessionRecord table to verify that the session
-                is still active. Used in the message polling loop to determine
-                when to stop checking for messages.
+        ``block`` waits up to ``session_queue_put_timeout`` seconds for room, pushing
+        back on the sender; ``drop_oldest`` evicts the oldest queued message and
+        ``drop_newest`` discards the new one. Dropped messages are counted.
+
+        Args:
+            session_id: Session the queue belongs to.
+            queue: The session's message queue.
+            message: Message to deliver.
 
-                This inner function is designed to be run in a thread executor
-                to avoid blocking the async event loop during database reads.
+        Examples:
+            >>> import asyncio
+            >>> from unittest.mock import patch
+            >>> reg = SessionRegistry(backend='memory')
+            >>> q = asyncio.Queue(maxsize=1)
+            >>> with patch('mcpgateway.cache.session_registry.settings') as s:
+            ...     s.session_queue_overflow = 'drop_oldest'
+            ...     asyncio.run(reg._enqueue('s', q, 'first'))
+            ...     asyncio.run(reg._enqueue('s', q, 'second'))
+            >>> (q.get_nowait(), reg._dropped_messages)
+            ('second', 1)
+        """
+        policy = settings.session_queue_overflow
+        if policy == "block":
+            try:
+                await asyncio.wait_for(queue.put(message), timeout=settings.session_queue_put_timeout)
+                return
+            except asyncio.TimeoutError:
+                pass
+        else:
+            try:
+                queue.put_nowait(message)
+                return
+            except asyncio.QueueFull:
+                if policy == "drop_oldest":
+                    queue.get_nowait()
+                    queue.put_nowait(message)
 
-                Args:
-                    session_id: The session identifier to look up.
+        self._dropped_messages += 1
+        if self._dropped_messages == 1 or self._dropped_messages % 1000 == 0:
+            logger.warning(f"Message queue full for session {session_id} (policy {policy}); {self._dropped_messages} messages dropped so far")
 
-                Returns:
-                    SessionRecord: The session record if found, None otherwise.
+    @staticmethod
+    def _close_queue(queue: Optional[asyncio.Queue]) -> None:
+        """Wake a session's consumer so it exits, discarding undelivered messages if the queue is full.
 
-                Raises:
-                    Exception: Any database error is re-raised after rollback.
+        Args:
+            queue: Queue of a removed session, if it had one.
+        """
+        if queue is None:
+            return
+        while True:
+            try:
+                queue.put_nowait(_QUEUE_CLOSED)
+                return
+            except asyncio.QueueFull:
+                queue.get_nowait()
 
-                Examples:
-                    >>> # This function is called internally by message_check_loop()
-                    >>> # Returns SessionRecord object if session exists
-                    >>> # Returns None if session has been removed
-                """
-                db_session = next(get_db())
-                try:
-                    # Delete sessions that haven't been accessed for TTL seconds
-                    result = db_session.query(SessionRecord).filter_by(session_id=session_id).first()
-                    return result
-                except Exception as ex:
-                    db_session.rollback()
-                    raise ex
-                finally:
-                    db_session.close()
-
-            def _db_read(session_id: str) -> SessionMessageRecord | None:
-                """Read pending message for a session from the database.
-
-                Retrieves the first (oldest) unprocessed message for the given
-                session_id from the SessionMessageRecord table. Messages are
-                processed in FIFO order.
-
-                This inner function is designed to be run in a thread executor
-                to avoid blocking the async event loop during database queries.
-
-                Args:
-                    session_id: The session identifier to read messages for.
-
-                Returns:
-                    SessionMessageRecord: The oldest message record if found, None otherwise.
-
-                Raises:
-                    Exception: Any database error is re-raised after rollback.
-
-                Examples:
-                    >>> # This function is called internally by message_check_loop()
-                    >>> # Returns SessionMessageRecord with message data
-                    >>> # Returns None if no pending messages
-                """
-                db_session = next(get_db())
-                try:
-                    # Delete sessions that haven't been accessed for TTL seconds
-                    result = db_session.query(SessionMessageRecord).filter_by(session_id=session_id).first()
-                    return result
-                except Exception as ex:
-                    db_session.rollback()
-                    raise ex
-                finally:
-                    db_session.close()
-
-            def _db_remove(session_id: str, message: str) -> None:
-                """Remove processed message from the database.
-
-                Deletes a specific message record after it has been successfully
-                processed and sent to the transport. This prevents duplicate
-                message delivery.
-
-                This inner function is designed to be run in a thread executor
-                to avoid blocking the async event loop during database deletes.
-
-                Args:
-                    session_id: The session identifier the message belongs to.
-                    message: The exact message content to remove (must match exactly).
-
-                Raises:
-                    Exception: Any database error is re-raised after rollback.
-
-                Examples:
-                    >>> # This function is called internally after message processing
-                    >>> # Deletes the specific SessionMessageRecord entry
-                    >>> # Log: "Removed message from mcp_messages table"
-                """
-                db_session = next(get_db())
+    def _db_claim_messages(self, session_ids: list[str]) -> tuple[Dict[str, list[str]], set[str]]:
+        """Fetch and delete pending messages for a set of sessions in one transaction.
+
+        Runs in a thread executor. Sessions are queried in chunks so the ``IN`` lists
+        stay bounded; a worker with fewer than 500 listening sessions issues one
+        message query and one liveness query per poll, however many sessions it hosts.
+
+        Args:
+            session_ids: Local sessions awaiting messages.
+
+        Returns:
+            tuple[Dict[str, list[str]], set[str]]: Pending messages per session in
+            arrival order, and the sessions that still exist in the database.
+
+        Raises:
+            Exception: Any database error is re-raised after rollback.
+        """
+        pending: Dict[str, list[str]] = {}
+        alive: set[str] = set()
+        db_session = next(get_db())
+        try:
+            for start in range(0, len(session_ids), 500):
+                chunk = session_ids[start : start + 500]
+                alive.update(db_session.execute(select(SessionRecord.session_id).where(SessionRecord.session_id.in_(chunk))).scalars())
+                rows = db_session.execute(
+                    select(SessionMessageRecord.id, SessionMessageRecord.session_id, SessionMessageRecord.message).where(SessionMessageRecord.session_id.in_(chunk)).order_by(SessionMessageRecord.id)
+                ).all()
+                if rows:
+                    db_session.execute(delete(SessionMessageRecord).where(SessionMessageRecord.id.in_([row.id for row in rows])))
+                for row in rows:
+                    pending.setdefault(row.session_id, []).append(row.message)
+            db_session.commit()
+            return pending, alive
+        except Exception as ex:
+            db_session.rollback()
+            raise ex
+        finally:
+            db_session.close()
+
+    async def _db_message_poller(self) -> None:
+        """Deliver database-backed messages to every local session from a single loop.
+
+        Replaces one polling task per session: each cycle claims the messages of all
+        sessions registered by :meth:`respond`, drops sessions whose record is gone,
+        and hands messages to per-session delivery tasks so a slow response does not
+        hold up other sessions. The poll interval starts at
+        ``session_poll_min_interval`` and doubles while idle up to
+        ``session_poll_max_interval``; a broadcast to a local session wakes the poller
+        immediately.
+        """
+        interval = settings.session_poll_min_interval
+        while True:
+            if not self._db_listeners:
+                self._db_poll_wakeup.clear()
+                await self._db_poll_wakeup.wait()
+                interval = settings.session_poll_min_interval
+                continue
+
+            self._db_poll_wakeup.clear()
+            session_ids = list(self._db_listeners)
+            try:
+                pending, alive = await asyncio.to_thread(self._db_claim_messages, session_ids)
+            except Exception as e:
+                logger.error(f"Database error polling session messages: {e}")
+                pending, alive = {}, set(session_ids)
+
+            for session_id in session_ids:
+                if session_id not in alive:
+                    self._db_listeners.pop(session_id, None)
+            for session_id, messages in pending.items():
+                self._db_deliver(session_id, messages)
+
+            interval = settings.session_poll_min_interval if pending else min(interval * 2, settings.session_poll_max_interval)
+            try:
+                await asyncio.wait_for(self._db_poll_wakeup.wait(), timeout=interval)
+                interval = settings.session_poll_min_interval
+            except asyncio.TimeoutError:
+                pass
+
+    def _db_deliver(self, session_id: str, messages: list[str]) -> None:
+        """Schedule delivery of claimed messages, after any earlier delivery for the session.
+
+        Args:
+            session_id: Session the messages belong to.
+            messages: Serialized messages in arrival order.
+        """
+        previous = self._db_deliveries.get(session_id)
+
+        async def _deliver() -> None:
+            """Generate responses for the messages in order."""
+            if previous and not previous.done():
+                await asyncio.wait([previous])
+            for raw in messages:
+                listener = self._db_listeners.get(session_id)
+                transport = self.get_session_sync(session_id)
+                if not listener or not transport:
+                    return
+                logger.info("Ready to respond")
                 try:
-                    db_session.query(SessionMessageRecord).filter(SessionMessageRecord.session_id == session_id).filter(SessionMessageRecord.message == message).delete()
-                    db_session.commit()
-                    logger.info("Removed message from mcp_messages table")
-                except Exception as ex:
-                    db_session.rollback()
-                    raise ex
-                finally:
-                    db_session.close()
-
-            async def message_check_loop(session_id: str) -> None:
-                """Poll database for messages and deliver to local transport.
-
-                Continuously checks the database for new messages directed to
-                the specified session_id. When messages are found and the
-                transport exists locally, delivers the message and removes it
-                from the database. Exits when the session no longer exists.
-
-                This coroutine runs as a background task for each active session
-                using database backend, enabling message delivery across worker
-                processes.
-
-                Args:
-                    session_id: The session identifier to monitor for messages.
-
-                Examples:
-                    >>> # This function is called as a task by respond()
-                    >>> # asyncio.create_task(message_check_loop('abc123'))
-                    >>> # Polls every 0.1 seconds until session is removed
-                    >>> # Delivers messages to transport and cleans up database
-                """
-                while True:
-                    record = await asyncio.to_thread(_db_read, session_id)
-
-                    if record:
-                        message = json.loads(record.message)
-                        transport = self.get_session_sync(session_id)
-                        if transport:
-                            logger.info("Ready to respond")
-                            await self.generate_response(message=message, transport=transport, server_id=server_id, user=user, base_url=base_url)
-
-                            await asyncio.to_thread(_db_remove, session_id, record.message)
-
-                    session_exists = await asyncio.to_thread(_db_read_session, session_id)
-                    if not session_exists:
-                        break
-
-                    await asyncio.sleep(0.1)
-
-            asyncio.create_task(message_check_loop(session_id))
+                    await self.generate_response(message=json.loads(raw), transport=transport, **listener)
+                except Exception as e:
+                    logger.error(f"Error responding to message for session {session_id}: {e}")
+
+        task = asyncio.create_task(_deliver())
+        self._db_deliveries[session_id] = task
+        task.add_done_callback(lambda done: self._db_deliveries.pop(session_id, None) if self._db_deliveries.get(session_id) is done else None)
 
     async def _refresh_redis_sessions(self) -> None:
         """Refresh TTLs for Redis sessions and clean up disconnected sessions.
@@ -1322,10 +1398,13 @@ class SessionRegistry(SessionBackend):
 
         Processes MCP protocol messages and generates appropriate responses based on
         the method. Supports various MCP methods including initialization, tool/resource/prompt
-        listing, tool invocation, and ping.
+        listing, tool invocation, and ping. Messages are dispatched in-process when an RPC
+        dispatcher is registered (see ``set_rpc_dispatcher``), otherwise they are forwarded
+        to the gateway's ``/rpc`` endpoint.
 
         Args:
-            message: Incoming MCP message as JSON. Must contain 'method' and 'id' fields.
+            message: Incoming MCP message as JSON. Must contain 'method' and 'id' fields,
+                or be a JSON-RPC batch (handled only by the in-process dispatcher).
             transport: SSE transport to send responses through.
             server_id: Optional server ID for scoped operations.
             user: User information containing authentication token.
@@ -1348,6 +1427,18 @@ class SessionRegistry(SessionBackend):
         """
         result = {}
 
+        if isinstance(message, list) and self._rpc_dispatcher is not None:
+            # JSON-RPC batch: scope every request to this server and dispatch them together
+            batch = [{**item, "params": {**(item.get("params") or {}), "server_id": server_id}} if isinstance(item, dict) and "method" in item else item for item in message]
+            try:
+                response = await self._rpc_dispatcher(batch, user)
+            except Exception as e:
+                logger.error(f"SSE RPC: Exception during in-process batch dispatch: {type(e).__name__}: {e}")
+                response = {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Internal error", "data": str(e)}, "id": None}
+            if response is not None:
+                await transport.send_message(response)
+            return
+
         if "method" in message and "id" in message:
             method = message["method"]
             params = message.get("params", {})
@@ -1360,6 +1451,17 @@ class SessionRegistry(SessionBackend):
                 "params": params,
                 "id": req_id,
             }
+            if self._rpc_dispatcher is not None:
+                try:
+                    response = await self._rpc_dispatcher(rpc_input, user)
+                except Exception as e:
+                    logger.error(f"SSE RPC: Exception during in-process dispatch: {type(e).__name__}: {e}")
+                    response = {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Internal error", "data": str(e)}, "id": req_id}
+                logging.debug(f"Sending sse message:{response}")
+                await transport.send_message(response)
+                await self._send_initialize_notifications(message, transport)
+                return
+
             # Get the token from the current authentication context
             # The user object doesn't contain the token directly, we need to reconstruct it
             # Since we don't have access to the original headers here, we need a different approach
@@ -1434,25 +1536,34 @@ class SessionRegistry(SessionBackend):
 
             logging.debug(f"Sending sse message:{response}")
             await transport.send_message(response)
+            await self._send_initialize_notifications(message, transport)
 
-            if message["method"] == "initialize":
-                await transport.send_message(
-                    {
-                        "jsonrpc": "2.0",
-                        "method": "notifications/initialized",
-                        "params": {},
-                    }
-                )
-                notifications = [
-                    "tools/list_changed",
-                    "resources/list_changed",
-                    "prompts/list_changed",
-                ]
-                for notification in notifications:
-                    await transport.send_message(
-                        {
-                            "jsonrpc": "2.0",
-                            "method": f"notifications/{notification}",
-                            "params": {},
-                        }
-                    )
+    async def _send_initialize_notifications(self, message: Dict[str, Any], transport: SSETransport) -> None:
+        """Follow an ``initialize`` response with the initialized and list-changed notifications.
+
+        Args:
+            message: The MCP message that was just answered.
+            transport: SSE transport to send notifications through.
+        """
+        if message["method"] != "initialize":
+            return
+        await transport.send_message(
+            {
+                "jsonrpc": "2.0",
+                "method": "notifications/initialized",
+                "params": {},
+            }
+        )
+        notifications = [
+            "tools/list_changed",
+            "resources/list_changed",
+            "prompts/list_changed",
+        ]
+        for notification in notifications:
+            await transport.send_message(
+                {
+                    "jsonrpc": "2.0",
+                    "method": f"notifications/{notification}",
+                    "params": {},
+                }
+            )
@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/tool_lookup_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tool Lookup Cache.
+Every ``tools/call`` resolves the tool by name, re-selects its gateway, decrypts
+credentials and, when plugins are enabled, validates both rows into plugin
+metadata models. None of that changes between calls, so this module keeps a
+detached snapshot of the resolved tool per name:
+
+- ``ResolvedTool`` / ``ResolvedGateway`` hold the columns the invoke path reads,
+  plus the decrypted auth headers and plugin metadata once computed.
+- Tool events drop the entry for that tool id; gateway events drop every tool
+  behind that gateway. With ``cache_type=redis`` the invalidation is published
+  so every worker drops them.
+- ``tool_lookup_cache_ttl`` bounds staleness for changes made outside the
+  services (for example direct database edits).
+
+Examples:
+    >>> cache = ToolLookupCache(max_size=10, ttl=60)
+    >>> tool = ResolvedTool(id="t1", name="echo", gateway_id="g1")
+    >>> cache.put("echo", tool)
+    >>> cache.get("echo") is tool
+    True
+    >>> cache.invalidate_local("gateway", "g1")
+    1
+    >>> cache.get("echo") is None
+    True
+"""
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+from typing import Any, Dict, List, Optional, Set
+
+# First-Party
+from mcpgateway.cache.invalidation import InvalidationChannel
+from mcpgateway.config import settings
+
+
+@dataclass
+class ResolvedGateway:
+    """Detached copy of the gateway columns used to invoke a tool.
+
+    Attributes:
+        id: Gateway id
+        name: Gateway name
+        url: Upstream MCP server URL
+        enabled: Whether the gateway is enabled
+        auth_type: Gateway auth type
+        auth_value: Encrypted gateway credentials
+        oauth_config: OAuth configuration, if any
+        passthrough_headers: Gateway-specific passthrough header allowlist
+        ca_certificate: Custom CA certificate (PEM)
+        ca_certificate_sig: Signature over the CA certificate
+        auth_headers: Decrypted credentials, filled on first use
+    """
+
+    id: Optional[str] = None
+    name: Optional[str] = None
+    url: Optional[str] = None
+    enabled: bool = True
+    auth_type: Optional[str] = None
+    auth_value: Any = None
+    oauth_config: Optional[Dict[str, Any]] = None
+    passthrough_headers: Optional[List[str]] = None
+    ca_certificate: Optional[str] = None
+    ca_certificate_sig: Optional[str] = None
+    auth_headers: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_db(cls, gateway: Any) -> "ResolvedGateway":
+        """Copy a gateway row.
+
+        Args:
+            gateway: ORM gateway (or any object with the same attributes)
+
+        Returns:
+            ResolvedGateway: Detached snapshot.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> ResolvedGateway.from_db(SimpleNamespace(id="g1", name="gw", url="http://gw/mcp")).url
+            'http://gw/mcp'
+        """
+        return cls(
+            id=getattr(gateway, "id", None),
+            name=getattr(gateway, "name", None),
+            url=getattr(gateway, "url", None),
+            enabled=getattr(gateway, "enabled", True),
+            auth_type=getattr(gateway, "auth_type", None),
+            auth_value=getattr(gateway, "auth_value", None),
+            oauth_config=getattr(gateway, "oauth_config", None),
+            passthrough_headers=getattr(gateway, "passthrough_headers", None),
+            ca_certificate=getattr(gateway, "ca_certificate", None),
+            ca_certificate_sig=getattr(gateway, "ca_certificate_sig", None),
+        )
+
+
+@dataclass
+class ResolvedTool:
+    """Detached copy of a tool, its gateway and derived invocation state.
+
+    Attributes:
+        id: Tool id
+        name: Tool name as called by clients
+        original_name: Tool name on the upstream server
+        gateway_id: Owning gateway id, if federated
+        integration_type: ``REST``, ``MCP`` or ``A2A``
+        request_type: HTTP method or MCP transport
+        url: REST endpoint URL
+        headers: Static request headers
+        auth_type: Tool auth type
+        auth_value: Encrypted tool credentials
+        oauth_config: OAuth configuration, if any
+        annotations: Tool annotations
+        jsonpath_filter: Response filter
+        output_schema: Output schema for structured content validation
+        reachable: Whether the tool is reachable
+        gateway: The tool's gateway (used for credentials and TLS settings)
+        upstream: The tool's gateway if enabled (used for the URL and plugin metadata)
+        auth_headers: Decrypted tool credentials, filled on first use
+        tool_metadata: Plugin metadata model for the tool, filled on first use
+        gateway_metadata: Plugin metadata model for the gateway, filled on first use
+    """
+
+    id: Any = None
+    name: Optional[str] = None
+    original_name: Optional[str] = None
+    gateway_id: Optional[str] = None
+    integration_type: Optional[str] = None
+    request_type: Optional[str] = None
+    url: Optional[str] = None
+    headers: Optional[Dict[str, str]] = None
+    auth_type: Optional[str] = None
+    auth_value: Any = None
+    oauth_config: Optional[Dict[str, Any]] = None
+    annotations: Optional[Dict[str, Any]] = None
+    jsonpath_filter: Optional[str] = None
+    output_schema: Optional[Dict[str, Any]] = None
+    reachable: bool = True
+    gateway: Optional[ResolvedGateway] = None
+    upstream: Optional[ResolvedGateway] = None
+    auth_headers: Optional[Dict[str, str]] = None
+    tool_metadata: Any = None
+    gateway_metadata: Any = None
+
+    @classmethod
+    def from_db(cls, tool: Any, upstream: Any = None) -> "ResolvedTool":
+        """Copy a tool row and its gateways.
+
+        Args:
+            tool: ORM tool
+            upstream: The tool's gateway row if it is enabled, else None
+
+        Returns:
+            ResolvedTool: Detached snapshot.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> gw = SimpleNamespace(id="g1", url="http://gw/mcp")
+            >>> resolved = ResolvedTool.from_db(SimpleNamespace(id="t1", name="echo", gateway=gw, headers={"X": "1"}), upstream=gw)
+            >>> resolved.gateway is resolved.upstream
+            True
+            >>> resolved.headers
+            {'X': '1'}
+        """
+        gateway = getattr(tool, "gateway", None)
+        resolved_gateway = ResolvedGateway.from_db(gateway) if gateway is not None else None
+        if upstream is None:
+            resolved_upstream = None
+        elif upstream is gateway:
+            resolved_upstream = resolved_gateway
+        else:
+            resolved_upstream = ResolvedGateway.from_db(upstream)
+        return cls(
+            id=getattr(tool, "id", None),
+            name=getattr(tool, "name", None),
+            original_name=getattr(tool, "original_name", None),
+            gateway_id=getattr(tool, "gateway_id", None),
+            integration_type=getattr(tool, "integration_type", None),
+            request_type=getattr(tool, "request_type", None),
+            url=getattr(tool, "url", None),
+            headers=dict(getattr(tool, "headers", None) or {}),
+            auth_type=getattr(tool, "auth_type", None),
+            auth_value=getattr(tool, "auth_value", None),
+            oauth_config=getattr(tool, "oauth_config", None),
+            annotations=getattr(tool, "annotations", None),
+            jsonpath_filter=getattr(tool, "jsonpath_filter", None),
+            output_schema=getattr(tool, "output_schema", None),
+            reachable=getattr(tool, "reachable", True),
+            gateway=resolved_gateway,
+            upstream=resolved_upstream,
+        )
+
+
+@dataclass
+class _Entry:
+    """Cached tool and its expiry."""
+
+    tool: ResolvedTool
+    expires_at: float
+    keys: Dict[str, str] = field(default_factory=dict)
+
+
+class ToolLookupCache:
+    """
+    Bounded TTL cache of resolved tools keyed by tool name.
+
+    Secondary indexes by tool id and gateway id let catalog events drop exactly
+    the affected entries.
+
+    Attributes:
+        max_size: Maximum number of cached tools
+        ttl: Seconds a resolved tool is reused
+
+    Examples:
+        >>> cache = ToolLookupCache(max_size=1, ttl=60)
+        >>> cache.put("a", ResolvedTool(id="1"))
+        >>> cache.put("b", ResolvedTool(id="2"))
+        >>> cache.get("a") is None
+        True
+        >>> cache.stats()["evictions"]
+        1
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (defaults to ``tool_lookup_cache_max_size``)
+            ttl: Seconds an entry is reused (defaults to ``tool_lookup_cache_ttl``)
+        """
+        self.max_size = max_size if max_size is not None else settings.tool_lookup_cache_max_size
+        self.ttl = ttl if ttl is not None else settings.tool_lookup_cache_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._index: Dict[str, Dict[str, Set[str]]] = {"tool": {}, "gateway": {}}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._channel = InvalidationChannel("tool_lookup_invalidate", self.invalidate_local)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether resolved tools are cached.
+
+        Returns:
+            bool: True when caching is enabled and the TTL is positive.
+
+        Examples:
+            >>> ToolLookupCache(ttl=0).enabled
+            False
+        """
+        return settings.tool_lookup_cache_enabled and self.ttl > 0
+
+    def get(self, name: str) -> Optional[ResolvedTool]:
+        """Return the cached tool for a name, if still valid.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Optional[ResolvedTool]: The resolved tool, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(name)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                self._remove(name)
+            self._misses += 1
+            return None
+        self._entries.move_to_end(name)
+        self._hits += 1
+        return entry.tool
+
+    def put(self, name: str, tool: ResolvedTool) -> None:
+        """Cache a resolved tool.
+
+        Args:
+            name: Tool name it was resolved from
+            tool: Resolved tool
+        """
+        if not self.enabled:
+            return
+        self._remove(name)
+        keys = {"tool": str(tool.id)}
+        if tool.gateway_id:
+            keys["gateway"] = str(tool.gateway_id)
+        self._entries[name] = _Entry(tool=tool, expires_at=time.time() + self.ttl, keys=keys)
+        for kind, value in keys.items():
+            self._index[kind].setdefault(value, set()).add(name)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, name: str) -> None:
+        """Drop one entry and its index references.
+
+        Args:
+            name: Tool name
+        """
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+        for kind, value in entry.keys.items():
+            names = self._index[kind].get(value)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._index[kind][value]
+
+    def invalidate_local(self, kind: str, value: Optional[str] = None) -> int:
+        """Drop entries in this process only.
+
+        Args:
+            kind: ``"tool"`` (by tool id), ``"gateway"`` (by gateway id) or ``"all"``
+            value: Tool or gateway id (ignored for ``"all"``)
+
+        Returns:
+            int: Number of entries dropped.
+
+        Examples:
+            >>> cache = ToolLookupCache(ttl=60)
+            >>> cache.put("a", ResolvedTool(id=1))
+            >>> cache.invalidate_local("tool", "1")
+            1
+            >>> cache.invalidate_local("all")
+            0
+        """
+        if kind == "all":
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._index = {"tool": {}, "gateway": {}}
+        else:
+            names = list(self._index.get(kind, {}).get(str(value), ()))
+            for name in names:
+                self._remove(name)
+            dropped = len(names)
+        self._invalidations += dropped
+        return dropped
+
+    async def invalidate_tool(self, tool_id: Any) -> None:
+        """Drop a changed tool on every worker.
+
+        Args:
+            tool_id: Tool id
+        """
+        self.invalidate_local("tool", str(tool_id))
+        await self._channel.publish("tool", str(tool_id))
+
+    async def invalidate_gateway(self, gateway_id: Any) -> None:
+        """Drop every tool behind a changed gateway on every worker.
+
+        Args:
+            gateway_id: Gateway id
+        """
+        self.invalidate_local("gateway", str(gateway_id))
+        await self._channel.publish("gateway", str(gateway_id))
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations when the Redis cache backend is configured."""
+        if self.enabled:
+            await self._channel.start()
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and close Redis connections."""
+        await self._channel.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, evictions, invalidations and size.
+
+        Examples:
+            >>> ToolLookupCache(ttl=60).stats()["size"]
+            0
+        """
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "cross_worker": self._channel.active,
+        }
+
+
+_tool_lookup_cache: Optional[ToolLookupCache] = None
+
+
+def get_tool_lookup_cache() -> ToolLookupCache:
+    """Get the global ToolLookupCache singleton instance.
+
+    Returns:
+        The global ToolLookupCache instance
+
+    Examples:
+        >>> get_tool_lookup_cache() is get_tool_lookup_cache()
+        True
+    """
+    global _tool_lookup_cache  # pylint: disable=global-statement
+    if _tool_lookup_cache is None:
+        _tool_lookup_cache = ToolLookupCache()
+    return _tool_lookup_cache
+
+
+def set_tool_lookup_cache(cache: Optional[ToolLookupCache]) -> None:
+    """Set the global ToolLookupCache instance.
+
+    This is primarily used for testing to inject a fresh cache.
+
+    Args:
+        cache: The ToolLookupCache instance to use globally
+    """
+    global _tool_lookup_cache  # pylint: disable=global-statement
+    _tool_lookup_cache = cache
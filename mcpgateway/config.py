@@ -180,6 +180,19 @@ class Settings(BaseSettings):
 
     require_token_expiration: bool = Field(default=False, description="Require all JWT tokens to have expiration claims")  # Default to flexible mode for backward compatibility
 
+    # Authentication decision cache
+    auth_cache_enabled: bool = Field(default=True, description="Cache successful token verifications keyed by token digest")
+    auth_cache_ttl: float = Field(default=30.0, ge=0, description="Seconds a cached authentication decision is reused (never beyond token expiry); API token last_used can lag by this long")
+    auth_cache_max_size: int = Field(default=10000, ge=1, description="Maximum number of cached authentication decisions")
+
+    # RBAC permission cache and audit
+    permission_cache_enabled: bool = Field(default=True, description="Share resolved role permissions, admin flags and team roles between requests")
+    permission_cache_ttl: float = Field(default=60.0, ge=0, description="Seconds a resolved RBAC lookup is reused; role, assignment and membership changes invalidate it immediately")
+    permission_cache_max_size: int = Field(default=10000, ge=1, description="Maximum number of cached RBAC lookups per worker")
+    permission_audit_buffer_enabled: bool = Field(default=True, description="Write permission audit records in background batches instead of committing on the request path")
+    permission_audit_buffer_max_size: int = Field(default=10000, ge=1, description="Maximum queued permission audit records per worker; records beyond this are dropped and counted")
+    permission_audit_flush_interval: float = Field(default=2.0, gt=0, description="Maximum seconds a queued permission audit record waits before being flushed")
+
     # SSO Configuration
     sso_enabled: bool = Field(default=False, description="Enable Single Sign-On authentication")
     sso_github_enabled: bool = Field(default=False, description="Enable GitHub OAuth authentication")
@@ -253,6 +266,8 @@ class Settings(BaseSettings):
     oauth_request_timeout: int = Field(default=30, description="OAuth request timeout in seconds")
     oauth_max_retries: int = Field(default=3, description="Maximum retries for OAuth token requests")
     oauth_default_timeout: int = Field(default=3600, description="Default OAuth token timeout in seconds")
+    oauth_token_cache_enabled: bool = Field(default=True, description="Cache client-credentials and password-grant access tokens until shortly before expiry")
+    oauth_token_expiry_margin: float = Field(default=60.0, ge=0, description="Seconds before expires_in at which a cached OAuth access token is no longer used")
 
     # ===================================
     # Dynamic Client Registration (DCR) - Client Mode
@@ -298,6 +313,9 @@ class Settings(BaseSettings):
     argon2id_time_cost: int = Field(default=3, description="Argon2id time cost (number of iterations)")
     argon2id_memory_cost: int = Field(default=65536, description="Argon2id memory cost in KiB")
     argon2id_parallelism: int = Field(default=1, description="Argon2id parallelism (number of threads)")
+    encryption_key_cache_size: int = Field(default=256, ge=0, description="Derived encryption keys kept in memory so repeat decrypts skip Argon2id (0 disables)")
+    encryption_kdf_executor: Literal["thread", "process"] = Field(default="thread", description="Pool used by async encrypt/decrypt to run Argon2id off the event loop")
+    encryption_kdf_max_concurrency: int = Field(default=4, ge=1, description="Maximum concurrent Argon2id derivations (bounds memory to this times ARGON2ID_MEMORY_COST)")
 
     # Password Policy Configuration
     password_min_length: int = Field(default=8, description="Minimum password length")
@@ -759,6 +777,21 @@ class Settings(BaseSettings):
     # Enable span events
     observability_events_enabled: bool = Field(default=True, description="Enable event logging within spans")
 
+    # Buffered trace export (traces are written in bulk by a background task)
+    observability_buffer_enabled: bool = Field(default=True, description="Buffer traces in memory and export them in bulk from a background task")
+    observability_buffer_max_spans: int = Field(default=10000, ge=100, description="Maximum traces, spans and events held in memory before new ones are dropped")
+    observability_export_batch_size: int = Field(default=200, ge=1, description="Maximum traces written per export transaction")
+    observability_export_interval: float = Field(default=2.0, gt=0, description="Seconds between trace exports")
+
+    # Tail sampling of completed traces (errors and slow traces are always kept)
+    observability_tail_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Fraction of successful, fast completed traces to keep (0.0-1.0)")
+    observability_tail_latency_threshold_ms: float = Field(default=1000.0, ge=0.0, description="Completed traces at least this slow are always kept by tail sampling")
+
+    # Latency quantile sketches backing the percentile and time-series dashboards
+    observability_latency_sketches_enabled: bool = Field(default=True, description="Keep per-bucket latency sketches of completed traces and serve percentile dashboards from them")
+    observability_sketch_bucket_seconds: int = Field(default=300, ge=60, description="Width in seconds of a latency sketch time bucket")
+    observability_sketch_flush_interval: float = Field(default=60.0, gt=0, description="Seconds between writes of closed latency sketch buckets")
+
     @field_validator("log_level", mode="before")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -791,6 +824,8 @@ class Settings(BaseSettings):
     sse_retry_timeout: int = 5000  # milliseconds
     sse_keepalive_enabled: bool = True  # Enable SSE keepalive events
     sse_keepalive_interval: int = 30  # seconds between keepalive events
+    rpc_batch_max_size: int = Field(default=100, ge=1, description="Maximum number of calls accepted in one JSON-RPC batch")
+    rpc_batch_concurrency: int = Field(default=10, ge=1, description="Maximum calls of one JSON-RPC batch executed at the same time")
 
     # Federation
     federation_enabled: bool = True
@@ -914,16 +949,50 @@ class Settings(BaseSettings):
     max_tool_retries: int = 3
     tool_rate_limit: int = 100  # requests per minute
     tool_concurrent_limit: int = 10
+    tool_lookup_cache_enabled: bool = Field(default=True, description="Cache resolved tools, gateways and decrypted credentials for tools/call")
+    tool_lookup_cache_ttl: float = Field(default=60.0, ge=0, description="Seconds a resolved tool is reused; catalog changes invalidate it immediately")
+    tool_lookup_cache_max_size: int = Field(default=5000, ge=1, description="Maximum number of resolved tools kept per worker")
+
+    # Upstream MCP client session pooling (tools/call against MCP gateways)
+    mcp_session_pool_enabled: bool = Field(default=False, description="Reuse initialized upstream MCP client sessions across tool invocations")
+    mcp_session_pool_max_sessions: int = Field(default=100, ge=1, description="Maximum number of pooled upstream MCP sessions per worker")
+    mcp_session_pool_idle_timeout: float = Field(default=300.0, gt=0, description="Seconds an unused pooled session is kept before eviction")
+    mcp_session_pool_max_lifetime: float = Field(default=3600.0, gt=0, description="Seconds after which an idle pooled session is recycled")
+    mcp_session_pool_health_check_interval: float = Field(default=60.0, gt=0, description="Seconds between pool maintenance sweeps and ping health checks")
+    mcp_session_pool_connect_timeout: float = Field(default=30.0, gt=0, description="Seconds allowed to connect and initialize a pooled session")
+
+    # Execution metric rollups (pre-aggregated tool/resource/prompt/server/A2A metrics)
+    metrics_raw_retention_days: int = Field(default=0, ge=0, description="Days to keep raw per-invocation metric rows; totals stay in the rollups (0 keeps them forever)")
+    metrics_compaction_interval: int = Field(default=3600, ge=60, description="Seconds between metric compaction runs")
+
+    # Asynchronous batched writes of invocation metrics
+    metrics_buffer_enabled: bool = Field(default=True, description="Queue invocation metrics in memory and write them in background batches instead of committing on the request path")
+    metrics_buffer_max_size: int = Field(default=10000, ge=1, description="Maximum queued metric records per worker; records beyond this are dropped and counted")
+    metrics_buffer_batch_size: int = Field(default=500, ge=1, description="Number of queued metric records that triggers an immediate flush")
+    metrics_buffer_flush_interval: float = Field(default=2.0, gt=0, description="Maximum seconds a queued metric record waits before being flushed")
 
     # Prompts
     prompt_cache_size: int = 100
     max_prompt_size: int = 100 * 1024  # 100KB
     prompt_render_timeout: int = 10  # seconds
 
+    # Completion (completion/complete)
+    completion_index_enabled: bool = Field(default=True, description="Answer completion/complete from an in-memory index of resource URIs and prompt argument values")
+    completion_index_ttl: float = Field(default=60.0, ge=0, description="Seconds indexed completion sources are reused; resource and prompt changes update them immediately")
+
+    # Catalog list snapshots (tools/list, resources/list, prompts/list)
+    catalog_snapshot_enabled: bool = Field(default=True, description="Serve MCP list methods from cached, pre-serialized snapshots with ETags")
+    catalog_snapshot_ttl: float = Field(default=60.0, ge=0, description="Seconds a list snapshot is reused; catalog changes invalidate it at once, metrics refresh within this window")
+    catalog_snapshot_max_entries: int = Field(default=1000, ge=1, description="Maximum number of cached list pages per worker")
+
     # Health Checks
     health_check_interval: int = 60  # seconds
     health_check_timeout: int = 10  # seconds
     unhealthy_threshold: int = 5  # after this many failures, mark as Offline
+    health_check_concurrency: int = Field(default=10, ge=1, description="Maximum gateways health-checked at the same time")
+    health_check_max_interval: int = Field(default=300, ge=1, description="Longest interval (secs) a consistently healthy gateway backs off to")
+    health_check_min_interval: int = Field(default=15, ge=1, description="Interval (secs) used right after a gateway's health status changes")
+    health_check_jitter: float = Field(default=0.1, ge=0, le=0.5, description="Random +/- fraction applied to each gateway's next check time")
 
     # Validation Gateway URL
     gateway_validation_timeout: int = 5  # seconds
@@ -949,12 +1018,31 @@ class Settings(BaseSettings):
     cache_prefix: str = "mcpgw:"
     session_ttl: int = 3600
     message_ttl: int = 600
+    session_poll_min_interval: float = Field(default=0.1, gt=0, description="Fastest poll interval (secs) for database-backed session messages, used while messages are flowing")
+    session_poll_max_interval: float = Field(default=2.0, gt=0, description="Slowest poll interval (secs) the database session message poller backs off to when idle")
+    session_queue_maxsize: int = Field(default=1000, ge=1, description="Maximum queued messages per session with the memory cache backend")
+    session_queue_overflow: Literal["block", "drop_oldest", "drop_newest"] = Field(default="block", description="What broadcast does when a memory-backend session queue is full")
+    session_queue_put_timeout: float = Field(default=5.0, gt=0, description="Seconds a blocking broadcast waits for queue space before dropping the message")
+    event_queue_maxsize: int = Field(default=1000, ge=1, description="Maximum pending events per admin UI / event stream subscriber")
+    event_queue_overflow: Literal["drop_oldest", "drop_newest", "coalesce"] = Field(
+        default="coalesce", description="What happens when an event subscriber falls behind: coalesce updates to the same entity, then drop the oldest event"
+    )
     redis_max_retries: int = 3
     redis_retry_interval_ms: int = 2000
 
     # streamable http transport
     use_stateful_sessions: bool = False  # Set to False to use stateless sessions without event store
     json_response_enabled: bool = True  # Enable JSON responses instead of SSE streams
+    streamable_http_event_store: Literal["auto", "memory", "redis", "database"] = Field(
+        default="auto", description="Event store used for stateful session resumability; 'auto' follows cache_type so replay works across workers"
+    )
+    streamable_http_max_events_per_stream: int = Field(default=100, ge=1, description="Maximum events retained per stream for Last-Event-ID replay")
+    streamable_http_event_ttl: int = Field(default=3600, ge=1, description="Seconds stored stream events are kept for replay")
+
+    # Reverse proxy sessions
+    reverse_proxy_request_timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a reverse proxy session to answer a forwarded request")
+    reverse_proxy_max_inflight: int = Field(default=32, ge=1, description="Maximum requests awaiting a response per reverse proxy session")
+    reverse_proxy_session_ttl: int = Field(default=60, ge=10, description="Seconds a worker's claim on a reverse proxy session lasts in Redis without being refreshed")
 
     # Core plugin settings
     plugins_enabled: bool = Field(default=False, description="Enable the plugin framework")
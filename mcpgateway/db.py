@@ -29,7 +29,29 @@ import uuid
 
 # Third-Party
 import jsonschema
-from sqlalchemy import Boolean, Column, create_engine, DateTime, event, Float, ForeignKey, func, Index, Integer, JSON, make_url, MetaData, select, String, Table, Text, UniqueConstraint, VARCHAR
+from sqlalchemy import (
+    Boolean,
+    Column,
+    create_engine,
+    DateTime,
+    delete,
+    event,
+    Float,
+    ForeignKey,
+    func,
+    Index,
+    insert,
+    Integer,
+    JSON,
+    make_url,
+    MetaData,
+    select,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    VARCHAR,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.event import listen
 from sqlalchemy.exc import SQLAlchemyError
@@ -1596,6 +1618,112 @@ class A2AAgentMetric(Base):
     a2a_agent: Mapped["A2AAgent"] = relationship("A2AAgent", back_populates="metrics")
 
 
+class MetricRollupMixin:
+    """
+    Columns and derived values shared by the per-entity metric rollup tables.
+
+    A rollup row holds the running aggregate of every raw metric recorded for one
+    entity. It is updated in the same transaction as the raw metric insert, so read
+    paths can report totals without scanning the raw metric tables, and raw rows can
+    be compacted without losing lifetime totals.
+
+    Examples:
+        >>> rollup = ToolMetricRollup(tool_id="t1", total_executions=4, successful_executions=3, failed_executions=1, total_response_time=2.0)
+        >>> rollup.failure_rate
+        0.25
+        >>> rollup.avg_response_time
+        0.5
+        >>> ToolMetricRollup(tool_id="t2").summary()["total_executions"]
+        0
+    """
+
+    total_executions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    successful_executions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_executions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_response_time: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    last_execution_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
+
+    @property
+    def failure_rate(self) -> float:
+        """Failed executions divided by total executions, or 0.0 when there are none.
+
+        Returns:
+            float: The failure rate as a value between 0 and 1.
+        """
+        total = self.total_executions or 0
+        return (self.failed_executions or 0) / total if total else 0.0
+
+    @property
+    def avg_response_time(self) -> Optional[float]:
+        """Mean response time, or None when there are no executions.
+
+        Returns:
+            Optional[float]: The average response time in seconds.
+        """
+        total = self.total_executions or 0
+        return (self.total_response_time or 0.0) / total if total else None
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the rollup in the shape used by the ``*Metrics`` schemas.
+
+        Returns:
+            Dict[str, Any]: Aggregated metrics for the entity.
+        """
+        return {
+            "total_executions": self.total_executions or 0,
+            "successful_executions": self.successful_executions or 0,
+            "failed_executions": self.failed_executions or 0,
+            "failure_rate": self.failure_rate,
+            "min_response_time": self.min_response_time,
+            "max_response_time": self.max_response_time,
+            "avg_response_time": self.avg_response_time,
+            "last_execution_time": self.last_execution_time,
+        }
+
+
+class ToolMetricRollup(MetricRollupMixin, Base):
+    """Running aggregate of ToolMetric rows for a single tool."""
+
+    __tablename__ = "tool_metric_rollups"
+
+    tool_id: Mapped[str] = mapped_column(String(36), ForeignKey("tools.id", ondelete="CASCADE"), primary_key=True)
+
+
+class ResourceMetricRollup(MetricRollupMixin, Base):
+    """Running aggregate of ResourceMetric rows for a single resource."""
+
+    __tablename__ = "resource_metric_rollups"
+
+    resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id", ondelete="CASCADE"), primary_key=True)
+
+
+class ServerMetricRollup(MetricRollupMixin, Base):
+    """Running aggregate of ServerMetric rows for a single server."""
+
+    __tablename__ = "server_metric_rollups"
+
+    server_id: Mapped[str] = mapped_column(String(36), ForeignKey("servers.id", ondelete="CASCADE"), primary_key=True)
+
+
+class PromptMetricRollup(MetricRollupMixin, Base):
+    """Running aggregate of PromptMetric rows for a single prompt."""
+
+    __tablename__ = "prompt_metric_rollups"
+
+    prompt_id: Mapped[int] = mapped_column(Integer, ForeignKey("prompts.id", ondelete="CASCADE"), primary_key=True)
+
+
+class A2AAgentMetricRollup(MetricRollupMixin, Base):
+    """Running aggregate of A2AAgentMetric rows for a single A2A agent."""
+
+    __tablename__ = "a2a_agent_metric_rollups"
+
+    a2a_agent_id: Mapped[str] = mapped_column(String(36), ForeignKey("a2a_agents.id", ondelete="CASCADE"), primary_key=True)
+
+
 # ===================================
 # Observability Models (OpenTelemetry-style traces, spans, events)
 # ===================================
@@ -1849,6 +1977,42 @@ class ObservabilityMetric(Base):
     )
 
 
+class ObservabilityLatencySketch(Base):
+    """
+    ORM model for a serialized latency quantile sketch of one time bucket.
+
+    Each worker writes one row per entity and closed bucket
+    (``observability_sketch_bucket_seconds`` wide); rows are insert-only and are
+    merged at query time, so a bucket may have several rows.
+
+    Attributes:
+        id (int): Auto-incrementing primary key.
+        entity_type (str): What the sketch covers (``trace`` for HTTP request traces).
+        entity_id (str): Entity identifier, ``*`` for the aggregate over all entities.
+        bucket_start (datetime): Inclusive start of the bucket.
+        count (int): Completed traces in the sketch.
+        success_count (int): Traces that ended with status ``ok``.
+        error_count (int): Traces that ended with status ``error``.
+        sketch (dict): Serialized ``LatencySketch`` of durations in milliseconds.
+    """
+
+    __tablename__ = "observability_latency_sketches"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sketch: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index("idx_observability_latency_sketches_entity_bucket", "entity_type", "entity_id", "bucket_start"),
+        Index("idx_observability_latency_sketches_bucket_start", "bucket_start"),
+    )
+
+
 class ObservabilitySavedQuery(Base):
     """
     ORM model for saved observability queries (filter presets).
@@ -1899,6 +2063,35 @@ class ObservabilitySavedQuery(Base):
     )
 
 
+class EntityTag(Base):
+    """
+    ORM model indexing the tags of tools, resources, prompts, servers and gateways.
+
+    The ``tags`` JSON column of each entity stays the source of truth. This table
+    mirrors it with one row per (entity, tag) so tag filters, tag counts and tag
+    listings are index lookups instead of scans that parse every entity's JSON.
+    Rows are kept in sync by mapper events on the tagged models.
+
+    Attributes:
+        id (int): Auto-incrementing primary key.
+        entity_type (str): ``tool``, ``resource``, ``prompt``, ``server`` or ``gateway``.
+        entity_id (str): Primary key of the entity, as a string.
+        tag (str): One tag of the entity.
+    """
+
+    __tablename__ = "entity_tags"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    tag: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", "tag", name="uq_entity_tags_entity_tag"),
+        Index("idx_entity_tags_tag_type", "tag", "entity_type", "entity_id"),
+    )
+
+
 class Tool(Base):
     """
     ORM model for a registered Tool.
@@ -1908,8 +2101,9 @@ class Tool(Base):
     - "MCP" for MCP-compliant tools (default)
     - "REST" for REST tools
 
-    Additionally, this model provides computed properties for aggregated metrics based
-    on the associated ToolMetric records. These include:
+    Additionally, this model provides computed properties for aggregated metrics, read
+    from the tool's ToolMetricRollup row when present and otherwise computed from the
+    associated ToolMetric records. These include:
         - execution_count: Total number of invocations.
         - successful_executions: Count of successful invocations.
         - failed_executions: Count of failed invocations.
@@ -1996,6 +2190,7 @@ class Tool(Base):
 
     # Relationship with ToolMetric records
     metrics: Mapped[List["ToolMetric"]] = relationship("ToolMetric", back_populates="tool", cascade="all, delete-orphan")
+    metrics_rollup: Mapped[Optional["ToolMetricRollup"]] = relationship("ToolMetricRollup", uselist=False, cascade="all, delete-orphan", lazy="selectin")
 
     # Team scoping fields for resource organization
     team_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("email_teams.id", ondelete="SET NULL"), nullable=True)
@@ -2071,17 +2266,19 @@ class Tool(Base):
         Returns:
             int: Count of ToolMetric records for this tool.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.total_executions
         return len(getattr(self, "metrics", []))
 
     @execution_count.expression
     @classmethod
     def execution_count(cls) -> Any:
-        """SQL expression that counts ToolMetric rows for this tool.
+        """SQL expression that reads the execution total from the tool's metric rollup.
 
         Returns:
-            Any: SQLAlchemy labeled count expression for tool metrics.
+            Any: SQLAlchemy labeled expression for the tool's execution count.
         """
-        return select(func.count(ToolMetric.id)).where(ToolMetric.tool_id == cls.id).label("execution_count")  # pylint: disable=not-callable
+        return func.coalesce(select(ToolMetricRollup.total_executions).where(ToolMetricRollup.tool_id == cls.id).scalar_subquery(), 0).label("execution_count")
 
     @property
     def successful_executions(self) -> int:
@@ -2092,6 +2289,8 @@ class Tool(Base):
         Returns:
             int: The count of successful tool executions.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.successful_executions
         return sum(1 for m in self.metrics if m.is_success)
 
     @property
@@ -2103,6 +2302,8 @@ class Tool(Base):
         Returns:
             int: The count of failed tool executions.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failed_executions
         return sum(1 for m in self.metrics if not m.is_success)
 
     @property
@@ -2130,6 +2331,8 @@ class Tool(Base):
         Returns:
             Optional[float]: The minimum response time, or None if no executions exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.min_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return min(times) if times else None
 
@@ -2142,6 +2345,8 @@ class Tool(Base):
         Returns:
             Optional[float]: The maximum response time, or None if no executions exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.max_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return max(times) if times else None
 
@@ -2154,6 +2359,8 @@ class Tool(Base):
         Returns:
             Optional[float]: The average response time, or None if no executions exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.avg_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return sum(times) / len(times) if times else None
 
@@ -2166,6 +2373,8 @@ class Tool(Base):
         Returns:
             Optional[datetime]: The timestamp of the most recent execution, or None if no executions exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.last_execution_time
         if not self.metrics:
             return None
         return max(m.timestamp for m in self.metrics)
@@ -2238,6 +2447,7 @@ class Resource(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["ResourceMetric"]] = relationship("ResourceMetric", back_populates="resource", cascade="all, delete-orphan")
+    metrics_rollup: Mapped[Optional["ResourceMetricRollup"]] = relationship("ResourceMetricRollup", uselist=False, cascade="all, delete-orphan", lazy="selectin")
 
     # Content storage - can be text or binary
     text_content: Mapped[Optional[str]] = mapped_column(Text)
@@ -2323,6 +2533,8 @@ class Resource(Base):
         Returns:
             int: The total count of resource invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.total_executions
         return len(self.metrics)
 
     @property
@@ -2334,6 +2546,8 @@ class Resource(Base):
         Returns:
             int: The count of successful resource invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.successful_executions
         return sum(1 for m in self.metrics if m.is_success)
 
     @property
@@ -2345,6 +2559,8 @@ class Resource(Base):
         Returns:
             int: The count of failed resource invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failed_executions
         return sum(1 for m in self.metrics if not m.is_success)
 
     @property
@@ -2371,6 +2587,8 @@ class Resource(Base):
         Returns:
             Optional[float]: The minimum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.min_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return min(times) if times else None
 
@@ -2383,6 +2601,8 @@ class Resource(Base):
         Returns:
             Optional[float]: The maximum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.max_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return max(times) if times else None
 
@@ -2395,6 +2615,8 @@ class Resource(Base):
         Returns:
             Optional[float]: The average response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.avg_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return sum(times) / len(times) if times else None
 
@@ -2407,6 +2629,8 @@ class Resource(Base):
         Returns:
             Optional[datetime]: The timestamp of the most recent invocation, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.last_execution_time
         if not self.metrics:
             return None
         return max(m.timestamp for m in self.metrics)
@@ -2437,8 +2661,9 @@ class Prompt(Base):
 
     Represents a prompt template along with its argument schema.
     Supports rendering and invocation of prompts.
-    Additionally, this model provides computed properties for aggregated metrics based
-    on the associated PromptMetric records. These include:
+    Additionally, this model provides computed properties for aggregated metrics, read
+    from the prompt's PromptMetricRollup row when present and otherwise computed from the
+    associated PromptMetric records. These include:
         - execution_count: Total number of prompt invocations.
         - successful_executions: Count of successful invocations.
         - failed_executions: Count of failed invocations.
@@ -2477,6 +2702,7 @@ class Prompt(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["PromptMetric"]] = relationship("PromptMetric", back_populates="prompt", cascade="all, delete-orphan")
+    metrics_rollup: Mapped[Optional["PromptMetricRollup"]] = relationship("PromptMetricRollup", uselist=False, cascade="all, delete-orphan", lazy="selectin")
 
     gateway_id: Mapped[Optional[str]] = mapped_column(ForeignKey("gateways.id"))
     gateway: Mapped["Gateway"] = relationship("Gateway", back_populates="prompts")
@@ -2535,6 +2761,8 @@ class Prompt(Base):
         Returns:
             int: The total count of prompt invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.total_executions
         return len(self.metrics)
 
     @property
@@ -2546,6 +2774,8 @@ class Prompt(Base):
         Returns:
             int: The count of successful prompt invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.successful_executions
         return sum(1 for m in self.metrics if m.is_success)
 
     @property
@@ -2557,6 +2787,8 @@ class Prompt(Base):
         Returns:
             int: The count of failed prompt invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failed_executions
         return sum(1 for m in self.metrics if not m.is_success)
 
     @property
@@ -2583,6 +2815,8 @@ class Prompt(Base):
         Returns:
             Optional[float]: The minimum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.min_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return min(times) if times else None
 
@@ -2595,6 +2829,8 @@ class Prompt(Base):
         Returns:
             Optional[float]: The maximum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.max_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return max(times) if times else None
 
@@ -2607,6 +2843,8 @@ class Prompt(Base):
         Returns:
             Optional[float]: The average response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.avg_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return sum(times) / len(times) if times else None
 
@@ -2619,6 +2857,8 @@ class Prompt(Base):
         Returns:
             Optional[datetime]: The timestamp of the most recent invocation, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.last_execution_time
         if not self.metrics:
             return None
         return max(m.timestamp for m in self.metrics)
@@ -2629,8 +2869,9 @@ class Server(Base):
     ORM model for MCP Servers Catalog.
 
     Represents a server that composes catalog items (tools, resources, prompts).
-    Additionally, this model provides computed properties for aggregated metrics based
-    on the associated ServerMetric records. These include:
+    Additionally, this model provides computed properties for aggregated metrics, read
+    from the server's ServerMetricRollup row when present and otherwise computed from the
+    associated ServerMetric records. These include:
         - execution_count: Total number of invocations.
         - successful_executions: Count of successful invocations.
         - failed_executions: Count of failed invocations.
@@ -2668,6 +2909,7 @@ class Server(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["ServerMetric"]] = relationship("ServerMetric", back_populates="server", cascade="all, delete-orphan")
+    metrics_rollup: Mapped[Optional["ServerMetricRollup"]] = relationship("ServerMetricRollup", uselist=False, cascade="all, delete-orphan", lazy="selectin")
 
     # Many-to-many relationships for associated items
     tools: Mapped[List["Tool"]] = relationship("Tool", secondary=server_tool_association, back_populates="servers")
@@ -2687,6 +2929,8 @@ class Server(Base):
         Returns:
             int: The total count of server invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.total_executions
         return len(self.metrics)
 
     @property
@@ -2698,6 +2942,8 @@ class Server(Base):
         Returns:
             int: The count of successful server invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.successful_executions
         return sum(1 for m in self.metrics if m.is_success)
 
     @property
@@ -2709,6 +2955,8 @@ class Server(Base):
         Returns:
             int: The count of failed server invocations.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failed_executions
         return sum(1 for m in self.metrics if not m.is_success)
 
     @property
@@ -2747,6 +2995,8 @@ class Server(Base):
         Returns:
             Optional[float]: The minimum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.min_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return min(times) if times else None
 
@@ -2759,6 +3009,8 @@ class Server(Base):
         Returns:
             Optional[float]: The maximum response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.max_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return max(times) if times else None
 
@@ -2771,6 +3023,8 @@ class Server(Base):
         Returns:
             Optional[float]: The average response time, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.avg_response_time
         times: List[float] = [m.response_time for m in self.metrics]
         return sum(times) / len(times) if times else None
 
@@ -2783,6 +3037,8 @@ class Server(Base):
         Returns:
             Optional[datetime]: The timestamp of the most recent invocation, or None if no invocations exist.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.last_execution_time
         if not self.metrics:
             return None
         return max(m.timestamp for m in self.metrics)
@@ -2915,6 +3171,79 @@ def update_tool_names_on_gateway_update(_mapper, connection, target):
     connection.execute(stmt)
 
 
+# Entity type recorded in ``entity_tags`` for each tagged model
+TAGGED_ENTITY_TYPES: Dict[type, str] = {Tool: "tool", Resource: "resource", Prompt: "prompt", Server: "server", Gateway: "gateway"}
+
+
+def entity_tag_rows(entity_type: str, entity_id: Any, tags: Optional[List[Any]]) -> List[Dict[str, str]]:
+    """
+    Build the ``entity_tags`` rows mirroring an entity's tags.
+
+    Args:
+        entity_type: Entity type recorded in ``entity_tags``
+        entity_id: Entity primary key
+        tags: Value of the entity's ``tags`` column
+
+    Returns:
+        List[Dict[str, str]]: One row per distinct non-empty string tag, in first-seen order.
+
+    Examples:
+        >>> [row["tag"] for row in entity_tag_rows("tool", "abc", ["api", "db", "api", "", None])]
+        ['api', 'db']
+        >>> entity_tag_rows("resource", 7, None)
+        []
+    """
+    return [{"entity_type": entity_type, "entity_id": str(entity_id), "tag": tag} for tag in dict.fromkeys(tag for tag in tags or [] if isinstance(tag, str) and tag)]
+
+
+def insert_entity_tags(mapper, connection, target):
+    """
+    Index the tags of a newly inserted entity.
+
+    Args:
+        mapper: Mapper of the tagged model
+        connection: Connection of the flushing transaction
+        target: Inserted entity
+    """
+    rows = entity_tag_rows(TAGGED_ENTITY_TYPES[mapper.class_], target.id, target.tags)
+    if rows:
+        connection.execute(insert(EntityTag), rows)
+
+
+def update_entity_tags(mapper, connection, target):
+    """
+    Re-index an updated entity's tags, if they changed.
+
+    Args:
+        mapper: Mapper of the tagged model
+        connection: Connection of the flushing transaction
+        target: Updated entity
+    """
+    if not get_history(target, "tags").has_changes():
+        return
+    delete_entity_tags(mapper, connection, target)
+    insert_entity_tags(mapper, connection, target)
+
+
+def delete_entity_tags(mapper, connection, target):
+    """
+    Remove a deleted entity's tags from the index.
+
+    Args:
+        mapper: Mapper of the tagged model
+        connection: Connection of the flushing transaction
+        target: Deleted entity
+    """
+    entity_type = TAGGED_ENTITY_TYPES[mapper.class_]
+    connection.execute(delete(EntityTag).where(EntityTag.entity_type == entity_type, EntityTag.entity_id == str(target.id)))
+
+
+for _tagged_model in TAGGED_ENTITY_TYPES:
+    listen(_tagged_model, "after_insert", insert_entity_tags)
+    listen(_tagged_model, "after_update", update_entity_tags)
+    listen(_tagged_model, "after_delete", delete_entity_tags)
+
+
 class A2AAgent(Base):
     """
     ORM model for A2A (Agent-to-Agent) compatible agents.
@@ -2980,6 +3309,7 @@ class A2AAgent(Base):
     # Relationships
     servers: Mapped[List["Server"]] = relationship("Server", secondary=server_a2a_association, back_populates="a2a_agents")
     metrics: Mapped[List["A2AAgentMetric"]] = relationship("A2AAgentMetric", back_populates="a2a_agent", cascade="all, delete-orphan")
+    metrics_rollup: Mapped[Optional["A2AAgentMetricRollup"]] = relationship("A2AAgentMetricRollup", uselist=False, cascade="all, delete-orphan", lazy="selectin")
     __table_args__ = (UniqueConstraint("team_id", "owner_email", "slug", name="uq_team_owner_slug_a2a_agent"),)
 
     # Relationship with OAuth tokens
@@ -2995,6 +3325,8 @@ class A2AAgent(Base):
         Returns:
             int: The total count of interactions.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.total_executions
         return len(self.metrics)
 
     @property
@@ -3004,6 +3336,8 @@ class A2AAgent(Base):
         Returns:
             int: The count of successful interactions.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.successful_executions
         return sum(1 for m in self.metrics if m.is_success)
 
     @property
@@ -3013,6 +3347,8 @@ class A2AAgent(Base):
         Returns:
             int: The count of failed interactions.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failed_executions
         return sum(1 for m in self.metrics if not m.is_success)
 
     @property
@@ -3022,6 +3358,8 @@ class A2AAgent(Base):
         Returns:
             float: The failure rate percentage.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.failure_rate * 100
         if not self.metrics:
             return 0.0
         return (self.failed_executions / len(self.metrics)) * 100
@@ -3033,6 +3371,8 @@ class A2AAgent(Base):
         Returns:
             Optional[float]: The average response time, or None if no metrics.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.avg_response_time
         if not self.metrics:
             return None
         return sum(m.response_time for m in self.metrics) / len(self.metrics)
@@ -3044,6 +3384,8 @@ class A2AAgent(Base):
         Returns:
             Optional[datetime]: The timestamp of the last interaction, or None if no metrics.
         """
+        if self.metrics_rollup is not None:
+            return self.metrics_rollup.last_execution_time
         if not self.metrics:
             return None
         return max(m.timestamp for m in self.metrics)
@@ -3159,6 +3501,24 @@ class SessionMessageRecord(Base):
     session: Mapped["SessionRecord"] = relationship("SessionRecord", back_populates="messages")
 
 
+class StreamEventRecord(Base):
+    """ORM model for Streamable HTTP events kept for resumability across workers.
+
+    Events are keyed by an opaque per-session scope and the SDK stream id; the
+    composite index on ``(scope, stream_id, id)`` makes replay-after-event an
+    index range scan.
+    """
+
+    __tablename__ = "mcp_stream_events"
+    __table_args__ = (Index("idx_mcp_stream_events_stream", "scope", "stream_id", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    scope: Mapped[str] = mapped_column(String(64), nullable=False)
+    stream_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, index=True)
+
+
 class OAuthToken(Base):
     """ORM model for OAuth access and refresh tokens with user association."""
 
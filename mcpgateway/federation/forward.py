@@ -42,6 +42,8 @@ from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import ServerMetric
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import record_metric_rollup
 from mcpgateway.utils.passthrough_headers import get_passthrough_headers
 
 # Initialize logging service first
@@ -372,6 +374,9 @@ class ForwardingService:
         end_time = time.monotonic()
         response_time = end_time - start_time
 
+        if settings.metrics_buffer_enabled and get_metrics_buffer_service().record("server", gateway.id, response_time, success, error_message):
+            return
+
         metric = ServerMetric(
             server_id=gateway.id,
             response_time=response_time,
@@ -379,6 +384,7 @@ class ForwardingService:
             error_message=error_message,
         )
         db.add(metric)
+        record_metric_rollup(db, "server", gateway.id, response_time, success)
         db.commit()
 
     async def _forward_to_gateway(
@@ -52,10 +52,25 @@ def _write_span_to_db(span_data: dict) -> None:
         # pylint: disable=import-outside-toplevel
         from mcpgateway.db import ObservabilitySpan, SessionLocal
         from mcpgateway.services.observability_service import ObservabilityService
+        from mcpgateway.services.trace_export_service import get_trace_export_service
 
         # pylint: enable=import-outside-toplevel
 
         service = ObservabilityService()
+        if get_trace_export_service().running:
+            # Buffered: the span joins its trace in memory and is exported in bulk
+            span_id = service.start_span(
+                db=None,
+                trace_id=span_data["trace_id"],
+                name=span_data["name"],
+                kind=span_data["kind"],
+                resource_type=span_data["resource_type"],
+                resource_name=span_data["resource_name"],
+                attributes=span_data["start_attributes"],
+            )
+            service.end_span(db=None, span_id=span_id, status=span_data["status"], attributes=span_data["end_attributes"], duration_ms=span_data["duration_ms"])
+            return
+
         db = SessionLocal()
         try:
             span_id = service.start_span(
@@ -32,7 +32,7 @@ from datetime import datetime
 import json
 import os as _os  # local alias to avoid collisions
 import sys
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Union
 from urllib.parse import urlparse, urlunparse
 import uuid
 
@@ -43,6 +43,7 @@ from fastapi.exception_handlers import request_validation_exception_handler as f
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from jsonpath_ng.ext import parse
@@ -63,6 +64,11 @@ from mcpgateway.admin import admin_router, set_logging_service
 from mcpgateway.auth import get_current_user
 from mcpgateway.bootstrap_db import main as bootstrap_db
 from mcpgateway.cache import ResourceCache, SessionRegistry
+from mcpgateway.cache.auth_cache import get_auth_cache
+from mcpgateway.cache.catalog_snapshot import CATALOG_METHODS, CatalogSnapshot, etag_matches, get_catalog_snapshot_cache
+from mcpgateway.cache.completion_index import get_completion_index
+from mcpgateway.cache.permission_cache import get_permission_cache
+from mcpgateway.cache.tool_lookup_cache import get_tool_lookup_cache
 from mcpgateway.common.models import InitializeResult
 from mcpgateway.common.models import JSONRPCError as PydanticJSONRPCError
 from mcpgateway.common.models import ListResourceTemplatesResult, LogLevel, Root
@@ -78,6 +84,7 @@ from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
 from mcpgateway.middleware.token_scoping import token_scoping_middleware
 from mcpgateway.observability import init_telemetry
 from mcpgateway.plugins.framework import PluginError, PluginManager, PluginViolationError
+from mcpgateway.routers.reverse_proxy import manager as reverse_proxy_manager
 from mcpgateway.routers.well_known import router as well_known_router
 from mcpgateway.schemas import (
     A2AAgentCreate,
@@ -107,19 +114,27 @@ from mcpgateway.schemas import (
 )
 from mcpgateway.services.a2a_service import A2AAgentError, A2AAgentNameConflictError, A2AAgentNotFoundError, A2AAgentService
 from mcpgateway.services.completion_service import CompletionService
+from mcpgateway.services.event_service import get_event_fanout
 from mcpgateway.services.export_service import ExportError, ExportService
 from mcpgateway.services.gateway_service import GatewayConnectionError, GatewayDuplicateConflictError, GatewayError, GatewayNameConflictError, GatewayNotFoundError, GatewayService
 from mcpgateway.services.import_service import ConflictStrategy, ImportConflictError
 from mcpgateway.services.import_service import ImportError as ImportServiceError
 from mcpgateway.services.import_service import ImportService, ImportValidationError
+from mcpgateway.services.latency_sketch_service import get_latency_sketch_service
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.mcp_session_pool import get_mcp_session_pool
 from mcpgateway.services.metrics import setup_metrics
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import MetricsRollupService
+from mcpgateway.services.oauth_manager import get_oauth_token_cache
+from mcpgateway.services.permission_audit_service import get_permission_audit_buffer
 from mcpgateway.services.prompt_service import PromptError, PromptNameConflictError, PromptNotFoundError, PromptService
 from mcpgateway.services.resource_service import ResourceError, ResourceNotFoundError, ResourceService, ResourceURIConflictError
 from mcpgateway.services.root_service import RootService
 from mcpgateway.services.server_service import ServerError, ServerNameConflictError, ServerNotFoundError, ServerService
 from mcpgateway.services.tag_service import TagService
 from mcpgateway.services.tool_service import ToolError, ToolNameConflictError, ToolNotFoundError, ToolService
+from mcpgateway.services.trace_export_service import get_trace_export_service
 from mcpgateway.transports.sse_transport import SSETransport
 from mcpgateway.transports.streamablehttp_transport import SessionManagerWrapper, streamable_http_auth
 from mcpgateway.utils.db_isready import wait_for_db_ready
@@ -128,8 +143,7 @@ from mcpgateway.utils.metadata_capture import MetadataCapture
 from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.passthrough_headers import set_global_passthrough_headers
 from mcpgateway.utils.redis_isready import wait_for_redis_ready
-from mcpgateway.utils.retry_manager import ResilientHttpClient
-from mcpgateway.utils.verify_credentials import require_auth, require_docs_auth_override, verify_jwt_token
+from mcpgateway.utils.verify_credentials import require_auth, require_docs_auth_override
 from mcpgateway.validation.jsonrpc import JSONRPCError
 
 # Import the admin routes from the new module
@@ -178,6 +192,7 @@ server_service = ServerService()
 tag_service = TagService()
 export_service = ExportService()
 import_service = ImportService()
+metrics_rollup_service = MetricsRollupService()
 # Initialize A2A service only if A2A features are enabled
 a2a_service = A2AAgentService() if settings.mcpgateway_a2a_enabled else None
 
@@ -425,6 +440,28 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             await a2a_service.initialize()
         await resource_cache.initialize()
         await streamable_http_session.initialize()
+        await metrics_rollup_service.initialize()
+        # SSE sessions dispatch JSON-RPC messages in-process instead of calling back into /rpc
+        session_registry.set_rpc_dispatcher(dispatch_rpc_message)
+        if settings.metrics_buffer_enabled:
+            await get_metrics_buffer_service().start()
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            await get_trace_export_service().start()
+        if settings.observability_enabled and settings.observability_latency_sketches_enabled:
+            await get_latency_sketch_service().start()
+        await get_auth_cache().start()
+        await get_tool_lookup_cache().start()
+        await get_permission_cache().start()
+        await get_completion_index().start()
+        await get_catalog_snapshot_cache().start()
+        if settings.permission_audit_buffer_enabled:
+            await get_permission_audit_buffer().start()
+        await reverse_proxy_manager.relay.start()
+
+        # Initialize upstream MCP session pool
+        if settings.mcp_session_pool_enabled:
+            await get_mcp_session_pool().start()
+            logger.info("MCP session pool initialized")
 
         # Initialize elicitation service
         if settings.mcpgateway_elicitation_enabled:
@@ -482,6 +519,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             resource_service,
             tool_service,
             streamable_http_session,
+            metrics_rollup_service,
         ]
 
         if a2a_service:
@@ -495,6 +533,26 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             elicitation_service = get_elicitation_service()
             services_to_shutdown.insert(5, elicitation_service)
 
+        if settings.mcp_session_pool_enabled:
+            services_to_shutdown.append(get_mcp_session_pool())
+
+        # Flush buffered metrics before the services they reference go away
+        if settings.metrics_buffer_enabled:
+            services_to_shutdown.insert(0, get_metrics_buffer_service())
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            services_to_shutdown.insert(0, get_trace_export_service())
+        if settings.observability_enabled and settings.observability_latency_sketches_enabled:
+            services_to_shutdown.insert(0, get_latency_sketch_service())
+        if settings.permission_audit_buffer_enabled:
+            services_to_shutdown.insert(0, get_permission_audit_buffer())
+        services_to_shutdown.append(get_auth_cache())
+        services_to_shutdown.append(get_tool_lookup_cache())
+        services_to_shutdown.append(get_permission_cache())
+        services_to_shutdown.append(get_completion_index())
+        services_to_shutdown.append(get_catalog_snapshot_cache())
+        services_to_shutdown.append(get_event_fanout())
+        services_to_shutdown.append(reverse_proxy_manager.relay)
+
         await shutdown_services(services_to_shutdown)
 
         logger.info("Shutdown complete")
@@ -3880,11 +3938,335 @@ async def subscribe_roots_changes(
 ##################
 # Utility Routes #
 ##################
+async def catalog_snapshot(db: Session, method: str, params: Dict[str, Any]) -> CatalogSnapshot:
+    """Return the cached snapshot answering a catalog list method.
+
+    Args:
+        db: Database session, used only when the snapshot has to be built.
+        method: ``tools/list``, ``list_tools``, ``resources/list`` or ``prompts/list``.
+        params: JSON-RPC params (``server_id`` and ``cursor`` are honoured when present).
+
+    Returns:
+        CatalogSnapshot: The list page, with its serialized result and ETag.
+    """
+    kind = CATALOG_METHODS[method]
+    service = {"tools": tool_service, "resources": resource_service, "prompts": prompt_service}[kind]
+    return await get_catalog_snapshot_cache().get(db, kind, params.get("server_id"), params.get("cursor"), service)
+
+
+async def dispatch_rpc(
+    db: Session,
+    method: str,
+    params: Dict[str, Any],
+    user: Any,
+    request_headers: Optional[Mapping[str, str]] = None,
+    session_id: Optional[str] = None,
+    plugin_context_table: Optional[Any] = None,
+    plugin_global_context: Optional[Any] = None,
+) -> Any:
+    """Route a validated JSON-RPC method call to the service layer.
+
+    This is the method table shared by the ``/rpc`` endpoint, SSE sessions and the
+    WebSocket transport, so every transport dispatches in-process with the same
+    auth context and plugin hooks instead of calling back into ``/rpc`` over HTTP.
+
+    Args:
+        db: Database session.
+        method: JSON-RPC method name.
+        params: JSON-RPC params (``server_id`` and ``cursor`` are honoured when present).
+        user: The authenticated user (RBAC dict, JWT payload or username).
+        request_headers: Headers of the originating request, passed through to tool invocations.
+        session_id: Transport session id used for capability tracking on ``initialize``.
+        plugin_context_table: Plugin contexts from HTTP-level hooks, for cross-hook sharing.
+        plugin_global_context: Plugin global context from HTTP-level hooks.
+
+    Returns:
+        The method result, ready to be placed in a JSON-RPC ``result`` member.
+
+    Raises:
+        JSONRPCError: If the params are invalid or the method cannot be resolved.
+        PluginError: If encounters issue with plugin
+        PluginViolationError: If plugin violated the request.
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(dispatch_rpc(None, "ping", {}, "anonymous"))
+        {}
+    """
+    if method == "initialize":
+        # Extract session_id from params or query string (for capability tracking)
+        init_session_id = params.get("session_id") or params.get("sessionId") or session_id
+        result = await session_registry.handle_initialize_logic(params, session_id=init_session_id)
+        if hasattr(result, "model_dump"):
+            result = result.model_dump(by_alias=True, exclude_none=True)
+    elif method in CATALOG_METHODS:  # tools/list (and legacy list_tools), resources/list, prompts/list
+        result = (await catalog_snapshot(db, method, params)).payload()
+    elif method == "list_gateways":
+        gateways = await gateway_service.list_gateways(db, include_inactive=False)
+        result = {"gateways": [g.model_dump(by_alias=True, exclude_none=True) for g in gateways]}
+    elif method == "list_roots":
+        roots = await root_service.list_roots()
+        result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
+    elif method == "resources/read":
+        uri = params.get("uri")
+        request_id = params.get("requestId", None)
+        if not uri:
+            raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
+        # Get user email for OAuth token selection
+        user_email = get_user_email(user)
+        try:
+            result = await resource_service.read_resource(
+                db,
+                resource_uri=uri,
+                request_id=request_id,
+                user=user_email,
+                plugin_context_table=plugin_context_table,
+                plugin_global_context=plugin_global_context,
+            )
+            if hasattr(result, "model_dump"):
+                result = {"contents": [result.model_dump(by_alias=True, exclude_none=True)]}
+            else:
+                result = {"contents": [result]}
+        except ValueError:
+            # Resource has no local content, forward to upstream MCP server
+            result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True, exclude_none=True)
+    elif method == "resources/subscribe":
+        # MCP spec-compliant resource subscription endpoint
+        uri = params.get("uri")
+        if not uri:
+            raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
+        # Get user email for subscriber ID
+        user_email = get_user_email(user)
+        subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
+        await resource_service.subscribe_resource(db, subscription)
+        result = {}
+    elif method == "resources/unsubscribe":
+        # MCP spec-compliant resource unsubscription endpoint
+        uri = params.get("uri")
+        if not uri:
+            raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
+        # Get user email for subscriber ID
+        user_email = get_user_email(user)
+        subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
+        await resource_service.unsubscribe_resource(db, subscription)
+        result = {}
+    elif method == "prompts/get":
+        name = params.get("name")
+        arguments = params.get("arguments", {})
+        if not name:
+            raise JSONRPCError(-32602, "Missing prompt name in parameters", params)
+        result = await prompt_service.get_prompt(
+            db,
+            name,
+            arguments,
+            plugin_context_table=plugin_context_table,
+            plugin_global_context=plugin_global_context,
+        )
+        if hasattr(result, "model_dump"):
+            result = result.model_dump(by_alias=True, exclude_none=True)
+    elif method == "ping":
+        # Per the MCP spec, a ping returns an empty result.
+        result = {}
+    elif method == "tools/call":
+        headers = {k.lower(): v for k, v in (request_headers or {}).items()}
+        name = params.get("name")
+        arguments = params.get("arguments", {})
+        if not name:
+            raise JSONRPCError(-32602, "Missing tool name in parameters", params)
+        # Get user email for OAuth token selection
+        user_email = get_user_email(user)
+        try:
+            result = await tool_service.invoke_tool(
+                db=db,
+                name=name,
+                arguments=arguments,
+                request_headers=headers,
+                app_user_email=user_email,
+                plugin_context_table=plugin_context_table,
+                plugin_global_context=plugin_global_context,
+            )
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True, exclude_none=True)
+        except ValueError:
+            result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True, exclude_none=True)
+    # TODO: Implement methods  # pylint: disable=fixme
+    elif method == "resources/templates/list":
+        # MCP spec-compliant resource templates list endpoint
+        resource_templates = await resource_service.list_resource_templates(db)
+        result = {"resourceTemplates": [rt.model_dump(by_alias=True, exclude_none=True) for rt in resource_templates]}
+    elif method == "roots/list":
+        # MCP spec-compliant method name
+        roots = await root_service.list_roots()
+        result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
+    elif method.startswith("roots/"):
+        # Catch-all for other roots/* methods (currently unsupported)
+        result = {}
+    elif method == "notifications/initialized":
+        # MCP spec-compliant notification: client initialized
+        logger.info("Client initialized")
+        await logging_service.notify("Client initialized", LogLevel.INFO)
+        result = {}
+    elif method == "notifications/cancelled":
+        # MCP spec-compliant notification: request cancelled
+        request_id = params.get("requestId")
+        logger.info(f"Request cancelled: {request_id}")
+        await logging_service.notify(f"Request cancelled: {request_id}", LogLevel.INFO)
+        result = {}
+    elif method == "notifications/message":
+        # MCP spec-compliant notification: log message
+        await logging_service.notify(
+            params.get("data"),
+            LogLevel(params.get("level", "info")),
+            params.get("logger"),
+        )
+        result = {}
+    elif method.startswith("notifications/"):
+        # Catch-all for other notifications/* methods (currently unsupported)
+        result = {}
+    elif method == "sampling/createMessage":
+        # MCP spec-compliant sampling endpoint
+        result = await sampling_handler.create_message(db, params)
+    elif method.startswith("sampling/"):
+        # Catch-all for other sampling/* methods (currently unsupported)
+        result = {}
+    elif method == "elicitation/create":
+        # MCP spec 2025-06-18: Elicitation support (server-to-client requests)
+        # Elicitation allows servers to request structured user input through clients
+
+        # Check if elicitation is enabled
+        if not settings.mcpgateway_elicitation_enabled:
+            raise JSONRPCError(-32601, "Elicitation feature is disabled", {"feature": "elicitation", "config": "MCPGATEWAY_ELICITATION_ENABLED=false"})
+
+        # Validate params
+        # First-Party
+        from mcpgateway.common.models import ElicitRequestParams  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.elicitation_service import get_elicitation_service  # pylint: disable=import-outside-toplevel
+
+        try:
+            elicit_params = ElicitRequestParams(**params)
+        except Exception as e:
+            raise JSONRPCError(-32602, f"Invalid elicitation params: {e}", params)
+
+        # Get target session (from params or find elicitation-capable session)
+        target_session_id = params.get("session_id") or params.get("sessionId")
+        if not target_session_id:
+            # Find an elicitation-capable session
+            capable_sessions = await session_registry.get_elicitation_capable_sessions()
+            if not capable_sessions:
+                raise JSONRPCError(-32000, "No elicitation-capable clients available", {"message": elicit_params.message})
+            target_session_id = capable_sessions[0]
+            logger.debug(f"Selected session {target_session_id} for elicitation")
+
+        # Verify session has elicitation capability
+        if not await session_registry.has_elicitation_capability(target_session_id):
+            raise JSONRPCError(-32000, f"Session {target_session_id} does not support elicitation", {"session_id": target_session_id})
+
+        # Get elicitation service and create request
+        elicitation_service = get_elicitation_service()
+
+        # Extract timeout from params or use default
+        timeout = params.get("timeout", settings.mcpgateway_elicitation_timeout)
+
+        try:
+            # Create elicitation request - this stores it and waits for response
+            # For now, use dummy upstream_session_id - in full bidirectional proxy,
+            # this would be the session that initiated the request
+            upstream_session_id = "gateway"
+
+            # Start the elicitation (creates pending request and future)
+            elicitation_task = asyncio.create_task(
+                elicitation_service.create_elicitation(
+                    upstream_session_id=upstream_session_id, downstream_session_id=target_session_id, message=elicit_params.message, requested_schema=elicit_params.requestedSchema, timeout=timeout
+                )
+            )
+
+            # Get the pending elicitation to extract request_id
+            # Wait a moment for it to be created
+            await asyncio.sleep(0.01)
+            pending_elicitations = [e for e in elicitation_service._pending.values() if e.downstream_session_id == target_session_id]  # pylint: disable=protected-access
+            if not pending_elicitations:
+                raise JSONRPCError(-32000, "Failed to create elicitation request", {})
+
+            pending = pending_elicitations[-1]  # Get most recent
+
+            # Send elicitation request to client via broadcast
+            elicitation_request = {
+                "jsonrpc": "2.0",
+                "id": pending.request_id,
+                "method": "elicitation/create",
+                "params": {"message": elicit_params.message, "requestedSchema": elicit_params.requestedSchema},
+            }
+
+            await session_registry.broadcast(target_session_id, elicitation_request)
+            logger.debug(f"Sent elicitation request {pending.request_id} to session {target_session_id}")
+
+            # Wait for response
+            elicit_result = await elicitation_task
+
+            # Return result
+            result = elicit_result.model_dump(by_alias=True, exclude_none=True)
+
+        except asyncio.TimeoutError:
+            raise JSONRPCError(-32000, f"Elicitation timed out after {timeout}s", {"message": elicit_params.message, "timeout": timeout})
+        except ValueError as e:
+            raise JSONRPCError(-32000, str(e), {"message": elicit_params.message})
+    elif method.startswith("elicitation/"):
+        # Catch-all for other elicitation/* methods
+        result = {}
+    elif method == "completion/complete":
+        # MCP spec-compliant completion endpoint
+        result = await completion_service.handle_completion(db, params)
+    elif method.startswith("completion/"):
+        # Catch-all for other completion/* methods (currently unsupported)
+        result = {}
+    elif method == "logging/setLevel":
+        # MCP spec-compliant logging endpoint
+        level = LogLevel(params.get("level"))
+        await logging_service.set_level(level)
+        result = {}
+    elif method.startswith("logging/"):
+        # Catch-all for other logging/* methods (currently unsupported)
+        result = {}
+    else:
+        # Backward compatibility: Try to invoke as a tool directly
+        # This allows both old format (method=tool_name) and new format (method=tools/call)
+        # Standard
+        headers = {k.lower(): v for k, v in (request_headers or {}).items()}
+        # Get user email for OAuth token selection
+        user_email = get_user_email(user)
+        try:
+            result = await tool_service.invoke_tool(db=db, name=method, arguments=params, request_headers=headers, app_user_email=user_email)
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True, exclude_none=True)
+        except (PluginError, PluginViolationError):
+            raise
+        except (ValueError, Exception):
+            # If not a tool, try forwarding to gateway
+            try:
+                result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
+                if hasattr(result, "model_dump"):
+                    result = result.model_dump(by_alias=True, exclude_none=True)
+            except Exception:
+                # If all else fails, return invalid method error
+                raise JSONRPCError(-32000, "Invalid method", params)
+
+    return result
+
+
 @utility_router.post("/rpc/")
 @utility_router.post("/rpc")
 async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depends(require_auth)):
     """Handle RPC requests.
 
+    A JSON array body is handled as a JSON-RPC 2.0 batch (see ``dispatch_rpc_batch``);
+    a batch of only notifications gets an empty 204 response. Catalog list methods
+    are answered from cached snapshots with an ``ETag``; a matching ``If-None-Match``
+    gets an empty 304 response.
+
     Args:
         request (Request): The incoming FastAPI request.
         db (Session): Database session.
@@ -3909,321 +4291,35 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
 
         logger.debug(f"User {user_id} made an RPC request")
         body = await request.json()
+        if isinstance(body, list):
+            responses = await dispatch_rpc_batch(body, user, request_headers=request.headers)
+            return starletteResponse(status_code=204) if responses is None else responses
         method = body["method"]
         req_id = body.get("id")
         if req_id is None:
             req_id = str(uuid.uuid4())
         params = body.get("params", {})
-        server_id = params.get("server_id", None)
-        cursor = params.get("cursor")  # Extract cursor parameter
 
         RPCRequest(jsonrpc="2.0", method=method, params=params)  # Validate the request body against the RPCRequest model
 
-        if method == "initialize":
-            # Extract session_id from params or query string (for capability tracking)
-            init_session_id = params.get("session_id") or params.get("sessionId") or request.query_params.get("session_id")
-            result = await session_registry.handle_initialize_logic(body.get("params", {}), session_id=init_session_id)
-            if hasattr(result, "model_dump"):
-                result = result.model_dump(by_alias=True, exclude_none=True)
-        elif method == "tools/list":
-            if server_id:
-                tools = await tool_service.list_server_tools(db, server_id, cursor=cursor)
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-            else:
-                tools, next_cursor = await tool_service.list_tools(db, cursor=cursor)
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "list_tools":  # Legacy endpoint
-            if server_id:
-                tools = await tool_service.list_server_tools(db, server_id, cursor=cursor)
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-            else:
-                tools, next_cursor = await tool_service.list_tools(db, cursor=cursor)
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "list_gateways":
-            gateways = await gateway_service.list_gateways(db, include_inactive=False)
-            result = {"gateways": [g.model_dump(by_alias=True, exclude_none=True) for g in gateways]}
-        elif method == "list_roots":
-            roots = await root_service.list_roots()
-            result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
-        elif method == "resources/list":
-            if server_id:
-                resources = await resource_service.list_server_resources(db, server_id)
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-            else:
-                resources, next_cursor = await resource_service.list_resources(db, cursor=cursor)
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "resources/read":
-            uri = params.get("uri")
-            request_id = params.get("requestId", None)
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-            # Get user email for OAuth token selection
-            user_email = get_user_email(user)
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-            try:
-                result = await resource_service.read_resource(
-                    db,
-                    resource_uri=uri,
-                    request_id=request_id,
-                    user=user_email,
-                    plugin_context_table=plugin_context_table,
-                    plugin_global_context=plugin_global_context,
-                )
-                if hasattr(result, "model_dump"):
-                    result = {"contents": [result.model_dump(by_alias=True, exclude_none=True)]}
-                else:
-                    result = {"contents": [result]}
-            except ValueError:
-                # Resource has no local content, forward to upstream MCP server
-                result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
-                if hasattr(result, "model_dump"):
-                    result = result.model_dump(by_alias=True, exclude_none=True)
-        elif method == "resources/subscribe":
-            # MCP spec-compliant resource subscription endpoint
-            uri = params.get("uri")
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-            # Get user email for subscriber ID
-            user_email = get_user_email(user)
-            subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
-            await resource_service.subscribe_resource(db, subscription)
-            result = {}
-        elif method == "resources/unsubscribe":
-            # MCP spec-compliant resource unsubscription endpoint
-            uri = params.get("uri")
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-            # Get user email for subscriber ID
-            user_email = get_user_email(user)
-            subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
-            await resource_service.unsubscribe_resource(db, subscription)
-            result = {}
-        elif method == "prompts/list":
-            if server_id:
-                prompts = await prompt_service.list_server_prompts(db, server_id, cursor=cursor)
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-            else:
-                prompts, next_cursor = await prompt_service.list_prompts(db, cursor=cursor)
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "prompts/get":
-            name = params.get("name")
-            arguments = params.get("arguments", {})
-            if not name:
-                raise JSONRPCError(-32602, "Missing prompt name in parameters", params)
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-            result = await prompt_service.get_prompt(
-                db,
-                name,
-                arguments,
-                plugin_context_table=plugin_context_table,
-                plugin_global_context=plugin_global_context,
-            )
-            if hasattr(result, "model_dump"):
-                result = result.model_dump(by_alias=True, exclude_none=True)
-        elif method == "ping":
-            # Per the MCP spec, a ping returns an empty result.
-            result = {}
-        elif method == "tools/call":
-            # Get request headers
-            headers = {k.lower(): v for k, v in request.headers.items()}
-            name = params.get("name")
-            arguments = params.get("arguments", {})
-            if not name:
-                raise JSONRPCError(-32602, "Missing tool name in parameters", params)
-            # Get user email for OAuth token selection
-            user_email = get_user_email(user)
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-            try:
-                result = await tool_service.invoke_tool(
-                    db=db,
-                    name=name,
-                    arguments=arguments,
-                    request_headers=headers,
-                    app_user_email=user_email,
-                    plugin_context_table=plugin_context_table,
-                    plugin_global_context=plugin_global_context,
-                )
-                if hasattr(result, "model_dump"):
-                    result = result.model_dump(by_alias=True, exclude_none=True)
-            except ValueError:
-                result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
-                if hasattr(result, "model_dump"):
-                    result = result.model_dump(by_alias=True, exclude_none=True)
-        # TODO: Implement methods  # pylint: disable=fixme
-        elif method == "resources/templates/list":
-            # MCP spec-compliant resource templates list endpoint
-            resource_templates = await resource_service.list_resource_templates(db)
-            result = {"resourceTemplates": [rt.model_dump(by_alias=True, exclude_none=True) for rt in resource_templates]}
-        elif method == "roots/list":
-            # MCP spec-compliant method name
-            roots = await root_service.list_roots()
-            result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
-        elif method.startswith("roots/"):
-            # Catch-all for other roots/* methods (currently unsupported)
-            result = {}
-        elif method == "notifications/initialized":
-            # MCP spec-compliant notification: client initialized
-            logger.info("Client initialized")
-            await logging_service.notify("Client initialized", LogLevel.INFO)
-            result = {}
-        elif method == "notifications/cancelled":
-            # MCP spec-compliant notification: request cancelled
-            request_id = params.get("requestId")
-            logger.info(f"Request cancelled: {request_id}")
-            await logging_service.notify(f"Request cancelled: {request_id}", LogLevel.INFO)
-            result = {}
-        elif method == "notifications/message":
-            # MCP spec-compliant notification: log message
-            await logging_service.notify(
-                params.get("data"),
-                LogLevel(params.get("level", "info")),
-                params.get("logger"),
-            )
-            result = {}
-        elif method.startswith("notifications/"):
-            # Catch-all for other notifications/* methods (currently unsupported)
-            result = {}
-        elif method == "sampling/createMessage":
-            # MCP spec-compliant sampling endpoint
-            result = await sampling_handler.create_message(db, params)
-        elif method.startswith("sampling/"):
-            # Catch-all for other sampling/* methods (currently unsupported)
-            result = {}
-        elif method == "elicitation/create":
-            # MCP spec 2025-06-18: Elicitation support (server-to-client requests)
-            # Elicitation allows servers to request structured user input through clients
-
-            # Check if elicitation is enabled
-            if not settings.mcpgateway_elicitation_enabled:
-                raise JSONRPCError(-32601, "Elicitation feature is disabled", {"feature": "elicitation", "config": "MCPGATEWAY_ELICITATION_ENABLED=false"})
-
-            # Validate params
-            # First-Party
-            from mcpgateway.common.models import ElicitRequestParams  # pylint: disable=import-outside-toplevel
-            from mcpgateway.services.elicitation_service import get_elicitation_service  # pylint: disable=import-outside-toplevel
-
-            try:
-                elicit_params = ElicitRequestParams(**params)
-            except Exception as e:
-                raise JSONRPCError(-32602, f"Invalid elicitation params: {e}", params)
-
-            # Get target session (from params or find elicitation-capable session)
-            target_session_id = params.get("session_id") or params.get("sessionId")
-            if not target_session_id:
-                # Find an elicitation-capable session
-                capable_sessions = await session_registry.get_elicitation_capable_sessions()
-                if not capable_sessions:
-                    raise JSONRPCError(-32000, "No elicitation-capable clients available", {"message": elicit_params.message})
-                target_session_id = capable_sessions[0]
-                logger.debug(f"Selected session {target_session_id} for elicitation")
-
-            # Verify session has elicitation capability
-            if not await session_registry.has_elicitation_capability(target_session_id):
-                raise JSONRPCError(-32000, f"Session {target_session_id} does not support elicitation", {"session_id": target_session_id})
-
-            # Get elicitation service and create request
-            elicitation_service = get_elicitation_service()
-
-            # Extract timeout from params or use default
-            timeout = params.get("timeout", settings.mcpgateway_elicitation_timeout)
-
-            try:
-                # Create elicitation request - this stores it and waits for response
-                # For now, use dummy upstream_session_id - in full bidirectional proxy,
-                # this would be the session that initiated the request
-                upstream_session_id = "gateway"
-
-                # Start the elicitation (creates pending request and future)
-                elicitation_task = asyncio.create_task(
-                    elicitation_service.create_elicitation(
-                        upstream_session_id=upstream_session_id, downstream_session_id=target_session_id, message=elicit_params.message, requested_schema=elicit_params.requestedSchema, timeout=timeout
-                    )
-                )
-
-                # Get the pending elicitation to extract request_id
-                # Wait a moment for it to be created
-                await asyncio.sleep(0.01)
-                pending_elicitations = [e for e in elicitation_service._pending.values() if e.downstream_session_id == target_session_id]  # pylint: disable=protected-access
-                if not pending_elicitations:
-                    raise JSONRPCError(-32000, "Failed to create elicitation request", {})
-
-                pending = pending_elicitations[-1]  # Get most recent
-
-                # Send elicitation request to client via broadcast
-                elicitation_request = {
-                    "jsonrpc": "2.0",
-                    "id": pending.request_id,
-                    "method": "elicitation/create",
-                    "params": {"message": elicit_params.message, "requestedSchema": elicit_params.requestedSchema},
-                }
-
-                await session_registry.broadcast(target_session_id, elicitation_request)
-                logger.debug(f"Sent elicitation request {pending.request_id} to session {target_session_id}")
-
-                # Wait for response
-                elicit_result = await elicitation_task
-
-                # Return result
-                result = elicit_result.model_dump(by_alias=True, exclude_none=True)
-
-            except asyncio.TimeoutError:
-                raise JSONRPCError(-32000, f"Elicitation timed out after {timeout}s", {"message": elicit_params.message, "timeout": timeout})
-            except ValueError as e:
-                raise JSONRPCError(-32000, str(e), {"message": elicit_params.message})
-        elif method.startswith("elicitation/"):
-            # Catch-all for other elicitation/* methods
-            result = {}
-        elif method == "completion/complete":
-            # MCP spec-compliant completion endpoint
-            result = await completion_service.handle_completion(db, params)
-        elif method.startswith("completion/"):
-            # Catch-all for other completion/* methods (currently unsupported)
-            result = {}
-        elif method == "logging/setLevel":
-            # MCP spec-compliant logging endpoint
-            level = LogLevel(params.get("level"))
-            await logging_service.set_level(level)
-            result = {}
-        elif method.startswith("logging/"):
-            # Catch-all for other logging/* methods (currently unsupported)
-            result = {}
-        else:
-            # Backward compatibility: Try to invoke as a tool directly
-            # This allows both old format (method=tool_name) and new format (method=tools/call)
-            # Standard
-            headers = {k.lower(): v for k, v in request.headers.items()}
-            # Get user email for OAuth token selection
-            user_email = get_user_email(user)
-            try:
-                result = await tool_service.invoke_tool(db=db, name=method, arguments=params, request_headers=headers, app_user_email=user_email)
-                if hasattr(result, "model_dump"):
-                    result = result.model_dump(by_alias=True, exclude_none=True)
-            except (PluginError, PluginViolationError):
-                raise
-            except (ValueError, Exception):
-                # If not a tool, try forwarding to gateway
-                try:
-                    result = await gateway_service.forward_request(db, method, params, app_user_email=user_email)
-                    if hasattr(result, "model_dump"):
-                        result = result.model_dump(by_alias=True, exclude_none=True)
-                except Exception:
-                    # If all else fails, return invalid method error
-                    raise JSONRPCError(-32000, "Invalid method", params)
+        if method in CATALOG_METHODS:
+            # Send the pre-serialized list result as is; clients holding it get a 304
+            snapshot = await catalog_snapshot(db, method, params)
+            headers = {"ETag": snapshot.etag}
+            if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+                return starletteResponse(status_code=304, headers=headers)
+            return starletteResponse(content=snapshot.envelope(req_id), media_type="application/json", headers=headers)
 
+        result = await dispatch_rpc(
+            db,
+            method,
+            params,
+            user,
+            request_headers=request.headers,
+            session_id=request.query_params.get("session_id"),
+            plugin_context_table=getattr(request.state, "plugin_context_table", None),
+            plugin_global_context=getattr(request.state, "plugin_global_context", None),
+        )
         return {"jsonrpc": "2.0", "result": result, "id": req_id}
 
     except (PluginError, PluginViolationError):
@@ -4242,18 +4338,134 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
         }
 
 
+async def dispatch_rpc_message(message: Union[Dict[str, Any], List[Any]], user: Any, request_headers: Optional[Mapping[str, str]] = None) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Dispatch a parsed JSON-RPC message in-process and build the response envelope.
+
+    Used by SSE sessions and the WebSocket transport in place of a loopback HTTP call
+    to ``/rpc``. Errors never propagate: JSON-RPC, plugin and unexpected errors are all
+    returned as JSON-RPC error responses. A list is handled as a batch (see
+    ``dispatch_rpc_batch``).
+
+    Args:
+        message: The parsed JSON-RPC request, or a batch of requests.
+        user: The authenticated user of the session.
+        request_headers: Headers of the request that opened the session.
+
+    Returns:
+        A JSON-RPC response with either ``result`` or ``error``; for a batch, the
+        responses of its requests, or None when it contained only notifications.
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(dispatch_rpc_message({"jsonrpc": "2.0", "method": "ping", "id": 1}, "anonymous"))
+        {'jsonrpc': '2.0', 'result': {}, 'id': 1}
+        >>> asyncio.run(dispatch_rpc_message({"jsonrpc": "2.0", "id": 2}, "anonymous"))["error"]["code"]
+        -32600
+        >>> asyncio.run(dispatch_rpc_message([{"jsonrpc": "2.0", "method": "ping", "id": 3}], "anonymous"))
+        [{'jsonrpc': '2.0', 'result': {}, 'id': 3}]
+    """
+    if isinstance(message, list):
+        return await dispatch_rpc_batch(message, user, request_headers=request_headers)
+
+    req_id = message.get("id") if isinstance(message, dict) else None
+    try:
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            raise JSONRPCError(-32600, "Invalid Request")
+        method = message["method"]
+        params = message.get("params") or {}
+        RPCRequest(jsonrpc="2.0", method=method, params=params)  # Validate the message against the RPCRequest model
+
+        db = SessionLocal()
+        try:
+            result = await dispatch_rpc(db, method, params, user, request_headers=request_headers)
+        finally:
+            db.close()
+        return {"jsonrpc": "2.0", "result": result, "id": req_id}
+    except JSONRPCError as e:
+        return {"jsonrpc": "2.0", "error": e.to_dict()["error"], "id": req_id}
+    except PluginViolationError as e:
+        error = json.loads((await plugin_violation_exception_handler(None, e)).body)["error"]
+        return {"jsonrpc": "2.0", "error": error, "id": req_id}
+    except PluginError as e:
+        error = json.loads((await plugin_exception_handler(None, e)).body)["error"]
+        return {"jsonrpc": "2.0", "error": error, "id": req_id}
+    except Exception as e:
+        logger.error(f"RPC error: {str(e)}")
+        return {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Internal error", "data": str(e)}, "id": req_id}
+
+
+async def dispatch_rpc_batch(messages: List[Any], user: Any, request_headers: Optional[Mapping[str, str]] = None) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Dispatch a JSON-RPC 2.0 batch in-process.
+
+    The calls of a batch are independent, so they run concurrently (at most
+    ``rpc_batch_concurrency`` at a time), each with its own database session and the
+    caller's already-resolved auth context. Responses are returned in request order.
+    Notifications (requests without an ``id``) are executed but get no response.
+
+    Args:
+        messages: The parsed batch.
+        user: The authenticated user.
+        request_headers: Headers of the originating request.
+
+    Returns:
+        The responses in request order; None when the batch held only notifications;
+        a single error response when the batch is empty or too large.
+
+    Examples:
+        >>> import asyncio
+        >>> batch = [
+        ...     {"jsonrpc": "2.0", "method": "ping", "id": 1},
+        ...     {"jsonrpc": "2.0", "method": "notifications/unknown"},
+        ...     42,
+        ... ]
+        >>> asyncio.run(dispatch_rpc_batch(batch, "anonymous"))
+        [{'jsonrpc': '2.0', 'result': {}, 'id': 1}, {'jsonrpc': '2.0', 'error': {'code': -32600, 'message': 'Invalid Request'}, 'id': None}]
+        >>> asyncio.run(dispatch_rpc_batch([{"jsonrpc": "2.0", "method": "notifications/unknown"}], "anonymous")) is None
+        True
+        >>> asyncio.run(dispatch_rpc_batch([], "anonymous"))["error"]["code"]
+        -32600
+    """
+    if not messages:
+        return {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None}
+    if len(messages) > settings.rpc_batch_max_size:
+        return {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Batch too large", "data": {"max_size": settings.rpc_batch_max_size}}, "id": None}
+
+    semaphore = asyncio.Semaphore(settings.rpc_batch_concurrency)
+
+    async def _dispatch(message: Any) -> Optional[Dict[str, Any]]:
+        """Dispatch one call of the batch.
+
+        Args:
+            message: One element of the batch.
+
+        Returns:
+            Optional[Dict[str, Any]]: The response, or None for a notification.
+        """
+        if not isinstance(message, dict):
+            # Nested batches are not allowed
+            return {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None}
+        async with semaphore:
+            response = await dispatch_rpc_message(message, user, request_headers=request_headers)
+        return None if "id" not in message and "method" in message else response
+
+    responses = [response for response in await asyncio.gather(*(_dispatch(message) for message in messages)) if response is not None]
+    return responses or None
+
+
 @utility_router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
-    Handle WebSocket connection to relay JSON-RPC requests to the internal RPC endpoint.
+    Handle WebSocket connection to serve JSON-RPC requests.
 
-    Accepts incoming text messages, parses them as JSON-RPC requests, sends them to /rpc,
-    and returns the result to the client over the same WebSocket.
+    Accepts incoming text messages, parses them as JSON-RPC requests, dispatches them
+    in-process with the connection's auth context, and returns the result to the client
+    over the same WebSocket.
 
     Args:
         websocket: The WebSocket connection instance.
     """
     try:
+        user: Any = "anonymous"
         # Authenticate WebSocket connection
         if settings.mcp_client_auth_enabled or settings.auth_required:
             # Extract auth from query params or headers
@@ -4268,35 +4480,38 @@ async def websocket_endpoint(websocket: WebSocket):
                     token = auth_header[7:]
 
             # Check for proxy auth if MCP client auth is disabled
+            proxy_user = None
             if not settings.mcp_client_auth_enabled and settings.trust_proxy_auth:
                 proxy_user = websocket.headers.get(settings.proxy_user_header)
                 if not proxy_user and not token:
                     await websocket.close(code=1008, reason="Authentication required")
                     return
+                user = proxy_user or user
             elif settings.auth_required and not token:
                 await websocket.close(code=1008, reason="Authentication required")
                 return
 
-            # Verify JWT token if provided and MCP client auth is enabled
-            if token and settings.mcp_client_auth_enabled:
+            # Messages are dispatched in-process as this user, so any token that is
+            # not vouched for by a trusted proxy goes through the same JWT/API token,
+            # revocation and active-account checks as the HTTP endpoints
+            if token and not proxy_user:
+                db = SessionLocal()
                 try:
-                    await verify_jwt_token(token)
+                    account = await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token), db)
                 except Exception:
                     await websocket.close(code=1008, reason="Invalid authentication")
                     return
+                finally:
+                    db.close()
+                user = {"sub": account.email, "email": account.email, "is_admin": account.is_admin}
 
         await websocket.accept()
         while True:
             try:
                 data = await websocket.receive_text()
-                client_args = {"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify}
-                async with ResilientHttpClient(client_args=client_args) as client:
-                    response = await client.post(
-                        f"http://localhost:{settings.port}{settings.app_root_path}/rpc",
-                        json=json.loads(data),
-                        headers={"Content-Type": "application/json"},
-                    )
-                    await websocket.send_text(response.text)
+                response = await dispatch_rpc_message(json.loads(data), user, request_headers=websocket.headers)
+                if response is not None:
+                    await websocket.send_text(json.dumps(response))
             except JSONRPCError as e:
                 await websocket.send_text(json.dumps(e.to_dict()))
             except json.JSONDecodeError:
@@ -4459,6 +4674,24 @@ async def get_metrics(db: Session = Depends(get_db), user=Depends(get_current_us
         a2a_metrics = await a2a_service.aggregate_metrics(db)
         metrics_result["a2a_agents"] = a2a_metrics
 
+    if settings.mcp_session_pool_enabled:
+        metrics_result["mcp_session_pool"] = get_mcp_session_pool().get_metrics()
+    if settings.metrics_buffer_enabled:
+        metrics_result["metrics_buffer"] = get_metrics_buffer_service().get_metrics()
+    if settings.observability_enabled and settings.observability_buffer_enabled:
+        metrics_result["trace_export"] = get_trace_export_service().get_metrics()
+    if settings.observability_enabled and settings.observability_latency_sketches_enabled:
+        metrics_result["latency_sketches"] = get_latency_sketch_service().get_metrics()
+    metrics_result["auth_cache"] = get_auth_cache().stats()
+    metrics_result["tool_lookup_cache"] = get_tool_lookup_cache().stats()
+    metrics_result["permission_cache"] = get_permission_cache().stats()
+    metrics_result["completion_index"] = get_completion_index().stats()
+    metrics_result["catalog_snapshots"] = get_catalog_snapshot_cache().stats()
+    metrics_result["event_fanout"] = get_event_fanout().stats()
+    if settings.permission_audit_buffer_enabled:
+        metrics_result["permission_audit_buffer"] = get_permission_audit_buffer().get_metrics()
+    metrics_result["oauth_token_cache"] = get_oauth_token_cache().stats()
+
     return metrics_result
 
 
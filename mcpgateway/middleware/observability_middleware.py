@@ -16,6 +16,7 @@ Examples:
 
 # Standard
 import logging
+import random
 import time
 import traceback
 from typing import Callable
@@ -30,6 +31,7 @@ from mcpgateway.config import settings
 from mcpgateway.db import SessionLocal
 from mcpgateway.instrumentation.sqlalchemy import attach_trace_to_session
 from mcpgateway.services.observability_service import current_trace_id, ObservabilityService, parse_traceparent
+from mcpgateway.services.trace_export_service import get_trace_export_service
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +79,11 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         if request.url.path in ["/health", "/healthz", "/ready", "/metrics"] or request.url.path.startswith("/static/"):
             return await call_next(request)
 
+        # Head sampling: unsampled requests are not traced at all
+        sample_rate = getattr(settings, "observability_sample_rate", 1.0)
+        if sample_rate < 1.0 and random.random() >= sample_rate:  # noqa: DUO102 # nosec B311 - sampling, not security
+            return await call_next(request)
+
         # Extract request context
         http_method = request.method
         http_url = str(request.url)
@@ -104,8 +111,9 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         start_time = time.time()
 
         try:
-            # Create database session
-            db = SessionLocal()
+            # Buffered traces are exported in bulk, so a database session is only needed for direct writes
+            if not get_trace_export_service().running:
+                db = SessionLocal()
 
             # Start trace (use external trace_id if provided for distributed tracing)
             trace_id = self.service.start_trace(
@@ -135,7 +143,8 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             current_trace_id.set(trace_id)
 
             # Attach trace_id to database session for SQL query instrumentation
-            attach_trace_to_session(db, trace_id)
+            if db is not None:
+                attach_trace_to_session(db, trace_id)
 
             # Start request span
             span_id = self.service.start_span(db=db, trace_id=trace_id, name="http.request", kind="server", attributes={"http.method": http_method, "http.url": http_url})
@@ -100,6 +100,15 @@ class Plugin(ABC):
         """
         return self._config.priority
 
+    @property
+    def modifies_payload(self) -> bool:
+        """Return whether the plugin may modify the payload.
+
+        Returns:
+            False if the plugin only observes or validates payloads.
+        """
+        return self._config.modifies_payload
+
     @property
     def config(self) -> PluginConfig:
         """Return the plugin's configuration.
@@ -317,6 +326,15 @@ class PluginRef:
         """
         return self._plugin.priority
 
+    @property
+    def modifies_payload(self) -> bool:
+        """Return whether the plugin may modify the payload.
+
+        Returns:
+            False if the plugin only observes or validates payloads.
+        """
+        return self._plugin.modifies_payload
+
     @property
     def name(self) -> str:
         """Return the plugin's name.
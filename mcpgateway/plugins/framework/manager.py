@@ -29,7 +29,6 @@ Examples:
 
 # Standard
 import asyncio
-from copy import deepcopy
 import logging
 from typing import Any, Optional, Union
 
@@ -77,6 +76,8 @@ class PluginExecutor:
     - Context management between plugins
     - Error isolation to prevent plugin failures from affecting the gateway
     - Metadata aggregation from multiple plugins
+    - Concurrent execution of adjacent same-priority plugins that do not modify
+      the payload, when ``parallel_execution_within_band`` is set
 
     Examples:
         >>> executor = PluginExecutor()
@@ -150,10 +151,11 @@ class PluginExecutor:
         # Validate payload size
         self._validate_payload_size(payload)
 
-        res_local_contexts = {}
+        res_local_contexts: PluginContextTable = {}
         combined_metadata: dict[str, Any] = {}
         current_payload: PluginPayload | None = None
 
+        runnable = []
         for hook_ref in hook_refs:
             # Skip disabled plugins
             if hook_ref.plugin_ref.mode == PluginMode.DISABLED:
@@ -163,23 +165,17 @@ class PluginExecutor:
             if hook_ref.plugin_ref.conditions and not payload_matches(payload, hook_type, hook_ref.plugin_ref.conditions, global_context):
                 logger.debug("Skipping plugin %s - conditions not met", hook_ref.plugin_ref.name)
                 continue
+            runnable.append(hook_ref)
 
-            tmp_global_context = GlobalContext(
-                request_id=global_context.request_id,
-                user=global_context.user,
-                tenant_id=global_context.tenant_id,
-                server_id=global_context.server_id,
-                state={} if not global_context.state else deepcopy(global_context.state),
-                metadata={} if not global_context.metadata else deepcopy(global_context.metadata),
-            )
-            # Get or create local context for this plugin
-            local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
-            if local_contexts and local_context_key in local_contexts:
-                local_context = local_contexts[local_context_key]
-                local_context.global_context = tmp_global_context
-            else:
-                local_context = PluginContext(global_context=tmp_global_context)
-            res_local_contexts[local_context_key] = local_context
+        for band in self._bands(runnable):
+            if len(band) > 1:
+                result = await self._execute_band(band, current_payload or payload, global_context, local_contexts, res_local_contexts, violations_as_exceptions, combined_metadata)
+                if result is not None:
+                    return (result, res_local_contexts)
+                continue
+
+            hook_ref = band[0]
+            local_context = self._local_context(hook_ref, global_context, local_contexts, res_local_contexts)
 
             # Execute plugin with timeout protection
             result = await self.execute_plugin(
@@ -201,6 +197,121 @@ class PluginExecutor:
             res_local_contexts,
         )
 
+    def _bands(self, hook_refs: list[HookRef]) -> list[list[HookRef]]:
+        """Group plugins into the units executed one after another.
+
+        Adjacent plugins with the same priority that do not modify the payload
+        form one band and run concurrently; every other plugin is a band of its
+        own, so payload-modifying plugins keep their order.
+
+        Args:
+            hook_refs: Hook references to run, sorted by priority.
+
+        Returns:
+            The hook references grouped into bands, in execution order.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> def ref(name, priority, modifies):
+            ...     return SimpleNamespace(name=name, plugin_ref=SimpleNamespace(priority=priority, modifies_payload=modifies))
+            >>> refs = [ref("a", 10, False), ref("b", 10, False), ref("c", 10, True), ref("d", 20, False)]
+            >>> [[r.name for r in band] for band in PluginExecutor()._bands(refs)]
+            [['a'], ['b'], ['c'], ['d']]
+            >>> from mcpgateway.plugins.framework.models import PluginSettings
+            >>> executor = PluginExecutor(Config(plugin_settings=PluginSettings(parallel_execution_within_band=True)))
+            >>> [[r.name for r in band] for band in executor._bands(refs)]
+            [['a', 'b'], ['c'], ['d']]
+        """
+        if not (self.config and self.config.plugin_settings.parallel_execution_within_band):
+            return [[hook_ref] for hook_ref in hook_refs]
+        bands: list[list[HookRef]] = []
+        for hook_ref in hook_refs:
+            last = bands[-1] if bands else None
+            if last and hook_ref.plugin_ref.modifies_payload is False and last[0].plugin_ref.modifies_payload is False and last[0].plugin_ref.priority == hook_ref.plugin_ref.priority:
+                last.append(hook_ref)
+            else:
+                bands.append([hook_ref])
+        return bands
+
+    def _local_context(
+        self,
+        hook_ref: HookRef,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+    ) -> PluginContext:
+        """Get or create a plugin's local context with its own copy-on-write fork of the global context.
+
+        Args:
+            hook_ref: Hook reference of the plugin about to run.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Contexts of this execution, updated in place.
+
+        Returns:
+            The plugin's local context.
+        """
+        tmp_global_context = global_context.fork()
+        # Get or create local context for this plugin
+        local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
+        if local_contexts and local_context_key in local_contexts:
+            local_context = local_contexts[local_context_key]
+            local_context.global_context = tmp_global_context
+        else:
+            local_context = PluginContext(global_context=tmp_global_context)
+        res_local_contexts[local_context_key] = local_context
+        return local_context
+
+    async def _execute_band(
+        self,
+        band: list[HookRef],
+        payload: PluginPayload,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+        violations_as_exceptions: bool,
+        combined_metadata: dict[str, Any],
+    ) -> Optional[PluginResult]:
+        """Run a band of non-modifying plugins concurrently.
+
+        Every plugin sees the same payload and global context. Results are then
+        merged in priority order, as if the plugins had run one after another:
+        context and metadata updates are applied in that order, the first error
+        in that order is raised, and the first enforcing block wins.
+
+        Args:
+            band: Hook references with equal priority that do not modify the payload.
+            payload: The payload to be processed by plugins.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Contexts of this execution, updated in place.
+            violations_as_exceptions: Raise violations as exceptions rather than as returns.
+            combined_metadata: combination of the metadata of all plugins, updated in place.
+
+        Returns:
+            The blocking result if a plugin in enforce mode blocked the request, else None.
+
+        Raises:
+            BaseException: The first error raised by a plugin in the band, in priority order.
+        """
+        contexts = [self._local_context(hook_ref, global_context, local_contexts, res_local_contexts) for hook_ref in band]
+        results = await asyncio.gather(
+            *(self.execute_plugin(hook_ref, payload, context, violations_as_exceptions) for hook_ref, context in zip(band, contexts)),
+            return_exceptions=True,
+        )
+        for hook_ref, context, result in zip(band, contexts, results):
+            if isinstance(result, BaseException):
+                raise result
+            if context.global_context:
+                global_context.merge(context.global_context)
+            if result.metadata:
+                combined_metadata.update(result.metadata)
+            if not result.continue_processing and hook_ref.plugin_ref.plugin.mode == PluginMode.ENFORCE:
+                return PluginResult(continue_processing=False, modified_payload=payload, violation=result.violation, metadata=combined_metadata)
+            if result.modified_payload is not None:
+                logger.warning("Plugin %s declares modifies_payload: false but returned a modified payload; ignoring it", hook_ref.plugin_ref.name)
+        return None
+
     async def execute_plugin(
         self,
         hook_ref: HookRef,
@@ -234,8 +345,7 @@ class PluginExecutor:
             # Execute plugin with timeout protection
             result = await self._execute_with_timeout(hook_ref, payload, local_context)
             if local_context.global_context and global_context:
-                global_context.state.update(local_context.global_context.state)
-                global_context.metadata.update(local_context.global_context.metadata)
+                global_context.merge(local_context.global_context)
             # Aggregate metadata from all plugins
             if result.metadata and combined_metadata is not None:
                 combined_metadata.update(result.metadata)
@@ -320,12 +430,14 @@ class PluginExecutor:
             # pylint: disable=import-outside-toplevel
             from mcpgateway.db import SessionLocal
             from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
+            from mcpgateway.services.trace_export_service import get_trace_export_service
 
             # pylint: enable=import-outside-toplevel
 
             trace_id = current_trace_id.get()
             if trace_id:
-                db = SessionLocal()
+                # Buffered spans need no database session; only direct writes open one
+                db = None if get_trace_export_service().running else SessionLocal()
                 try:
                     service = ObservabilityService()
                     span_id = service.start_span(
@@ -359,7 +471,8 @@ class PluginExecutor:
                     )
                     return result
                 finally:
-                    db.close()
+                    if db is not None:
+                        db.close()
             else:
                 # No active trace, execute without instrumentation
                 return await asyncio.wait_for(hook_ref.hook(payload, context), timeout=self.timeout)
@@ -10,6 +10,7 @@ the base plugin layer including configurations, and contexts.
 """
 
 # Standard
+from copy import deepcopy
 from enum import Enum
 import os
 from pathlib import Path
@@ -557,6 +558,8 @@ class PluginConfig(BaseModel):
         tags (list[str]): a list of tags for making the plugin searchable.
         mode (bool): whether the plugin is active.
         priority (int): indicates the order in which the plugin is run. Lower = higher priority. Default: 100.
+        modifies_payload (bool): whether the plugin may return a modified payload. Plugins that only observe or
+            validate set this to False so they can run concurrently with others in their priority band. Default: True.
         conditions (Optional[list[PluginCondition]]): the conditions on which the plugin is run.
         applied_to (Optional[list[AppliedTo]]): the tools, fields, that the plugin is applied to.
         config (dict[str, Any]): the plugin specific configurations.
@@ -573,6 +576,7 @@ class PluginConfig(BaseModel):
     tags: list[str] = Field(default_factory=list)
     mode: PluginMode = PluginMode.ENFORCE
     priority: int = 100  # Lower = higher priority
+    modifies_payload: bool = True  # False lets the plugin run concurrently within its priority band
     conditions: list[PluginCondition] = Field(default_factory=list)  # When to apply
     applied_to: Optional[AppliedTo] = None  # Fields to apply to.
     config: Optional[dict[str, Any]] = None
@@ -724,7 +728,7 @@ class PluginSettings(BaseModel):
     """Global plugin settings.
 
     Attributes:
-        parallel_execution_within_band (bool): execute plugins with same priority in parallel.
+        parallel_execution_within_band (bool): execute plugins with same priority that do not modify the payload in parallel.
         plugin_timeout (int):  timeout value for plugins operations.
         fail_on_plugin_error (bool): error when there is a plugin connectivity or ignore.
         enable_plugin_api (bool): enable or disable plugins globally.
@@ -792,6 +796,237 @@ class PluginResult(BaseModel, Generic[T]):
     metadata: Optional[dict[str, Any]] = Field(default_factory=dict)
 
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset)
+
+
+class CopyOnWriteDict(dict):
+    """A dict sharing its values with a base dict until they are touched.
+
+    Creating one copies only the top-level key table. A mutable value is
+    deep-copied the first time it is read, so changes never reach the base; keys
+    that were read or written this way are reported by ``changes()``. Plugins
+    get one of these per run instead of a deep copy of the whole context, so
+    large metadata such as tool and gateway models is copied only when a plugin
+    actually uses it.
+
+    Examples:
+        >>> base = {"tags": ["a"], "n": 1}
+        >>> view = CopyOnWriteDict(base)
+        >>> view["tags"].append("b")
+        >>> view["x"] = 2
+        >>> base
+        {'tags': ['a'], 'n': 1}
+        >>> view.changes()
+        {'tags': ['a', 'b'], 'x': 2}
+        >>> dict(view) == {"tags": ["a", "b"], "n": 1, "x": 2}
+        True
+    """
+
+    def __init__(self, base: Optional[dict[str, Any]] = None):
+        """Create a view over ``base`` without copying its values.
+
+        Args:
+            base: Dict whose values are shared until touched.
+        """
+        # dict.copy reads the raw table, so a CopyOnWriteDict base is not materialized
+        super().__init__(dict.copy(base) if base else {})
+        self._owned: set[str] = set()
+
+    def _own(self, key: str) -> None:
+        """Give this view a private copy of a mutable value.
+
+        Args:
+            key: Key whose value is about to be exposed.
+        """
+        if key in self._owned:
+            return
+        value = dict.__getitem__(self, key)
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            dict.__setitem__(self, key, deepcopy(value))
+            self._owned.add(key)
+
+    def _own_all(self) -> None:
+        """Give this view private copies of every mutable value."""
+        for key in list(dict.keys(self)):
+            self._own(key)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a value, copying it first if it is shared and mutable.
+
+        Args:
+            key: Key to read.
+
+        Returns:
+            The value.
+        """
+        if dict.__contains__(self, key):
+            self._own(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a value in this view only.
+
+        Args:
+            key: Key to write.
+            value: Value to store.
+        """
+        super().__setitem__(key, value)
+        self._owned.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a key from this view only.
+
+        Args:
+            key: Key to remove.
+        """
+        super().__delitem__(key)
+        self._owned.discard(key)
+
+    def __iter__(self):
+        """Iterate keys; overriding this makes ``dict(view)`` and ``{**view}`` read through ``__getitem__``.
+
+        Returns:
+            Iterator over keys.
+        """
+        return super().__iter__()
+
+    def __deepcopy__(self, memo: dict) -> dict[str, Any]:
+        """Return a plain deep copy.
+
+        Args:
+            memo: deepcopy memo.
+
+        Returns:
+            A plain dict.
+        """
+        return {key: deepcopy(dict.__getitem__(self, key), memo) for key in dict.keys(self)}
+
+    def __or__(self, other: dict[str, Any]) -> dict[str, Any]:  # type: ignore[override]
+        """Merge into a new plain dict.
+
+        Args:
+            other: Dict to merge in.
+
+        Returns:
+            A plain dict.
+        """
+        merged = dict(self)
+        merged.update(other)
+        return merged
+
+    def __ior__(self, other: dict[str, Any]) -> Self:  # type: ignore[override]
+        """Merge in place.
+
+        Args:
+            other: Dict to merge in.
+
+        Returns:
+            This view.
+        """
+        self.update(other)
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a value or a default.
+
+        Args:
+            key: Key to read.
+            default: Value returned when the key is missing.
+
+        Returns:
+            The value or the default.
+        """
+        return self[key] if dict.__contains__(self, key) else default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return a value, inserting a default when missing.
+
+        Args:
+            key: Key to read.
+            default: Value inserted when the key is missing.
+
+        Returns:
+            The value.
+        """
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove a key and return its value.
+
+        Args:
+            key: Key to remove.
+            *default: Optional value returned when the key is missing.
+
+        Returns:
+            The removed value or the default.
+        """
+        if not dict.__contains__(self, key):
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        """Remove and return the last inserted item.
+
+        Returns:
+            The removed key and value.
+
+        Raises:
+            KeyError: If the view is empty.
+        """
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Write several values to this view.
+
+        Args:
+            *args: Mapping or iterable of pairs.
+            **kwargs: Additional values.
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def values(self):
+        """Return values, copying shared mutable ones first.
+
+        Returns:
+            A values view.
+        """
+        self._own_all()
+        return super().values()
+
+    def items(self):
+        """Return items, copying shared mutable values first.
+
+        Returns:
+            An items view.
+        """
+        self._own_all()
+        return super().items()
+
+    def copy(self) -> "CopyOnWriteDict":
+        """Return another copy-on-write view with the same contents.
+
+        Returns:
+            A new view.
+        """
+        return CopyOnWriteDict(self)
+
+    def changes(self) -> dict[str, Any]:
+        """Return the values this view wrote or took private copies of.
+
+        Returns:
+            The changed keys and their values.
+        """
+        return {key: value for key, value in dict.items(self) if key in self._owned}
+
+
 class GlobalContext(BaseModel):
     """The global context, which shared across all plugins.
 
@@ -828,6 +1063,40 @@ class GlobalContext(BaseModel):
     state: dict[str, Any] = Field(default_factory=dict)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    def fork(self) -> "GlobalContext":
+        """Return an isolated copy for one plugin run that shares values until they are touched.
+
+        Returns:
+            A global context whose state and metadata are ``CopyOnWriteDict`` views of this one.
+
+        Examples:
+            >>> ctx = GlobalContext(request_id="r1", state={"seen": []})
+            >>> child = ctx.fork()
+            >>> child.state["seen"].append("plugin")
+            >>> ctx.state
+            {'seen': []}
+            >>> ctx.merge(child)
+            >>> ctx.state
+            {'seen': ['plugin']}
+        """
+        return GlobalContext.model_construct(
+            request_id=self.request_id,
+            user=self.user,
+            tenant_id=self.tenant_id,
+            server_id=self.server_id,
+            state=CopyOnWriteDict(self.state),
+            metadata=CopyOnWriteDict(self.metadata),
+        )
+
+    def merge(self, other: "GlobalContext") -> None:
+        """Apply the state and metadata changes made to a fork of this context.
+
+        Args:
+            other: A context returned by ``fork`` (or a plain context, merged in full).
+        """
+        for target, source in ((self.state, other.state), (self.metadata, other.metadata)):
+            target.update(source.changes() if isinstance(source, CopyOnWriteDict) else source)
+
 
 class PluginContext(BaseModel):
     """The plugin's context, which lasts a request lifecycle.
@@ -28,6 +28,7 @@ from sqlalchemy.orm import Session
 
 # First-Party
 from mcpgateway.auth import get_current_user
+from mcpgateway.cache.permission_cache import get_permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailUser, SessionLocal
 from mcpgateway.middleware.rbac import require_permission
@@ -621,6 +622,7 @@ async def update_user(user_email: str, user_request: EmailRegistrationRequest, c
 
         db.commit()
         db.refresh(user)
+        await get_permission_cache().invalidate_user(user.email)
 
         logger.info(f"Admin {current_user.email} updated user: {user.email}")
 
@@ -8,25 +8,42 @@ FastAPI router for handling reverse proxy connections.
 
 This module provides WebSocket and SSE endpoints for reverse proxy clients
 to connect and tunnel their local MCP servers through the gateway.
+
+A reverse proxy session lives on the worker holding its WebSocket. Requests
+for it may arrive on any worker: with ``cache_type=redis`` a
+``ReverseProxyRelay`` records which worker owns each session and relays the
+JSON-RPC request to that worker over Redis pub/sub, returning the response to
+the caller. Without Redis the relay is a local stand-in that only knows the
+sessions of the current process.
 """
 
 # Standard
 import asyncio
 from datetime import datetime, timezone
 import json
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Set
 import uuid
 
 # Third-Party
-from fastapi import APIRouter, Depends, HTTPException, Request, status, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.db import get_db
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.utils.verify_credentials import require_auth
 
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Initialize logging
 logging_service = LoggingService()
 LOGGER = logging_service.get_logger("mcpgateway.routers.reverse_proxy")
@@ -34,16 +51,29 @@ LOGGER = logging_service.get_logger("mcpgateway.routers.reverse_proxy")
 router = APIRouter(prefix="/reverse-proxy", tags=["reverse-proxy"])
 
 
+class ReverseProxyError(Exception):
+    """Base error for requests forwarded to a reverse proxy session."""
+
+
+class SessionNotFoundError(ReverseProxyError):
+    """No worker holds the requested reverse proxy session."""
+
+
+class SessionBusyError(ReverseProxyError):
+    """The session already has the maximum number of requests in flight."""
+
+
 class ReverseProxySession:
     """Manages a reverse proxy session."""
 
-    def __init__(self, session_id: str, websocket: WebSocket, user: Optional[str | dict] = None):
+    def __init__(self, session_id: str, websocket: WebSocket, user: Optional[str | dict] = None, max_inflight: Optional[int] = None):
         """Initialize reverse proxy session.
 
         Args:
             session_id: Unique session identifier.
             websocket: WebSocket connection.
             user: Authenticated user info (if any).
+            max_inflight: Requests allowed to await a response at once; defaults to ``reverse_proxy_max_inflight``.
         """
         self.session_id = session_id
         self.websocket = websocket
@@ -53,6 +83,16 @@ class ReverseProxySession:
         self.last_activity = datetime.now(tz=timezone.utc)
         self.message_count = 0
         self.bytes_transferred = 0
+        self.max_inflight = max_inflight or settings.reverse_proxy_max_inflight
+        # Requests awaiting a response, keyed by the JSON-RPC id sent to the client
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.request_count = 0
+        self.error_count = 0
+        self.timeout_count = 0
+        self.rejected_count = 0
+        self.response_count = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
 
     async def send_message(self, message: Dict[str, Any]) -> None:
         """Send message to the client.
@@ -77,6 +117,407 @@ class ReverseProxySession:
         self.last_activity = datetime.now(tz=timezone.utc)
         return json.loads(data)
 
+    async def send_request(self, payload: Dict[str, Any]) -> None:
+        """Send an MCP message to the client without waiting for a response.
+
+        Args:
+            payload: JSON-RPC message to deliver to the proxied server.
+        """
+        await self.send_message({"type": "request", "sessionId": self.session_id, "payload": payload})
+
+    async def request(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Send a JSON-RPC request to the client and wait for its response.
+
+        The client echoes the JSON-RPC id of the request it forwarded, so the id
+        is swapped for a session-unique one on the way out and the caller's id
+        is restored on the response. Notifications are sent without waiting.
+
+        Args:
+            payload: JSON-RPC request or notification.
+            timeout: Seconds to wait for the response; defaults to ``reverse_proxy_request_timeout``.
+
+        Returns:
+            The JSON-RPC response, or None for notifications.
+
+        Raises:
+            SessionBusyError: If ``max_inflight`` requests are already waiting.
+            asyncio.TimeoutError: If no response arrives in time.
+            Exception: If sending fails or the session disconnects first.
+        """
+        if payload.get("id") is None:
+            await self.send_request(payload)
+            return None
+        if len(self._pending) >= self.max_inflight:
+            self.rejected_count += 1
+            raise SessionBusyError(f"Session {self.session_id} has {self.max_inflight} requests in flight")
+
+        relay_id = f"rp-{uuid.uuid4().hex}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending[relay_id] = future
+        self.request_count += 1
+        started = time.perf_counter()
+        try:
+            await self.send_request({**payload, "id": relay_id})
+            response = await asyncio.wait_for(future, timeout or settings.reverse_proxy_request_timeout)
+        except asyncio.TimeoutError:
+            self.timeout_count += 1
+            raise
+        except Exception:
+            self.error_count += 1
+            raise
+        finally:
+            self._pending.pop(relay_id, None)
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.response_count += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if "error" in response:
+            self.error_count += 1
+        return {**response, "id": payload["id"]}
+
+    def resolve(self, message: Dict[str, Any]) -> bool:
+        """Complete the pending request a ``response`` message answers.
+
+        Args:
+            message: Reverse proxy message whose ``payload`` is a JSON-RPC response.
+
+        Returns:
+            True if the response matched a pending request.
+
+        Examples:
+            >>> session = ReverseProxySession("s1", None)
+            >>> session.resolve({"type": "response", "payload": {"jsonrpc": "2.0", "id": "unknown", "result": {}}})
+            False
+            >>> session.resolve({"type": "response", "id": 1})
+            False
+        """
+        payload = message.get("payload")
+        if not isinstance(payload, dict):
+            return False
+        future = self._pending.get(str(payload.get("id")))
+        if future is None or future.done():
+            return False
+        future.set_result(payload)
+        return True
+
+    def close(self) -> None:
+        """Fail every request still waiting for a response from this session."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"Reverse proxy session {self.session_id} disconnected"))
+        self._pending.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Request counters and latency for this session.
+
+        Returns:
+            Dictionary of in-flight, request, error, timeout and latency figures.
+
+        Examples:
+            >>> ReverseProxySession("s1", None, max_inflight=4).get_metrics()["max_inflight"]
+            4
+        """
+        return {
+            "inflight": len(self._pending),
+            "max_inflight": self.max_inflight,
+            "requests": self.request_count,
+            "errors": self.error_count,
+            "timeouts": self.timeout_count,
+            "rejected": self.rejected_count,
+            "avg_latency_ms": round(self.total_latency_ms / self.response_count, 2) if self.response_count else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 2),
+        }
+
+
+class ReverseProxyRelay:
+    """Session directory and request relay shared by all workers.
+
+    With the Redis cache backend each worker claims the sessions it holds under
+    ``<cache_prefix>reverse_proxy:session:<id>`` (refreshed well within
+    ``reverse_proxy_session_ttl``) and listens on its own
+    ``<cache_prefix>reverse_proxy:worker:<worker_id>`` channel. A worker asked
+    about a session it does not hold looks up the owner, publishes the request on
+    the owner's channel and waits for the reply on its own. Otherwise the relay
+    stays inactive and only sessions of this process can be reached.
+
+    Examples:
+        >>> relay = ReverseProxyRelay(ReverseProxyManager())
+        >>> relay.active
+        False
+        >>> relay.session_key("abc").endswith("reverse_proxy:session:abc")
+        True
+        >>> relay.worker_channel(relay.worker_id) == relay.channel
+        True
+    """
+
+    def __init__(self, manager: "ReverseProxyManager"):
+        """Initialize the relay.
+
+        Args:
+            manager: Manager holding the sessions connected to this worker.
+        """
+        self.worker_id = uuid.uuid4().hex
+        self.channel = self.worker_channel(self.worker_id)
+        self._manager = manager
+        self._redis: Any = None
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.relayed_count = 0
+        self.served_count = 0
+        self.failed_count = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether requests are relayed between workers.
+
+        Returns:
+            bool: True while the listener task is running.
+        """
+        return self._listener is not None
+
+    @staticmethod
+    def session_key(session_id: str) -> str:
+        """Redis key recording which worker holds a session.
+
+        Args:
+            session_id: Reverse proxy session ID.
+
+        Returns:
+            str: Prefixed directory key.
+        """
+        return f"{settings.cache_prefix}reverse_proxy:session:{session_id}"
+
+    @staticmethod
+    def worker_channel(worker_id: str) -> str:
+        """Pub/sub channel a worker receives relayed requests and replies on.
+
+        Args:
+            worker_id: Worker identifier.
+
+        Returns:
+            str: Prefixed channel name.
+        """
+        return f"{settings.cache_prefix}reverse_proxy:worker:{worker_id}"
+
+    async def start(self) -> None:
+        """Subscribe to this worker's channel when the Redis cache backend is configured."""
+        if settings.cache_type != "redis" or not REDIS_AVAILABLE or not settings.redis_url or self._listener is not None:
+            return
+        try:
+            self._redis = Redis.from_url(settings.redis_url, decode_responses=True)
+            self._pubsub = self._redis.pubsub()
+            await self._pubsub.subscribe(self.channel)
+        except Exception as e:
+            LOGGER.warning(f"Reverse proxy relay unavailable, sessions are only reachable on the worker holding them: {e}")
+            self._redis = self._pubsub = None
+            return
+        self._listener = asyncio.create_task(self._listen())
+        self._refresher = asyncio.create_task(self._refresh())
+        for session_id in list(self._manager.sessions):
+            await self.claim(session_id)
+
+    async def claim(self, session_id: str) -> None:
+        """Record this worker as the owner of a session.
+
+        Args:
+            session_id: Session connected to this worker.
+        """
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(self.session_key(session_id), self.worker_id, ex=settings.reverse_proxy_session_ttl)
+        except Exception as e:
+            LOGGER.warning(f"Failed to claim reverse proxy session {session_id}: {e}")
+
+    async def release(self, session_id: str) -> None:
+        """Drop the directory entry for a session this worker no longer holds.
+
+        Args:
+            session_id: Session that disconnected.
+        """
+        if self._redis is None:
+            return
+        key = self.session_key(session_id)
+        try:
+            # A reconnect may already have claimed the session on another worker
+            if await self._redis.get(key) == self.worker_id:
+                await self._redis.delete(key)
+        except Exception as e:
+            LOGGER.warning(f"Failed to release reverse proxy session {session_id}: {e}")
+
+    async def owner(self, session_id: str) -> Optional[str]:
+        """Look up the worker holding a session.
+
+        Args:
+            session_id: Session to look up.
+
+        Returns:
+            Optional[str]: Worker ID, or None if no worker holds the session.
+        """
+        if self._redis is None:
+            return None
+        return await self._redis.get(self.session_key(session_id))
+
+    async def forward(self, session_id: str, payload: Dict[str, Any], timeout: float, wait: bool = True) -> Optional[Dict[str, Any]]:
+        """Relay a request to the worker holding the session.
+
+        Args:
+            session_id: Session to deliver the request to.
+            payload: JSON-RPC message.
+            timeout: Seconds to wait for the response.
+            wait: Whether to wait for the JSON-RPC response or only for delivery.
+
+        Returns:
+            The JSON-RPC response, or None if not waiting or for notifications.
+
+        Raises:
+            SessionNotFoundError: If no live worker holds the session.
+            SessionBusyError: If the session has too many requests in flight.
+            asyncio.TimeoutError: If no reply arrives in time.
+            ReverseProxyError: If the owning worker failed to deliver the request.
+        """
+        owner = await self.owner(session_id)
+        if owner is None or owner == self.worker_id:
+            raise SessionNotFoundError(f"Session {session_id} not found")
+
+        relay_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[relay_id] = future
+        message = {"kind": "request", "id": relay_id, "reply_to": self.worker_id, "session_id": session_id, "payload": payload, "timeout": timeout, "wait": wait}
+        try:
+            if not await self._redis.publish(self.worker_channel(owner), json.dumps(message)):
+                # The owner exited without releasing its sessions
+                raise SessionNotFoundError(f"Session {session_id} not found")
+            self.relayed_count += 1
+            reply = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(relay_id, None)
+
+        error = reply.get("error")
+        if error:
+            raise _RELAY_ERRORS.get(error.get("type"), ReverseProxyError)(error.get("message", "Relayed request failed"))
+        return reply.get("payload")
+
+    def dispatch(self, data: Dict[str, Any]) -> None:
+        """Handle a message received on this worker's channel.
+
+        Args:
+            data: Decoded relay request or reply.
+
+        Examples:
+            >>> relay = ReverseProxyRelay(ReverseProxyManager())
+            >>> relay.dispatch({"kind": "response", "id": "unknown", "payload": None})
+            >>> relay.dispatch({"kind": "other"})
+        """
+        if data.get("kind") == "response":
+            future = self._pending.get(data.get("id", ""))
+            if future is not None and not future.done():
+                future.set_result(data)
+        elif data.get("kind") == "request":
+            task = asyncio.create_task(self._serve(data))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _serve(self, data: Dict[str, Any]) -> None:
+        """Deliver a relayed request to a local session and publish the reply.
+
+        Args:
+            data: Relay request published by another worker.
+        """
+        reply: Dict[str, Any] = {"kind": "response", "id": data.get("id")}
+        session = self._manager.get_session(data.get("session_id", ""))
+        try:
+            if session is None:
+                raise SessionNotFoundError(f"Session {data.get('session_id')} not found")
+            if data.get("wait", True):
+                reply["payload"] = await session.request(data.get("payload") or {}, data.get("timeout"))
+            else:
+                await session.send_request(data.get("payload") or {})
+            self.served_count += 1
+        except asyncio.TimeoutError:
+            reply["error"] = {"type": "timeout", "message": f"Session {data.get('session_id')} did not respond in time"}
+        except Exception as e:
+            reply["error"] = {"type": next((name for name, cls in _RELAY_ERRORS.items() if isinstance(e, cls)), "failed"), "message": str(e)}
+        if "error" in reply:
+            self.failed_count += 1
+        try:
+            await self._redis.publish(self.worker_channel(data.get("reply_to", "")), json.dumps(reply))
+        except Exception as e:
+            LOGGER.warning(f"Failed to return relayed reverse proxy response: {e}")
+
+    async def _listen(self) -> None:
+        """Dispatch relay messages published to this worker."""
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                self.dispatch(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            LOGGER.warning(f"Reverse proxy relay listener stopped: {e}")
+
+    async def _refresh(self) -> None:
+        """Keep directory entries of local sessions from expiring."""
+        interval = max(1.0, settings.reverse_proxy_session_ttl / 3)
+        while True:
+            await asyncio.sleep(interval)
+            for session_id in list(self._manager.sessions):
+                await self.claim(session_id)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Relay counters for this worker.
+
+        Returns:
+            Dictionary with relay state and request counts.
+
+        Examples:
+            >>> ReverseProxyRelay(ReverseProxyManager()).get_metrics()["active"]
+            False
+        """
+        return {
+            "active": self.active,
+            "worker_id": self.worker_id,
+            "relayed": self.relayed_count,
+            "served": self.served_count,
+            "failed": self.failed_count,
+            "pending": len(self._pending),
+        }
+
+    async def shutdown(self) -> None:
+        """Release local sessions, stop background tasks and close Redis connections."""
+        for session_id in list(self._manager.sessions):
+            await self.release(session_id)
+        for task in (self._listener, self._refresher, *self._tasks):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._listener = self._refresher = None
+        self._tasks.clear()
+        for conn in (self._pubsub, self._redis):
+            if conn is not None:
+                try:
+                    await conn.aclose()
+                except Exception as e:
+                    LOGGER.debug(f"Error closing reverse proxy relay connection: {e}")
+        self._pubsub = self._redis = None
+
+
+# Error types carried in relay replies
+_RELAY_ERRORS: Dict[str, type] = {"not_found": SessionNotFoundError, "busy": SessionBusyError, "timeout": asyncio.TimeoutError}
+
 
 class ReverseProxyManager:
     """Manages all reverse proxy sessions."""
@@ -85,6 +526,7 @@ class ReverseProxyManager:
         """Initialize the manager."""
         self.sessions: Dict[str, ReverseProxySession] = {}
         self._lock = asyncio.Lock()
+        self.relay = ReverseProxyRelay(self)
 
     async def add_session(self, session: ReverseProxySession) -> None:
         """Add a new session.
@@ -95,6 +537,7 @@ class ReverseProxyManager:
         async with self._lock:
             self.sessions[session.session_id] = session
             LOGGER.info(f"Added reverse proxy session: {session.session_id}")
+        await self.relay.claim(session.session_id)
 
     async def remove_session(self, session_id: str) -> None:
         """Remove a session.
@@ -103,9 +546,12 @@ class ReverseProxyManager:
             session_id: Session ID to remove.
         """
         async with self._lock:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
-                LOGGER.info(f"Removed reverse proxy session: {session_id}")
+            session = self.sessions.pop(session_id, None)
+            if session is None:
+                return
+            LOGGER.info(f"Removed reverse proxy session: {session_id}")
+        session.close()
+        await self.relay.release(session_id)
 
     def get_session(self, session_id: str) -> Optional[ReverseProxySession]:
         """Get a session by ID.
@@ -118,6 +564,40 @@ class ReverseProxyManager:
         """
         return self.sessions.get(session_id)
 
+    async def request(self, session_id: str, payload: Dict[str, Any], timeout: Optional[float] = None, wait: bool = True) -> Optional[Dict[str, Any]]:
+        """Send a JSON-RPC message to a session held by any worker.
+
+        Args:
+            session_id: Target session.
+            payload: JSON-RPC request or notification.
+            timeout: Seconds to wait for the response; defaults to ``reverse_proxy_request_timeout``.
+            wait: Whether to wait for the JSON-RPC response or only for delivery.
+
+        Returns:
+            The JSON-RPC response, or None if not waiting or for notifications.
+
+        Raises:
+            SessionNotFoundError: If no worker holds the session.
+
+        Examples:
+            >>> import asyncio
+            >>> try:
+            ...     asyncio.run(ReverseProxyManager().request("missing", {"jsonrpc": "2.0", "id": 1, "method": "ping"}))
+            ... except SessionNotFoundError as e:
+            ...     print(e)
+            Session missing not found
+        """
+        timeout = timeout or settings.reverse_proxy_request_timeout
+        session = self.get_session(session_id)
+        if session is None:
+            if not self.relay.active:
+                raise SessionNotFoundError(f"Session {session_id} not found")
+            return await self.relay.forward(session_id, payload, timeout, wait)
+        if not wait:
+            await session.send_request(payload)
+            return None
+        return await session.request(payload, timeout)
+
     def list_sessions(self) -> list[Dict[str, Any]]:
         """List all active sessions.
 
@@ -142,6 +622,7 @@ class ReverseProxyManager:
                 "message_count": session.message_count,
                 "bytes_transferred": session.bytes_transferred,
                 "user": session.user if isinstance(session.user, str) else session.user.get("sub") if isinstance(session.user, dict) else None,
+                "metrics": session.get_metrics(),
             }
             for session in self.sessions.values()
         ]
@@ -209,8 +690,12 @@ async def websocket_endpoint(
                     # Respond to heartbeat
                     await session.send_message({"type": "heartbeat", "sessionId": session_id, "timestamp": datetime.now(tz=timezone.utc).isoformat()})
 
-                elif msg_type in ("response", "notification"):
-                    # Handle MCP response/notification from the proxied server
+                elif msg_type == "response":
+                    # Complete the request waiting on this response, wherever it was sent from
+                    if not session.resolve(message):
+                        LOGGER.debug(f"Received unsolicited response from session {session_id}")
+
+                elif msg_type == "notification":
                     # TODO: Route to appropriate MCP client
                     LOGGER.debug(f"Received {msg_type} from session {session_id}")
 
@@ -246,7 +731,7 @@ async def list_sessions(
     Returns:
         List of session information.
     """
-    return {"sessions": manager.list_sessions(), "total": len(manager.sessions)}
+    return {"sessions": manager.list_sessions(), "total": len(manager.sessions), "relay": manager.relay.get_metrics()}
 
 
 @router.delete("/sessions/{session_id}")
@@ -284,35 +769,44 @@ async def send_request_to_session(
     session_id: str,
     mcp_request: Dict[str, Any],
     request: Request,
+    wait: bool = Query(False, description="Wait for the JSON-RPC response instead of returning once the request is sent"),
+    timeout: Optional[float] = Query(None, gt=0, description="Seconds to wait for the response (defaults to REVERSE_PROXY_REQUEST_TIMEOUT)"),
     _: str | dict = Depends(require_auth),
 ):
     """Send an MCP request to a reverse proxy session.
 
+    The session may be connected to any worker; requests for sessions held
+    elsewhere are relayed to the owning worker.
+
     Args:
         session_id: Session ID to send request to.
         mcp_request: MCP request to send.
         request: HTTP request.
+        wait: Whether to wait for and return the JSON-RPC response.
+        timeout: Seconds to wait for the response.
         _: Authenticated user info (used for auth check).
 
     Returns:
-        Request acknowledgment.
+        Request acknowledgment, including the response when waiting.
 
     Raises:
-        HTTPException: If session is not found or request fails.
+        HTTPException: If session is not found, is busy, times out or the request fails.
     """
-    session = manager.get_session(session_id)
-    if not session:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Session {session_id} not found")
-
-    # Wrap the request in reverse proxy envelope
-    message = {"type": "request", "sessionId": session_id, "payload": mcp_request}
-
     try:
-        await session.send_message(message)
-        return {"status": "sent", "session_id": session_id}
+        response = await manager.request(session_id, mcp_request, timeout=timeout, wait=wait)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Session {session_id} not found")
+    except SessionBusyError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=f"Session {session_id} did not respond in time")
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to send request: {e}")
 
+    if response is None:
+        return {"status": "sent", "session_id": session_id}
+    return {"status": "completed", "session_id": session_id, "response": response}
+
 
 @router.get("/sse/{session_id}")
 async def sse_endpoint(
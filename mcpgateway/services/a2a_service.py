@@ -17,18 +17,22 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 # Third-Party
 import httpx
-from sqlalchemy import and_, case, delete, desc, func, or_, select
+from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.db import A2AAgent as DbA2AAgent
 from mcpgateway.db import A2AAgentMetric, EmailTeam
 from mcpgateway.schemas import A2AAgentCreate, A2AAgentMetrics, A2AAgentRead, A2AAgentUpdate
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, record_metric_rollup, reset_rollups
 from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.services.tool_service import ToolService
 from mcpgateway.utils.create_slug import slugify
+from mcpgateway.utils.metrics_common import summarize_metrics
 from mcpgateway.utils.services_auth import encode_auth  # ,decode_auth
 
 # Initialize logging service first
@@ -822,8 +826,13 @@ class A2AAgentService:
             end_time = datetime.now(timezone.utc)
             response_time = (end_time - start_time).total_seconds()
 
-            metric = A2AAgentMetric(a2a_agent_id=agent.id, response_time=response_time, is_success=success, error_message=error_message, interaction_type=interaction_type)
-            db.add(metric)
+            buffered = settings.metrics_buffer_enabled and get_metrics_buffer_service().record(
+                "a2a_agent", agent.id, response_time, success, error_message, end_time, interaction_type=interaction_type
+            )
+            if not buffered:
+                metric = A2AAgentMetric(a2a_agent_id=agent.id, response_time=response_time, is_success=success, error_message=error_message, interaction_type=interaction_type)
+                db.add(metric)
+                record_metric_rollup(db, "a2a_agent", agent.id, response_time, success, end_time)
 
             # Update last interaction timestamp
             query = select(DbA2AAgent).where(DbA2AAgent.id == agent.id)
@@ -847,30 +856,14 @@ class A2AAgentService:
         total_agents = db.execute(select(func.count(DbA2AAgent.id))).scalar()  # pylint: disable=not-callable
         active_agents = db.execute(select(func.count(DbA2AAgent.id)).where(DbA2AAgent.enabled.is_(True))).scalar()  # pylint: disable=not-callable
 
-        # Get overall metrics
-        metrics_query = select(
-            func.count(A2AAgentMetric.id).label("total_interactions"),  # pylint: disable=not-callable
-            func.sum(case((A2AAgentMetric.is_success.is_(True), 1), else_=0)).label("successful_interactions"),
-            func.avg(A2AAgentMetric.response_time).label("avg_response_time"),
-            func.min(A2AAgentMetric.response_time).label("min_response_time"),
-            func.max(A2AAgentMetric.response_time).label("max_response_time"),
-        )
-
-        metrics_result = db.execute(metrics_query).first()
-
-        if metrics_result:
-            total_interactions = metrics_result.total_interactions or 0
-            successful_interactions = metrics_result.successful_interactions or 0
-            avg_rt = float(metrics_result.avg_response_time or 0.0)
-            min_rt = float(metrics_result.min_response_time or 0.0)
-            max_rt = float(metrics_result.max_response_time or 0.0)
-        else:
-            total_interactions = 0
-            successful_interactions = 0
-            avg_rt = 0.0
-            min_rt = 0.0
-            max_rt = 0.0
-        failed_interactions = total_interactions - successful_interactions
+        # Get overall metrics from the per-agent rollups
+        rollup = aggregate_rollups(db, "a2a_agent")
+        total_interactions = rollup["total_executions"]
+        successful_interactions = rollup["successful_executions"]
+        failed_interactions = rollup["failed_executions"]
+        avg_rt = float(rollup["avg_response_time"] or 0.0)
+        min_rt = float(rollup["min_response_time"] or 0.0)
+        max_rt = float(rollup["max_response_time"] or 0.0)
 
         return {
             "total_agents": total_agents,
@@ -891,14 +884,7 @@ class A2AAgentService:
             db: Database session.
             agent_id: Optional agent ID to reset metrics for specific agent.
         """
-        if agent_id:
-            # Reset metrics for specific agent
-            delete_query = delete(A2AAgentMetric).where(A2AAgentMetric.a2a_agent_id == agent_id)
-        else:
-            # Reset all metrics
-            delete_query = delete(A2AAgentMetric)
-
-        db.execute(delete_query)
+        reset_rollups(db, "a2a_agent", agent_id or None)
         db.commit()
 
         logger.info("Reset A2A agent metrics" + (f" for agent {agent_id}" if agent_id else ""))
@@ -940,30 +926,10 @@ class A2AAgentService:
         setattr(db_agent, "team", self._get_team_name(db, getattr(db_agent, "team_id", None)))
 
         # ✅ Compute metrics
-        total_executions = len(db_agent.metrics)
-        successful_executions = sum(1 for m in db_agent.metrics if m.is_success)
-        failed_executions = total_executions - successful_executions
-        failure_rate = (failed_executions / total_executions * 100) if total_executions > 0 else 0.0
-
-        min_response_time = max_response_time = avg_response_time = last_execution_time = None
-        if db_agent.metrics:
-            response_times = [m.response_time for m in db_agent.metrics if m.response_time is not None]
-            if response_times:
-                min_response_time = min(response_times)
-                max_response_time = max(response_times)
-                avg_response_time = sum(response_times) / len(response_times)
-            last_execution_time = max((m.timestamp for m in db_agent.metrics), default=None)
-
-        metrics = A2AAgentMetrics(
-            total_executions=total_executions,
-            successful_executions=successful_executions,
-            failed_executions=failed_executions,
-            failure_rate=failure_rate,
-            min_response_time=min_response_time,
-            max_response_time=max_response_time,
-            avg_response_time=avg_response_time,
-            last_execution_time=last_execution_time,
-        )
+        summary = summarize_metrics(db_agent)
+
+        # A2A agents report the failure rate as a percentage
+        metrics = A2AAgentMetrics(**{**summary, "failure_rate": summary["failure_rate"] * 100})
 
         # Build dict from ORM model
         agent_data = {k: getattr(db_agent, k, None) for k in A2AAgentRead.model_fields.keys()}
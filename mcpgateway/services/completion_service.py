@@ -7,6 +7,8 @@ Authors: Mihai Criveti
 Completion Service Implementation.
 This module implements argument completion according to the MCP specification.
 It handles completion suggestions for prompt arguments and resource URIs.
+Candidates come from the process-wide completion index, so a request only
+touches the database when the index has nothing fresh for it.
 
 Examples:
     >>> from mcpgateway.services.completion_service import CompletionService, CompletionError
@@ -22,9 +24,10 @@ from typing import Any, Dict, List
 
 # Third-Party
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import load_only, Session
 
 # First-Party
+from mcpgateway.cache.completion_index import get_completion_index, TermIndex
 from mcpgateway.common.models import CompleteResult
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import Resource as DbResource
@@ -69,6 +72,7 @@ class CompletionService:
             {}
         """
         self._custom_completions: Dict[str, List[str]] = {}
+        self._custom_terms: Dict[str, TermIndex] = {}
 
     async def initialize(self) -> None:
         """Initialize completion service."""
@@ -78,6 +82,7 @@ class CompletionService:
         """Shutdown completion service."""
         logger.info("Shutting down completion service")
         self._custom_completions.clear()
+        self._custom_terms.clear()
 
     async def handle_completion(self, db: Session, request: Dict[str, Any]) -> CompleteResult:
         """Handle completion request.
@@ -176,42 +181,27 @@ class CompletionService:
         if not prompt_name:
             raise CompletionError("Missing prompt name")
 
-        prompt = db.execute(select(DbPrompt).where(DbPrompt.name == prompt_name).where(DbPrompt.is_active)).scalar_one_or_none()
+        index = get_completion_index()
+        prompt_completions = index.get_prompt(prompt_name)
+        if prompt_completions is None:
+            prompt = db.execute(select(DbPrompt).where(DbPrompt.name == prompt_name).where(DbPrompt.is_active)).scalar_one_or_none()
 
-        if not prompt:
-            raise CompletionError(f"Prompt not found: {prompt_name}")
+            if not prompt:
+                raise CompletionError(f"Prompt not found: {prompt_name}")
 
-        # Find argument in schema
-        arg_schema = None
-        for arg in prompt.argument_schema.get("properties", {}).values():
-            if arg.get("name") == arg_name:
-                arg_schema = arg
-                break
+            prompt_completions = index.put_prompt(prompt_name, prompt.id, prompt.argument_schema)
 
-        if not arg_schema:
+        if arg_name not in prompt_completions.arguments:
             raise CompletionError(f"Argument not found: {arg_name}")
 
         # Get enum values if defined
-        if "enum" in arg_schema:
-            values = [v for v in arg_schema["enum"] if arg_value.lower() in str(v).lower()]
-            return CompleteResult(
-                completion={
-                    "values": values[:100],
-                    "total": len(values),
-                    "hasMore": len(values) > 100,
-                }
-            )
+        enum_terms = prompt_completions.arguments[arg_name]
+        if enum_terms is not None:
+            return CompleteResult(completion=enum_terms.complete(arg_value))
 
         # Check custom completions
-        if arg_name in self._custom_completions:
-            values = [v for v in self._custom_completions[arg_name] if arg_value.lower() in v.lower()]
-            return CompleteResult(
-                completion={
-                    "values": values[:100],
-                    "total": len(values),
-                    "hasMore": len(values) > 100,
-                }
-            )
+        if arg_name in self._custom_terms:
+            return CompleteResult(completion=self._custom_terms[arg_name].complete(arg_value))
 
         # No completions available
         return CompleteResult(completion={"values": [], "total": 0, "hasMore": False})
@@ -253,33 +243,31 @@ class CompletionService:
             ...     MagicMock(uri='http://example.com')
             ... ]
             >>> db.execute.return_value.scalars.return_value.all.return_value = mock_resources
+            >>> from mcpgateway.cache.completion_index import CompletionIndex, set_completion_index
+            >>> set_completion_index(CompletionIndex(ttl=60))
             >>> result = asyncio.run(service._complete_resource_uri(db, ref, 'doc'))
-            >>> len(result.completion['values'])
-            2
-            >>> 'file://doc1.txt' in result.completion['values']
-            True
+            >>> result.completion['values']
+            ['file://doc1.txt', 'file://doc2.txt']
+
+            >>> # Later requests are served from the index
+            >>> db.execute.reset_mock()
+            >>> asyncio.run(service._complete_resource_uri(db, ref, 'http')).completion['values']
+            ['http://example.com']
+            >>> db.execute.called
+            False
+            >>> set_completion_index(None)
         """
         # Get base URI template
         uri_template = ref.get("uri")
         if not uri_template:
             raise CompletionError("Missing URI template")
 
-        # List matching resources
-        resources = db.execute(select(DbResource).where(DbResource.is_active)).scalars().all()
-
-        # Filter by URI pattern
-        matches = []
-        for resource in resources:
-            if arg_value.lower() in resource.uri.lower():
-                matches.append(resource.uri)
+        index = get_completion_index()
+        if index.resources_expired():
+            resources = db.execute(select(DbResource).options(load_only(DbResource.id, DbResource.uri)).where(DbResource.is_active)).scalars().all()
+            index.load_resources((resource.id, resource.uri) for resource in resources)
 
-        return CompleteResult(
-            completion={
-                "values": matches[:100],
-                "total": len(matches),
-                "hasMore": len(matches) > 100,
-            }
-        )
+        return CompleteResult(completion=index.complete_resource_uri(arg_value))
 
     def register_completions(self, arg_name: str, values: List[str]) -> None:
         """Register custom completion values.
@@ -302,6 +290,7 @@ class CompletionService:
             ['c']
         """
         self._custom_completions[arg_name] = list(values)
+        self._custom_terms[arg_name] = TermIndex(self._custom_completions[arg_name])
 
     def unregister_completions(self, arg_name: str) -> None:
         """Unregister custom completion values.
@@ -318,3 +307,4 @@ class CompletionService:
             False
         """
         self._custom_completions.pop(arg_name, None)
+        self._custom_terms.pop(arg_name, None)
@@ -31,6 +31,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import get_auth_cache
+from mcpgateway.cache.permission_cache import get_permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailAuthEvent, EmailUser
 from mcpgateway.services.argon2_service import Argon2PasswordService
@@ -536,6 +538,7 @@ class EmailAuthService:
             existing_admin.is_active = True
 
             self.db.commit()
+            await get_permission_cache().invalidate_user(email)
             logger.info(f"Updated platform admin user: {email}")
             return existing_admin
 
@@ -667,6 +670,8 @@ class EmailAuthService:
             user.updated_at = datetime.now(timezone.utc)
 
             self.db.commit()
+            await get_auth_cache().invalidate_user(email)
+            await get_permission_cache().invalidate_user(email)
             return user
 
         except Exception as e:
@@ -730,6 +735,7 @@ class EmailAuthService:
             user.updated_at = datetime.now(timezone.utc)
 
             self.db.commit()
+            await get_auth_cache().invalidate_user(email)
             logger.info(f"User {email} deactivated")
             return user
 
@@ -809,6 +815,8 @@ class EmailAuthService:
             # Delete the user
             self.db.delete(user)
             self.db.commit()
+            await get_auth_cache().invalidate_user(email)
+            await get_permission_cache().invalidate_user(email)
 
             logger.info(f"User {email} deleted permanently")
             return True
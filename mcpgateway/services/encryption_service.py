@@ -8,14 +8,28 @@ Encryption Service.
 
 This service provides encryption and decryption functions for client secrets
 using the AUTH_ENCRYPTION_SECRET from configuration.
+
+Deriving a key with Argon2id is deliberately expensive (tens of milliseconds and
+``argon2id_memory_cost`` KiB per derivation), while a given ciphertext always
+needs the same key. Derived keys are therefore kept in a small process-wide LRU
+keyed by a digest of the passphrase, the bundle's salt and its cost parameters,
+so decrypting a secret seen before costs only the Fernet step. The number of
+derivations running at once is capped to bound memory, and the ``*_async``
+variants run a derivation in a thread or process pool instead of on the event
+loop.
 """
 
 # Standard
+import asyncio
 import base64
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+import hashlib
 import json
 import logging
 import os
-from typing import Optional, Union
+import threading
+from typing import Optional, Tuple, Union
 
 # Third-Party
 from argon2.low_level import hash_secret_raw, Type
@@ -27,6 +41,73 @@ from mcpgateway.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Derived keys by (sha256(passphrase), salt, t, m, p, hash_len); never holds the passphrase itself
+_derived_keys: "OrderedDict[Tuple[bytes, bytes, int, int, int, int], bytes]" = OrderedDict()
+_derived_keys_lock = threading.Lock()
+# Caps concurrent Argon2id runs so memory stays bounded at roughly n * memory_cost
+_kdf_slots = threading.BoundedSemaphore(max(1, settings.encryption_kdf_max_concurrency))
+_kdf_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _argon2id(passphrase: bytes, salt: bytes, time_cost: int, memory_cost: int, parallelism: int, hash_len: int) -> bytes:
+    """Run Argon2id and return the urlsafe-base64 Fernet key (picklable for process pools).
+
+    Args:
+        passphrase: The passphrase to derive the key from
+        salt: The salt to use in key derivation
+        time_cost: Argon2id time cost parameter
+        memory_cost: Argon2id memory cost parameter (in KiB)
+        parallelism: Argon2id parallelism parameter
+        hash_len: Length of the derived key
+
+    Returns:
+        The derived key
+
+    Examples:
+        >>> len(_argon2id(b"secret", b"0123456789abcdef", 1, 8, 1, 32))
+        44
+    """
+    raw = hash_secret_raw(
+        secret=passphrase,
+        salt=salt,
+        time_cost=time_cost,
+        memory_cost=memory_cost,  # KiB
+        parallelism=parallelism,
+        hash_len=hash_len,
+        type=Type.ID,
+    )
+    return base64.urlsafe_b64encode(raw)
+
+
+def _kdf_executor() -> Optional[Executor]:
+    """Return the executor for async key derivation per ``encryption_kdf_executor``.
+
+    Returns:
+        Optional[Executor]: A process pool, or None for the default thread pool.
+
+    Examples:
+        >>> _kdf_executor() is None or isinstance(_kdf_executor(), ProcessPoolExecutor)
+        True
+    """
+    global _kdf_process_pool  # pylint: disable=global-statement
+    if settings.encryption_kdf_executor != "process":
+        return None
+    if _kdf_process_pool is None:
+        _kdf_process_pool = ProcessPoolExecutor(max_workers=max(1, settings.encryption_kdf_max_concurrency))
+    return _kdf_process_pool
+
+
+def clear_derived_key_cache() -> None:
+    """Forget all cached derived keys, e.g. after rotating ``AUTH_ENCRYPTION_SECRET``.
+
+    Examples:
+        >>> clear_derived_key_cache()
+        >>> len(_derived_keys)
+        0
+    """
+    with _derived_keys_lock:
+        _derived_keys.clear()
+
 
 class EncryptionService:
     """Handles encryption and decryption of client secrets.
@@ -70,8 +151,85 @@ class EncryptionService:
         self.hash_len = hash_len
         self.salt_len = salt_len
 
+    def _cache_key(self, passphrase: bytes, salt: bytes, time_cost: int, memory_cost: int, parallelism: int) -> Tuple[bytes, bytes, int, int, int, int]:
+        """Build the derived-key cache key.
+
+        Args:
+            passphrase: The passphrase the key is derived from
+            salt: The salt used in key derivation
+            time_cost: Argon2id time cost parameter
+            memory_cost: Argon2id memory cost parameter (in KiB)
+            parallelism: Argon2id parallelism parameter
+
+        Returns:
+            Tuple of the passphrase digest, salt and parameters.
+        """
+        return (hashlib.sha256(passphrase).digest(), salt, int(time_cost), int(memory_cost), int(parallelism), self.hash_len)
+
+    @staticmethod
+    def _cached_key(cache_key: Tuple[bytes, bytes, int, int, int, int]) -> Optional[bytes]:
+        """Look up a derived key.
+
+        Args:
+            cache_key: Key from ``_cache_key``
+
+        Returns:
+            The derived key, or None on a miss.
+        """
+        with _derived_keys_lock:
+            key = _derived_keys.get(cache_key)
+            if key is not None:
+                _derived_keys.move_to_end(cache_key)
+            return key
+
+    @staticmethod
+    def _remember_key(cache_key: Tuple[bytes, bytes, int, int, int, int], key: bytes) -> None:
+        """Store a derived key, evicting the least recently used beyond ``encryption_key_cache_size``.
+
+        Args:
+            cache_key: Key from ``_cache_key``
+            key: Derived key
+        """
+        if settings.encryption_key_cache_size <= 0:
+            return
+        with _derived_keys_lock:
+            _derived_keys[cache_key] = key
+            _derived_keys.move_to_end(cache_key)
+            while len(_derived_keys) > settings.encryption_key_cache_size:
+                _derived_keys.popitem(last=False)
+
     def derive_key_argon2id(self, passphrase: bytes, salt: bytes, time_cost: int, memory_cost: int, parallelism: int) -> bytes:
-        """Derive a key from a passphrase using Argon2id.
+        """Derive a key from a passphrase using Argon2id, reusing a cached result when available.
+
+        Args:
+            passphrase: The passphrase to derive the key from
+            salt: The salt to use in key derivation
+            time_cost: Argon2id time cost parameter
+            memory_cost: Argon2id memory cost parameter (in KiB)
+            parallelism: Argon2id parallelism parameter
+
+        Returns:
+            The derived key
+
+        Examples:
+            >>> enc = EncryptionService("k", time_cost=1, memory_cost=8)
+            >>> salt = b"0123456789abcdef"
+            >>> enc.derive_key_argon2id(b"k", salt, 1, 8, 1) == enc.derive_key_argon2id(b"k", salt, 1, 8, 1)
+            True
+        """
+        cache_key = self._cache_key(passphrase, salt, time_cost, memory_cost, parallelism)
+        key = self._cached_key(cache_key)
+        if key is None:
+            with _kdf_slots:
+                key = _argon2id(passphrase, salt, time_cost, memory_cost, parallelism, self.hash_len)
+            self._remember_key(cache_key, key)
+        return key
+
+    async def derive_key_argon2id_async(self, passphrase: bytes, salt: bytes, time_cost: int, memory_cost: int, parallelism: int) -> bytes:
+        """Derive a key like ``derive_key_argon2id`` without running Argon2id on the event loop.
+
+        Cache hits return immediately; misses run in the pool selected by
+        ``encryption_kdf_executor`` (``thread`` or ``process``).
 
         Args:
             passphrase: The passphrase to derive the key from
@@ -83,16 +241,40 @@ class EncryptionService:
         Returns:
             The derived key
         """
-        raw = hash_secret_raw(
-            secret=passphrase,
-            salt=salt,
-            time_cost=time_cost,
-            memory_cost=memory_cost,  # KiB
-            parallelism=parallelism,
-            hash_len=self.hash_len,
-            type=Type.ID,
+        cache_key = self._cache_key(passphrase, salt, time_cost, memory_cost, parallelism)
+        key = self._cached_key(cache_key)
+        if key is not None:
+            return key
+        executor = _kdf_executor()
+        if executor is None:
+            key = await asyncio.to_thread(self.derive_key_argon2id, passphrase, salt, time_cost, memory_cost, parallelism)
+        else:
+            key = await asyncio.get_running_loop().run_in_executor(executor, _argon2id, passphrase, salt, time_cost, memory_cost, parallelism, self.hash_len)
+            self._remember_key(cache_key, key)
+        return key
+
+    def _bundle(self, salt: bytes, key: bytes, plaintext: str) -> str:
+        """Encrypt with a derived key and wrap the token with its KDF parameters.
+
+        Args:
+            salt: Salt the key was derived with
+            key: Derived key
+            plaintext: The secret to encrypt
+
+        Returns:
+            JSON bundle string
+        """
+        encrypted = Fernet(key).encrypt(plaintext.encode())
+        return json.dumps(
+            {
+                "kdf": "argon2id",
+                "t": self.time_cost,
+                "m": self.memory_cost,
+                "p": self.parallelism,
+                "salt": base64.b64encode(salt).decode(),
+                "token": encrypted.decode(),
+            }
         )
-        return base64.urlsafe_b64encode(raw)
 
     def encrypt_secret(self, plaintext: str) -> str:
         """Encrypt a plaintext secret.
@@ -109,18 +291,33 @@ class EncryptionService:
         try:
             salt = os.urandom(16)
             key = self.derive_key_argon2id(self.encryption_secret, salt, self.time_cost, self.memory_cost, self.parallelism)
-            fernet = Fernet(key)
-            encrypted = fernet.encrypt(plaintext.encode())
-            return json.dumps(
-                {
-                    "kdf": "argon2id",
-                    "t": self.time_cost,
-                    "m": self.memory_cost,
-                    "p": self.parallelism,
-                    "salt": base64.b64encode(salt).decode(),
-                    "token": encrypted.decode(),
-                }
-            )
+            return self._bundle(salt, key, plaintext)
+        except Exception as e:
+            logger.error(f"Failed to encrypt secret: {e}")
+            raise
+
+    async def encrypt_secret_async(self, plaintext: str) -> str:
+        """Encrypt a plaintext secret without running Argon2id on the event loop.
+
+        Args:
+            plaintext: The secret to encrypt
+
+        Returns:
+            Base64-encoded encrypted string
+
+        Raises:
+            Exception: If encryption fails
+
+        Examples:
+            >>> import asyncio
+            >>> enc = EncryptionService("k", time_cost=1, memory_cost=8)
+            >>> enc.decrypt_secret(asyncio.run(enc.encrypt_secret_async("hello")))
+            'hello'
+        """
+        try:
+            salt = os.urandom(16)
+            key = await self.derive_key_argon2id_async(self.encryption_secret, salt, self.time_cost, self.memory_cost, self.parallelism)
+            return self._bundle(salt, key, plaintext)
         except Exception as e:
             logger.error(f"Failed to encrypt secret: {e}")
             raise
@@ -145,6 +342,32 @@ class EncryptionService:
             logger.error(f"Failed to decrypt secret: {e}")
             return None
 
+    async def decrypt_secret_async(self, bundle_json: str) -> Optional[str]:
+        """Decrypt an encrypted secret without running Argon2id on the event loop.
+
+        Args:
+            bundle_json: str: JSON string containing encryption metadata and token
+
+        Returns:
+            Decrypted secret string, or None if decryption fails
+
+        Examples:
+            >>> import asyncio
+            >>> enc = EncryptionService("k", time_cost=1, memory_cost=8)
+            >>> asyncio.run(enc.decrypt_secret_async(enc.encrypt_secret("hello")))
+            'hello'
+            >>> asyncio.run(enc.decrypt_secret_async("not-a-bundle")) is None
+            True
+        """
+        try:
+            b = json.loads(bundle_json)
+            salt = base64.b64decode(b["salt"])
+            key = await self.derive_key_argon2id_async(self.encryption_secret, salt, time_cost=b["t"], memory_cost=b["m"], parallelism=b["p"])
+            return Fernet(key).decrypt(b["token"].encode()).decode()
+        except Exception as e:
+            logger.error(f"Failed to decrypt secret: {e}")
+            return None
+
     def is_encrypted(self, text: str) -> bool:
         """Check if a string appears to be encrypted.
 
@@ -12,11 +12,16 @@ Description:
 
     - Primary Transport (Redis): Uses Redis Pub/Sub for distributed event
       broadcasting. This allows multiple Gateway instances (scaled horizontally)
-      to share events.
-    - Fallback Transport (Local Queue): Uses `asyncio.Queue` for in-memory
-      communication. This activates automatically if Redis is unavailable or
+      to share events. Each worker holds one Redis subscription covering every
+      channel its subscribers listen to (see ``EventFanout``).
+    - Fallback Transport (Local): Events are handed to this worker's subscribers
+      directly. This activates automatically if Redis is unavailable or
       misconfigured, ensuring the application remains functional in a single-node
       development environment.
+    - Delivery: Every subscriber reads from its own bounded buffer
+      (``EventSubscription``). Publishing never waits for a subscriber; a
+      subscriber that falls behind has events coalesced or dropped according to
+      ``event_queue_overflow``, and its backlog is reported in the metrics.
 
 Usage Guide:
 
@@ -54,8 +59,10 @@ Usage Guide:
 
 # Standard
 import asyncio
+from collections import OrderedDict
 import json
-from typing import Any, AsyncGenerator, Dict, List, Optional
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 try:
     # Third-Party
@@ -73,14 +80,453 @@ from mcpgateway.services.logging_service import LoggingService
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
 
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+# Counters of a subscription, summed per channel in the fan-out metrics
+SUBSCRIPTION_COUNTERS = ("delivered", "dropped", "coalesced")
+
+
+class EventSubscription:
+    """Bounded buffer of events for one subscriber.
+
+    ``offer`` never blocks. When the buffer is full, ``drop_oldest`` evicts the
+    oldest pending event and ``drop_newest`` discards the new one. ``coalesce``
+    first drops a pending event of the same type for the same entity
+    (``data.id``) and queues the new one behind the others, so the subscriber
+    still sees an entity's changes in order; then it behaves like ``drop_oldest``.
+
+    Attributes:
+        channel: Channel the subscriber listens to
+        max_size: Maximum number of pending events
+        policy: Overflow policy
+        delivered: Events handed to the subscriber
+        dropped: Events lost to overflow
+        coalesced: Pending events replaced by a newer event of the same type for the same entity
+        max_pending: Largest backlog seen
+
+    Examples:
+        >>> sub = EventSubscription("c", max_size=2, policy="coalesce")
+        >>> for version in (1, 2):
+        ...     _ = sub.offer({"type": "tool_updated", "data": {"id": "t1", "version": version}})
+        >>> _ = sub.offer({"type": "tool_added", "data": {"id": "t2"}})
+        >>> _ = sub.offer({"type": "tool_added", "data": {"id": "t3"}})
+        >>> [e["data"]["id"] for e in sub.drain()], sub.coalesced, sub.dropped
+        (['t2', 't3'], 1, 1)
+        >>> for kind in ("tool_activated", "tool_deactivated", "tool_activated"):
+        ...     _ = sub.offer({"type": kind, "data": {"id": "t1"}})
+        >>> [e["type"] for e in sub.drain()]
+        ['tool_deactivated', 'tool_activated']
+    """
+
+    def __init__(self, channel: str, max_size: Optional[int] = None, policy: Optional[str] = None):
+        """Initialize the subscription.
+
+        Args:
+            channel: Channel the subscriber listens to
+            max_size: Maximum pending events (defaults to ``event_queue_maxsize``)
+            policy: Overflow policy (defaults to ``event_queue_overflow``)
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        self.channel = channel
+        self.max_size = max_size or settings.event_queue_maxsize
+        self.policy = policy or settings.event_queue_overflow
+        if self.policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown event overflow policy: {self.policy}")
+        # Pending events in arrival order with their enqueue time, keyed by entity for coalescing
+        self._pending: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._seq = 0
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_pending = 0
+
+    @staticmethod
+    def _entity_key(event: Dict[str, Any]) -> Optional[Tuple[Any, str]]:
+        """Return the key under which an event may replace a pending one.
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            Optional[Tuple[Any, str]]: ``(type, data.id)``, or None if the event names no entity.
+
+        Examples:
+            >>> EventSubscription._entity_key({"type": "tool_updated", "data": {"id": 5}})
+            ('tool_updated', '5')
+            >>> EventSubscription._entity_key({"type": "ping"}) is None
+            True
+        """
+        data = event.get("data") if isinstance(event, dict) else None
+        if not isinstance(data, dict) or data.get("id") is None:
+            return None
+        return (event.get("type"), str(data["id"]))
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        """Buffer an event without waiting.
+
+        Args:
+            event: Event to deliver
+
+        Returns:
+            bool: False if the event was discarded.
+
+        Examples:
+            >>> sub = EventSubscription("c", max_size=1, policy="drop_newest")
+            >>> sub.offer({"n": 1}), sub.offer({"n": 2}), sub.drain()
+            (True, False, [{'n': 1}])
+        """
+        return self._offer(event, self._entity_key(event), time.monotonic())
+
+    def _offer(self, event: Dict[str, Any], key: Optional[Tuple[Any, str]], now: float) -> bool:
+        """Buffer an event whose entity key and arrival time were computed by the caller.
+
+        Args:
+            event: Event to deliver
+            key: Result of ``_entity_key`` for the event
+            now: ``time.monotonic()`` at arrival
+
+        Returns:
+            bool: False if the event was discarded.
+        """
+        if self.closed:
+            return False
+        if self.policy != "coalesce":
+            key = None
+        elif key is not None and key in self._pending:
+            # Queue the replacement last: events of other types for the entity may have arrived since
+            self._pending[key] = (now, event)
+            self._pending.move_to_end(key)
+            self.coalesced += 1
+            self._ready.set()
+            return True
+        if len(self._pending) >= self.max_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Event subscriber on {self.channel} is {len(self._pending)} events behind (policy {self.policy}); {self.dropped} events dropped so far")
+            if self.policy == "drop_newest":
+                return False
+            self._pending.popitem(last=False)
+        if key is None:
+            self._seq += 1
+            key = self._seq
+        self._pending[key] = (now, event)
+        if len(self._pending) > self.max_pending:
+            self.max_pending = len(self._pending)
+        self._ready.set()
+        return True
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next event.
+
+        Returns:
+            Optional[Dict[str, Any]]: The oldest pending event, or None once the subscription is closed and drained.
+
+        Examples:
+            >>> import asyncio
+            >>> sub = EventSubscription("c", max_size=5, policy="drop_oldest")
+            >>> _ = sub.offer({"n": 1})
+            >>> sub.close()
+            >>> asyncio.run(sub.get()), asyncio.run(sub.get())
+            ({'n': 1}, None)
+        """
+        while not self._pending:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        _, (_, event) = self._pending.popitem(last=False)
+        self.delivered += 1
+        return event
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Take every pending event without waiting.
+
+        Returns:
+            List[Dict[str, Any]]: Pending events, oldest first.
+        """
+        events = [event for _, event in self._pending.values()]
+        self._pending.clear()
+        self.delivered += len(events)
+        return events
+
+    def close(self) -> None:
+        """Stop accepting events and wake the subscriber once the backlog is read."""
+        self.closed = True
+        self._ready.set()
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be read.
+
+        Returns:
+            int: Backlog size.
+        """
+        return len(self._pending)
+
+    @property
+    def lag_seconds(self) -> float:
+        """How long the oldest pending event has been waiting.
+
+        Returns:
+            float: Seconds, or 0.0 without a backlog.
+
+        Examples:
+            >>> EventSubscription("c", max_size=1, policy="coalesce").lag_seconds
+            0.0
+        """
+        if not self._pending:
+            return 0.0
+        return time.monotonic() - next(iter(self._pending.values()))[0]
+
+
+class EventFanout:
+    """Per-worker hub delivering events to every local subscriber of a channel.
+
+    Subscribers register an ``EventSubscription`` per channel. Events published
+    locally, or received from Redis, are offered to each subscription without
+    waiting. With Redis, the worker keeps a single pub/sub connection subscribed
+    to every channel it has had subscribers for, instead of one connection per
+    subscriber; it reconnects with backoff if the connection drops.
+
+    Examples:
+        >>> fanout = EventFanout()
+        >>> a, b = fanout.subscribe("c", max_size=2), fanout.subscribe("c", max_size=2)
+        >>> fanout.deliver("c", {"type": "ping"})
+        2
+        >>> fanout.unsubscribe(a)
+        >>> fanout.stats()["channels"]["c"]["subscribers"], a.closed
+        (1, True)
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self._subscriptions: Dict[str, List[EventSubscription]] = {}
+        self._published: Dict[str, int] = {}
+        # Counters of closed subscriptions, so the totals survive disconnects
+        self._retired: Dict[str, Dict[str, int]] = {}
+        self._redis: Any = None
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task] = None
+        self._remote_channels: Set[str] = set()
+        self._lock: Optional[asyncio.Lock] = None
+        self._reconnects = 0
+
+    def subscribe(self, channel: str, max_size: Optional[int] = None, policy: Optional[str] = None) -> EventSubscription:
+        """Register a local subscriber.
+
+        Args:
+            channel: Channel to listen to
+            max_size: Maximum pending events (defaults to ``event_queue_maxsize``)
+            policy: Overflow policy (defaults to ``event_queue_overflow``)
+
+        Returns:
+            EventSubscription: The subscriber's buffer.
+        """
+        subscription = EventSubscription(channel, max_size=max_size, policy=policy)
+        self._subscriptions.setdefault(channel, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove and close a subscriber.
+
+        Args:
+            subscription: Subscription returned by ``subscribe``
+        """
+        subscription.close()
+        subscriptions = self._subscriptions.get(subscription.channel, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            retired = self._retired.setdefault(subscription.channel, dict.fromkeys(SUBSCRIPTION_COUNTERS, 0))
+            for counter in SUBSCRIPTION_COUNTERS:
+                retired[counter] += getattr(subscription, counter)
+
+    def deliver(self, channel: str, event: Dict[str, Any]) -> int:
+        """Offer an event to every local subscriber of a channel.
+
+        Args:
+            channel: Channel the event was published on
+            event: Event dictionary
+
+        Returns:
+            int: Number of subscribers that accepted the event.
+        """
+        self._published[channel] = self._published.get(channel, 0) + 1
+        subscriptions = self._subscriptions.get(channel)
+        if not subscriptions:
+            return 0
+        key, now = EventSubscription._entity_key(event), time.monotonic()  # pylint: disable=protected-access
+        return sum(subscription._offer(event, key, now) for subscription in subscriptions)  # pylint: disable=protected-access
+
+    async def listen_remote(self, channel: str) -> None:
+        """Make sure this worker's Redis subscription covers a channel.
+
+        Args:
+            channel: Channel to receive from Redis
+
+        Raises:
+            Exception: If Redis cannot be reached for the first subscription.
+        """
+        if channel in self._remote_channels:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._pubsub is None:
+                await self._connect()
+            if channel not in self._remote_channels:
+                try:
+                    await self._pubsub.subscribe(channel)
+                except Exception:
+                    if self._listener is None:
+                        await self._close_connection()
+                    raise
+                self._remote_channels.add(channel)
+            if self._listener is None:
+                self._listener = asyncio.create_task(self._listen())
+
+    async def _connect(self) -> None:
+        """Open the pub/sub connection and subscribe to every known channel."""
+        # Third-Party
+        import redis.asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+        client = aioredis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = client.pubsub()
+        try:
+            if self._remote_channels:
+                await pubsub.subscribe(*self._remote_channels)
+        except Exception:
+            await client.aclose()
+            raise
+        self._redis, self._pubsub = client, pubsub
+
+    async def _close_connection(self) -> None:
+        """Close the pub/sub connection, ignoring errors."""
+        for conn in (self._pubsub, self._redis):
+            if conn is not None:
+                try:
+                    await conn.aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing event subscription connection: {e}")
+        self._pubsub = self._redis = None
+
+    async def _listen(self) -> None:
+        """Deliver messages from Redis, reconnecting with backoff when the connection drops."""
+        backoff = 1.0
+        while True:
+            try:
+                if self._pubsub is None:
+                    async with self._lock:
+                        if self._pubsub is None:
+                            await self._connect()
+                            self._reconnects += 1
+                async for message in self._pubsub.listen():
+                    backoff = 1.0
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        event = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    self.deliver(message.get("channel"), event)
+                logger.warning("Redis event subscription ended, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis event subscription lost, reconnecting in {backoff:.0f}s: {e}")
+            await self._close_connection()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    async def shutdown(self) -> None:
+        """Close every subscription, stop the listener and close Redis connections."""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                self.unsubscribe(subscription)
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self._close_connection()
+        self._remote_channels.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-channel delivery and lag counters.
+
+        Returns:
+            Dict[str, Any]: For each channel: subscribers, published, delivered,
+            dropped and coalesced events, current and peak backlog and the age
+            of the oldest pending event; plus the Redis subscription state.
+
+        Examples:
+            >>> fanout = EventFanout()
+            >>> sub = fanout.subscribe("c", max_size=1, policy="drop_oldest")
+            >>> _ = fanout.deliver("c", {"n": 1}), fanout.deliver("c", {"n": 2})
+            >>> stats = fanout.stats()["channels"]["c"]
+            >>> stats["published"], stats["dropped"], stats["pending"]
+            (2, 1, 1)
+        """
+        channels = {}
+        for channel in set(self._subscriptions) | set(self._published) | set(self._retired):
+            subscriptions = self._subscriptions.get(channel, [])
+            totals = dict(self._retired.get(channel, dict.fromkeys(SUBSCRIPTION_COUNTERS, 0)))
+            for subscription in subscriptions:
+                for counter in SUBSCRIPTION_COUNTERS:
+                    totals[counter] += getattr(subscription, counter)
+            channels[channel] = {
+                "subscribers": len(subscriptions),
+                "published": self._published.get(channel, 0),
+                **totals,
+                "pending": sum(subscription.pending for subscription in subscriptions),
+                "max_pending": max((subscription.max_pending for subscription in subscriptions), default=0),
+                "max_lag_seconds": max((subscription.lag_seconds for subscription in subscriptions), default=0.0),
+            }
+        return {"channels": channels, "redis_subscribed": self._listener is not None, "redis_channels": len(self._remote_channels), "redis_reconnects": self._reconnects}
+
+
+_event_fanout: Optional[EventFanout] = None
+
+
+def get_event_fanout() -> EventFanout:
+    """Get the global EventFanout singleton instance.
+
+    Returns:
+        The global EventFanout instance
+
+    Examples:
+        >>> get_event_fanout() is get_event_fanout()
+        True
+    """
+    global _event_fanout  # pylint: disable=global-statement
+    if _event_fanout is None:
+        _event_fanout = EventFanout()
+    return _event_fanout
+
+
+def set_event_fanout(fanout: Optional[EventFanout]) -> None:
+    """Set the global EventFanout instance.
+
+    This is primarily used for testing to inject a fresh hub.
+
+    Args:
+        fanout: The EventFanout instance to use globally
+    """
+    global _event_fanout  # pylint: disable=global-statement
+    _event_fanout = fanout
+
 
 class EventService:
-    """Generic Event Service handling Redis PubSub with Local Queue fallback.
+    """Generic Event Service handling Redis PubSub with local fan-out fallback.
 
     Replicates the logic from GatewayService for use in other services. It attempts
     to connect to Redis for a distributed event bus. If Redis is unavailable or
-    configured to perform locally, it falls back to asyncio.Queue for in-process
-    communication.
+    configured to perform locally, events are handed straight to this worker's
+    subscribers through the shared ``EventFanout``.
 
     Attributes:
         channel_name (str): The specific Redis/Queue channel identifier.
@@ -100,7 +546,8 @@ class EventService:
             'test:channel'
         """
         self.channel_name = channel_name
-        self._event_subscribers: List[asyncio.Queue] = []
+        # Subscriptions opened through this instance, closed on shutdown
+        self._event_subscribers: List[EventSubscription] = []
 
         self.redis_url = settings.redis_url if settings.cache_type == "redis" else None
         self._redis_client: Optional[Any] = None
@@ -114,12 +561,45 @@ class EventService:
                 logger.warning(f"Failed to initialize Redis for EventService ({channel_name}): {e}")
                 self._redis_client = None
 
+    def subscribe(self, max_size: Optional[int] = None, policy: Optional[str] = None) -> EventSubscription:
+        """Register a bounded local subscription to this channel.
+
+        Args:
+            max_size: Maximum pending events (defaults to ``event_queue_maxsize``)
+            policy: Overflow policy (defaults to ``event_queue_overflow``)
+
+        Returns:
+            EventSubscription: Buffer receiving events published on this worker.
+
+        Example:
+            >>> service = EventService("test:subscribe")
+            >>> sub = service.subscribe(max_size=10, policy="drop_oldest")
+            >>> (sub.channel, sub.max_size, sub in service._event_subscribers)
+            ('test:subscribe', 10, True)
+            >>> service.unsubscribe(sub)
+            >>> sub.closed, service._event_subscribers
+            (True, [])
+        """
+        subscription = get_event_fanout().subscribe(self.channel_name, max_size=max_size, policy=policy)
+        self._event_subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Close a subscription opened with ``subscribe``.
+
+        Args:
+            subscription: Subscription to close
+        """
+        get_event_fanout().unsubscribe(subscription)
+        if subscription in self._event_subscribers:
+            self._event_subscribers.remove(subscription)
+
     async def publish_event(self, event: Dict[str, Any]) -> None:
         """Publish event to Redis or fallback to local subscribers.
 
         If a Redis client is active, the event is serialized to JSON and published
         to the configured channel. If Redis fails or is inactive, the event is
-        pushed to all registered local asyncio queues.
+        offered to every local subscriber without waiting on any of them.
 
         Args:
             event: A dictionary containing the event data to be published.
@@ -131,11 +611,12 @@ class EventService:
             ...     service = EventService("test:pub")
             ...     service._redis_client = None
             ...     # Create a listener
-            ...     queue = asyncio.Queue()
-            ...     service._event_subscribers.append(queue)
+            ...     sub = service.subscribe()
             ...
             ...     await service.publish_event({"type": "test", "data": 123})
-            ...     return await queue.get()
+            ...     event = await sub.get()
+            ...     service.unsubscribe(sub)
+            ...     return event
             >>> asyncio.run(test_pub())
             {'type': 'test', 'data': 123}
         """
@@ -144,21 +625,18 @@ class EventService:
                 await asyncio.to_thread(self._redis_client.publish, self.channel_name, json.dumps(event))
             except Exception as e:
                 logger.error(f"Failed to publish event to Redis channel {self.channel_name}: {e}")
-                # Fallback: push to local queues if Redis fails
-                for queue in self._event_subscribers:
-                    await queue.put(event)
+                # Fallback: deliver to this worker's subscribers if Redis fails
+                get_event_fanout().deliver(self.channel_name, event)
         else:
             # Local only (single worker or file-lock mode)
-            for queue in self._event_subscribers:
-                await queue.put(event)
+            get_event_fanout().deliver(self.channel_name, event)
 
     async def subscribe_events(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Subscribe to events. Yields events as they are published.
 
-        If Redis is available, this creates a dedicated async Redis connection
-        and yields messages from the PubSub channel. If Redis is not available,
-        it creates a local asyncio.Queue, adds it to the subscriber list, and
-        yields items put into that queue.
+        Events are read from a bounded ``EventSubscription``. If Redis is
+        available, the worker's shared Redis subscription is extended to this
+        channel, so any number of subscribers share one connection.
 
         Yields:
             Dict[str, Any]: The deserialized event data.
@@ -189,60 +667,29 @@ class EventService:
             >>> # asyncio.run(test_sub())
             {'msg': 'hello'}
         """
-
-        fallback_to_local = False
-
-        if self._redis_client:
-
-            try:
-                # Import asyncio version of redis here to avoid top-level dependency issues
-                # Third-Party
-                import redis.asyncio as aioredis  # pylint: disable=import-outside-toplevel
-
-                # Create a dedicated async connection for this subscription
-                client = aioredis.from_url(self.redis_url, decode_responses=True)
-                pubsub = client.pubsub()
-
-                await pubsub.subscribe(self.channel_name)
-
+        subscription = self.subscribe()
+        source = "local event subscription"
+        try:
+            if self._redis_client:
                 try:
-                    async for message in pubsub.listen():
-                        if message["type"] == "message":
-                            # Yield the data portion
-                            yield json.loads(message["data"])
-                except asyncio.CancelledError:
-                    # Handle client disconnection
-                    logger.error(f"Client disconnected from Redis subscription: {self.channel_name}")
-                    raise
+                    await get_event_fanout().listen_remote(self.channel_name)
+                    source = "Redis subscription"
+                except ImportError:
+                    logger.error("Redis is configured but redis-py does not support asyncio or is not installed.")
                 except Exception as e:
                     logger.error(f"Redis subscription error on {self.channel_name}: {e}")
                     raise
-                finally:
-                    # Cleanup
-                    try:
-                        await pubsub.unsubscribe(self.channel_name)
-                        await client.aclose()
-                    except Exception as e:
-                        logger.warning(f"Error closing Redis subscription: {e}")
-            except ImportError:
-                fallback_to_local = True
-                logger.error("Redis is configured but redis-py does not support asyncio or is not installed.")
-                # Fallthrough to queue mode if import fails
-
-        # Local Queue (Redis not available or import failed)
-        if fallback_to_local or not (self.redis_url and REDIS_AVAILABLE):
-            queue: asyncio.Queue = asyncio.Queue()
-            self._event_subscribers.append(queue)
-            try:
-                while True:
-                    event = await queue.get()
-                    yield event
-            except asyncio.CancelledError:
-                logger.error(f"Client disconnected from local event subscription: {self.channel_name}")
-                raise
-            finally:
-                if queue in self._event_subscribers:
-                    self._event_subscribers.remove(queue)
+
+            while True:
+                event = await subscription.get()
+                if event is None:
+                    return
+                yield event
+        except asyncio.CancelledError:
+            logger.error(f"Client disconnected from {source}: {self.channel_name}")
+            raise
+        finally:
+            self.unsubscribe(subscription)
 
     async def event_generator(self) -> AsyncGenerator[str, None]:
         """Generates Server-Sent Events (SSE) formatted strings.
@@ -269,14 +716,17 @@ class EventService:
     async def shutdown(self):
         """Cleanup resources.
 
-        Closes the synchronous Redis client connection and clears local subscribers.
+        Closes the synchronous Redis client connection and this instance's
+        subscriptions. The worker's shared Redis subscription is closed by
+        ``EventFanout.shutdown``.
 
         Example:
             >>> import asyncio
             >>> async def test_shutdown():
             ...     service = EventService("test:shutdown")
+            ...     sub = service.subscribe()
             ...     await service.shutdown()
-            ...     return len(service._event_subscribers) == 0
+            ...     return len(service._event_subscribers) == 0 and sub.closed
             >>> asyncio.run(test_shutdown())
             True
         """
@@ -284,4 +734,5 @@ class EventService:
             # Sync client doesn't always need explicit close in this context,
             # but good practice to clear references.
             self._redis_client.close()
-        self._event_subscribers.clear()
+        for subscription in list(self._event_subscribers):
+            self.unsubscribe(subscription)
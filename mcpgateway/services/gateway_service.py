@@ -39,10 +39,12 @@ Examples:
 
 # Standard
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
 import mimetypes
 import os
+import random
 import ssl
 import tempfile
 import time
@@ -56,7 +58,7 @@ import httpx
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -84,6 +86,7 @@ from mcpgateway.services.event_service import EventService
 
 # logging.getLogger("httpx").setLevel(logging.WARNING)  # Disables httpx logs for regular health checks
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.mcp_session_pool import get_mcp_session_pool
 from mcpgateway.services.oauth_manager import OAuthManager
 from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.services.tool_service import ToolService
@@ -91,7 +94,7 @@ from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.display_name import generate_display_name
 from mcpgateway.utils.retry_manager import ResilientHttpClient
 from mcpgateway.utils.services_auth import decode_auth, encode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr
 from mcpgateway.utils.validate_signature import validate_signature
 
 # Initialize logging service first
@@ -266,6 +269,21 @@ class GatewayConnectionError(GatewayError):
     """
 
 
+@dataclass
+class GatewayHealthSchedule:
+    """Per-gateway health check schedule.
+
+    Attributes:
+        interval: Seconds between checks before jitter is applied
+        next_due: Monotonic time the gateway is next due for a check
+        healthy: Result of the last completed check, None before the first one
+    """
+
+    interval: float
+    next_due: float = 0.0
+    healthy: Optional[bool] = None
+
+
 class GatewayService:  # pylint: disable=too-many-instance-attributes
     """Service for managing federated gateways.
 
@@ -314,11 +332,17 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         self._http_client = ResilientHttpClient(client_args={"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify})
         self._health_check_interval = GW_HEALTH_CHECK_INTERVAL
         self._health_check_task: Optional[asyncio.Task] = None
+        self._health_check_concurrency = settings.health_check_concurrency
+        self._health_check_max_interval = settings.health_check_max_interval
+        self._health_check_min_interval = settings.health_check_min_interval
+        self._health_check_jitter = settings.health_check_jitter
+        self._health_schedules: dict[str, GatewayHealthSchedule] = {}
         self._active_gateways: Set[str] = set()  # Track active gateway URLs
         self._stream_response = None
         self._pending_responses = {}
         self.tool_service = ToolService()
         self._gateway_failure_counts: dict[str, int] = {}
+        self._pending_unreachable: Set[str] = set()  # Gateways to mark unreachable when the health sweep is recorded
         self.oauth_manager = OAuthManager(request_timeout=int(os.getenv("OAUTH_REQUEST_TIMEOUT", "30")), max_retries=int(os.getenv("OAUTH_MAX_RETRIES", "3")))
         self._event_service = EventService(channel_name="mcpgateway:gateway_events")
 
@@ -1034,7 +1058,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             query = query.where(DbGateway.enabled)
 
         if tags:
-            query = query.where(json_contains_expr(db, DbGateway.tags, tags, match_any=True))
+            query = query.where(entity_tags_expr(DbGateway.id, "gateway", tags, match_any=True))
 
         gateways = db.execute(query).scalars().all()
 
@@ -1458,6 +1482,9 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 db.commit()
                 db.refresh(gateway)
 
+                # Pooled sessions may use the old URL, transport or credentials
+                await get_mcp_session_pool().evict_gateway(gateway.id)
+
                 # Notify subscribers
                 await self._notify_gateway_updated(gateway)
 
@@ -1668,6 +1695,9 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 db.commit()
                 db.refresh(gateway)
 
+                if not (gateway.enabled and gateway.reachable):
+                    await get_mcp_session_pool().evict_gateway(gateway.id)
+
                 # Notify Subscribers
                 if not gateway.enabled:
                     # Inactive
@@ -1773,6 +1803,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
             # Update tracking
             self._active_gateways.discard(gateway.url)
+            await get_mcp_session_pool().evict_gateway(gateway_info["id"])
 
             # Notify subscribers
             await self._notify_gateway_deleted(gateway_info)
@@ -2035,7 +2066,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
     async def _handle_gateway_failure(self, gateway: DbGateway) -> None:
         """Tracks and handles gateway failures during health checks.
-        If the failure count exceeds the threshold, the gateway is deactivated.
+        If the failure count exceeds the threshold, the gateway is queued to be marked
+        unreachable when the results of the health sweep are recorded.
 
         Args:
             gateway: The gateway object that failed its health check.
@@ -2054,6 +2086,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             >>> asyncio.run(service._handle_gateway_failure(gateway))  # doctest: +ELLIPSIS
             >>> service._gateway_failure_counts['gw1'] >= 1
             True
+            >>> for _ in range(GW_FAILURE_THRESHOLD - 1):
+            ...     asyncio.run(service._handle_gateway_failure(gateway))
+            >>> service._pending_unreachable, service._gateway_failure_counts['gw1']
+            ({'gw1'}, 0)
 
             >>> # Test disabled gateway (no action)
             >>> gateway.enabled = False
@@ -2078,9 +2114,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         if count >= GW_FAILURE_THRESHOLD:
             logger.error(f"Gateway {gateway.name} failed {GW_FAILURE_THRESHOLD} times. Deactivating...")
-            with cast(Any, SessionLocal)() as db:
-                await self.toggle_gateway_status(db, gateway.id, activate=True, reachable=False, only_update_reachable=True)
-                self._gateway_failure_counts[gateway.id] = 0  # Reset after deactivation
+            self._pending_unreachable.add(gateway.id)
+            self._gateway_failure_counts[gateway.id] = 0  # Reset after deactivation
 
     async def check_health_of_gateways(self, db: Session, gateways: List[DbGateway], user_email: Optional[str] = None) -> bool:
         """Check health of a batch of gateways.
@@ -2096,6 +2131,11 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         gateway becomes healthy again the service will attempt to update its
         reachable status.
 
+        Up to ``health_check_concurrency`` gateways are checked at the same time
+        and each check is bounded by ``health_check_timeout``. Once all checks
+        finish, the results are written in one batch and every checked gateway
+        is rescheduled according to its result.
+
         Args:
             db: Database Session used for token lookups and status updates.
             gateways: List of DbGateway objects to check.
@@ -2145,153 +2185,28 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         # Create trace span for health check batch
         with create_span("gateway.health_check_batch", {"gateway.count": len(gateways), "check.type": "health"}) as batch_span:
-            for gateway in gateways:
-
-                if gateway.auth_type == "one_time_auth":
-                    continue  # Skip health check for one-time auth gateways as these are authenticated with passthrough headers only
-
-                # Create span for individual gateway health check
-                with create_span(
-                    "gateway.health_check",
-                    {
-                        "gateway.name": gateway.name,
-                        "gateway.id": str(gateway.id),
-                        "gateway.url": gateway.url,
-                        "gateway.transport": gateway.transport,
-                        "gateway.enabled": gateway.enabled,
-                        "http.method": "GET",
-                        "http.url": gateway.url,
-                    },
-                ) as span:
-                    valid = False
-                    if gateway.ca_certificate:
-                        if settings.enable_ed25519_signing:
-                            public_key_pem = settings.ed25519_public_key
-                            valid = validate_signature(gateway.ca_certificate.encode(), gateway.ca_certificate_sig, public_key_pem)
-                        else:
-                            valid = True
-                    if valid:
-                        ssl_context = self.create_ssl_context(gateway.ca_certificate)
-                    else:
-                        ssl_context = None
-
-                    def get_httpx_client_factory(
-                        headers: dict[str, str] | None = None,
-                        timeout: httpx.Timeout | None = None,
-                        auth: httpx.Auth | None = None,
-                    ) -> httpx.AsyncClient:
-                        """Factory function to create httpx.AsyncClient with optional CA certificate.
-
-                        Args:
-                            headers: Optional headers for the client
-                            timeout: Optional timeout for the client
-                            auth: Optional auth for the client
-
-                        Returns:
-                            httpx.AsyncClient: Configured HTTPX async client
-                        """
-                        return httpx.AsyncClient(
-                            verify=ssl_context if ssl_context else True,  # pylint: disable=cell-var-from-loop
-                            follow_redirects=True,
-                            headers=headers,
-                            timeout=timeout or httpx.Timeout(30.0),
-                            auth=auth,
-                        )
-
-                    async with httpx.AsyncClient(verify=ssl_context) as client:
-                        logger.debug(f"Checking health of gateway: {gateway.name} ({gateway.url})")
-                        try:
-                            # Handle different authentication types
-                            headers = {}
+            gateways = [gateway for gateway in gateways if gateway.auth_type != "one_time_auth"]  # One-time auth gateways are authenticated with passthrough headers only
+            semaphore = asyncio.Semaphore(self._health_check_concurrency)
 
-                            if gateway and gateway.auth_type == "oauth" and gateway.oauth_config:
-                                grant_type = gateway.oauth_config.get("grant_type", "client_credentials")
-
-                                if grant_type == "authorization_code":
-                                    # For Authorization Code flow, try to get stored tokens
-                                    try:
-                                        # First-Party
-                                        from mcpgateway.services.token_storage_service import TokenStorageService  # pylint: disable=import-outside-toplevel
-
-                                        token_storage = TokenStorageService(db)
-
-                                        # Get user-specific OAuth token
-                                        if not user_email:
-                                            if span:
-                                                span.set_attribute("health.status", "unhealthy")
-                                                span.set_attribute("error.message", "User email required for OAuth token")
-                                            await self._handle_gateway_failure(gateway)
-
-                                        access_token: str = await token_storage.get_user_token(gateway.id, user_email)
-
-                                        if access_token:
-                                            headers["Authorization"] = f"Bearer {access_token}"
-                                        else:
-                                            if span:
-                                                span.set_attribute("health.status", "unhealthy")
-                                                span.set_attribute("error.message", "No valid OAuth token for user")
-                                            await self._handle_gateway_failure(gateway)
-                                    except Exception as e:
-                                        logger.error(f"Failed to obtain stored OAuth token for gateway {gateway.name}: {e}")
-                                        if span:
-                                            span.set_attribute("health.status", "unhealthy")
-                                            span.set_attribute("error.message", "Failed to obtain stored OAuth token")
-                                        await self._handle_gateway_failure(gateway)
-                                else:
-                                    # For Client Credentials flow, get token directly
-                                    try:
-                                        access_token: str = await self.oauth_manager.get_access_token(gateway.oauth_config)
-                                        headers["Authorization"] = f"Bearer {access_token}"
-                                    except Exception as e:
-                                        if span:
-                                            span.set_attribute("health.status", "unhealthy")
-                                            span.set_attribute("error.message", str(e))
-                                        await self._handle_gateway_failure(gateway)
-                            else:
-                                # Handle non-OAuth authentication (existing logic)
-                                auth_data = gateway.auth_value or {}
-                                if isinstance(auth_data, str):
-                                    headers = decode_auth(auth_data)
-                                elif isinstance(auth_data, dict):
-                                    headers = {str(k): str(v) for k, v in auth_data.items()}
-                                else:
-                                    headers = {}
-
-                            # Perform the GET and raise on 4xx/5xx
-                            if (gateway.transport).lower() == "sse":
-                                timeout = httpx.Timeout(settings.health_check_timeout)
-                                async with client.stream("GET", gateway.url, headers=headers, timeout=timeout) as response:
-                                    # This will raise immediately if status is 4xx/5xx
-                                    response.raise_for_status()
-                                    if span:
-                                        span.set_attribute("http.status_code", response.status_code)
-                            elif (gateway.transport).lower() == "streamablehttp":
-                                async with streamablehttp_client(url=gateway.url, headers=headers, timeout=settings.health_check_timeout, httpx_client_factory=get_httpx_client_factory) as (
-                                    read_stream,
-                                    write_stream,
-                                    _get_session_id,
-                                ):
-                                    async with ClientSession(read_stream, write_stream) as session:
-                                        # Initialize the session
-                                        response = await session.initialize()
-
-                            # Reactivate gateway if it was previously inactive and health check passed now
-                            if gateway.enabled and not gateway.reachable:
-                                logger.info(f"Reactivating gateway: {gateway.name}, as it is healthy now")
-                                await self.toggle_gateway_status(db, gateway.id, activate=True, reachable=True, only_update_reachable=True)
-
-                            # Mark successful check
-                            gateway.last_seen = datetime.now(timezone.utc)
+            async def check(gateway: DbGateway) -> bool:
+                """Check one gateway within the concurrency limit and the per-gateway timeout.
 
-                            if span:
-                                span.set_attribute("health.status", "healthy")
-                                span.set_attribute("success", True)
+                Args:
+                    gateway: Gateway to check
 
-                        except Exception as e:
-                            if span:
-                                span.set_attribute("health.status", "unhealthy")
-                                span.set_attribute("error.message", str(e))
-                            await self._handle_gateway_failure(gateway)
+                Returns:
+                    bool: True if the gateway is healthy
+                """
+                async with semaphore:
+                    try:
+                        return await asyncio.wait_for(self._check_gateway_health(db, gateway, user_email), timeout=settings.health_check_timeout)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"Health check of gateway {gateway.name} timed out after {settings.health_check_timeout}s")
+                        await self._handle_gateway_failure(gateway)
+                        return False
+
+            results = await asyncio.gather(*(check(gateway) for gateway in gateways))
+            await self._record_health_results(db, gateways, results)
 
             # Set batch span success metrics
             if batch_span:
@@ -2301,6 +2216,319 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             # All gateways passed
             return True
 
+    async def _check_gateway_health(self, db: Session, gateway: DbGateway, user_email: Optional[str] = None) -> bool:
+        """Check the health of a single gateway.
+
+        Args:
+            db: Database Session used for stored OAuth token lookups.
+            gateway: Gateway to check.
+            user_email: Optional user email used to retrieve stored OAuth tokens.
+
+        Returns:
+            bool: True if the gateway responded successfully.
+        """
+        with create_span(
+            "gateway.health_check",
+            {
+                "gateway.name": gateway.name,
+                "gateway.id": str(gateway.id),
+                "gateway.url": gateway.url,
+                "gateway.transport": gateway.transport,
+                "gateway.enabled": gateway.enabled,
+                "http.method": "GET",
+                "http.url": gateway.url,
+            },
+        ) as span:
+            valid = False
+            if gateway.ca_certificate:
+                if settings.enable_ed25519_signing:
+                    public_key_pem = settings.ed25519_public_key
+                    valid = validate_signature(gateway.ca_certificate.encode(), gateway.ca_certificate_sig, public_key_pem)
+                else:
+                    valid = True
+            if valid:
+                ssl_context = self.create_ssl_context(gateway.ca_certificate)
+            else:
+                ssl_context = None
+
+            def get_httpx_client_factory(
+                headers: dict[str, str] | None = None,
+                timeout: httpx.Timeout | None = None,
+                auth: httpx.Auth | None = None,
+            ) -> httpx.AsyncClient:
+                """Factory function to create httpx.AsyncClient with optional CA certificate.
+
+                Args:
+                    headers: Optional headers for the client
+                    timeout: Optional timeout for the client
+                    auth: Optional auth for the client
+
+                Returns:
+                    httpx.AsyncClient: Configured HTTPX async client
+                """
+                return httpx.AsyncClient(
+                    verify=ssl_context if ssl_context else True,
+                    follow_redirects=True,
+                    headers=headers,
+                    timeout=timeout or httpx.Timeout(30.0),
+                    auth=auth,
+                )
+
+            async with httpx.AsyncClient(verify=ssl_context) as client:
+                logger.debug(f"Checking health of gateway: {gateway.name} ({gateway.url})")
+                try:
+                    # Handle different authentication types
+                    headers = {}
+
+                    if gateway and gateway.auth_type == "oauth" and gateway.oauth_config:
+                        grant_type = gateway.oauth_config.get("grant_type", "client_credentials")
+
+                        if grant_type == "authorization_code":
+                            # For Authorization Code flow, try to get stored tokens
+                            try:
+                                # First-Party
+                                from mcpgateway.services.token_storage_service import TokenStorageService  # pylint: disable=import-outside-toplevel
+
+                                token_storage = TokenStorageService(db)
+
+                                # Get user-specific OAuth token
+                                if not user_email:
+                                    if span:
+                                        span.set_attribute("health.status", "unhealthy")
+                                        span.set_attribute("error.message", "User email required for OAuth token")
+                                    await self._handle_gateway_failure(gateway)
+
+                                access_token: str = await token_storage.get_user_token(gateway.id, user_email)
+
+                                if access_token:
+                                    headers["Authorization"] = f"Bearer {access_token}"
+                                else:
+                                    if span:
+                                        span.set_attribute("health.status", "unhealthy")
+                                        span.set_attribute("error.message", "No valid OAuth token for user")
+                                    await self._handle_gateway_failure(gateway)
+                            except Exception as e:
+                                logger.error(f"Failed to obtain stored OAuth token for gateway {gateway.name}: {e}")
+                                if span:
+                                    span.set_attribute("health.status", "unhealthy")
+                                    span.set_attribute("error.message", "Failed to obtain stored OAuth token")
+                                await self._handle_gateway_failure(gateway)
+                        else:
+                            # For Client Credentials flow, get token directly
+                            try:
+                                access_token: str = await self.oauth_manager.get_access_token(gateway.oauth_config)
+                                headers["Authorization"] = f"Bearer {access_token}"
+                            except Exception as e:
+                                if span:
+                                    span.set_attribute("health.status", "unhealthy")
+                                    span.set_attribute("error.message", str(e))
+                                await self._handle_gateway_failure(gateway)
+                    else:
+                        # Handle non-OAuth authentication (existing logic)
+                        auth_data = gateway.auth_value or {}
+                        if isinstance(auth_data, str):
+                            headers = decode_auth(auth_data)
+                        elif isinstance(auth_data, dict):
+                            headers = {str(k): str(v) for k, v in auth_data.items()}
+                        else:
+                            headers = {}
+
+                    # Perform the GET and raise on 4xx/5xx
+                    if (gateway.transport).lower() == "sse":
+                        timeout = httpx.Timeout(settings.health_check_timeout)
+                        async with client.stream("GET", gateway.url, headers=headers, timeout=timeout) as response:
+                            # This will raise immediately if status is 4xx/5xx
+                            response.raise_for_status()
+                            if span:
+                                span.set_attribute("http.status_code", response.status_code)
+                    elif (gateway.transport).lower() == "streamablehttp":
+                        async with streamablehttp_client(url=gateway.url, headers=headers, timeout=settings.health_check_timeout, httpx_client_factory=get_httpx_client_factory) as (
+                            read_stream,
+                            write_stream,
+                            _get_session_id,
+                        ):
+                            async with ClientSession(read_stream, write_stream) as session:
+                                # Initialize the session
+                                response = await session.initialize()
+
+                    if span:
+                        span.set_attribute("health.status", "healthy")
+                        span.set_attribute("success", True)
+                    return True
+
+                except Exception as e:
+                    if span:
+                        span.set_attribute("health.status", "unhealthy")
+                        span.set_attribute("error.message", str(e))
+                    await self._handle_gateway_failure(gateway)
+                    return False
+
+    async def _record_health_results(self, db: Session, gateways: List[DbGateway], results: List[bool]) -> None:
+        """Persist the outcome of a health check sweep and reschedule the checked gateways.
+
+        ``last_seen`` of every healthy gateway and the ``reachable`` flag of every
+        gateway that reached the failure threshold (and of its tools) are written in
+        one transaction. Offline notifications are published after the commit.
+        Gateways that were unreachable and are healthy again are reactivated one
+        at a time after the sweep, so the shared session is never used concurrently.
+
+        Args:
+            db: Database Session used for the writes.
+            gateways: Gateways that were checked.
+            results: Health of each gateway, in the same order.
+
+        Examples:
+            >>> from unittest.mock import MagicMock
+            >>> import asyncio
+            >>> service = GatewayService()
+            >>> gw = MagicMock(id="gw1", enabled=True, reachable=True)
+            >>> db = MagicMock()
+            >>> asyncio.run(service._record_health_results(db, [gw], [True]))
+            >>> db.execute.call_count, db.commit.call_count
+            (1, 1)
+            >>> service._health_schedules["gw1"].healthy
+            True
+        """
+        for gateway, healthy in zip(gateways, results):
+            self._reschedule_health_check(gateway.id, healthy)
+
+        healthy_gateways = [gateway for gateway, healthy in zip(gateways, results) if healthy]
+        unreachable_gateways = [gateway for gateway, healthy in zip(gateways, results) if not healthy and gateway.id in self._pending_unreachable]
+        self._pending_unreachable.difference_update(gateway.id for gateway in gateways)
+        if not healthy_gateways and not unreachable_gateways:
+            return
+
+        now = datetime.now(timezone.utc)
+        offline_tool_ids: List[str] = []
+        try:
+            if healthy_gateways:
+                db.execute(update(DbGateway).where(DbGateway.id.in_([gateway.id for gateway in healthy_gateways])).values(last_seen=now))
+            if unreachable_gateways:
+                gateway_ids = [gateway.id for gateway in unreachable_gateways]
+                offline_tool_ids = list(db.execute(select(DbTool.id).where(DbTool.gateway_id.in_(gateway_ids)).where(DbTool.reachable)).scalars().all())
+                db.execute(update(DbGateway).where(DbGateway.id.in_(gateway_ids)).values(reachable=False, updated_at=now).execution_options(synchronize_session=False))
+                db.execute(update(DbTool).where(DbTool.gateway_id.in_(gateway_ids)).values(reachable=False, updated_at=now).execution_options(synchronize_session=False))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to record gateway health check results: {e}")
+            return
+
+        for gateway in healthy_gateways:
+            gateway.last_seen = now
+        for gateway in unreachable_gateways:
+            gateway.reachable = False
+            gateway.updated_at = now
+            self._active_gateways.discard(gateway.url)
+            await get_mcp_session_pool().evict_gateway(gateway.id)
+            await self._notify_gateway_offline(gateway)
+            logger.info(f"Gateway status: {gateway.name} - enabled and inaccessible")
+        # One query reloads the tools whose status changed for their notifications
+        offline_tools = db.execute(select(DbTool).where(DbTool.id.in_(offline_tool_ids))).scalars().all() if offline_tool_ids else []
+        for tool in offline_tools:
+            if tool.enabled:
+                await self.tool_service._notify_tool_offline(tool)  # pylint: disable=protected-access
+            else:
+                await self.tool_service._notify_tool_deactivated(tool)  # pylint: disable=protected-access
+
+        for gateway in healthy_gateways:
+            # Reactivate gateway if it was previously inactive and health check passed now
+            if gateway.enabled and not gateway.reachable:
+                logger.info(f"Reactivating gateway: {gateway.name}, as it is healthy now")
+                try:
+                    await self.toggle_gateway_status(db, gateway.id, activate=True, reachable=True, only_update_reachable=True)
+                except Exception as e:
+                    logger.error(f"Failed to reactivate gateway {gateway.name}: {e}")
+
+    def _reschedule_health_check(self, gateway_id: str, healthy: bool) -> None:
+        """Adapt a gateway's check interval to its latest result and schedule its next check.
+
+        A gateway that stays healthy backs off towards ``health_check_max_interval``,
+        one that stays unhealthy is checked every ``health_check_interval`` and one
+        whose status just changed is rechecked after ``health_check_min_interval``.
+        The next check time is jittered so gateways do not run in lockstep.
+
+        Args:
+            gateway_id: ID of the checked gateway.
+            healthy: Result of the check.
+
+        Examples:
+            >>> service = GatewayService()
+            >>> service._health_check_interval, service._health_check_max_interval, service._health_check_min_interval = 60, 300, 15
+            >>> service._health_check_jitter = 0
+            >>> intervals = []
+            >>> for healthy in (True, True, True, True, False, False):
+            ...     service._reschedule_health_check("gw", healthy)
+            ...     intervals.append(service._health_schedules["gw"].interval)
+            >>> intervals
+            [60, 120, 240, 300, 15, 60]
+        """
+        base = self._health_check_interval
+        schedule = self._health_schedules.setdefault(gateway_id, GatewayHealthSchedule(interval=base))
+        if schedule.healthy is None:
+            schedule.interval = base
+        elif schedule.healthy != healthy:
+            schedule.interval = min(self._health_check_min_interval, base)
+        elif healthy:
+            schedule.interval = min(max(schedule.interval, base) * 2, max(self._health_check_max_interval, base))
+        else:
+            schedule.interval = base
+        schedule.healthy = healthy
+        jitter = random.uniform(-self._health_check_jitter, self._health_check_jitter)  # noqa: DUO102 # nosec B311 - scheduling, not security
+        schedule.next_due = time.monotonic() + schedule.interval * (1 + jitter)
+
+    def _due_gateways(self, gateways: List[DbGateway]) -> List[DbGateway]:
+        """Select the gateways whose health check is due.
+
+        Gateways without a schedule are due immediately. Selected gateways are
+        provisionally rescheduled one base interval ahead, so a check that never
+        reports back is retried later rather than immediately. Schedules of
+        gateways that no longer exist are dropped.
+
+        Args:
+            gateways: All known gateways.
+
+        Returns:
+            List[DbGateway]: Gateways to check now.
+
+        Examples:
+            >>> from unittest.mock import MagicMock
+            >>> service = GatewayService()
+            >>> gateways = [MagicMock(id="a"), MagicMock(id="b")]
+            >>> len(service._due_gateways(gateways))
+            2
+            >>> service._due_gateways(gateways)
+            []
+        """
+        now = time.monotonic()
+        known = {gateway.id for gateway in gateways}
+        for gateway_id in [gateway_id for gateway_id in self._health_schedules if gateway_id not in known]:
+            del self._health_schedules[gateway_id]
+
+        due = []
+        for gateway in gateways:
+            schedule = self._health_schedules.setdefault(gateway.id, GatewayHealthSchedule(interval=self._health_check_interval))
+            if schedule.next_due <= now:
+                schedule.next_due = now + self._health_check_interval
+                due.append(gateway)
+        return due
+
+    def _next_health_check_delay(self) -> float:
+        """Return how long the health check loop may sleep before a gateway is due.
+
+        Returns:
+            float: Seconds until the earliest scheduled check, at most ``health_check_interval``.
+
+        Examples:
+            >>> service = GatewayService()
+            >>> service._next_health_check_delay() == service._health_check_interval
+            True
+        """
+        if not self._health_schedules:
+            return self._health_check_interval
+        earliest = min(schedule.next_due for schedule in self._health_schedules.values())
+        return min(self._health_check_interval, max(0.0, earliest - time.monotonic()))
+
     async def aggregate_capabilities(self, db: Session) -> Dict[str, Any]:
         """
         Aggregate capabilities across all gateways.
@@ -2576,10 +2804,23 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             return None
         return GatewayRead.model_validate(result)
 
+    async def _run_due_health_checks(self, db: Session, user_email: str) -> None:
+        """Check the gateways whose scheduled health check is due.
+
+        Args:
+            db: Database session to use for health checks
+            user_email: Email of the user whose stored OAuth tokens are used
+        """
+        gateways = self._due_gateways(await asyncio.to_thread(self._get_gateways))
+        if gateways:
+            await self.check_health_of_gateways(db, gateways, user_email)
+
     async def _run_health_checks(self, db: Session, user_email: str) -> None:
         """Run health checks periodically,
         Uses Redis or FileLock - for multiple workers.
         Uses simple health check for single worker mode.
+        Each gateway is checked on its own adaptive schedule; the loop wakes up
+        when the earliest one is due, at least every ``health_check_interval``.
 
         Args:
             db: Database session to use for health checks
@@ -2610,22 +2851,18 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                     self._redis_client.expire(self._leader_key, self._leader_ttl)
 
                     # Run health checks
-                    gateways = await asyncio.to_thread(self._get_gateways)
-                    if gateways:
-                        await self.check_health_of_gateways(db, gateways, user_email)
+                    await self._run_due_health_checks(db, user_email)
 
-                    await asyncio.sleep(self._health_check_interval)
+                    await asyncio.sleep(self._next_health_check_delay())
 
                 elif settings.cache_type == "none":
                     try:
                         # For single worker mode, run health checks directly
-                        gateways = await asyncio.to_thread(self._get_gateways)
-                        if gateways:
-                            await self.check_health_of_gateways(db, gateways, user_email)
+                        await self._run_due_health_checks(db, user_email)
                     except Exception as e:
                         logger.error(f"Health check run failed: {str(e)}")
 
-                    await asyncio.sleep(self._health_check_interval)
+                    await asyncio.sleep(self._next_health_check_delay())
 
                 else:
                     # FileLock-based leader fallback
@@ -2634,10 +2871,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         logger.info("File lock acquired. Running health checks.")
 
                         while True:
-                            gateways = await asyncio.to_thread(self._get_gateways)
-                            if gateways:
-                                await self.check_health_of_gateways(db, gateways, user_email)
-                            await asyncio.sleep(self._health_check_interval)
+                            await self._run_due_health_checks(db, user_email)
+                            await asyncio.sleep(self._next_health_check_delay())
 
                     except Timeout:
                         logger.debug("File lock already held. Retrying later.")
@@ -3065,6 +3300,16 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             >>> # Verify the event was passed to the event service
             >>> service._event_service.publish_event.assert_awaited_with(test_event)
         """
+        data = event.get("data")
+        if isinstance(data, dict) and data.get("id") is not None:
+            # First-Party
+            from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache  # pylint: disable=import-outside-toplevel
+            from mcpgateway.cache.tool_lookup_cache import get_tool_lookup_cache  # pylint: disable=import-outside-toplevel
+
+            # Tools resolved through this gateway carry its URL and credentials
+            await get_tool_lookup_cache().invalidate_gateway(data["id"])
+            # Gateway changes add, remove or deactivate its tools, resources and prompts
+            await get_catalog_snapshot_cache().invalidate("all")
         await self._event_service.publish_event(event)
 
     async def _connect_to_sse_server_without_validation(self, server_url: str, authentication: Optional[Dict[str, str]] = None):
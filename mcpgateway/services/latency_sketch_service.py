@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/latency_sketch_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Latency Sketch Service.
+This module keeps trace latency percentiles cheap to query. Every completed trace
+is folded into a mergeable quantile sketch for its time bucket
+(``observability_sketch_bucket_seconds`` wide) as it ends, before tail sampling,
+so percentiles and request counts cover all traffic, not only the traces that
+were kept. Closed buckets are written by a background task as one small row per
+worker and bucket. Admin dashboards merge those rows at query time instead of
+loading and sorting every trace in the window.
+
+The sketch uses logarithmic bins with a fixed relative accuracy (the DDSketch
+approach): any quantile it reports is within ``RELATIVE_ACCURACY`` of a value
+that was recorded at that rank, and two sketches merge by adding bin counts.
+
+Examples:
+    >>> sketch = LatencySketch()
+    >>> for value in range(1, 101):
+    ...     sketch.add(float(value))
+    >>> abs(sketch.quantile(0.5) - 50) <= 50 * RELATIVE_ACCURACY
+    True
+    >>> LatencySketchService(bucket_seconds=300, flush_interval=60).running
+    False
+"""
+
+# Standard
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-Party
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import ObservabilityLatencySketch, SessionLocal
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+# Relative error bound of reported quantiles; fixed so persisted sketches always merge
+RELATIVE_ACCURACY = 0.01
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+# Durations below this (in milliseconds) are counted in a single zero bin
+_MIN_VALUE = 1e-3
+
+# Key of the aggregate over all traces
+ALL_TRACES = ("trace", "*")
+
+
+class LatencySketch:
+    """Mergeable quantile sketch over positive values with bounded relative error.
+
+    Examples:
+        >>> a, b = LatencySketch(), LatencySketch()
+        >>> for value in (1.0, 2.0, 3.0):
+        ...     a.add(value)
+        >>> b.add(100.0)
+        >>> a.merge(b)
+        >>> a.count, a.min, a.max
+        (4, 1.0, 100.0)
+        >>> round(a.quantile(0.99), 1)
+        3.0
+        >>> LatencySketch.from_dict(a.to_dict()).to_dict() == a.to_dict()
+        True
+        >>> LatencySketch().quantile(0.5) is None
+        True
+    """
+
+    __slots__ = ("bins", "zero_count", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        """Create an empty sketch."""
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Record one value.
+
+        Args:
+            value: The value (a duration in milliseconds)
+        """
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if value < _MIN_VALUE:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / _LOG_GAMMA)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Fold another sketch into this one.
+
+        Args:
+            other: The sketch to add
+        """
+        if not other.count:
+            return
+        for index, n in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)  # type: ignore[type-var]
+        self.max = other.max if self.max is None else max(self.max, other.max)  # type: ignore[type-var]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile with the rank convention of the admin percentile views.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Optional[float]: The estimate, or None for an empty sketch.
+        """
+        if not self.count:
+            return None
+        rank = max(0, int(self.count * q) - 1)
+        seen = self.zero_count
+        estimate = 0.0
+        if seen <= rank:
+            for index in sorted(self.bins):
+                seen += self.bins[index]
+                if seen > rank:
+                    estimate = 2 * _GAMMA**index / (_GAMMA + 1)
+                    break
+        return min(max(estimate, self.min), self.max)  # type: ignore[type-var]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize compactly for storage in a JSON column.
+
+        Returns:
+            Dict[str, Any]: Bin counts (keyed by index) and summary values.
+        """
+        return {"bins": {str(index): n for index, n in self.bins.items()}, "zero": self.zero_count, "count": self.count, "sum": self.total, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        """Rebuild a sketch serialized by ``to_dict``.
+
+        Args:
+            data: Serialized sketch
+
+        Returns:
+            LatencySketch: The sketch.
+        """
+        sketch = cls()
+        sketch.bins = {int(index): int(n) for index, n in (data.get("bins") or {}).items()}
+        sketch.zero_count = int(data.get("zero") or 0)
+        sketch.count = int(data.get("count") or 0)
+        sketch.total = float(data.get("sum") or 0.0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
+
+
+@dataclass
+class LatencyBucket:
+    """Latency sketch and status counts for one entity and time bucket.
+
+    Attributes:
+        sketch: Durations of completed traces in milliseconds
+        success_count: Traces that ended with status ``ok``
+        error_count: Traces that ended with status ``error``
+    """
+
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+    success_count: int = 0
+    error_count: int = 0
+
+    @property
+    def count(self) -> int:
+        """Number of completed traces in the bucket.
+
+        Returns:
+            int: The trace count.
+        """
+        return self.sketch.count
+
+    def add(self, duration_ms: float, status: str) -> None:
+        """Record one completed trace.
+
+        Args:
+            duration_ms: Trace duration in milliseconds
+            status: Trace status
+        """
+        self.sketch.add(duration_ms)
+        if status == "ok":
+            self.success_count += 1
+        elif status == "error":
+            self.error_count += 1
+
+    def merge(self, other: "LatencyBucket") -> None:
+        """Fold another bucket into this one.
+
+        Args:
+            other: The bucket to add
+        """
+        self.sketch.merge(other.sketch)
+        self.success_count += other.success_count
+        self.error_count += other.error_count
+
+
+# (entity_type, entity_id, bucket_start)
+BucketKey = Tuple[str, str, datetime]
+
+
+class LatencySketchService:
+    """Per-worker accumulator of latency sketches with a background writer.
+
+    ``record`` only touches memory. A bucket is written once it has closed (and on
+    shutdown), as an insert-only row, so workers never contend on shared rows;
+    ``query`` merges the stored rows with the buckets this worker has not written yet.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> async def demo():
+        ...     service = LatencySketchService(bucket_seconds=300, flush_interval=3600)
+        ...     with patch.object(service, "_write_rows") as write:
+        ...         await service.start()
+        ...         service.record(datetime.now(timezone.utc), 12.5, "ok")
+        ...         await service.shutdown()
+        ...     return write.call_count, len(write.call_args.args[0])
+        >>> asyncio.run(demo())
+        (1, 1)
+    """
+
+    def __init__(self, bucket_seconds: Optional[int] = None, flush_interval: Optional[float] = None) -> None:
+        """Initialize the service.
+
+        Args:
+            bucket_seconds: Width of a time bucket in seconds
+            flush_interval: Seconds between checks for closed buckets to write
+        """
+        self.bucket_seconds = bucket_seconds or settings.observability_sketch_bucket_seconds
+        self.flush_interval = flush_interval or settings.observability_sketch_flush_interval
+        self._pending: Dict[BucketKey, LatencyBucket] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self._flushed_rows = 0
+        self._failed_rows = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is running and ``record`` accepts traces.
+
+        Returns:
+            bool: True when traces are being sketched.
+        """
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info(f"Latency sketches started (bucket: {self.bucket_seconds}s, flush interval: {self.flush_interval}s)")
+
+    async def shutdown(self) -> None:
+        """Stop the writer and write every bucket still held in memory, open ones included."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush(include_open=True)
+        logger.info("Latency sketches stopped")
+
+    def bucket_start(self, timestamp: datetime) -> datetime:
+        """Align a timestamp to the start of its bucket.
+
+        Args:
+            timestamp: Any timestamp (naive values are treated as UTC)
+
+        Returns:
+            datetime: The timezone-aware bucket start.
+
+        Examples:
+            >>> service = LatencySketchService(bucket_seconds=300, flush_interval=60)
+            >>> service.bucket_start(datetime(2025, 1, 1, 10, 7, 42, tzinfo=timezone.utc)).isoformat()
+            '2025-01-01T10:05:00+00:00'
+        """
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        epoch = int(timestamp.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % self.bucket_seconds, tz=timezone.utc)
+
+    def record(self, start_time: datetime, duration_ms: Optional[float], status: str, entity: Tuple[str, str] = ALL_TRACES) -> None:
+        """Fold a completed trace into its bucket; a no-op while the service is stopped.
+
+        Args:
+            start_time: When the trace started
+            duration_ms: Trace duration in milliseconds
+            status: Trace status (ok, error, ...)
+            entity: ``(entity_type, entity_id)`` the sketch is kept for
+        """
+        if duration_ms is None or not self.running:
+            return
+        key = (entity[0], entity[1], self.bucket_start(start_time))
+        with self._lock:
+            bucket = self._pending.get(key)
+            if bucket is None:
+                bucket = self._pending[key] = LatencyBucket()
+            bucket.add(duration_ms, status)
+
+    async def flush(self, include_open: bool = False) -> None:
+        """Write closed buckets (and open ones when asked) in a worker thread.
+
+        Args:
+            include_open: Also write buckets that may still receive traces
+        """
+        current = self.bucket_start(datetime.now(timezone.utc))
+        with self._lock:
+            keys = [key for key in self._pending if include_open or key[2] < current]
+            rows = [(key, self._pending.pop(key)) for key in keys]
+        if not rows:
+            return
+        try:
+            await asyncio.to_thread(self._write_rows, rows)
+            self._flushed_rows += len(rows)
+        except Exception as e:
+            self._failed_rows += len(rows)
+            logger.error(f"Failed to write {len(rows)} latency sketches: {e}")
+
+    async def _flush_loop(self) -> None:
+        """Periodically write closed buckets and prune expired rows."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if time.monotonic() - self._last_prune > 3600:
+                self._last_prune = time.monotonic()
+                try:
+                    await asyncio.to_thread(self._prune)
+                except Exception as e:
+                    logger.error(f"Failed to prune latency sketches: {e}")
+
+    def _write_rows(self, rows: List[Tuple[BucketKey, LatencyBucket]]) -> None:
+        """Insert one row per bucket.
+
+        Args:
+            rows: Buckets to write
+        """
+        values = [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "bucket_start": bucket_start,
+                "count": bucket.count,
+                "success_count": bucket.success_count,
+                "error_count": bucket.error_count,
+                "sketch": bucket.sketch.to_dict(),
+            }
+            for (entity_type, entity_id, bucket_start), bucket in rows
+        ]
+        with SessionLocal() as db:
+            db.execute(insert(ObservabilityLatencySketch), values)
+            db.commit()
+
+    def _prune(self) -> None:
+        """Delete sketches older than the trace retention period."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.observability_trace_retention_days)
+        with SessionLocal() as db:
+            db.execute(delete(ObservabilityLatencySketch).where(ObservabilityLatencySketch.bucket_start < cutoff))
+            db.commit()
+
+    def query(self, db: Session, since: datetime, entity: Tuple[str, str] = ALL_TRACES) -> Dict[datetime, LatencyBucket]:
+        """Merge stored and not yet written buckets that overlap a time window.
+
+        Args:
+            db: Database session
+            since: Start of the window
+            entity: ``(entity_type, entity_id)`` to read
+
+        Returns:
+            Dict[datetime, LatencyBucket]: One merged bucket per bucket start.
+        """
+        # A bucket overlaps the window if it ends after ``since``
+        first = since - timedelta(seconds=self.bucket_seconds)
+        rows = (
+            db.query(ObservabilityLatencySketch.bucket_start, ObservabilityLatencySketch.success_count, ObservabilityLatencySketch.error_count, ObservabilityLatencySketch.sketch)
+            .filter(
+                ObservabilityLatencySketch.entity_type == entity[0],
+                ObservabilityLatencySketch.entity_id == entity[1],
+                ObservabilityLatencySketch.bucket_start > first,
+            )
+            .all()
+        )
+
+        merged: Dict[datetime, LatencyBucket] = {}
+        for bucket_start, success_count, error_count, sketch in rows:
+            bucket_start = self.bucket_start(bucket_start)
+            stored = LatencyBucket(sketch=LatencySketch.from_dict(sketch or {}), success_count=success_count, error_count=error_count)
+            merged.setdefault(bucket_start, LatencyBucket()).merge(stored)
+
+        with self._lock:
+            for (entity_type, entity_id, bucket_start), bucket in self._pending.items():
+                if (entity_type, entity_id) == entity and bucket_start > first:
+                    merged.setdefault(bucket_start, LatencyBucket()).merge(bucket)
+        return merged
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return writer counters.
+
+        Returns:
+            Dict[str, Any]: Pending buckets and written/failed row counts.
+
+        Examples:
+            >>> LatencySketchService(bucket_seconds=60, flush_interval=60).get_metrics()
+            {'running': False, 'pending_buckets': 0, 'flushed_rows': 0, 'failed_rows': 0}
+        """
+        return {"running": self.running, "pending_buckets": len(self._pending), "flushed_rows": self._flushed_rows, "failed_rows": self._failed_rows}
+
+
+_latency_sketch_service: Optional[LatencySketchService] = None
+
+
+def get_latency_sketch_service() -> LatencySketchService:
+    """Get the global LatencySketchService singleton instance.
+
+    Returns:
+        The global LatencySketchService instance
+    """
+    global _latency_sketch_service  # pylint: disable=global-statement
+    if _latency_sketch_service is None:
+        _latency_sketch_service = LatencySketchService()
+    return _latency_sketch_service
+
+
+def set_latency_sketch_service(service: Optional[LatencySketchService]) -> None:
+    """Set the global LatencySketchService instance.
+
+    This is primarily used for testing to inject a service with custom settings.
+
+    Args:
+        service: The LatencySketchService instance to use globally
+    """
+    global _latency_sketch_service  # pylint: disable=global-statement
+    _latency_sketch_service = service
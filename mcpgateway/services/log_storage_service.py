@@ -7,20 +7,40 @@ Authors: Mihai Criveti
 Log Storage Service Implementation.
 This service provides in-memory storage for recent logs with entity context,
 supporting filtering, pagination, and real-time streaming.
+
+Entries are appended synchronously under a lock, so logging handlers can store
+records from any thread without scheduling a task per line. Per-level, entity and
+request indexes hold direct references to entries in insertion order; queries walk
+the smallest matching index in the requested order and stop once a page is full.
 """
 
 # Standard
 import asyncio
 from collections import deque
 from datetime import datetime, timezone
+import heapq
+from itertools import count
 import sys
-from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, TypedDict
+import threading
+from typing import Any, AsyncGenerator, Deque, Dict, Iterable, Iterator, List, Optional, TypedDict
 import uuid
 
 # First-Party
 from mcpgateway.common.models import LogLevel
 from mcpgateway.config import settings
 
+# RFC 5424 severity ordering used for minimum-level filtering
+_LEVEL_VALUES: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.NOTICE: 2,
+    LogLevel.WARNING: 3,
+    LogLevel.ERROR: 4,
+    LogLevel.CRITICAL: 5,
+    LogLevel.ALERT: 6,
+    LogLevel.EMERGENCY: 7,
+}
+
 
 class LogEntryDict(TypedDict, total=False):
     """TypedDict for LogEntry serialization."""
@@ -53,7 +73,7 @@ class LogEntry:
         request_id: Associated request ID for tracing
     """
 
-    __slots__ = ("id", "timestamp", "level", "entity_type", "entity_id", "entity_name", "message", "logger", "data", "request_id", "_size")
+    __slots__ = ("id", "timestamp", "level", "entity_type", "entity_id", "entity_name", "message", "logger", "data", "request_id", "_size", "_seq")
 
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
@@ -101,6 +121,9 @@ class LogEntry:
         self._size += sys.getsizeof(self.data) if self.data else 0
         self._size += sys.getsizeof(self.request_id) if self.request_id else 0
 
+        # Insertion sequence, assigned by LogStorageService when the entry is stored
+        self._seq = 0
+
     def to_dict(self) -> LogEntryDict:
         """Convert to dictionary for JSON serialization.
 
@@ -164,10 +187,18 @@ class LogStorageService:
         # Use deque for efficient append/pop operations
         self._buffer: Deque[LogEntry] = deque()
         self._subscribers: List[asyncio.Queue[LogStorageMessage]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-        # Indices for efficient filtering
-        self._entity_index: Dict[str, List[str]] = {}  # entity_key -> [log_ids]
-        self._request_index: Dict[str, List[str]] = {}  # request_id -> [log_ids]
+        # Guards the buffer and indices; entries may be appended from any thread
+        self._lock = threading.Lock()
+        self._seq = count(1)
+
+        # Indices for efficient filtering; each holds entries in insertion order,
+        # so eviction from the buffer always removes the leftmost index element
+        self._level_index: Dict[LogLevel, Deque[LogEntry]] = {}
+        self._entity_index: Dict[str, Deque[LogEntry]] = {}  # entity_key -> entries
+        self._request_index: Dict[str, Deque[LogEntry]] = {}  # request_id -> entries
+        self._entity_type_counts: Dict[str, int] = {}
 
     async def add_log(  # pylint: disable=too-many-positional-arguments
         self,
@@ -195,7 +226,7 @@ class LogStorageService:
         Returns:
             The created LogEntry
         """
-        log_entry = LogEntry(
+        return self.append_log(
             level=level,
             message=message,
             entity_type=entity_type,
@@ -206,60 +237,140 @@ class LogStorageService:
             request_id=request_id,
         )
 
-        # Add to buffer and update size
-        self._buffer.append(log_entry)
-        self._current_size_bytes += log_entry._size  # pylint: disable=protected-access
+    def append_log(  # pylint: disable=too-many-positional-arguments
+        self,
+        level: LogLevel,
+        message: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        entity_name: Optional[str] = None,
+        logger: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+    ) -> LogEntry:
+        """Add a log entry to storage synchronously; safe to call from any thread.
 
-        # Update indices BEFORE eviction so they can be cleaned up properly
-        if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            if key not in self._entity_index:
-                self._entity_index[key] = []
-            self._entity_index[key].append(log_entry.id)
+        Args:
+            level: Log severity level
+            message: Log message
+            entity_type: Type of entity (tool, resource, server, gateway)
+            entity_id: ID of the related entity
+            entity_name: Name of the related entity
+            logger: Logger name/source
+            data: Additional structured data
+            request_id: Associated request ID for tracing
 
-        if request_id:
-            if request_id not in self._request_index:
-                self._request_index[request_id] = []
-            self._request_index[request_id].append(log_entry.id)
+        Returns:
+            The created LogEntry
+
+        Examples:
+            >>> from mcpgateway.common.models import LogLevel
+            >>> service = LogStorageService()
+            >>> entry = service.append_log(LogLevel.INFO, "Started", entity_type="tool", entity_id="t1")
+            >>> len(service._buffer), len(service._entity_index["tool:t1"])
+            (1, 1)
+        """
+        log_entry = LogEntry(
+            level=level,
+            message=message,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            entity_name=entity_name,
+            logger=logger,
+            data=data,
+            request_id=request_id,
+        )
 
-        # Remove old entries if size limit exceeded
-        while self._current_size_bytes > self._max_size_bytes and self._buffer:
-            old_entry = self._buffer.popleft()
-            self._current_size_bytes -= old_entry._size  # pylint: disable=protected-access
-            self._remove_from_indices(old_entry)
+        with self._lock:
+            log_entry._seq = next(self._seq)  # pylint: disable=protected-access
+
+            # Add to buffer and update size
+            self._buffer.append(log_entry)
+            self._current_size_bytes += log_entry._size  # pylint: disable=protected-access
+
+            # Update indices BEFORE eviction so they can be cleaned up properly
+            self._level_index.setdefault(level, deque()).append(log_entry)
+            if entity_type:
+                self._entity_type_counts[entity_type] = self._entity_type_counts.get(entity_type, 0) + 1
+            if entity_id:
+                key = f"{entity_type}:{entity_id}" if entity_type else entity_id
+                self._entity_index.setdefault(key, deque()).append(log_entry)
+            if request_id:
+                self._request_index.setdefault(request_id, deque()).append(log_entry)
+
+            # Remove old entries if size limit exceeded
+            while self._current_size_bytes > self._max_size_bytes and self._buffer:
+                old_entry = self._buffer.popleft()
+                self._current_size_bytes -= old_entry._size  # pylint: disable=protected-access
+                self._remove_from_indices(old_entry)
 
         # Notify subscribers
-        await self._notify_subscribers(log_entry)
+        if self._subscribers:
+            self._publish(log_entry)
 
         return log_entry
 
+    @staticmethod
+    def _discard(index: Dict[Any, Deque[LogEntry]], key: Any, entry: LogEntry) -> None:
+        """Remove an evicted entry from one index bucket.
+
+        Args:
+            index: The index to update
+            key: Bucket key
+            entry: The evicted entry
+        """
+        bucket = index.get(key)
+        if not bucket:
+            return
+        if bucket[0] is entry:
+            bucket.popleft()
+        else:
+            try:
+                bucket.remove(entry)
+            except ValueError:
+                return
+        if not bucket:
+            del index[key]
+
     def _remove_from_indices(self, entry: LogEntry) -> None:
-        """Remove entry from indices when evicted from buffer.
+        """Remove entry from indices when evicted from buffer (the caller holds the lock).
 
         Args:
             entry: LogEntry to remove from indices
         """
+        self._discard(self._level_index, entry.level, entry)
+
+        if entry.entity_type and entry.entity_type in self._entity_type_counts:
+            self._entity_type_counts[entry.entity_type] -= 1
+            if not self._entity_type_counts[entry.entity_type]:
+                del self._entity_type_counts[entry.entity_type]
+
         # Remove from entity index
         if entry.entity_id:
             key = f"{entry.entity_type}:{entry.entity_id}" if entry.entity_type else entry.entity_id
-            if key in self._entity_index:
-                try:
-                    self._entity_index[key].remove(entry.id)
-                    if not self._entity_index[key]:
-                        del self._entity_index[key]
-                except ValueError:
-                    pass
+            self._discard(self._entity_index, key, entry)
 
         # Remove from request index
-        if entry.request_id and entry.request_id in self._request_index:
-            try:
-                self._request_index[entry.request_id].remove(entry.id)
-                if not self._request_index[entry.request_id]:
-                    del self._request_index[entry.request_id]
-            except ValueError:
-                pass
+        if entry.request_id:
+            self._discard(self._request_index, entry.request_id, entry)
 
-    async def _notify_subscribers(self, log_entry: LogEntry) -> None:
+    def _publish(self, log_entry: LogEntry) -> None:
+        """Hand a new entry to subscribers on the event loop they listen on.
+
+        Args:
+            log_entry: New log entry
+        """
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is None or running is loop:
+            self._notify_subscribers(log_entry)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._notify_subscribers, log_entry)
+
+    def _notify_subscribers(self, log_entry: LogEntry) -> None:
         """Notify subscribers of new log entry.
 
         Args:
@@ -316,49 +427,105 @@ class LogStorageService:
 
         Returns:
             List of matching log entries as dictionaries
-        """
-        # Start with all logs or filtered by indices
-        if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            log_ids = set(self._entity_index.get(key, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
-        elif request_id:
-            log_ids = set(self._request_index.get(request_id, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
-        else:
-            candidates = list(self._buffer)
 
-        # Apply filters
-        filtered = []
-        for log in candidates:
-            # Entity type filter
-            if entity_type and log.entity_type != entity_type:
-                continue
-
-            # Level filter
-            if level and not self._meets_level_threshold(log.level, level):
-                continue
+        Examples:
+            >>> import asyncio
+            >>> from mcpgateway.common.models import LogLevel
+            >>> service = LogStorageService()
+            >>> for i in range(5):
+            ...     _ = service.append_log(LogLevel.ERROR if i % 2 else LogLevel.INFO, f"log {i}")
+            >>> [log["message"] for log in asyncio.run(service.get_logs(level=LogLevel.WARNING))]
+            ['log 3', 'log 1']
+            >>> [log["message"] for log in asyncio.run(service.get_logs(limit=2, offset=1, order="asc"))]
+            ['log 1', 'log 2']
+        """
+        descending = order == "desc"
+        search_lower = search.lower() if search else None
+        page: List[LogEntry] = []
+        skipped = 0
+
+        with self._lock:
+            for log in self._candidates(entity_type, entity_id, level, request_id, descending):
+                # Entries are in insertion (time) order, so the range ends at the first out-of-range entry
+                if start_time and log.timestamp < start_time:
+                    if descending:
+                        break
+                    continue
+                if end_time and log.timestamp > end_time:
+                    if not descending:
+                        break
+                    continue
+
+                # Entity type filter
+                if entity_type and log.entity_type != entity_type:
+                    continue
+
+                # Level filter
+                if level and not self._meets_level_threshold(log.level, level):
+                    continue
+
+                # Search filter
+                if search_lower and search_lower not in log.message.lower():
+                    continue
+
+                # Paginate without materializing the full result set
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                page.append(log)
+                if len(page) >= limit:
+                    break
 
-            # Time range filters
-            if start_time and log.timestamp < start_time:
-                continue
-            if end_time and log.timestamp > end_time:
-                continue
+        # Convert to dictionaries
+        return [log.to_dict() for log in page]
 
-            # Search filter
-            if search and search.lower() not in log.message.lower():
-                continue
+    def _candidates(  # pylint: disable=too-many-positional-arguments
+        self,
+        entity_type: Optional[str],
+        entity_id: Optional[str],
+        level: Optional[LogLevel],
+        request_id: Optional[str],
+        descending: bool,
+    ) -> Iterable[LogEntry]:
+        """Pick the narrowest index for a query (the caller holds the lock).
 
-            filtered.append(log)
+        Args:
+            entity_type: Entity type filter
+            entity_id: Entity ID filter
+            level: Minimum log level
+            request_id: Request ID filter
+            descending: Whether to iterate newest first
 
-        # Sort
-        filtered.sort(key=lambda x: x.timestamp, reverse=order == "desc")
+        Returns:
+            Entries that may match, in the requested order
+        """
+        if entity_id:
+            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
+            return self._ordered(self._entity_index.get(key, ()), descending)
+        if request_id:
+            return self._ordered(self._request_index.get(request_id, ()), descending)
+        if level:
+            buckets = [bucket for bucket_level, bucket in self._level_index.items() if self._meets_level_threshold(bucket_level, level)]
+            if len(buckets) <= 1:
+                return self._ordered(buckets[0] if buckets else (), descending)
+            # Merge the per-level buckets back into insertion order
+            return heapq.merge(*(self._ordered(bucket, descending) for bucket in buckets), key=lambda entry: entry._seq, reverse=descending)  # pylint: disable=protected-access
+        return self._ordered(self._buffer, descending)
+
+    @staticmethod
+    def _ordered(entries: Iterable[LogEntry], descending: bool) -> Iterator[LogEntry]:
+        """Iterate a bucket oldest or newest first.
 
-        # Paginate
-        paginated = filtered[offset : offset + limit]  # noqa: E203
+        Args:
+            entries: Entries in insertion order
+            descending: Whether to iterate newest first
 
-        # Convert to dictionaries
-        return [log.to_dict() for log in paginated]
+        Returns:
+            Iterator over the entries
+        """
+        if descending and isinstance(entries, deque):
+            return reversed(entries)
+        return iter(entries)
 
     def _meets_level_threshold(self, log_level: LogLevel, min_level: LogLevel) -> bool:
         """Check if log level meets minimum threshold.
@@ -382,18 +549,7 @@ class LogStorageService:
             >>> service._meets_level_threshold(LogLevel.DEBUG, LogLevel.DEBUG)
             True
         """
-        level_values = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.NOTICE: 2,
-            LogLevel.WARNING: 3,
-            LogLevel.ERROR: 4,
-            LogLevel.CRITICAL: 5,
-            LogLevel.ALERT: 6,
-            LogLevel.EMERGENCY: 7,
-        }
-
-        return level_values.get(log_level, 0) >= level_values.get(min_level, 0)
+        return _LEVEL_VALUES.get(log_level, 0) >= _LEVEL_VALUES.get(min_level, 0)
 
     async def subscribe(self) -> AsyncGenerator[LogStorageMessage, None]:
         """Subscribe to real-time log updates.
@@ -402,6 +558,7 @@ class LogStorageService:
             Log entry events as they occur
         """
         queue: asyncio.Queue[LogStorageMessage] = asyncio.Queue(maxsize=100)
+        self._loop = asyncio.get_running_loop()
         self._subscribers.append(queue)
         try:
             while True:
@@ -432,16 +589,9 @@ class LogStorageService:
             >>> stats['unique_requests']
             0
         """
-        level_counts: Dict[LogLevel, int] = {}
-        entity_counts: Dict[str, int] = {}
-
-        for log in self._buffer:
-            # Count by level
-            level_counts[log.level] = level_counts.get(log.level, 0) + 1
-
-            # Count by entity type
-            if log.entity_type:
-                entity_counts[log.entity_type] = entity_counts.get(log.entity_type, 0) + 1
+        with self._lock:
+            level_counts: Dict[LogLevel, int] = {level: len(bucket) for level, bucket in self._level_index.items()}
+            entity_counts: Dict[str, int] = dict(self._entity_type_counts)
 
         return {
             "total_logs": len(self._buffer),
@@ -473,9 +623,12 @@ class LogStorageService:
             >>> len(service._buffer)
             0
         """
-        count = len(self._buffer)
-        self._buffer.clear()
-        self._entity_index.clear()
-        self._request_index.clear()
-        self._current_size_bytes = 0
-        return count
+        with self._lock:
+            cleared = len(self._buffer)
+            self._buffer.clear()
+            self._level_index.clear()
+            self._entity_index.clear()
+            self._request_index.clear()
+            self._entity_type_counts.clear()
+            self._current_size_bytes = 0
+        return cleared
@@ -11,7 +11,6 @@ It supports RFC 5424 severity levels, log level management, and log event subscr
 
 # Standard
 import asyncio
-from asyncio.events import AbstractEventLoop
 from datetime import datetime, timezone
 import logging
 from logging.handlers import RotatingFileHandler
@@ -109,7 +108,6 @@ class StorageHandler(logging.Handler):
         """
         super().__init__()
         self.storage = storage_service
-        self.loop: AbstractEventLoop | None = None
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to storage.
@@ -144,31 +142,17 @@ class StorageHandler(logging.Handler):
         except Exception:
             message = record.getMessage()
 
-        # Store the log asynchronously
+        # Store the log synchronously; the storage is lock-protected and thread-safe
         try:
-            # Get or create event loop
-            if not self.loop:
-                try:
-                    self.loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    # No running loop, can't store
-                    return
-
-            # Schedule the coroutine and store the future (fire-and-forget)
-            future = asyncio.run_coroutine_threadsafe(
-                self.storage.add_log(
-                    level=log_level,
-                    message=message,
-                    entity_type=entity_type,
-                    entity_id=entity_id,
-                    entity_name=entity_name,
-                    logger=record.name,
-                    request_id=request_id,
-                ),
-                self.loop,
+            self.storage.append_log(
+                level=log_level,
+                message=message,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                entity_name=entity_name,
+                logger=record.name,
+                request_id=request_id,
             )
-            # Add a done callback to catch any exceptions without blocking
-            future.add_done_callback(lambda f: f.exception() if not f.cancelled() else None)
         except Exception:
             # Silently fail to avoid logging recursion
             pass  # nosec B110 - Intentional to prevent logging recursion
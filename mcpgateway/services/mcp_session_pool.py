@@ -0,0 +1,581 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/mcp_session_pool.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+MCP Client Session Pool.
+This module keeps initialized upstream MCP ``ClientSession`` objects warm so that
+``tools/call`` requests routed to federated gateways do not pay the transport
+connect and ``initialize`` handshake on every invocation. Features:
+- One multiplexed session per gateway URL, transport and auth identity
+- Single-flight session creation (concurrent callers share one handshake)
+- Idle and max-lifetime eviction with periodic ping health checks
+- Eviction of sessions that fail at the transport level
+- Pool size and hit-rate metrics
+
+Each pooled session is owned by a dedicated background task that enters the
+transport and ``ClientSession`` context managers and keeps them open until the
+session is evicted, because anyio cancel scopes must be exited by the task that
+entered them.
+
+Examples:
+    >>> from mcpgateway.services.mcp_session_pool import MCPSessionPool
+    >>> pool = MCPSessionPool(max_sessions=10, idle_timeout=60)
+    >>> key = pool.make_key("gw-1", "http://upstream/mcp", "streamablehttp", {"Authorization": "Bearer a"})
+    >>> key == pool.make_key("gw-1", "http://upstream/mcp", "streamablehttp", {"Authorization": "Bearer a"})
+    True
+    >>> key == pool.make_key("gw-1", "http://upstream/mcp", "streamablehttp", {"Authorization": "Bearer b"})
+    False
+    >>> pool.get_metrics()["size"]
+    0
+"""
+
+# Standard
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import hashlib
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+# Third-Party
+import anyio
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+PoolKey = Tuple[str, str, str, str]
+
+# Errors that mean the session's connection is broken, as opposed to a failed call
+TRANSPORT_ERRORS = (httpx.TransportError, anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream, OSError)
+
+
+def is_transport_error(exc: BaseException) -> bool:
+    """Return whether an exception means the session's connection is unusable.
+
+    Args:
+        exc: Exception raised while using a pooled session
+
+    Returns:
+        bool: True for connection and stream errors, including inside exception groups.
+
+    Examples:
+        >>> is_transport_error(httpx.ConnectError("refused"))
+        True
+        >>> is_transport_error(ExceptionGroup("task group", [anyio.ClosedResourceError()]))
+        True
+        >>> is_transport_error(ValueError("bad arguments"))
+        False
+    """
+    if isinstance(exc, BaseExceptionGroup):
+        return any(is_transport_error(inner) for inner in exc.exceptions)
+    return isinstance(exc, TRANSPORT_ERRORS)
+
+
+@dataclass
+class PooledSession:
+    """An initialized upstream MCP session held open by the pool.
+
+    Attributes:
+        key: Pool key (gateway id, url, transport, identity digest)
+        session: The initialized ``ClientSession``
+        created_at: Monotonic time the session was created
+        last_used: Monotonic time the session was last handed out or released
+        in_use: Number of callers currently using the session
+        close_event: Set to ask the owner task to close the session
+        owner_task: Background task holding the transport context open
+    """
+
+    key: PoolKey
+    session: ClientSession
+    created_at: float
+    last_used: float
+    in_use: int = 0
+    close_event: asyncio.Event = field(default_factory=asyncio.Event)
+    owner_task: Optional[asyncio.Task] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session has been closed or its transport has died.
+
+        Returns:
+            bool: True if the session can no longer be used.
+        """
+        return self.close_event.is_set() or (self.owner_task is not None and self.owner_task.done())
+
+
+class MCPSessionPool:
+    """Pool of warm, multiplexed upstream MCP client sessions.
+
+    Attributes:
+        max_sessions: Maximum number of pooled sessions across all keys
+        idle_timeout: Seconds a session may stay unused before it is evicted
+        max_lifetime: Seconds after which a session is recycled once idle
+        health_check_interval: Seconds between maintenance sweeps and pings
+        connect_timeout: Seconds allowed for transport connect plus ``initialize``
+
+    Examples:
+        >>> pool = MCPSessionPool(max_sessions=2)
+        >>> pool.max_sessions
+        2
+        >>> sorted(pool.get_metrics().keys())
+        ['evictions', 'failures', 'hit_rate', 'hits', 'in_use', 'max_sessions', 'misses', 'overflow', 'size']
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        idle_timeout: float = 300.0,
+        max_lifetime: float = 3600.0,
+        health_check_interval: float = 60.0,
+        connect_timeout: float = 30.0,
+    ) -> None:
+        """Initialize the session pool.
+
+        Args:
+            max_sessions: Maximum number of pooled sessions across all keys
+            idle_timeout: Seconds a session may stay unused before it is evicted
+            max_lifetime: Seconds after which a session is recycled once idle
+            health_check_interval: Seconds between maintenance sweeps and pings
+            connect_timeout: Seconds allowed for transport connect plus ``initialize``
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self._sessions: Dict[PoolKey, PooledSession] = {}
+        # Single-flight creation locks, kept only while a key has a session or a caller in _acquire
+        self._key_locks: Dict[PoolKey, asyncio.Lock] = {}
+        self._lock_users: Dict[PoolKey, int] = {}
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._failures = 0
+        self._overflow = 0
+
+    @staticmethod
+    def make_key(gateway_id: Optional[str], url: str, transport: str, headers: Optional[Dict[str, str]]) -> PoolKey:
+        """Build the pool key for a gateway and auth identity.
+
+        The identity is a digest of the outbound headers, so different
+        credentials (including passthrough headers) never share a session.
+
+        Args:
+            gateway_id: Gateway identifier
+            url: Upstream MCP server URL
+            transport: ``sse`` or ``streamablehttp``
+            headers: Outbound request headers, including authentication
+
+        Returns:
+            PoolKey: Hashable key identifying the session.
+
+        Examples:
+            >>> k = MCPSessionPool.make_key("g", "http://x", "SSE", {"b": "2", "a": "1"})
+            >>> k[:3]
+            ('g', 'http://x', 'sse')
+            >>> k == MCPSessionPool.make_key("g", "http://x", "sse", {"a": "1", "b": "2"})
+            True
+        """
+        digest = hashlib.sha256()
+        for name, value in sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items()):
+            digest.update(name.encode())
+            digest.update(b"\x00")
+            digest.update(value.encode())
+            digest.update(b"\x00")
+        return (str(gateway_id or ""), url, transport.lower(), digest.hexdigest())
+
+    async def start(self) -> None:
+        """Start the background maintenance task."""
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+            logger.info("MCP session pool maintenance task started")
+
+    async def shutdown(self) -> None:
+        """Stop maintenance and close every pooled session."""
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+
+        for entry in list(self._sessions.values()):
+            await self._close(entry)
+        self._sessions.clear()
+        self._key_locks.clear()
+        self._lock_users.clear()
+        logger.info("MCP session pool shutdown complete")
+
+    @asynccontextmanager
+    async def session(
+        self,
+        url: str,
+        transport: str,
+        headers: Optional[Dict[str, str]] = None,
+        gateway_id: Optional[str] = None,
+        httpx_client_factory: Optional[Callable[..., Any]] = None,
+    ) -> AsyncIterator[ClientSession]:
+        """Borrow an initialized session for the given gateway and identity.
+
+        The session is shared with other concurrent callers using the same key;
+        requests are multiplexed by JSON-RPC id. If the caller fails with a
+        transport-level error (see ``is_transport_error``) the session is evicted
+        so the next caller gets a fresh one; any other error leaves it in place
+        for the callers still using it.
+
+        Args:
+            url: Upstream MCP server URL
+            transport: ``sse`` or ``streamablehttp``
+            headers: Outbound request headers, including authentication
+            gateway_id: Gateway identifier used to scope the pool key
+            httpx_client_factory: Optional factory for the underlying httpx client
+
+        Yields:
+            ClientSession: An initialized MCP client session.
+
+        Raises:
+            Exception: Any error raised while using the session is re-raised.
+        """
+        key = self.make_key(gateway_id, url, transport, headers)
+        entry = await self._acquire(key, url, transport, headers, httpx_client_factory)
+        if entry is None:
+            # Pool is full of busy sessions: fall back to a one-shot session
+            self._overflow += 1
+            async with self._transport(url, transport, headers, httpx_client_factory) as streams:
+                async with ClientSession(streams[0], streams[1]) as session:
+                    await session.initialize()
+                    yield session
+            return
+
+        entry.in_use += 1
+        try:
+            yield entry.session
+        except Exception as e:
+            # Protocol and tool errors leave the shared session healthy
+            if is_transport_error(e):
+                self._failures += 1
+                await self._evict(entry)
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return pool size and hit-rate metrics.
+
+        Returns:
+            Dict[str, Any]: Pool statistics.
+
+        Examples:
+            >>> pool = MCPSessionPool()
+            >>> pool._hits, pool._misses = 3, 1
+            >>> pool.get_metrics()["hit_rate"]
+            0.75
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "in_use": sum(1 for entry in self._sessions.values() if entry.in_use),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            "evictions": self._evictions,
+            "failures": self._failures,
+            "overflow": self._overflow,
+        }
+
+    async def evict_gateway(self, gateway_id: str) -> int:
+        """Close all pooled sessions belonging to a gateway.
+
+        Used when a gateway is updated, deactivated or deleted so that stale
+        URLs or credentials are not reused. Only this worker's pool is cleared;
+        other workers drop their sessions through idle and lifetime eviction, or
+        on the first transport error.
+
+        Args:
+            gateway_id: Gateway identifier
+
+        Returns:
+            int: Number of sessions evicted.
+        """
+        entries = [entry for key, entry in self._sessions.items() if key[0] == str(gateway_id)]
+        for entry in entries:
+            await self._evict(entry)
+        return len(entries)
+
+    async def _acquire(
+        self,
+        key: PoolKey,
+        url: str,
+        transport: str,
+        headers: Optional[Dict[str, str]],
+        httpx_client_factory: Optional[Callable[..., Any]],
+    ) -> Optional[PooledSession]:
+        """Return a live pooled session for ``key``, creating it if needed.
+
+        Args:
+            key: Pool key
+            url: Upstream MCP server URL
+            transport: ``sse`` or ``streamablehttp``
+            headers: Outbound request headers
+            httpx_client_factory: Optional factory for the underlying httpx client
+
+        Returns:
+            Optional[PooledSession]: The pooled session, or None if the pool is full.
+        """
+        entry = self._sessions.get(key)
+        if entry and not entry.closed:
+            self._hits += 1
+            entry.last_used = time.monotonic()
+            return entry
+
+        lock = self._key_locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another caller may have created the session while we waited
+                entry = self._sessions.get(key)
+                if entry and not entry.closed:
+                    self._hits += 1
+                    entry.last_used = time.monotonic()
+                    return entry
+                if entry:
+                    await self._evict(entry)
+
+                self._misses += 1
+                if len(self._sessions) >= self.max_sessions and not await self._evict_lru_idle():
+                    return None
+
+                entry = await self._open(key, url, transport, headers, httpx_client_factory)
+                self._sessions[key] = entry
+                return entry
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                self._discard_key_lock(key)
+
+    def _discard_key_lock(self, key: PoolKey) -> None:
+        """Drop the creation lock of a key that has no session and no caller waiting on it.
+
+        Pool keys include a digest of the outbound headers, so without this the lock
+        map would grow with every distinct passthrough or OAuth identity ever seen.
+
+        Args:
+            key: Pool key
+        """
+        if key not in self._sessions and key not in self._lock_users:
+            self._key_locks.pop(key, None)
+
+    async def _open(
+        self,
+        key: PoolKey,
+        url: str,
+        transport: str,
+        headers: Optional[Dict[str, str]],
+        httpx_client_factory: Optional[Callable[..., Any]],
+    ) -> PooledSession:
+        """Open and initialize a new session owned by a background task.
+
+        Args:
+            key: Pool key
+            url: Upstream MCP server URL
+            transport: ``sse`` or ``streamablehttp``
+            headers: Outbound request headers
+            httpx_client_factory: Optional factory for the underlying httpx client
+
+        Returns:
+            PooledSession: The initialized pooled session.
+
+        Raises:
+            Exception: If connecting or initializing the session fails.
+        """
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future = loop.create_future()
+        close_event = asyncio.Event()
+
+        async def _owner() -> None:
+            """Hold the transport and session open until asked to close."""
+            try:
+                async with self._transport(url, transport, headers, httpx_client_factory) as streams:
+                    async with ClientSession(streams[0], streams[1]) as client_session:
+                        await client_session.initialize()
+                        ready.set_result(client_session)
+                        await close_event.wait()
+            except asyncio.CancelledError:
+                if not ready.done():
+                    ready.cancel()
+                raise
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                else:
+                    logger.debug(f"Pooled MCP session for {url} closed with error: {e}")
+
+        owner_task = asyncio.create_task(_owner())
+        try:
+            client_session = await asyncio.wait_for(asyncio.shield(ready), timeout=self.connect_timeout)
+        except BaseException:
+            self._failures += 1
+            close_event.set()
+            owner_task.cancel()
+            raise
+
+        now = time.monotonic()
+        logger.debug(f"Opened pooled MCP session for {url} ({transport})")
+        return PooledSession(key=key, session=client_session, created_at=now, last_used=now, close_event=close_event, owner_task=owner_task)
+
+    @staticmethod
+    def _transport(url: str, transport: str, headers: Optional[Dict[str, str]], httpx_client_factory: Optional[Callable[..., Any]]):
+        """Build the transport context manager for the given transport type.
+
+        Args:
+            url: Upstream MCP server URL
+            transport: ``sse`` or ``streamablehttp``
+            headers: Outbound request headers
+            httpx_client_factory: Optional factory for the underlying httpx client
+
+        Returns:
+            An async context manager yielding the read and write streams.
+
+        Raises:
+            ValueError: If the transport is not supported.
+        """
+        kwargs: Dict[str, Any] = {"url": url, "headers": headers}
+        if httpx_client_factory is not None:
+            kwargs["httpx_client_factory"] = httpx_client_factory
+        if transport.lower() == "sse":
+            return sse_client(**kwargs)
+        if transport.lower() == "streamablehttp":
+            return streamablehttp_client(**kwargs)
+        raise ValueError(f"Unsupported MCP transport for session pooling: {transport}")
+
+    async def _evict(self, entry: PooledSession) -> None:
+        """Remove a session from the pool and close it.
+
+        Args:
+            entry: Pooled session to evict
+        """
+        if self._sessions.get(entry.key) is entry:
+            del self._sessions[entry.key]
+            self._evictions += 1
+            self._discard_key_lock(entry.key)
+        await self._close(entry)
+
+    async def _evict_lru_idle(self) -> bool:
+        """Evict the least recently used idle session to make room.
+
+        Returns:
+            bool: True if a session was evicted.
+        """
+        idle = [entry for entry in self._sessions.values() if entry.in_use == 0]
+        if not idle:
+            return False
+        await self._evict(min(idle, key=lambda entry: entry.last_used))
+        return True
+
+    @staticmethod
+    async def _close(entry: PooledSession) -> None:
+        """Signal the owner task to close the session and wait briefly for it.
+
+        Args:
+            entry: Pooled session to close
+        """
+        entry.close_event.set()
+        task = entry.owner_task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=5)
+        except asyncio.TimeoutError:
+            task.cancel()
+        except Exception as e:
+            logger.debug(f"Error closing pooled MCP session: {e}")
+
+    async def _ping(self, entry: PooledSession) -> bool:
+        """Check that an idle session still answers pings.
+
+        Args:
+            entry: Pooled session to check
+
+        Returns:
+            bool: True if the session is healthy.
+        """
+        try:
+            await asyncio.wait_for(entry.session.send_ping(), timeout=self.connect_timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled MCP session health check failed: {e}")
+            return False
+
+    async def _sweep(self) -> None:
+        """Evict idle, expired, dead or unhealthy sessions."""
+        now = time.monotonic()
+        for entry in list(self._sessions.values()):
+            if entry.closed:
+                await self._evict(entry)
+                continue
+            if entry.in_use:
+                continue
+            if now - entry.last_used > self.idle_timeout or now - entry.created_at > self.max_lifetime:
+                await self._evict(entry)
+            elif now - entry.last_used >= self.health_check_interval and not await self._ping(entry):
+                self._failures += 1
+                await self._evict(entry)
+
+    async def _maintenance_loop(self) -> None:
+        """Periodically sweep the pool."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self._sweep()
+            except Exception as e:
+                logger.error(f"Error during MCP session pool maintenance: {e}")
+
+
+# Global singleton instance
+_mcp_session_pool: Optional[MCPSessionPool] = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get the global MCPSessionPool singleton instance.
+
+    Returns:
+        The global MCPSessionPool instance
+    """
+    global _mcp_session_pool  # pylint: disable=global-statement
+    if _mcp_session_pool is None:
+        _mcp_session_pool = MCPSessionPool(
+            max_sessions=settings.mcp_session_pool_max_sessions,
+            idle_timeout=settings.mcp_session_pool_idle_timeout,
+            max_lifetime=settings.mcp_session_pool_max_lifetime,
+            health_check_interval=settings.mcp_session_pool_health_check_interval,
+            connect_timeout=settings.mcp_session_pool_connect_timeout,
+        )
+    return _mcp_session_pool
+
+
+def set_mcp_session_pool(pool: Optional[MCPSessionPool]) -> None:
+    """Set the global MCPSessionPool instance.
+
+    This is primarily used for testing to inject mock pools.
+
+    Args:
+        pool: The MCPSessionPool instance to use globally
+    """
+    global _mcp_session_pool  # pylint: disable=global-statement
+    _mcp_session_pool = pool
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/metrics_buffer_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Metrics Buffer Service.
+This module moves invocation metric writes off the request path. Tool, resource,
+prompt, server and A2A metrics are queued in memory and written by a background
+task in bulk inserts (one transaction per entity type, rollups included), flushed
+when the batch is full or the flush interval elapses, and drained on shutdown. A
+record whose entity was deleted before the flush is dropped on its own instead of
+failing the rest of the batch.
+
+The queue is bounded: when the database cannot keep up, new records are dropped
+and counted rather than growing memory without limit.
+
+Examples:
+    >>> import asyncio
+    >>> buffer = MetricsBufferService(max_size=2, batch_size=10, flush_interval=60)
+    >>> buffer.running
+    False
+    >>> buffer.record("tool", "t1", 0.1, True)
+    False
+"""
+
+# Standard
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Third-Party
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import SessionLocal, utc_now
+from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_rollup_service import ENTITY_METRIC_MODELS, record_metric_rollups
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+
+@dataclass
+class MetricRecord:
+    """A single buffered invocation metric.
+
+    Attributes:
+        entity_type: One of ``tool``, ``resource``, ``server``, ``prompt`` or ``a2a_agent``
+        entity_id: Identifier of the invoked entity
+        response_time: Response time in seconds
+        is_success: Whether the invocation succeeded
+        error_message: Error message for failed invocations
+        timestamp: When the invocation completed
+        extra: Additional model-specific columns (e.g. A2A ``interaction_type``)
+    """
+
+    entity_type: str
+    entity_id: Any
+    response_time: float
+    is_success: bool
+    error_message: Optional[str] = None
+    timestamp: datetime = field(default_factory=utc_now)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class MetricsBufferService:
+    """Bounded in-memory metric queue with a background bulk writer.
+
+    ``record`` never blocks and never touches the database. It returns False only when
+    the writer is not running, in which case the caller writes the metric inline; a
+    record that arrives while the queue is full is dropped and counted.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> async def demo():
+        ...     buffer = MetricsBufferService(max_size=10, batch_size=100, flush_interval=60)
+        ...     with patch.object(buffer, "_write_batch", return_value=0) as write:
+        ...         await buffer.start()
+        ...         queued = buffer.record("tool", "t1", 0.1, True)
+        ...         await buffer.shutdown()
+        ...     return queued, write.call_count, buffer.get_metrics()["flushed"]
+        >>> asyncio.run(demo())
+        (True, 1, 1)
+    """
+
+    def __init__(self, max_size: Optional[int] = None, batch_size: Optional[int] = None, flush_interval: Optional[float] = None) -> None:
+        """Initialize the metrics buffer.
+
+        Args:
+            max_size: Maximum number of queued records before new records are dropped
+            batch_size: Number of records that triggers an immediate flush
+            flush_interval: Maximum seconds a record waits before being flushed
+        """
+        self.max_size = max_size or settings.metrics_buffer_max_size
+        self.batch_size = batch_size or settings.metrics_buffer_batch_size
+        self.flush_interval = flush_interval or settings.metrics_buffer_flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        # Records the writer had taken off the queue when it was cancelled
+        self._collected: List[MetricRecord] = []
+        self._enqueued = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._failed = 0
+        self._flushes = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is accepting records.
+
+        Returns:
+            bool: True when ``record`` will queue metrics.
+        """
+        return self._writer_task is not None and not self._writer_task.done()
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        logger.info(f"Metrics buffer started (max size: {self.max_size}, batch size: {self.batch_size}, flush interval: {self.flush_interval}s)")
+
+    async def shutdown(self) -> None:
+        """Stop the writer and flush every record still queued or being batched."""
+        if self._writer_task is None:
+            return
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+        remaining = self._collected + self._drain()
+        self._collected = []
+        while remaining:
+            await self._flush(remaining[: self.batch_size])
+            remaining = remaining[self.batch_size :]
+        logger.info(f"Metrics buffer shut down ({self._flushed} flushed, {self._dropped} dropped, {self._failed} failed)")
+
+    def record(
+        self,
+        entity_type: str,
+        entity_id: Any,
+        response_time: float,
+        is_success: bool,
+        error_message: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        **extra: Any,
+    ) -> bool:
+        """Queue an invocation metric for the background writer.
+
+        Args:
+            entity_type: One of ``tool``, ``resource``, ``server``, ``prompt`` or ``a2a_agent``
+            entity_id: Identifier of the invoked entity
+            response_time: Response time in seconds
+            is_success: Whether the invocation succeeded
+            error_message: Error message for failed invocations
+            timestamp: When the invocation completed (defaults to now)
+            **extra: Additional model-specific columns
+
+        Returns:
+            bool: True if the buffer took ownership of the record (queued, or dropped because the
+            queue is full); False if the writer is not running and the caller must write it.
+        """
+        if not self.running:
+            return False
+        metric = MetricRecord(entity_type, entity_id, response_time, is_success, error_message, timestamp or utc_now(), extra)
+        try:
+            self._queue.put_nowait(metric)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(f"Metrics buffer full ({self.max_size} records); {self._dropped} metrics dropped so far")
+            return True
+        self._enqueued += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return buffer counters for the ``/metrics`` endpoint.
+
+        Returns:
+            Dict[str, Any]: Queue depth and enqueue/flush/drop counters.
+
+        Examples:
+            >>> sorted(MetricsBufferService(max_size=1, batch_size=1, flush_interval=1).get_metrics())
+            ['dropped', 'enqueued', 'failed', 'flushed', 'flushes', 'max_size', 'queued', 'running']
+        """
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "enqueued": self._enqueued,
+            "flushed": self._flushed,
+            "flushes": self._flushes,
+            "dropped": self._dropped,
+            "failed": self._failed,
+        }
+
+    async def _writer_loop(self) -> None:
+        """Collect records into batches and flush them on size or time thresholds."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[MetricRecord] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Hand the partial batch to shutdown, which flushes it with the rest of the queue
+                self._collected = batch
+                raise
+            # Shielded so cancelling the loop at shutdown never abandons a half-written batch
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+
+    def _drain(self) -> List[MetricRecord]:
+        """Remove and return every queued record.
+
+        Returns:
+            List[MetricRecord]: Records that were still waiting to be written.
+        """
+        records: List[MetricRecord] = []
+        while self._queue is not None and not self._queue.empty():
+            records.append(self._queue.get_nowait())
+        return records
+
+    async def _flush(self, batch: List[MetricRecord]) -> None:
+        """Write a batch in a worker thread, counting failures instead of raising.
+
+        Args:
+            batch: Records to write
+        """
+        try:
+            rejected = await asyncio.to_thread(self._write_batch, batch)
+            self._flushed += len(batch) - rejected
+            self._failed += rejected
+            self._flushes += 1
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"Failed to flush {len(batch)} buffered metrics: {e}")
+
+    def _write_batch(self, batch: List[MetricRecord]) -> int:
+        """Bulk insert a batch of raw metrics and fold it into the rollups, one transaction per entity type.
+
+        When a bulk insert violates an integrity constraint (typically an entity deleted
+        before the flush), that entity type is retried record by record so only the
+        offending records are lost. Any other error fails the entity type's records and
+        the remaining types are still written.
+
+        Args:
+            batch: Records to write
+
+        Returns:
+            int: Number of records that could not be written
+        """
+        by_type: Dict[str, List[MetricRecord]] = defaultdict(list)
+        for metric in batch:
+            by_type[metric.entity_type].append(metric)
+
+        rejected = 0
+        with SessionLocal() as db:
+            for entity_type, records in by_type.items():
+                try:
+                    self._write_records(db, entity_type, records)
+                    db.commit()
+                except IntegrityError:
+                    db.rollback()
+                    for metric in records:
+                        try:
+                            self._write_records(db, entity_type, [metric])
+                            db.commit()
+                        except IntegrityError:
+                            db.rollback()
+                            rejected += 1
+                            logger.warning(f"Dropped buffered {entity_type} metric for missing {entity_type} {metric.entity_id}")
+                except Exception as e:
+                    db.rollback()
+                    rejected += len(records)
+                    logger.error(f"Failed to flush {len(records)} buffered {entity_type} metrics: {e}")
+        return rejected
+
+    @staticmethod
+    def _write_records(db: Session, entity_type: str, records: List[MetricRecord]) -> None:
+        """Insert raw metrics of one entity type and update their rollups; the caller commits.
+
+        Args:
+            db: Database session
+            entity_type: Key of ``ENTITY_METRIC_MODELS``
+            records: Records of that entity type
+        """
+        models = ENTITY_METRIC_MODELS[entity_type]
+        rows = [
+            {
+                models.key: m.entity_id,
+                "response_time": m.response_time,
+                "is_success": m.is_success,
+                "error_message": m.error_message,
+                "timestamp": m.timestamp,
+                **m.extra,
+            }
+            for m in records
+        ]
+        db.execute(insert(models.raw), rows)
+        record_metric_rollups(db, entity_type, [(m.entity_id, m.response_time, m.is_success, m.timestamp) for m in records])
+
+
+_metrics_buffer_service: Optional[MetricsBufferService] = None
+
+
+def get_metrics_buffer_service() -> MetricsBufferService:
+    """Get the global MetricsBufferService singleton instance.
+
+    Returns:
+        The global MetricsBufferService instance
+    """
+    global _metrics_buffer_service  # pylint: disable=global-statement
+    if _metrics_buffer_service is None:
+        _metrics_buffer_service = MetricsBufferService()
+    return _metrics_buffer_service
+
+
+def set_metrics_buffer_service(service: Optional[MetricsBufferService]) -> None:
+    """Set the global MetricsBufferService instance.
+
+    This is primarily used for testing to inject mock buffers.
+
+    Args:
+        service: The MetricsBufferService instance to use globally
+    """
+    global _metrics_buffer_service  # pylint: disable=global-statement
+    _metrics_buffer_service = service
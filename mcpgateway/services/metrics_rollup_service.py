@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/metrics_rollup_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Metric Rollup Service.
+This module maintains pre-aggregated execution metrics so that read paths never
+scan the raw ``*_metrics`` tables. It provides:
+- Incremental, atomic updates of per-entity lifetime rollups on every metric write
+- Rollup-backed aggregate, top-performer and reset helpers used by the services
+- Retention-based compaction of raw metric rows
+
+Rollups hold lifetime aggregates only; per-entity time-bucketed histograms are
+not maintained. Time-windowed questions about an entity are answered from the
+raw rows kept within the retention window.
+
+Examples:
+    >>> from mcpgateway.services.metrics_rollup_service import ENTITY_METRIC_MODELS
+    >>> sorted(ENTITY_METRIC_MODELS)
+    ['a2a_agent', 'prompt', 'resource', 'server', 'tool']
+"""
+
+# Standard
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+# Third-Party
+from sqlalchemy import case, delete, desc, Float, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import A2AAgent, A2AAgentMetric, A2AAgentMetricRollup, Prompt, PromptMetric, PromptMetricRollup, Resource, ResourceMetric, ResourceMetricRollup
+from mcpgateway.db import Server, ServerMetric, ServerMetricRollup, SessionLocal, Tool, ToolMetric, ToolMetricRollup, utc_now
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class EntityMetricModels:
+    """ORM models backing the metrics of one entity type.
+
+    Attributes:
+        entity: Entity model (e.g. ``Tool``)
+        raw: Raw per-invocation metric model (e.g. ``ToolMetric``)
+        rollup: Lifetime rollup model (e.g. ``ToolMetricRollup``)
+        key: Name of the entity foreign key column on the raw and rollup models
+        name: Entity column reported as the name of a top performer
+    """
+
+    entity: Type[Any]
+    raw: Type[Any]
+    rollup: Type[Any]
+    key: str
+    name: str = "name"
+
+
+ENTITY_METRIC_MODELS: Dict[str, EntityMetricModels] = {
+    "tool": EntityMetricModels(Tool, ToolMetric, ToolMetricRollup, "tool_id"),
+    "resource": EntityMetricModels(Resource, ResourceMetric, ResourceMetricRollup, "resource_id", name="uri"),
+    "server": EntityMetricModels(Server, ServerMetric, ServerMetricRollup, "server_id"),
+    "prompt": EntityMetricModels(Prompt, PromptMetric, PromptMetricRollup, "prompt_id"),
+    "a2a_agent": EntityMetricModels(A2AAgent, A2AAgentMetric, A2AAgentMetricRollup, "a2a_agent_id"),
+}
+
+
+@dataclass
+class MetricAggregate:
+    """Partial aggregate of a group of metric samples.
+
+    Examples:
+        >>> agg = MetricAggregate()
+        >>> agg.add(0.5, True, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        >>> agg.add(1.5, False, datetime(2025, 1, 2, tzinfo=timezone.utc))
+        >>> (agg.total, agg.successful, agg.failed, agg.response_time, agg.min_rt, agg.max_rt)
+        (2, 1, 1, 2.0, 0.5, 1.5)
+        >>> agg.last.day
+        2
+    """
+
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    response_time: float = 0.0
+    min_rt: Optional[float] = None
+    max_rt: Optional[float] = None
+    last: Optional[datetime] = None
+
+    def add(self, response_time: float, success: bool, timestamp: datetime) -> None:
+        """Fold one sample into the aggregate.
+
+        Args:
+            response_time: Response time in seconds
+            success: Whether the invocation succeeded
+            timestamp: When the invocation completed
+        """
+        self.total += 1
+        if success:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self.response_time += response_time
+        self.min_rt = response_time if self.min_rt is None else min(self.min_rt, response_time)
+        self.max_rt = response_time if self.max_rt is None else max(self.max_rt, response_time)
+        self.last = timestamp if self.last is None else max(self.last, timestamp)
+
+
+def _insert_ignore(db: Session, model: Type[Any], values: Dict[str, Any]) -> None:
+    """Insert a row, silently skipping it if the key already exists.
+
+    Args:
+        db: Database session
+        model: ORM model to insert into
+        values: Column values for the new row
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(pg_insert(model).values(**values).on_conflict_do_nothing())
+    elif dialect == "sqlite":
+        db.execute(sqlite_insert(model).values(**values).on_conflict_do_nothing())
+    elif dialect in ("mysql", "mariadb"):
+        db.execute(insert(model).values(**values).prefix_with("IGNORE"))
+    else:
+        db.execute(insert(model).values(**values))
+
+
+def _increment_values(model: Type[Any], agg: MetricAggregate) -> Dict[Any, Any]:
+    """Build the UPDATE SET clause that folds ``agg`` into an existing row.
+
+    Args:
+        model: Rollup model
+        agg: Aggregate to add
+
+    Returns:
+        Dict[Any, Any]: Column to SQL expression mapping.
+    """
+    return {
+        model.total_executions: model.total_executions + agg.total,
+        model.successful_executions: model.successful_executions + agg.successful,
+        model.failed_executions: model.failed_executions + agg.failed,
+        model.total_response_time: model.total_response_time + agg.response_time,
+        model.min_response_time: case((or_(model.min_response_time.is_(None), model.min_response_time > agg.min_rt), agg.min_rt), else_=model.min_response_time),
+        model.max_response_time: case((or_(model.max_response_time.is_(None), model.max_response_time < agg.max_rt), agg.max_rt), else_=model.max_response_time),
+        model.last_execution_time: case((or_(model.last_execution_time.is_(None), model.last_execution_time < agg.last), agg.last), else_=model.last_execution_time),
+        model.updated_at: utc_now(),
+    }
+
+
+def _upsert(db: Session, model: Type[Any], key: Dict[str, Any], agg: MetricAggregate) -> None:
+    """Atomically add ``agg`` to the row identified by ``key``, creating it if needed.
+
+    The increment is a single ``UPDATE ... SET col = col + n`` so concurrent writers
+    from other workers never lose updates. The row is created with zero counters the
+    first time an entity is seen.
+
+    Args:
+        db: Database session
+        model: Rollup model
+        key: Column values identifying the row
+        agg: Aggregate to add
+    """
+    conditions = [getattr(model, column) == value for column, value in key.items()]
+    stmt = update(model).where(*conditions).values(_increment_values(model, agg)).execution_options(synchronize_session=False)
+    if db.execute(stmt).rowcount == 0:
+        _insert_ignore(db, model, {**key, "total_executions": 0, "successful_executions": 0, "failed_executions": 0, "total_response_time": 0.0})
+        db.execute(stmt)
+
+
+def record_metric_rollups(db: Session, entity_type: str, samples: Iterable[Tuple[Any, float, bool, Optional[datetime]]]) -> None:
+    """Fold metric samples into the lifetime rollups.
+
+    Samples are grouped per entity first, so a batch of N samples for the same
+    entity costs one rollup update. The caller owns the transaction and is
+    expected to commit.
+
+    Args:
+        db: Database session
+        entity_type: One of the keys of ``ENTITY_METRIC_MODELS``
+        samples: ``(entity_id, response_time, success, timestamp)`` tuples; a None
+            timestamp means "now"
+
+    Examples:
+        >>> from unittest.mock import MagicMock
+        >>> db = MagicMock()
+        >>> record_metric_rollups(db, "tool", [("t1", 0.2, True, None), ("t1", 0.4, False, None)])
+        >>> db.execute.call_count  # one rollup update for the entity
+        1
+    """
+    models = ENTITY_METRIC_MODELS[entity_type]
+    per_entity: Dict[Any, MetricAggregate] = {}
+    now = utc_now()
+    for entity_id, response_time, success, timestamp in samples:
+        per_entity.setdefault(entity_id, MetricAggregate()).add(response_time, success, timestamp or now)
+
+    for entity_id, agg in per_entity.items():
+        _upsert(db, models.rollup, {models.key: entity_id}, agg)
+
+
+def record_metric_rollup(db: Session, entity_type: str, entity_id: Any, response_time: float, success: bool, timestamp: Optional[datetime] = None) -> None:
+    """Fold a single metric sample into the rollups.
+
+    Args:
+        db: Database session
+        entity_type: One of the keys of ``ENTITY_METRIC_MODELS``
+        entity_id: Entity identifier
+        response_time: Response time in seconds
+        success: Whether the invocation succeeded
+        timestamp: When the invocation completed (defaults to now)
+    """
+    record_metric_rollups(db, entity_type, [(entity_id, response_time, success, timestamp)])
+
+
+def aggregate_rollups(db: Session, entity_type: str) -> Dict[str, Any]:
+    """Aggregate lifetime metrics across all entities of a type.
+
+    Args:
+        db: Database session
+        entity_type: One of the keys of ``ENTITY_METRIC_MODELS``
+
+    Returns:
+        Dict[str, Any]: Totals in the shape of the ``*Metrics`` schemas.
+
+    Examples:
+        >>> from unittest.mock import MagicMock
+        >>> db = MagicMock()
+        >>> db.execute.return_value.one.return_value = (4, 3, 1, 0.1, 0.9, 2.0, None)
+        >>> result = aggregate_rollups(db, "tool")
+        >>> result["total_executions"], result["failure_rate"], result["avg_response_time"]
+        (4, 0.25, 0.5)
+    """
+    rollup = ENTITY_METRIC_MODELS[entity_type].rollup
+    row = db.execute(
+        select(
+            func.sum(rollup.total_executions),
+            func.sum(rollup.successful_executions),
+            func.sum(rollup.failed_executions),
+            func.min(rollup.min_response_time),
+            func.max(rollup.max_response_time),
+            func.sum(rollup.total_response_time),
+            func.max(rollup.last_execution_time),
+        )
+    ).one()
+    total, successful, failed, min_rt, max_rt, total_rt, last_time = row
+    total = int(total or 0)
+    failed = int(failed or 0)
+    return {
+        "total_executions": total,
+        "successful_executions": int(successful or 0),
+        "failed_executions": failed,
+        "failure_rate": failed / total if total > 0 else 0.0,
+        "min_response_time": min_rt,
+        "max_response_time": max_rt,
+        "avg_response_time": (total_rt or 0.0) / total if total > 0 else None,
+        "last_execution_time": last_time,
+    }
+
+
+def top_performers_query(db: Session, entity_type: str, limit: Optional[int] = 5) -> List[Any]:
+    """Return rows for ``build_top_performers`` ordered by execution count.
+
+    Args:
+        db: Database session
+        entity_type: One of the keys of ``ENTITY_METRIC_MODELS``
+        limit: Maximum number of rows to return, or None for all
+
+    Returns:
+        List[Any]: Rows with ``id``, ``name``, ``execution_count``, ``avg_response_time``,
+        ``success_rate`` and ``last_execution``.
+    """
+    models = ENTITY_METRIC_MODELS[entity_type]
+    entity, rollup = models.entity, models.rollup
+    executions = func.coalesce(rollup.total_executions, 0)
+    query = (
+        db.query(
+            entity.id,
+            getattr(entity, models.name).label("name"),
+            executions.label("execution_count"),
+            case((rollup.total_executions > 0, rollup.total_response_time / rollup.total_executions), else_=None).label("avg_response_time"),
+            case((rollup.total_executions > 0, rollup.successful_executions.cast(Float) / rollup.total_executions * 100), else_=None).label("success_rate"),
+            rollup.last_execution_time.label("last_execution"),
+        )
+        .outerjoin(rollup, getattr(rollup, models.key) == entity.id)
+        .order_by(desc("execution_count"))
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def reset_rollups(db: Session, entity_type: str, entity_id: Optional[Any] = None) -> None:
+    """Delete raw metrics and rollups for an entity type or a single entity.
+
+    The caller owns the transaction and is expected to commit.
+
+    Args:
+        db: Database session
+        entity_type: One of the keys of ``ENTITY_METRIC_MODELS``
+        entity_id: Optional entity identifier; all entities when omitted
+    """
+    models = ENTITY_METRIC_MODELS[entity_type]
+    if entity_id is not None:
+        db.execute(delete(models.raw).where(getattr(models.raw, models.key) == entity_id))
+        db.execute(delete(models.rollup).where(getattr(models.rollup, models.key) == entity_id))
+    else:
+        db.execute(delete(models.raw))
+        db.execute(delete(models.rollup))
+
+
+class MetricsRollupService:
+    """Periodic compaction of raw metric rows.
+
+    Raw rows older than ``metrics_raw_retention_days`` are deleted (their totals are
+    already in the rollups). A retention of 0 keeps data forever.
+
+    Examples:
+        >>> service = MetricsRollupService(raw_retention_days=0)
+        >>> from unittest.mock import MagicMock
+        >>> service.compact(MagicMock())
+        {}
+    """
+
+    def __init__(self, raw_retention_days: Optional[int] = None, interval: Optional[int] = None) -> None:
+        """Initialize the rollup service.
+
+        Args:
+            raw_retention_days: Days to keep raw metric rows (0 keeps forever)
+            interval: Seconds between compaction runs
+        """
+        self.raw_retention_days = settings.metrics_raw_retention_days if raw_retention_days is None else raw_retention_days
+        self.interval = settings.metrics_compaction_interval if interval is None else interval
+        self._compaction_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Start the background compaction task when a raw retention is configured."""
+        if self.raw_retention_days > 0 and (self._compaction_task is None or self._compaction_task.done()):
+            self._compaction_task = asyncio.create_task(self._compaction_loop())
+            logger.info(f"Metric compaction enabled (raw retention: {self.raw_retention_days}d)")
+
+    async def shutdown(self) -> None:
+        """Stop the background compaction task."""
+        if self._compaction_task:
+            self._compaction_task.cancel()
+            try:
+                await self._compaction_task
+            except asyncio.CancelledError:
+                pass
+            self._compaction_task = None
+
+    def compact(self, db: Session) -> Dict[str, int]:
+        """Delete raw metrics that fall outside the retention window.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dict[str, int]: Number of rows deleted per table.
+        """
+        deleted: Dict[str, int] = {}
+        now = datetime.now(timezone.utc)
+        if self.raw_retention_days > 0:
+            cutoff = now - timedelta(days=self.raw_retention_days)
+            for models in ENTITY_METRIC_MODELS.values():
+                result = db.execute(delete(models.raw).where(models.raw.timestamp < cutoff))
+                deleted[models.raw.__tablename__] = result.rowcount or 0
+        if deleted:
+            db.commit()
+        return deleted
+
+    async def _compaction_loop(self) -> None:
+        """Run compaction every ``interval`` seconds."""
+        while True:
+            try:
+                deleted = await asyncio.to_thread(self._compact_in_new_session)
+                if any(deleted.values()):
+                    logger.info(f"Compacted metrics: {deleted}")
+            except Exception as e:
+                logger.error(f"Metric compaction failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def _compact_in_new_session(self) -> Dict[str, int]:
+        """Run :meth:`compact` in a dedicated session (used from a worker thread).
+
+        Returns:
+            Dict[str, int]: Number of rows deleted per table.
+        """
+        with SessionLocal() as db:
+            return self.compact(db)
@@ -9,18 +9,24 @@ OAuth 2.0 Manager for MCP Gateway.
 This module handles OAuth 2.0 authentication flows including:
 - Client Credentials (Machine-to-Machine)
 - Authorization Code (User Delegation)
+
+Access tokens obtained without user interaction (client credentials and password
+grants) are cached until shortly before they expire, refreshed in the background
+ahead of expiry, and fetched at most once at a time per client and scope.
 """
 
 # Standard
 import asyncio
 import base64
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import hashlib
 import hmac
 import json
 import logging
 import secrets
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 # Third-Party
 import aiohttp
@@ -77,6 +83,308 @@ async def _get_redis_client():
     return _redis_client
 
 
+@dataclass
+class _CachedToken:
+    """Access token with its effective expiry and proactive refresh time."""
+
+    access_token: str
+    expires_at: float
+    refresh_at: float
+
+
+class OAuthTokenCache:
+    """
+    Per-worker cache of machine-to-machine access tokens.
+
+    - A token is reused until ``expires_in`` minus ``oauth_token_expiry_margin``
+      (the margin is capped at half the token lifetime).
+    - After three quarters of that window a background refresh replaces it, so
+      callers never wait on the token endpoint for a warm key.
+    - Concurrent misses for one key share a single token request.
+    - With ``cache_type=redis`` tokens are shared (encrypted) between workers and
+      a short Redis lock keeps workers from fetching the same token at once.
+
+    Examples:
+        >>> import asyncio
+        >>> cache = OAuthTokenCache(margin=60)
+        >>> calls = []
+        >>> async def fetch():
+        ...     calls.append(1)
+        ...     return {"access_token": "tok", "expires_in": 3600}
+        >>> async def twice():
+        ...     return [await cache.get("k", fetch), await cache.get("k", fetch)]
+        >>> asyncio.run(twice())
+        ['tok', 'tok']
+        >>> len(calls)
+        1
+    """
+
+    def __init__(self, margin: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            margin: Seconds before expiry at which a token stops being used
+                (defaults to ``oauth_token_expiry_margin``)
+        """
+        self.margin = margin if margin is not None else get_settings().oauth_token_expiry_margin
+        self._tokens: Dict[str, _CachedToken] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._background_refreshes = 0
+
+    @staticmethod
+    def key_for(credentials: Dict[str, Any]) -> str:
+        """Build the cache key for a client, its secret and the requested scope.
+
+        Args:
+            credentials: OAuth configuration
+
+        Returns:
+            str: SHA-256 digest identifying the token.
+
+        Examples:
+            >>> a = OAuthTokenCache.key_for({"grant_type": "client_credentials", "client_id": "c", "scopes": ["read"]})
+            >>> b = OAuthTokenCache.key_for({"grant_type": "client_credentials", "client_id": "c", "scopes": ["write"]})
+            >>> a == b
+            False
+        """
+        scopes = credentials.get("scopes") or []
+        scope = " ".join(scopes) if isinstance(scopes, list) else str(scopes)
+        parts = [credentials.get(name) for name in ("grant_type", "token_url", "client_id", "client_secret", "username", "password")]
+        return hashlib.sha256(json.dumps(parts + [scope], default=str).encode()).hexdigest()
+
+    def _entry_for(self, token_response: Dict[str, Any]) -> _CachedToken:
+        """Derive expiry and refresh times from a token endpoint response.
+
+        Args:
+            token_response: Parsed token endpoint response
+
+        Returns:
+            _CachedToken: Token with its effective expiry.
+
+        Examples:
+            >>> entry = OAuthTokenCache(margin=60)._entry_for({"access_token": "t", "expires_in": "100"})
+            >>> round(entry.expires_at - time.time())
+            50
+        """
+        try:
+            expires_in = float(token_response.get("expires_in"))
+        except (TypeError, ValueError):
+            expires_in = float(get_settings().oauth_default_timeout)
+        lifetime = max(expires_in - min(self.margin, expires_in / 2), 0.0)
+        now = time.time()
+        return _CachedToken(access_token=token_response["access_token"], expires_at=now + lifetime, refresh_at=now + lifetime * 0.75)
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> str:
+        """Return a valid access token, fetching one only when needed.
+
+        Args:
+            key: Cache key from ``key_for``
+            fetch: Coroutine function returning the token endpoint response
+
+        Returns:
+            str: Access token.
+        """
+        now = time.time()
+        entry = self._tokens.get(key)
+        if entry is None or now >= entry.expires_at:
+            entry = await self._load_shared(key)
+            if entry is not None and now < entry.expires_at:
+                self._tokens[key] = entry
+        if entry is not None and now < entry.expires_at:
+            self._hits += 1
+            if now >= entry.refresh_at and key not in self._inflight:
+                self._background_refreshes += 1
+                self._start_fetch(key, fetch)
+            return entry.access_token
+
+        self._misses += 1
+        task = self._inflight.get(key) or self._start_fetch(key, fetch)
+        return (await asyncio.shield(task)).access_token
+
+    def _start_fetch(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        """Start the single in-flight token request for a key.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function returning the token endpoint response
+
+        Returns:
+            asyncio.Task: Task resolving to the cached token.
+        """
+        task = asyncio.create_task(self._fetch(key, fetch))
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            """Clear the in-flight slot and surface errors nobody awaited.
+
+            Args:
+                finished: Completed fetch task
+            """
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning(f"OAuth token request failed: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> _CachedToken:
+        """Request a token, coordinating with other workers when Redis is available.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function returning the token endpoint response
+
+        Returns:
+            _CachedToken: The new token.
+        """
+        redis = await _get_redis_client()
+        lock_key = f"oauth:token_lock:{key}"
+        locked = False
+        if redis:
+            timeout = get_settings().oauth_request_timeout
+            try:
+                locked = bool(await redis.set(lock_key, "1", nx=True, ex=timeout))
+                if not locked:
+                    # Another worker is fetching this token; wait for it to publish
+                    deadline = time.time() + timeout
+                    while time.time() < deadline:
+                        await asyncio.sleep(0.1)
+                        shared = await self._load_shared(key)
+                        if shared is not None and time.time() < shared.refresh_at:
+                            self._tokens[key] = shared
+                            return shared
+            except Exception as e:
+                logger.warning(f"OAuth token lock unavailable, fetching locally: {e}")
+
+        try:
+            self._fetches += 1
+            entry = self._entry_for(await fetch())
+            self._tokens[key] = entry
+            await self._store_shared(key, entry)
+            return entry
+        finally:
+            if locked:
+                try:
+                    await redis.delete(lock_key)
+                except Exception as e:
+                    logger.debug(f"Failed to release OAuth token lock: {e}")
+
+    async def _load_shared(self, key: str) -> Optional[_CachedToken]:
+        """Read a token published by another worker.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[_CachedToken]: The shared token, if any.
+        """
+        redis = await _get_redis_client()
+        if not redis:
+            return None
+        try:
+            raw = await redis.get(f"oauth:token:{key}")
+            if not raw:
+                return None
+            data = json.loads(raw)
+            access_token = await get_encryption_service(get_settings().auth_encryption_secret).decrypt_secret_async(data["access_token"])
+            if not access_token:
+                return None
+            return _CachedToken(access_token=access_token, expires_at=data["expires_at"], refresh_at=data["refresh_at"])
+        except Exception as e:
+            logger.warning(f"Failed to load shared OAuth token: {e}")
+            return None
+
+    async def _store_shared(self, key: str, entry: _CachedToken) -> None:
+        """Publish a token for other workers until it expires.
+
+        Args:
+            key: Cache key
+            entry: Token to share
+        """
+        redis = await _get_redis_client()
+        ttl = int(entry.expires_at - time.time())
+        if not redis or ttl <= 0:
+            return
+        try:
+            encrypted = await get_encryption_service(get_settings().auth_encryption_secret).encrypt_secret_async(entry.access_token)
+            await redis.setex(f"oauth:token:{key}", ttl, json.dumps({"access_token": encrypted, "expires_at": entry.expires_at, "refresh_at": entry.refresh_at}))
+        except Exception as e:
+            logger.warning(f"Failed to share OAuth token: {e}")
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a token the upstream rejected, locally and for other workers.
+
+        Args:
+            key: Cache key
+
+        Examples:
+            >>> import asyncio
+            >>> cache = OAuthTokenCache()
+            >>> asyncio.run(cache.invalidate("missing"))
+        """
+        self._tokens.pop(key, None)
+        redis = await _get_redis_client()
+        if redis:
+            try:
+                await redis.delete(f"oauth:token:{key}")
+            except Exception as e:
+                logger.debug(f"Failed to drop shared OAuth token: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, token requests and background refreshes.
+
+        Examples:
+            >>> OAuthTokenCache().stats()["tokens"]
+            0
+        """
+        return {
+            "enabled": get_settings().oauth_token_cache_enabled,
+            "tokens": len(self._tokens),
+            "hits": self._hits,
+            "misses": self._misses,
+            "token_requests": self._fetches,
+            "background_refreshes": self._background_refreshes,
+        }
+
+
+_oauth_token_cache: Optional[OAuthTokenCache] = None
+
+
+def get_oauth_token_cache() -> OAuthTokenCache:
+    """Get the global OAuthTokenCache singleton instance.
+
+    Returns:
+        The global OAuthTokenCache instance
+
+    Examples:
+        >>> get_oauth_token_cache() is get_oauth_token_cache()
+        True
+    """
+    global _oauth_token_cache  # pylint: disable=global-statement
+    if _oauth_token_cache is None:
+        _oauth_token_cache = OAuthTokenCache()
+    return _oauth_token_cache
+
+
+def set_oauth_token_cache(cache: Optional[OAuthTokenCache]) -> None:
+    """Set the global OAuthTokenCache instance.
+
+    This is primarily used for testing to inject a fresh cache.
+
+    Args:
+        cache: The OAuthTokenCache instance to use globally
+    """
+    global _oauth_token_cache  # pylint: disable=global-statement
+    _oauth_token_cache = cache
+
+
 class OAuthManager:
     """Manages OAuth 2.0 authentication flows.
 
@@ -158,8 +466,8 @@ class OAuthManager:
             Client credentials flow:
             >>> import asyncio
             >>> class TestMgr(OAuthManager):
-            ...     async def _client_credentials_flow(self, credentials):
-            ...         return 'tok'
+            ...     async def _request_client_credentials_token(self, credentials):
+            ...         return {'access_token': 'tok'}
             >>> mgr = TestMgr()
             >>> asyncio.run(mgr.get_access_token({'grant_type': 'client_credentials'}))
             'tok'
@@ -181,9 +489,9 @@ class OAuthManager:
         logger.debug(f"Getting access token for grant type: {grant_type}")
 
         if grant_type == "client_credentials":
-            return await self._client_credentials_flow(credentials)
+            return await self._cached_access_token(credentials, self._request_client_credentials_token)
         if grant_type == "password":
-            return await self._password_flow(credentials)
+            return await self._cached_access_token(credentials, self._request_password_token)
         if grant_type == "authorization_code":
             # For authorization code flow in gateway initialization, we need to handle this differently
             # Since this is called during gateway setup, we'll try to use client credentials as fallback
@@ -191,7 +499,7 @@ class OAuthManager:
             logger.warning("Authorization code flow requires user interaction. " + "For gateway initialization, consider using 'client_credentials' grant type instead.")
             # Try to use client credentials flow if possible (some OAuth providers support this)
             try:
-                return await self._client_credentials_flow(credentials)
+                return await self._cached_access_token(credentials, self._request_client_credentials_token)
             except Exception as e:
                 raise OAuthError(
                     f"Authorization code flow cannot be used for automatic gateway initialization. "
@@ -201,6 +509,28 @@ class OAuthManager:
         else:
             raise ValueError(f"Unsupported grant type: {grant_type}")
 
+    async def _cached_access_token(self, credentials: Dict[str, Any], request: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> str:
+        """Serve an access token from the token cache, requesting one when needed.
+
+        Args:
+            credentials: OAuth configuration
+            request: Token request for the grant type, returning the token endpoint response
+
+        Returns:
+            Access token string
+        """
+        if not self.settings.oauth_token_cache_enabled:
+            return (await request(credentials))["access_token"]
+        return await get_oauth_token_cache().get(OAuthTokenCache.key_for(credentials), lambda: request(credentials))
+
+    async def invalidate_access_token(self, credentials: Dict[str, Any]) -> None:
+        """Forget the cached access token for these credentials, e.g. after the upstream rejected it.
+
+        Args:
+            credentials: OAuth configuration the token was obtained with
+        """
+        await get_oauth_token_cache().invalidate(OAuthTokenCache.key_for(credentials))
+
     async def _client_credentials_flow(self, credentials: Dict[str, Any]) -> str:
         """Machine-to-machine authentication using client credentials.
 
@@ -209,6 +539,17 @@ class OAuthManager:
 
         Returns:
             Access token string
+        """
+        return (await self._request_client_credentials_token(credentials))["access_token"]
+
+    async def _request_client_credentials_token(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
+        """Request a token from the token endpoint using client credentials.
+
+        Args:
+            credentials: OAuth configuration with client_id, client_secret, token_url
+
+        Returns:
+            Token endpoint response containing ``access_token`` (and usually ``expires_in``)
 
         Raises:
             OAuthError: If token acquisition fails after all retries
@@ -273,7 +614,7 @@ class OAuthManager:
                             raise OAuthError(f"No access_token in response: {token_response}")
 
                         logger.info("""Successfully obtained access token via client credentials""")
-                        return token_response["access_token"]
+                        return token_response
 
             except aiohttp.ClientError as e:
                 logger.warning(f"Token request attempt {attempt + 1} failed: {str(e)}")
@@ -295,6 +636,17 @@ class OAuthManager:
 
         Returns:
             Access token string
+        """
+        return (await self._request_password_token(credentials))["access_token"]
+
+    async def _request_password_token(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
+        """Request a token from the token endpoint using the password grant.
+
+        Args:
+            credentials: OAuth configuration with client_id, optional client_secret, token_url, username, password
+
+        Returns:
+            Token endpoint response containing ``access_token`` (and usually ``expires_in``)
 
         Raises:
             OAuthError: If token acquisition fails after all retries
@@ -372,7 +724,7 @@ class OAuthManager:
                             raise OAuthError(f"No access_token in response: {token_response}")
 
                         logger.info("Successfully obtained access token via password grant")
-                        return token_response["access_token"]
+                        return token_response
 
             except aiohttp.ClientError as e:
                 logger.warning(f"Token request attempt {attempt + 1} failed: {str(e)}")
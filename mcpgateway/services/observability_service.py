@@ -41,6 +41,8 @@ from sqlalchemy.orm import joinedload, Session
 
 # First-Party
 from mcpgateway.db import ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services.latency_sketch_service import get_latency_sketch_service
+from mcpgateway.services.trace_export_service import get_trace_export_service
 
 logger = logging.getLogger(__name__)
 
@@ -180,7 +182,7 @@ class ObservabilityService:
 
     def start_trace(
         self,
-        db: Session,
+        db: Optional[Session],
         name: str,
         trace_id: Optional[str] = None,
         parent_span_id: Optional[str] = None,
@@ -194,8 +196,11 @@ class ObservabilityService:
     ) -> str:
         """Start a new trace.
 
+        While the trace exporter is running the trace is buffered and written in bulk
+        when it ends; otherwise it is committed immediately.
+
         Args:
-            db: Database session
+            db: Database session (unused while traces are buffered)
             name: Trace name (e.g., "POST /tools/invoke")
             trace_id: External trace ID (for distributed tracing, W3C format)
             parent_span_id: Parent span ID from upstream service
@@ -228,28 +233,32 @@ class ObservabilityService:
         if parent_span_id:
             attrs["parent_span_id"] = parent_span_id
 
-        trace = ObservabilityTrace(
-            trace_id=trace_id,
-            name=name,
-            start_time=utc_now(),
-            status="unset",
-            http_method=http_method,
-            http_url=http_url,
-            user_email=user_email,
-            user_agent=user_agent,
-            ip_address=ip_address,
-            attributes=attrs,
-            resource_attributes=resource_attributes or {},
-            created_at=utc_now(),
-        )
-        db.add(trace)
-        db.commit()
+        row = {
+            "trace_id": trace_id,
+            "name": name,
+            "start_time": utc_now(),
+            "status": "unset",
+            "http_method": http_method,
+            "http_url": http_url,
+            "user_email": user_email,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "attributes": attrs,
+            "resource_attributes": resource_attributes or {},
+            "created_at": utc_now(),
+        }
+        exporter = get_trace_export_service()
+        if exporter.running:
+            exporter.record_trace(row)
+        else:
+            db.add(ObservabilityTrace(**row))
+            db.commit()
         logger.debug(f"Started trace {trace_id}: {name}")
         return trace_id
 
     def end_trace(
         self,
-        db: Session,
+        db: Optional[Session],
         trace_id: str,
         status: str = "ok",
         status_message: Optional[str] = None,
@@ -259,7 +268,7 @@ class ObservabilityService:
         """End a trace.
 
         Args:
-            db: Database session
+            db: Database session (unused while traces are buffered)
             trace_id: Trace ID to end
             status: Trace status (ok, error)
             status_message: Optional status message
@@ -274,6 +283,18 @@ class ObservabilityService:
             ...     http_status_code=200
             ... )
         """
+        exporter = get_trace_export_service()
+        if exporter.running:
+            updates: Dict[str, Any] = {"status": status, "status_message": status_message}
+            if http_status_code is not None:
+                updates["http_status_code"] = http_status_code
+            row = exporter.end_trace(trace_id, updates, attributes)
+            if row is not None:
+                # Sketched before tail sampling decides whether the trace is stored
+                get_latency_sketch_service().record(row["start_time"], row["duration_ms"], status)
+            logger.debug(f"Ended trace {trace_id}: {status}")
+            return
+
         trace = db.query(ObservabilityTrace).filter_by(trace_id=trace_id).first()
         if not trace:
             logger.warning(f"Trace {trace_id} not found")
@@ -292,6 +313,7 @@ class ObservabilityService:
             trace.attributes = {**(trace.attributes or {}), **attributes}
 
         db.commit()
+        get_latency_sketch_service().record(trace.start_time, duration_ms, status)
         logger.debug(f"Ended trace {trace_id}: {status} ({duration_ms:.2f}ms)")
 
     def get_trace(self, db: Session, trace_id: str, include_spans: bool = False) -> Optional[ObservabilityTrace]:
@@ -321,7 +343,7 @@ class ObservabilityService:
 
     def start_span(
         self,
-        db: Session,
+        db: Optional[Session],
         trace_id: str,
         name: str,
         parent_span_id: Optional[str] = None,
@@ -334,7 +356,7 @@ class ObservabilityService:
         """Start a new span within a trace.
 
         Args:
-            db: Database session
+            db: Database session (unused while traces are buffered)
             trace_id: Parent trace ID
             name: Span name (e.g., "database_query", "tool_invocation")
             parent_span_id: Parent span ID (for nested spans)
@@ -357,52 +379,65 @@ class ObservabilityService:
             ... )
         """
         span_id = str(uuid.uuid4())
-        span = ObservabilitySpan(
-            span_id=span_id,
-            trace_id=trace_id,
-            parent_span_id=parent_span_id,
-            name=name,
-            kind=kind,
-            start_time=utc_now(),
-            status="unset",
-            resource_name=resource_name,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            attributes=attributes or {},
-            created_at=utc_now(),
-        )
-        db.add(span)
-        db.commit()
+        row = {
+            "span_id": span_id,
+            "trace_id": trace_id,
+            "parent_span_id": parent_span_id,
+            "name": name,
+            "kind": kind,
+            "start_time": utc_now(),
+            "status": "unset",
+            "resource_name": resource_name,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "attributes": attributes or {},
+            "created_at": utc_now(),
+        }
+        exporter = get_trace_export_service()
+        if exporter.running:
+            exporter.record_span(row)
+        else:
+            db.add(ObservabilitySpan(**row))
+            db.commit()
         logger.debug(f"Started span {span_id}: {name} (trace={trace_id})")
         return span_id
 
     def end_span(
         self,
-        db: Session,
+        db: Optional[Session],
         span_id: str,
         status: str = "ok",
         status_message: Optional[str] = None,
         attributes: Optional[Dict[str, Any]] = None,
+        duration_ms: Optional[float] = None,
     ) -> None:
         """End a span.
 
         Args:
-            db: Database session
+            db: Database session (unused while traces are buffered)
             span_id: Span ID to end
             status: Span status (ok, error)
             status_message: Optional status message
             attributes: Additional attributes to merge
+            duration_ms: Measured duration overriding the start/end difference
 
         Examples:
             >>> service.end_span(db, span_id, status="ok")  # doctest: +SKIP
         """
+        exporter = get_trace_export_service()
+        if exporter.running:
+            exporter.end_span(span_id, {"status": status, "status_message": status_message}, attributes, duration_ms)
+            logger.debug(f"Ended span {span_id}: {status}")
+            return
+
         span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
         if not span:
             logger.warning(f"Span {span_id} not found")
             return
 
         end_time = utc_now()
-        duration_ms = (end_time - ensure_timezone_aware(span.start_time)).total_seconds() * 1000
+        if duration_ms is None:
+            duration_ms = (end_time - ensure_timezone_aware(span.start_time)).total_seconds() * 1000
 
         span.end_time = end_time
         span.duration_ms = duration_ms
@@ -547,7 +582,7 @@ class ObservabilityService:
 
     def add_event(
         self,
-        db: Session,
+        db: Optional[Session],
         span_id: str,
         name: str,
         severity: Optional[str] = None,
@@ -556,11 +591,11 @@ class ObservabilityService:
         exception_message: Optional[str] = None,
         exception_stacktrace: Optional[str] = None,
         attributes: Optional[Dict[str, Any]] = None,
-    ) -> int:
+    ) -> Optional[int]:
         """Add an event to a span.
 
         Args:
-            db: Database session
+            db: Database session (unused while traces are buffered)
             span_id: Parent span ID
             name: Event name
             severity: Log severity (debug, info, warning, error, critical)
@@ -571,7 +606,7 @@ class ObservabilityService:
             attributes: Additional event attributes
 
         Returns:
-            Event ID
+            Event ID, or None while traces are buffered (the ID is assigned on export)
 
         Examples:
             >>> event_id = service.add_event(  # doctest: +SKIP
@@ -582,18 +617,25 @@ class ObservabilityService:
             ...     message="Failed to connect to database"  # doctest: +SKIP
             ... )  # doctest: +SKIP
         """
-        event = ObservabilityEvent(
-            span_id=span_id,
-            name=name,
-            timestamp=utc_now(),
-            severity=severity,
-            message=message,
-            exception_type=exception_type,
-            exception_message=exception_message,
-            exception_stacktrace=exception_stacktrace,
-            attributes=attributes or {},
-            created_at=utc_now(),
-        )
+        row = {
+            "span_id": span_id,
+            "name": name,
+            "timestamp": utc_now(),
+            "severity": severity,
+            "message": message,
+            "exception_type": exception_type,
+            "exception_message": exception_message,
+            "exception_stacktrace": exception_stacktrace,
+            "attributes": attributes or {},
+            "created_at": utc_now(),
+        }
+        exporter = get_trace_export_service()
+        if exporter.running:
+            exporter.record_event(row)
+            logger.debug(f"Added event to span {span_id}: {name}")
+            return None
+
+        event = ObservabilityEvent(**row)
         db.add(event)
         db.commit()
         db.refresh(event)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/permission_audit_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Permission Audit Buffer.
+Every RBAC check writes a ``PermissionAuditLog`` row. Committing it on the
+request's own session costs a transaction per check and commits whatever else
+the request had pending. This module queues audit records in memory and a
+background task bulk inserts them in its own session, flushed when the batch is
+full or the flush interval elapses, and drained on shutdown.
+
+The queue is bounded: when the database cannot keep up, new records are dropped
+and counted rather than growing memory without limit.
+
+Examples:
+    >>> buffer = PermissionAuditBuffer(max_size=2, batch_size=10, flush_interval=60)
+    >>> buffer.running
+    False
+    >>> buffer.record({"user_email": "a@example.com", "permission": "tools.read", "granted": True})
+    False
+"""
+
+# Standard
+import asyncio
+from typing import Any, Dict, List, Optional
+
+# Third-Party
+from sqlalchemy import insert
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import PermissionAuditLog, SessionLocal, utc_now
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+
+class PermissionAuditBuffer:
+    """Bounded in-memory audit record queue with a background bulk writer.
+
+    ``record`` never blocks and never touches the database. It returns False only when
+    the writer is not running, in which case the caller writes the record inline; a
+    record that arrives while the queue is full is dropped and counted.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> async def demo():
+        ...     buffer = PermissionAuditBuffer(max_size=10, batch_size=100, flush_interval=60)
+        ...     with patch.object(buffer, "_write_batch") as write:
+        ...         await buffer.start()
+        ...         queued = buffer.record({"user_email": "a@example.com", "permission": "tools.read", "granted": True})
+        ...         await buffer.shutdown()
+        ...     return queued, write.call_count, buffer.get_metrics()["flushed"]
+        >>> asyncio.run(demo())
+        (True, 1, 1)
+    """
+
+    def __init__(self, max_size: Optional[int] = None, batch_size: int = 500, flush_interval: Optional[float] = None) -> None:
+        """Initialize the audit buffer.
+
+        Args:
+            max_size: Maximum number of queued records before new records are dropped
+            batch_size: Number of records that triggers an immediate flush
+            flush_interval: Maximum seconds a record waits before being flushed
+        """
+        self.max_size = max_size or settings.permission_audit_buffer_max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval or settings.permission_audit_flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        # Records the writer had taken off the queue when it was cancelled
+        self._collected: List[Dict[str, Any]] = []
+        self._enqueued = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is accepting records.
+
+        Returns:
+            bool: True when ``record`` will queue audit records.
+        """
+        return self._writer_task is not None and not self._writer_task.done()
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        logger.info(f"Permission audit buffer started (max size: {self.max_size}, flush interval: {self.flush_interval}s)")
+
+    async def shutdown(self) -> None:
+        """Stop the writer and flush every record still queued or being batched."""
+        if self._writer_task is None:
+            return
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+        remaining, self._collected = self._collected, []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        while remaining:
+            await self._flush(remaining[: self.batch_size])
+            remaining = remaining[self.batch_size :]
+        logger.info(f"Permission audit buffer shut down ({self._flushed} flushed, {self._dropped} dropped, {self._failed} failed)")
+
+    def record(self, values: Dict[str, Any]) -> bool:
+        """Queue an audit record for the background writer.
+
+        Args:
+            values: ``PermissionAuditLog`` column values
+
+        Returns:
+            bool: True if the buffer took ownership of the record (queued, or dropped because the
+            queue is full); False if the writer is not running and the caller must write it.
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait({"timestamp": utc_now(), **values})
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(f"Permission audit buffer full ({self.max_size} records); {self._dropped} records dropped so far")
+            return True
+        self._enqueued += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return buffer counters for the ``/metrics`` endpoint.
+
+        Returns:
+            Dict[str, Any]: Queue depth and enqueue/flush/drop counters.
+
+        Examples:
+            >>> sorted(PermissionAuditBuffer(max_size=1, flush_interval=1).get_metrics())
+            ['dropped', 'enqueued', 'failed', 'flushed', 'max_size', 'queued', 'running']
+        """
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "enqueued": self._enqueued,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "failed": self._failed,
+        }
+
+    async def _writer_loop(self) -> None:
+        """Collect records into batches and flush them on size or time thresholds."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Dict[str, Any]] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Hand the partial batch to shutdown, which flushes it with the rest of the queue
+                self._collected = batch
+                raise
+            # Shielded so cancelling the loop at shutdown never abandons a half-written batch
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch in a worker thread, counting failures instead of raising.
+
+        Args:
+            batch: Records to write
+        """
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+            self._flushed += len(batch)
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"Failed to flush {len(batch)} permission audit records: {e}")
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Bulk insert a batch of audit records in one transaction.
+
+        Args:
+            batch: Records to write
+        """
+        with SessionLocal() as db:
+            db.execute(insert(PermissionAuditLog), batch)
+            db.commit()
+
+
+_permission_audit_buffer: Optional[PermissionAuditBuffer] = None
+
+
+def get_permission_audit_buffer() -> PermissionAuditBuffer:
+    """Get the global PermissionAuditBuffer singleton instance.
+
+    Returns:
+        The global PermissionAuditBuffer instance
+    """
+    global _permission_audit_buffer  # pylint: disable=global-statement
+    if _permission_audit_buffer is None:
+        _permission_audit_buffer = PermissionAuditBuffer()
+    return _permission_audit_buffer
+
+
+def set_permission_audit_buffer(buffer: Optional[PermissionAuditBuffer]) -> None:
+    """Set the global PermissionAuditBuffer instance.
+
+    This is primarily used for testing to inject mock buffers.
+
+    Args:
+        buffer: The PermissionAuditBuffer instance to use globally
+    """
+    global _permission_audit_buffer  # pylint: disable=global-statement
+    _permission_audit_buffer = buffer
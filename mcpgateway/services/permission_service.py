@@ -8,23 +8,44 @@ Permission Service for RBAC System.
 
 This module provides the core permission checking logic for the RBAC system.
 It handles role-based permission validation, permission auditing, and caching.
+Role, admin and team membership lookups are shared between instances through
+the process-wide ``PermissionCache``, and audit records are written in batches
+by the ``PermissionAuditBuffer`` when it is running.
 """
 
 # Standard
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 # Third-Party
 from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache, MISSING, ResolvedPermissions
 from mcpgateway.db import PermissionAuditLog, Permissions, Role, UserRole, utc_now
+from mcpgateway.services.permission_audit_service import get_permission_audit_buffer
 
 logger = logging.getLogger(__name__)
 
 
+def _epoch(value: datetime) -> float:
+    """Convert a stored timestamp to epoch seconds, treating naive values as UTC.
+
+    Args:
+        value: Timestamp as returned by the database
+
+    Returns:
+        float: Seconds since the epoch
+
+    Examples:
+        >>> _epoch(datetime(1970, 1, 1, 0, 1))
+        60.0
+    """
+    return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+
+
 class PermissionService:
     """Service for checking and managing user permissions.
 
@@ -170,21 +191,43 @@ class PermissionService:
         if self._is_cache_valid(cache_key):
             return self._permission_cache[cache_key]
 
-        permissions = set()
+        permissions = set((await self._resolve_permissions(user_email, team_id)).permissions)
+
+        # Cache the result
+        self._permission_cache[cache_key] = permissions
+        self._cache_timestamps[cache_key] = utc_now()
+
+        return permissions
+
+    async def _resolve_permissions(self, user_email: str, team_id: Optional[str]) -> ResolvedPermissions:
+        """Return the user's effective permissions and roles, from the shared cache when possible.
+
+        Args:
+            user_email: Email of the user
+            team_id: Optional team context
+
+        Returns:
+            ResolvedPermissions: Permissions granted by the user's active roles in this context.
+        """
+        cache = get_permission_cache()
+        key = cache.permissions_key(user_email, team_id)
+        resolved = cache.get(key)
+        if resolved is not MISSING:
+            return resolved
 
         # Get all active roles for the user
         user_roles = await self._get_user_roles(user_email, team_id)
 
         # Collect permissions from all roles
+        permissions: Set[str] = set()
         for user_role in user_roles:
-            role_permissions = user_role.role.get_effective_permissions()
-            permissions.update(role_permissions)
+            permissions.update(user_role.role.get_effective_permissions())
 
-        # Cache the result
-        self._permission_cache[cache_key] = permissions
-        self._cache_timestamps[cache_key] = utc_now()
-
-        return permissions
+        resolved = ResolvedPermissions(permissions=frozenset(permissions), roles=self._summarize_roles(user_roles))
+        # An expiring assignment must stop granting its permissions on time
+        expiries = [_epoch(user_role.expires_at) for user_role in user_roles if isinstance(user_role.expires_at, datetime)]
+        cache.put(key, resolved, user=user_email, team=team_id, expires_at=min(expiries) if expiries else None)
+        return resolved
 
     async def get_user_roles(self, user_email: str, scope: Optional[str] = None, team_id: Optional[str] = None, include_expired: bool = False) -> List[UserRole]:
         """Get user's role assignments.
@@ -325,9 +368,10 @@ class PermissionService:
         return any(perm in user_permissions for perm in admin_permissions)
 
     def clear_user_cache(self, user_email: str) -> None:
-        """Clear cached permissions for a user.
+        """Clear this instance's cached permissions for a user.
 
-        Should be called when user's roles change.
+        Role changes made through ``RoleService`` also invalidate the shared
+        ``PermissionCache`` on every worker.
 
         Args:
             user_email: Email of the user
@@ -425,19 +469,22 @@ class PermissionService:
             ip_address: IP address of request
             user_agent: User agent of request
         """
-        audit_log = PermissionAuditLog(
-            user_email=user_email,
-            permission=permission,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            team_id=team_id,
-            granted=granted,
-            roles_checked=roles_checked,
-            ip_address=ip_address,
-            user_agent=user_agent,
-        )
-
-        self.db.add(audit_log)
+        values = {
+            "user_email": user_email,
+            "permission": permission,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "team_id": team_id,
+            "granted": granted,
+            "roles_checked": roles_checked,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+        # Written in the background in batches; inline only when the buffer is not running
+        if get_permission_audit_buffer().record(values):
+            return
+
+        self.db.add(PermissionAuditLog(**values))
         self.db.commit()
 
     async def _get_roles_for_audit(self, user_email: str, team_id: Optional[str]) -> Dict:
@@ -450,8 +497,23 @@ class PermissionService:
         Returns:
             Dict: Role information for audit logging
         """
+        resolved = get_permission_cache().get(get_permission_cache().permissions_key(user_email, team_id))
+        if resolved is not MISSING:
+            return {"roles": resolved.roles}
         user_roles = await self._get_user_roles(user_email, team_id)
-        return {"roles": [{"id": ur.role_id, "name": ur.role.name, "scope": ur.scope, "permissions": ur.role.permissions} for ur in user_roles]}
+        return {"roles": self._summarize_roles(user_roles)}
+
+    @staticmethod
+    def _summarize_roles(user_roles: List[UserRole]) -> List[Dict[str, Any]]:
+        """Describe role assignments for audit logging.
+
+        Args:
+            user_roles: Role assignments
+
+        Returns:
+            List[Dict[str, Any]]: Role id, name, scope and permissions per assignment
+        """
+        return [{"id": ur.role_id, "name": ur.role.name, "scope": ur.scope, "permissions": ur.role.permissions} for ur in user_roles]
 
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached permissions are still valid.
@@ -488,8 +550,13 @@ class PermissionService:
         if user_email == getattr(settings, "platform_admin_email", ""):
             return True
 
-        user = self.db.execute(select(EmailUser).where(EmailUser.email == user_email)).scalar_one_or_none()
-        return bool(user and user.is_admin)
+        cache = get_permission_cache()
+        is_admin = cache.get(cache.admin_key(user_email))
+        if is_admin is MISSING:
+            user = self.db.execute(select(EmailUser).where(EmailUser.email == user_email)).scalar_one_or_none()
+            is_admin = bool(user and user.is_admin)
+            cache.put(cache.admin_key(user_email), is_admin, user=user_email)
+        return is_admin
 
     async def _check_team_fallback_permissions(self, user_email: str, permission: str, team_id: Optional[str]) -> bool:
         """Check fallback team permissions for users without explicit RBAC roles.
@@ -537,12 +604,7 @@ class PermissionService:
         Returns:
             bool: True if user is a team member
         """
-        # First-Party
-        from mcpgateway.db import EmailTeamMember  # pylint: disable=import-outside-toplevel
-
-        member = self.db.execute(select(EmailTeamMember).where(and_(EmailTeamMember.user_email == user_email, EmailTeamMember.team_id == team_id, EmailTeamMember.is_active))).scalar_one_or_none()
-
-        return member is not None
+        return await self._lookup_team_role(user_email, team_id) is not None
 
     async def _get_user_team_role(self, user_email: str, team_id: str) -> Optional[str]:
         """Get user's role in the specified team.
@@ -554,9 +616,27 @@ class PermissionService:
         Returns:
             Optional[str]: User's role in the team or None if not a member
         """
+        role = await self._lookup_team_role(user_email, team_id)
+        return role or None
+
+    async def _lookup_team_role(self, user_email: str, team_id: str) -> Optional[str]:
+        """Look up the user's active team membership, from the shared cache when possible.
+
+        Args:
+            user_email: Email address of the user
+            team_id: Team ID
+
+        Returns:
+            Optional[str]: The membership role ("" for a member without one), or None if not a member
+        """
         # First-Party
         from mcpgateway.db import EmailTeamMember  # pylint: disable=import-outside-toplevel
 
-        member = self.db.execute(select(EmailTeamMember).where(and_(EmailTeamMember.user_email == user_email, EmailTeamMember.team_id == team_id, EmailTeamMember.is_active))).scalar_one_or_none()
-
-        return member.role if member else None
+        cache = get_permission_cache()
+        key = cache.team_role_key(user_email, team_id)
+        role = cache.get(key)
+        if role is MISSING:
+            member = self.db.execute(select(EmailTeamMember).where(and_(EmailTeamMember.user_email == user_email, EmailTeamMember.team_id == team_id, EmailTeamMember.is_active))).scalar_one_or_none()
+            role = (member.role or "") if member is not None else None
+            cache.put(key, role, user=user_email, team=team_id)
+        return role
@@ -24,7 +24,7 @@ import uuid
 
 # Third-Party
 from jinja2 import Environment, meta, select_autoescape
-from sqlalchemy import and_, case, delete, desc, Float, func, not_, or_, select
+from sqlalchemy import and_, not_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -39,10 +39,12 @@ from mcpgateway.plugins.framework import GlobalContext, PluginContextTable, Plug
 from mcpgateway.schemas import PromptCreate, PromptRead, PromptUpdate, TopPerformer
 from mcpgateway.services.event_service import EventService
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, record_metric_rollup, reset_rollups, top_performers_query
 from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
-from mcpgateway.utils.metrics_common import build_top_performers
+from mcpgateway.utils.metrics_common import build_top_performers, summarize_metrics
 from mcpgateway.utils.pagination import decode_cursor, encode_cursor
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr
 
 # Initialize logging service first
 logging_service = LoggingService()
@@ -177,37 +179,14 @@ class PromptService:
                 - success_rate: Success rate percentage, or None if no metrics.
                 - last_execution: Timestamp of the last execution, or None if no metrics.
         """
-        query = (
-            db.query(
-                DbPrompt.id,
-                DbPrompt.name,
-                func.count(PromptMetric.id).label("execution_count"),  # pylint: disable=not-callable
-                func.avg(PromptMetric.response_time).label("avg_response_time"),  # pylint: disable=not-callable
-                case(
-                    (
-                        func.count(PromptMetric.id) > 0,  # pylint: disable=not-callable
-                        func.sum(case((PromptMetric.is_success.is_(True), 1), else_=0)).cast(Float) / func.count(PromptMetric.id) * 100,  # pylint: disable=not-callable
-                    ),
-                    else_=None,
-                ).label("success_rate"),
-                func.max(PromptMetric.timestamp).label("last_execution"),  # pylint: disable=not-callable
-            )
-            .outerjoin(PromptMetric)
-            .group_by(DbPrompt.id, DbPrompt.name)
-            .order_by(desc("execution_count"))
-        )
-
-        if limit is not None:
-            query = query.limit(limit)
-
-        results = query.all()
+        results = top_performers_query(db, "prompt", limit)
 
         return build_top_performers(results)
 
     def _convert_db_prompt(self, db_prompt: DbPrompt) -> Dict[str, Any]:
         """
         Convert a DbPrompt instance to a dictionary matching the PromptRead schema,
-        including aggregated metrics computed from the associated PromptMetric records.
+        including aggregated metrics taken from the prompt's metric rollup.
 
         Args:
             db_prompt: Db prompt to convert
@@ -227,14 +206,7 @@ class PromptService:
                     "required": arg_name in required_list,
                 }
             )
-        total = len(db_prompt.metrics) if hasattr(db_prompt, "metrics") and db_prompt.metrics is not None else 0
-        successful = sum(1 for m in db_prompt.metrics if m.is_success) if total > 0 else 0
-        failed = sum(1 for m in db_prompt.metrics if not m.is_success) if total > 0 else 0
-        failure_rate = failed / total if total > 0 else 0.0
-        min_rt = min((m.response_time for m in db_prompt.metrics), default=None) if total > 0 else None
-        max_rt = max((m.response_time for m in db_prompt.metrics), default=None) if total > 0 else None
-        avg_rt = (sum(m.response_time for m in db_prompt.metrics) / total) if total > 0 else None
-        last_time = max((m.timestamp for m in db_prompt.metrics), default=None) if total > 0 else None
+        metrics = summarize_metrics(db_prompt)
 
         return {
             "id": db_prompt.id,
@@ -246,14 +218,14 @@ class PromptService:
             "updated_at": db_prompt.updated_at,
             "is_active": db_prompt.is_active,
             "metrics": {
-                "totalExecutions": total,
-                "successfulExecutions": successful,
-                "failedExecutions": failed,
-                "failureRate": failure_rate,
-                "minResponseTime": min_rt,
-                "maxResponseTime": max_rt,
-                "avgResponseTime": avg_rt,
-                "lastExecutionTime": last_time,
+                "totalExecutions": metrics["total_executions"],
+                "successfulExecutions": metrics["successful_executions"],
+                "failedExecutions": metrics["failed_executions"],
+                "failureRate": metrics["failure_rate"],
+                "minResponseTime": metrics["min_response_time"],
+                "maxResponseTime": metrics["max_response_time"],
+                "avgResponseTime": metrics["avg_response_time"],
+                "lastExecutionTime": metrics["last_execution_time"],
             },
             "tags": db_prompt.tags or [],
             "visibility": db_prompt.visibility,
@@ -473,7 +445,7 @@ class PromptService:
 
         # Add tag filtering if tags are provided
         if tags:
-            query = query.where(json_contains_expr(db, DbPrompt.tags, tags, match_any=True))
+            query = query.where(entity_tags_expr(DbPrompt.id, "prompt", tags, match_any=True))
 
         # Fetch page_size + 1 to determine if there are more results
         query = query.limit(page_size + 1)
@@ -635,6 +607,9 @@ class PromptService:
         end_time = time.monotonic()
         response_time = end_time - start_time
 
+        if settings.metrics_buffer_enabled and get_metrics_buffer_service().record("prompt", prompt.id, response_time, success, error_message):
+            return
+
         metric = PromptMetric(
             prompt_id=prompt.id,
             response_time=response_time,
@@ -642,6 +617,7 @@ class PromptService:
             error_message=error_message,
         )
         db.add(metric)
+        record_metric_rollup(db, "prompt", prompt.id, response_time, success)
         db.commit()
 
     async def get_prompt(
@@ -1439,9 +1415,21 @@ class PromptService:
         """
         Publish event to all subscribers via the EventService.
 
+        Every prompt change is published through here, so it also drops the
+        prompt's argument values from the completion index and the cached
+        ``prompts/list`` snapshots.
+
         Args:
             event: Event to publish
         """
+        data = event.get("data")
+        if isinstance(data, dict) and data.get("id") is not None:
+            # First-Party
+            from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache  # pylint: disable=import-outside-toplevel
+            from mcpgateway.cache.completion_index import get_completion_index  # pylint: disable=import-outside-toplevel
+
+            await get_completion_index().invalidate_prompt(data["id"])
+            await get_catalog_snapshot_cache().invalidate("prompts")
         await self._event_service.publish_event(event)
 
     # --- Metrics ---
@@ -1462,43 +1450,25 @@ class PromptService:
                 - max_response_time
                 - avg_response_time
                 - last_execution_time
-            Aggregated metrics computed from all PromptMetric records.
+            Aggregated metrics computed from the per-prompt metric rollups.
 
         Examples:
             >>> from mcpgateway.services.prompt_service import PromptService
             >>> from unittest.mock import MagicMock
             >>> service = PromptService()
             >>> db = MagicMock()
-            >>> db.execute.return_value.scalar.return_value = 0
+            >>> db.execute.return_value.one.return_value = (0, 0, 0, None, None, None, None)
             >>> import asyncio
             >>> result = asyncio.run(service.aggregate_metrics(db))
             >>> isinstance(result, dict)
             True
         """
 
-        total = db.execute(select(func.count(PromptMetric.id))).scalar() or 0  # pylint: disable=not-callable
-        successful = db.execute(select(func.count(PromptMetric.id)).where(PromptMetric.is_success.is_(True))).scalar() or 0  # pylint: disable=not-callable
-        failed = db.execute(select(func.count(PromptMetric.id)).where(PromptMetric.is_success.is_(False))).scalar() or 0  # pylint: disable=not-callable
-        failure_rate = failed / total if total > 0 else 0.0
-        min_rt = db.execute(select(func.min(PromptMetric.response_time))).scalar()
-        max_rt = db.execute(select(func.max(PromptMetric.response_time))).scalar()
-        avg_rt = db.execute(select(func.avg(PromptMetric.response_time))).scalar()
-        last_time = db.execute(select(func.max(PromptMetric.timestamp))).scalar()
-
-        return {
-            "total_executions": total,
-            "successful_executions": successful,
-            "failed_executions": failed,
-            "failure_rate": failure_rate,
-            "min_response_time": min_rt,
-            "max_response_time": max_rt,
-            "avg_response_time": avg_rt,
-            "last_execution_time": last_time,
-        }
+        return aggregate_rollups(db, "prompt")
 
     async def reset_metrics(self, db: Session) -> None:
         """
-        Reset all prompt metrics by deleting all records from the prompt metrics table.
+        Reset all prompt metrics by deleting raw metric records and rollups.
 
         Args:
             db: Database session
@@ -1514,5 +1484,5 @@ class PromptService:
             >>> asyncio.run(service.reset_metrics(db))
         """
 
-        db.execute(delete(PromptMetric))
+        reset_rollups(db, "prompt")
         db.commit()
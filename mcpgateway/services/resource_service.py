@@ -31,7 +31,7 @@ import uuid
 
 # Third-Party
 import parse
-from sqlalchemy import and_, case, delete, desc, Float, func, not_, or_, select
+from sqlalchemy import and_, delete, not_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -47,10 +47,12 @@ from mcpgateway.observability import create_span
 from mcpgateway.schemas import ResourceCreate, ResourceMetrics, ResourceRead, ResourceSubscription, ResourceUpdate, TopPerformer
 from mcpgateway.services.event_service import EventService
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, record_metric_rollup, reset_rollups, top_performers_query
 from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
-from mcpgateway.utils.metrics_common import build_top_performers
+from mcpgateway.utils.metrics_common import build_top_performers, summarize_metrics
 from mcpgateway.utils.pagination import decode_cursor, encode_cursor
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr
 
 # Plugin support imports (conditional)
 try:
@@ -170,30 +172,7 @@ class ResourceService:
                 - success_rate: Success rate percentage, or None if no metrics.
                 - last_execution: Timestamp of the last execution, or None if no metrics.
         """
-        query = (
-            db.query(
-                DbResource.id,
-                DbResource.uri.label("name"),  # Using URI as the name field for TopPerformer
-                func.count(ResourceMetric.id).label("execution_count"),  # pylint: disable=not-callable
-                func.avg(ResourceMetric.response_time).label("avg_response_time"),  # pylint: disable=not-callable
-                case(
-                    (
-                        func.count(ResourceMetric.id) > 0,  # pylint: disable=not-callable
-                        func.sum(case((ResourceMetric.is_success.is_(True), 1), else_=0)).cast(Float) / func.count(ResourceMetric.id) * 100,  # pylint: disable=not-callable
-                    ),
-                    else_=None,
-                ).label("success_rate"),
-                func.max(ResourceMetric.timestamp).label("last_execution"),  # pylint: disable=not-callable
-            )
-            .outerjoin(ResourceMetric)
-            .group_by(DbResource.id, DbResource.uri)
-            .order_by(desc("execution_count"))
-        )
-
-        if limit is not None:
-            query = query.limit(limit)
-
-        results = query.all()
+        results = top_performers_query(db, "resource", limit)
 
         return build_top_performers(results)
 
@@ -230,26 +209,8 @@ class ResourceService:
         resource_dict.pop("_sa_instance_state", None)
         resource_dict.pop("metrics", None)
 
-        # Compute aggregated metrics from the resource's metrics list.
-        total = len(resource.metrics) if hasattr(resource, "metrics") and resource.metrics is not None else 0
-        successful = sum(1 for m in resource.metrics if m.is_success) if total > 0 else 0
-        failed = sum(1 for m in resource.metrics if not m.is_success) if total > 0 else 0
-        failure_rate = (failed / total) if total > 0 else 0.0
-        min_rt = min((m.response_time for m in resource.metrics), default=None) if total > 0 else None
-        max_rt = max((m.response_time for m in resource.metrics), default=None) if total > 0 else None
-        avg_rt = (sum(m.response_time for m in resource.metrics) / total) if total > 0 else None
-        last_time = max((m.timestamp for m in resource.metrics), default=None) if total > 0 else None
-
-        resource_dict["metrics"] = {
-            "total_executions": total,
-            "successful_executions": successful,
-            "failed_executions": failed,
-            "failure_rate": failure_rate,
-            "min_response_time": min_rt,
-            "max_response_time": max_rt,
-            "avg_response_time": avg_rt,
-            "last_execution_time": last_time,
-        }
+        resource_dict.pop("metrics_rollup", None)
+        resource_dict["metrics"] = summarize_metrics(resource)
         resource_dict["tags"] = resource.tags or []
         resource_dict["team"] = getattr(resource, "team", None)
 
@@ -466,7 +427,7 @@ class ResourceService:
 
         # Add tag filtering if tags are provided
         if tags:
-            query = query.where(json_contains_expr(db, DbResource.tags, tags, match_any=True))
+            query = query.where(entity_tags_expr(DbResource.id, "resource", tags, match_any=True))
 
         # Fetch page_size + 1 to determine if there are more results
         query = query.limit(page_size + 1)
@@ -663,6 +624,9 @@ class ResourceService:
         end_time = time.monotonic()
         response_time = end_time - start_time
 
+        if settings.metrics_buffer_enabled and get_metrics_buffer_service().record("resource", resource.id, response_time, success, error_message):
+            return
+
         metric = ResourceMetric(
             resource_id=resource.id,
             response_time=response_time,
@@ -670,6 +634,7 @@ class ResourceService:
             error_message=error_message,
         )
         db.add(metric)
+        record_metric_rollup(db, "resource", resource.id, response_time, success)
         db.commit()
 
     async def read_resource(
@@ -1651,9 +1616,21 @@ class ResourceService:
         """
         Publish event to all subscribers via the EventService.
 
+        Every resource change is published through here, so it also keeps the
+        URI completion index in step with the catalog and drops the cached
+        ``resources/list`` snapshots.
+
         Args:
             event: Event to publish
         """
+        data = event.get("data")
+        if isinstance(data, dict) and data.get("id") is not None:
+            # First-Party
+            from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache  # pylint: disable=import-outside-toplevel
+            from mcpgateway.cache.completion_index import get_completion_index  # pylint: disable=import-outside-toplevel
+
+            await get_completion_index().update_resource(data["id"], data.get("uri"), bool(data.get("is_active")))
+            await get_catalog_snapshot_cache().invalidate("resources")
         await self._event_service.publish_event(event)
 
     # --- Resource templates ---
@@ -1699,47 +1676,24 @@ class ResourceService:
             db: Database session
 
         Returns:
-            ResourceMetrics: Aggregated metrics computed from all ResourceMetric records.
+            ResourceMetrics: Aggregated metrics computed from the per-resource metric rollups.
 
         Examples:
             >>> from mcpgateway.services.resource_service import ResourceService
             >>> from unittest.mock import MagicMock
             >>> service = ResourceService()
             >>> db = MagicMock()
-            >>> db.execute.return_value.scalar.return_value = 0
+            >>> db.execute.return_value.one.return_value = (0, 0, 0, None, None, None, None)
             >>> import asyncio
             >>> result = asyncio.run(service.aggregate_metrics(db))
             >>> hasattr(result, 'total_executions')
             True
         """
-        total_executions = db.execute(select(func.count()).select_from(ResourceMetric)).scalar() or 0  # pylint: disable=not-callable
-
-        successful_executions = db.execute(select(func.count()).select_from(ResourceMetric).where(ResourceMetric.is_success.is_(True))).scalar() or 0  # pylint: disable=not-callable
-
-        failed_executions = db.execute(select(func.count()).select_from(ResourceMetric).where(ResourceMetric.is_success.is_(False))).scalar() or 0  # pylint: disable=not-callable
-
-        min_response_time = db.execute(select(func.min(ResourceMetric.response_time))).scalar()
-
-        max_response_time = db.execute(select(func.max(ResourceMetric.response_time))).scalar()
-
-        avg_response_time = db.execute(select(func.avg(ResourceMetric.response_time))).scalar()
-
-        last_execution_time = db.execute(select(func.max(ResourceMetric.timestamp))).scalar()
-
-        return ResourceMetrics(
-            total_executions=total_executions,
-            successful_executions=successful_executions,
-            failed_executions=failed_executions,
-            failure_rate=(failed_executions / total_executions) if total_executions > 0 else 0.0,
-            min_response_time=min_response_time,
-            max_response_time=max_response_time,
-            avg_response_time=avg_response_time,
-            last_execution_time=last_execution_time,
-        )
+        return ResourceMetrics(**aggregate_rollups(db, "resource"))
 
     async def reset_metrics(self, db: Session) -> None:
         """
-        Reset all resource metrics by deleting all records from the resource metrics table.
+        Reset all resource metrics by deleting raw metric records and rollups.
 
         Args:
             db: Database session
@@ -1754,5 +1708,5 @@ class ResourceService:
             >>> import asyncio
             >>> asyncio.run(service.reset_metrics(db))
         """
-        db.execute(delete(ResourceMetric))
+        reset_rollups(db, "resource")
         db.commit()
@@ -20,6 +20,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache
 from mcpgateway.db import Permissions, Role, UserRole, utc_now
 
 logger = logging.getLogger(__name__)
@@ -462,6 +463,8 @@ class RoleService:
 
         self.db.commit()
         self.db.refresh(role)
+        # Inheritance lets a role change reach users of any descendant role
+        await get_permission_cache().invalidate_all()
 
         logger.info(f"Updated role: {role.name} (id: {role.id})")
         return role
@@ -519,6 +522,7 @@ class RoleService:
         self.db.execute(select(UserRole).where(UserRole.role_id == role_id)).update({"is_active": False})
 
         self.db.commit()
+        await get_permission_cache().invalidate_all()
 
         logger.info(f"Deleted role: {role.name} (id: {role.id})")
         return True
@@ -621,6 +625,7 @@ class RoleService:
         self.db.add(user_role)
         self.db.commit()
         self.db.refresh(user_role)
+        await get_permission_cache().invalidate_user(user_email)
 
         logger.info(f"Assigned role {role.name} to {user_email} (scope: {scope}, scope_id: {scope_id})")
         return user_role
@@ -664,6 +669,7 @@ class RoleService:
 
         user_role.is_active = False
         self.db.commit()
+        await get_permission_cache().invalidate_user(user_email)
 
         logger.info(f"Revoked role {role_id} from {user_email} (scope: {scope}, scope_id: {scope_id})")
         return True
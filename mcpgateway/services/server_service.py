@@ -18,7 +18,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 # Third-Party
 import httpx
-from sqlalchemy import and_, case, delete, desc, Float, func, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -30,13 +30,13 @@ from mcpgateway.db import EmailTeamMember as DbEmailTeamMember
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.db import Server as DbServer
-from mcpgateway.db import ServerMetric
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.schemas import ServerCreate, ServerMetrics, ServerRead, ServerUpdate, TopPerformer
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, reset_rollups, top_performers_query
 from mcpgateway.services.team_management_service import TeamManagementService
-from mcpgateway.utils.metrics_common import build_top_performers
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_expr
+from mcpgateway.utils.metrics_common import build_top_performers, summarize_metrics
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr
 
 # Initialize logging service first
 logging_service = LoggingService()
@@ -161,30 +161,7 @@ class ServerService:
                 - success_rate: Success rate percentage, or None if no metrics.
                 - last_execution: Timestamp of the last execution, or None if no metrics.
         """
-        query = (
-            db.query(
-                DbServer.id,
-                DbServer.name,
-                func.count(ServerMetric.id).label("execution_count"),  # pylint: disable=not-callable
-                func.avg(ServerMetric.response_time).label("avg_response_time"),  # pylint: disable=not-callable
-                case(
-                    (
-                        func.count(ServerMetric.id) > 0,  # pylint: disable=not-callable
-                        func.sum(case((ServerMetric.is_success.is_(True), 1), else_=0)).cast(Float) / func.count(ServerMetric.id) * 100,  # pylint: disable=not-callable
-                    ),
-                    else_=None,
-                ).label("success_rate"),
-                func.max(ServerMetric.timestamp).label("last_execution"),  # pylint: disable=not-callable
-            )
-            .outerjoin(ServerMetric)
-            .group_by(DbServer.id, DbServer.name)
-            .order_by(desc("execution_count"))
-        )
-
-        if limit is not None:
-            query = query.limit(limit)
-
-        results = query.all()
+        results = top_performers_query(db, "server", limit)
 
         return build_top_performers(results)
 
@@ -221,26 +198,8 @@ class ServerService:
         """
         server_dict = server.__dict__.copy()
         server_dict.pop("_sa_instance_state", None)
-        # Compute aggregated metrics from server.metrics; default to 0/None when no records exist.
-        total = len(server.metrics) if hasattr(server, "metrics") else 0
-        successful = sum(1 for m in server.metrics if m.is_success) if total > 0 else 0
-        failed = sum(1 for m in server.metrics if not m.is_success) if total > 0 else 0
-        failure_rate = (failed / total) if total > 0 else 0.0
-        min_rt = min((m.response_time for m in server.metrics), default=None) if total > 0 else None
-        max_rt = max((m.response_time for m in server.metrics), default=None) if total > 0 else None
-        avg_rt = (sum(m.response_time for m in server.metrics) / total) if total > 0 else None
-        last_time = max((m.timestamp for m in server.metrics), default=None) if total > 0 else None
-
-        server_dict["metrics"] = {
-            "total_executions": total,
-            "successful_executions": successful,
-            "failed_executions": failed,
-            "failure_rate": failure_rate,
-            "min_response_time": min_rt,
-            "max_response_time": max_rt,
-            "avg_response_time": avg_rt,
-            "last_execution_time": last_time,
-        }
+        server_dict.pop("metrics_rollup", None)
+        server_dict["metrics"] = summarize_metrics(server)
         # Also update associated IDs (if not already done)
         server_dict["associated_tools"] = [tool.name for tool in server.tools] if server.tools else []
         server_dict["associated_resources"] = [res.id for res in server.resources] if server.resources else []
@@ -533,7 +492,7 @@ class ServerService:
 
         # Add tag filtering if tags are provided
         if tags:
-            query = query.where(json_contains_expr(db, DbServer.tags, tags, match_any=True))
+            query = query.where(entity_tags_expr(DbServer.id, "server", tags, match_any=True))
 
         servers = db.execute(query).scalars().all()
         result = []
@@ -1016,9 +975,19 @@ class ServerService:
         """
         Publish an event to all subscribed queues.
 
+        Every server change is published through here, so it also drops the
+        server's cached list snapshots (its tool, resource and prompt
+        associations may have changed).
+
         Args:
             event: Event to publish
         """
+        data = event.get("data")
+        if isinstance(data, dict) and data.get("id") is not None:
+            # First-Party
+            from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache  # pylint: disable=import-outside-toplevel
+
+            await get_catalog_snapshot_cache().invalidate("server", str(data["id"]))
         for queue in self._event_subscribers:
             await queue.put(event)
 
@@ -1148,47 +1117,24 @@ class ServerService:
             db: Database session
 
         Returns:
-            ServerMetrics: Aggregated metrics computed from all ServerMetric records.
+            ServerMetrics: Aggregated metrics computed from the per-server metric rollups.
 
         Examples:
             >>> from mcpgateway.services.server_service import ServerService
             >>> from unittest.mock import MagicMock
             >>> service = ServerService()
             >>> db = MagicMock()
-            >>> db.execute.return_value.scalar.return_value = 0
+            >>> db.execute.return_value.one.return_value = (0, 0, 0, None, None, None, None)
             >>> import asyncio
             >>> result = asyncio.run(service.aggregate_metrics(db))
             >>> hasattr(result, 'total_executions')
             True
         """
-        total_executions = db.execute(select(func.count()).select_from(ServerMetric)).scalar() or 0  # pylint: disable=not-callable
-
-        successful_executions = db.execute(select(func.count()).select_from(ServerMetric).where(ServerMetric.is_success.is_(True))).scalar() or 0  # pylint: disable=not-callable
-
-        failed_executions = db.execute(select(func.count()).select_from(ServerMetric).where(ServerMetric.is_success.is_(False))).scalar() or 0  # pylint: disable=not-callable
-
-        min_response_time = db.execute(select(func.min(ServerMetric.response_time))).scalar()
-
-        max_response_time = db.execute(select(func.max(ServerMetric.response_time))).scalar()
-
-        avg_response_time = db.execute(select(func.avg(ServerMetric.response_time))).scalar()
-
-        last_execution_time = db.execute(select(func.max(ServerMetric.timestamp))).scalar()
-
-        return ServerMetrics(
-            total_executions=total_executions,
-            successful_executions=successful_executions,
-            failed_executions=failed_executions,
-            failure_rate=(failed_executions / total_executions) if total_executions > 0 else 0.0,
-            min_response_time=min_response_time,
-            max_response_time=max_response_time,
-            avg_response_time=avg_response_time,
-            last_execution_time=last_execution_time,
-        )
+        return ServerMetrics(**aggregate_rollups(db, "server"))
 
     async def reset_metrics(self, db: Session) -> None:
         """
-        Reset all server metrics by deleting all records from the server metrics table.
+        Reset all server metrics by deleting raw metric records and rollups.
 
         Args:
             db: Database session
@@ -1203,5 +1149,5 @@ class ServerService:
             >>> import asyncio
             >>> asyncio.run(service.reset_metrics(db))
         """
-        db.execute(delete(ServerMetric))
+        reset_rollups(db, "server")
         db.commit()
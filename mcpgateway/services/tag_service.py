@@ -11,22 +11,36 @@ It handles:
 - Filtering tags by entity type
 - Tag statistics and counts
 - Retrieving entities that have specific tags
+
+Every query goes through the normalized ``entity_tags`` index table rather
+than scanning and parsing the ``tags`` JSON column of each entity.
 """
 
 # Standard
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Third-Party
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.db import EntityTag
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.db import Server as DbServer
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.schemas import TaggedEntity, TagInfo, TagStats
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_key, entity_tags_expr
+
+# Tagged models by plural entity type; ``entity_tags`` records the singular form
+ENTITY_MODELS = {
+    "tools": DbTool,
+    "resources": DbResource,
+    "prompts": DbPrompt,
+    "servers": DbServer,
+    "gateways": DbGateway,
+}
 
 
 class TagService:
@@ -91,26 +105,27 @@ class TagService:
             >>> asyncio.run(test_empty())
             0
 
-            >>> # Mock result with tag data
+            >>> # Mock (tag, entity_type, count) rows from the entity_tags index
             >>> mock_result = MagicMock()
             >>> mock_result.__iter__ = lambda self: iter([
-            ...     (["api", "database"],),
-            ...     (["api", "web"],),
+            ...     ("api", "tool", 2),
+            ...     ("database", "tool", 1),
+            ...     ("web", "tool", 1),
             ... ])
             >>> mock_db.execute.return_value = mock_result
             >>>
             >>> # Test with tag data
             >>> async def test_with_tags():
             ...     tags = await service.get_all_tags(mock_db, entity_types=["tools"])
-            ...     return len(tags) >= 2  # Should have at least api, database, web tags
+            ...     return [(tag.name, tag.stats.tools) for tag in tags]
             >>> asyncio.run(test_with_tags())
-            True
+            [('api', 2), ('database', 1), ('web', 1)]
 
-            >>> # include_entities=True path
+            >>> # include_entities=True path: (tag, entity) rows
             >>> from types import SimpleNamespace
             >>> entity = SimpleNamespace(id='1', name='E', description='d', tags=['api'])
             >>> mock_result2 = MagicMock()
-            >>> mock_result2.scalars.return_value = [entity]
+            >>> mock_result2.__iter__ = lambda self: iter([("api", entity)])
             >>> mock_db.execute.return_value = mock_result2
             >>> async def test_with_entities():
             ...     tags = await service.get_all_tags(mock_db, entity_types=["tools"], include_entities=True)
@@ -124,87 +139,94 @@ class TagService:
         """
         tag_data: Dict[str, Dict] = {}
 
-        # Define entity type mapping
-        entity_map = {
-            "tools": DbTool,
-            "resources": DbResource,
-            "prompts": DbPrompt,
-            "servers": DbServer,
-            "gateways": DbGateway,
-        }
-
         # If no entity types specified, use all
         if entity_types is None:
-            entity_types = list(entity_map.keys())
-
-        # Collect tags from each requested entity type
-        for entity_type in entity_types:
-            if entity_type not in entity_map:
-                continue
-
-            model = entity_map[entity_type]
-
-            # Query all entities with tags from this entity type
-            if include_entities:
-                # Get full entity details
-                stmt = select(model).where(model.tags.isnot(None))
-                result = db.execute(stmt)
-
-                for entity in result.scalars():
-                    tags = entity.tags if entity.tags else []
-                    for tag in tags:
-                        if tag not in tag_data:
-                            tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
-
-                        # Create TaggedEntity
-                        # Determine the ID
-                        if hasattr(entity, "id") and entity.id is not None:
-                            entity_id = str(entity.id)
-                        elif entity_type == "resources" and hasattr(entity, "uri"):
-                            entity_id = str(entity.uri)
-                        else:
-                            entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
-
-                        # Determine the name
-                        if hasattr(entity, "name") and entity.name:
-                            entity_name = entity.name
-                        elif hasattr(entity, "original_name") and entity.original_name:
-                            entity_name = entity.original_name
-                        elif hasattr(entity, "uri"):
-                            entity_name = str(entity.uri)
-                        else:
-                            entity_name = entity_id
-
-                        entity_info = TaggedEntity(
-                            id=entity_id,
-                            name=entity_name,
-                            type=entity_type[:-1],  # Remove plural 's'
-                            description=entity.description if hasattr(entity, "description") else None,
-                        )
-                        tag_data[tag]["entities"].append(entity_info)
-
-                        # Update stats
-                        self._update_stats(tag_data[tag]["stats"], entity_type)
-            else:
-                # Just get tags without entity details
-                stmt = select(model.tags).where(model.tags.isnot(None))
-                result = db.execute(stmt)
-
-                for row in result:
-                    tags = row[0] if row[0] else []
-                    for tag in tags:
-                        if tag not in tag_data:
-                            tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
-
-                        # Update stats
-                        self._update_stats(tag_data[tag]["stats"], entity_type)
+            entity_types = list(ENTITY_MODELS.keys())
+        entity_types = [entity_type for entity_type in entity_types if entity_type in ENTITY_MODELS]
+        if not entity_types:
+            return []
+
+        def _tag(name: str) -> Dict:
+            """Return the accumulator of a tag, creating it on first sight.
+
+            Args:
+                name: Tag name
+
+            Returns:
+                Dict: The tag's stats and entities
+            """
+            if name not in tag_data:
+                tag_data[name] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
+            return tag_data[name]
+
+        if include_entities:
+            # One indexed join per entity type returning (tag, entity) pairs
+            for entity_type in entity_types:
+                model = ENTITY_MODELS[entity_type]
+                stmt = select(EntityTag.tag, model).join(model, model.id == entity_tag_key(model.id)).where(EntityTag.entity_type == entity_type[:-1]).order_by(EntityTag.tag, EntityTag.id)
+                for tag, entity in db.execute(stmt):
+                    data = _tag(tag)
+                    data["entities"].append(self._to_tagged_entity(entity, entity_type))
+                    self._update_stats(data["stats"], entity_type)
+        else:
+            # Counts come straight from the (tag, entity_type) index
+            stmt = (
+                select(EntityTag.tag, EntityTag.entity_type, func.count())  # pylint: disable=not-callable
+                .where(EntityTag.entity_type.in_([entity_type[:-1] for entity_type in entity_types]))
+                .group_by(EntityTag.tag, EntityTag.entity_type)
+            )
+            for tag, entity_type, count in db.execute(stmt):
+                self._update_stats(_tag(tag)["stats"], f"{entity_type}s", count)
 
         # Convert to TagInfo list
         tags = [TagInfo(name=tag, stats=data["stats"], entities=data["entities"] if include_entities else []) for tag, data in sorted(tag_data.items())]
 
         return tags
 
-    def _update_stats(self, stats: TagStats, entity_type: str) -> None:
+    @staticmethod
+    def _to_tagged_entity(entity: Any, entity_type: str) -> TaggedEntity:
+        """Describe an entity for tag listings.
+
+        Args:
+            entity: Tool, resource, prompt, server or gateway
+            entity_type: Plural entity type ('tools', 'resources', ...)
+
+        Returns:
+            TaggedEntity with the entity's id, display name, singular type and description.
+
+        Example:
+            >>> from types import SimpleNamespace
+            >>> entity = SimpleNamespace(id=None, uri="resource://a", name=None, description=None)
+            >>> tagged = TagService._to_tagged_entity(entity, "resources")
+            >>> (tagged.id, tagged.name, tagged.type)
+            ('resource://a', 'resource://a', 'resource')
+        """
+        # Determine the ID
+        if hasattr(entity, "id") and entity.id is not None:
+            entity_id = str(entity.id)
+        elif entity_type == "resources" and hasattr(entity, "uri"):
+            entity_id = str(entity.uri)
+        else:
+            entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
+
+        # Determine the name
+        if hasattr(entity, "name") and entity.name:
+            entity_name = entity.name
+        elif hasattr(entity, "original_name") and entity.original_name:
+            entity_name = entity.original_name
+        elif hasattr(entity, "uri"):
+            entity_name = str(entity.uri)
+        else:
+            entity_name = entity_id
+
+        return TaggedEntity(
+            id=entity_id,
+            name=entity_name,
+            type=entity_type[:-1],  # Remove plural 's'
+            description=entity.description if hasattr(entity, "description") else None,
+        )
+
+    def _update_stats(self, stats: TagStats, entity_type: str, count: int = 1) -> None:
         """Update statistics for a specific entity type.
 
         This helper method increments the appropriate counter in the TagStats object
@@ -214,6 +236,7 @@ class TagService:
             stats: TagStats object to update with new counts
             entity_type: Type of entity to increment count for. Must be one of:
                         'tools', 'resources', 'prompts', 'servers', 'gateways'
+            count: Number of entities to add
 
         Example:
             >>> from mcpgateway.schemas import TagStats
@@ -238,22 +261,27 @@ class TagService:
             >>> service._update_stats(stats, "invalid")
             >>> stats.total  # Should remain 2
             2
+            >>>
+            >>> # Counts from an aggregate query
+            >>> service._update_stats(stats, "servers", 3)
+            >>> (stats.servers, stats.total)
+            (3, 5)
         """
         if entity_type == "tools":
-            stats.tools += 1
-            stats.total += 1
+            stats.tools += count
+            stats.total += count
         elif entity_type == "resources":
-            stats.resources += 1
-            stats.total += 1
+            stats.resources += count
+            stats.total += count
         elif entity_type == "prompts":
-            stats.prompts += 1
-            stats.total += 1
+            stats.prompts += count
+            stats.total += count
         elif entity_type == "servers":
-            stats.servers += 1
-            stats.total += 1
+            stats.servers += count
+            stats.total += count
         elif entity_type == "gateways":
-            stats.gateways += 1
-            stats.total += 1
+            stats.gateways += count
+            stats.total += count
         # Invalid entity types are ignored (no increment)
 
     async def get_entities_by_tag(self, db: Session, tag_name: str, entity_types: Optional[List[str]] = None) -> List[TaggedEntity]:
@@ -302,73 +330,37 @@ class TagService:
             >>> asyncio.run(test_entity_lookup())
             1
 
-            >>> # Test with non-existent tag
-            >>> mock_entity.tags = ["different", "tags"]
+            >>> # Test with non-existent tag (the index returns no rows)
+            >>> mock_result.scalars.return_value = []
             >>> async def test_no_match():
-            ...     entities = await service.get_entities_by_tag(mock_db, "api", ["tools"])
+            ...     entities = await service.get_entities_by_tag(mock_db, "missing", ["tools"])
             ...     return len(entities)
             >>> asyncio.run(test_no_match())
             0
 
         Note:
             - Tag matching is exact and case-sensitive
-            - Entities without the specified tag are filtered out after database query
-            - Performance scales with the number of entities in filtered types
-            - Uses JSON LIKE queries for database-level filtering when possible
+            - Matching entities are found through the indexed entity_tags table
+            - Performance scales with the number of matching entities, not the table size
         """
         entities = []
 
-        # Define entity type mapping
-        entity_map = {
-            "tools": DbTool,
-            "resources": DbResource,
-            "prompts": DbPrompt,
-            "servers": DbServer,
-            "gateways": DbGateway,
-        }
-
         # If no entity types specified, use all
         if entity_types is None:
-            entity_types = list(entity_map.keys())
+            entity_types = list(ENTITY_MODELS.keys())
 
         for entity_type in entity_types:
-            if entity_type not in entity_map:
+            if entity_type not in ENTITY_MODELS:
                 continue
 
-            model = entity_map[entity_type]
+            model = ENTITY_MODELS[entity_type]
 
-            # Query entities that have this tag
-            # Using JSON contains for PostgreSQL/SQLite JSON columns
-            stmt = select(model).where(func.json_extract(model.tags, "$").op("LIKE")(f'%"{tag_name}"%'))
+            # Indexed lookup through entity_tags
+            stmt = select(model).where(entity_tags_expr(model.id, entity_type[:-1], [tag_name]))
             result = db.execute(stmt)
 
             for entity in result.scalars():
-                if tag_name in (entity.tags or []):
-                    # Determine the ID
-                    if hasattr(entity, "id") and entity.id is not None:
-                        entity_id = str(entity.id)
-                    elif entity_type == "resources" and hasattr(entity, "uri"):
-                        entity_id = str(entity.uri)
-                    else:
-                        entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
-
-                    # Determine the name
-                    if hasattr(entity, "name") and entity.name:
-                        entity_name = entity.name
-                    elif hasattr(entity, "original_name") and entity.original_name:
-                        entity_name = entity.original_name
-                    elif hasattr(entity, "uri"):
-                        entity_name = str(entity.uri)
-                    else:
-                        entity_name = entity_id
-
-                    entity_info = TaggedEntity(
-                        id=entity_id,
-                        name=entity_name,
-                        type=entity_type[:-1],  # Remove plural 's'
-                        description=entity.description if hasattr(entity, "description") else None,
-                    )
-                    entities.append(entity_info)
+                entities.append(self._to_tagged_entity(entity, entity_type))
 
         return entities
 
@@ -394,20 +386,13 @@ class TagService:
             >>> service = TagService()
             >>> mock_db = MagicMock()
             >>>
-            >>> # Mock tag count results
-            >>> mock_db.execute.return_value.scalars.return_value.all.return_value = [2, 1, 3]  # 3 entities with 2, 1, 3 tags each
-            >>>
-            >>> # Execute method with mocked responses (same values reused for simplicity)
-            >>> class _Res:
-            ...     def scalars(self):
-            ...         class _S:
-            ...             def all(self_inner):
-            ...                 return [2, 1, 3]
-            ...         return _S()
-            >>> mock_db.execute.return_value = _Res()
+            >>> # Mock (entity_type, count) rows grouped from the entity_tags index
+            >>> mock_db.execute.return_value = iter([("tool", 6), ("prompt", 4)])
             >>> counts = asyncio.run(service.get_tag_counts(mock_db))
             >>> counts['tools']
             6
+            >>> counts['servers']
+            0
             >>> all(isinstance(v, int) for v in counts.values())
             True
             >>> len(counts)
@@ -417,33 +402,13 @@ class TagService:
             - Counts tag instances, not unique tag names
             - An entity with 3 tags contributes 3 to the count
             - Empty or null tag arrays contribute 0 to the count
-            - Uses json_array_length() for efficient counting
+            - A single grouped count over the entity_tags table
         """
-        counts = {}
-
-        # Count unique tags for tools
-        tool_tags_stmt = select(func.json_array_length(DbTool.tags)).where(DbTool.tags.isnot(None))
-        tool_tags = db.execute(tool_tags_stmt).scalars().all()
-        counts["tools"] = sum(tool_tags)
-
-        # Count unique tags for resources
-        resource_tags_stmt = select(func.json_array_length(DbResource.tags)).where(DbResource.tags.isnot(None))
-        resource_tags = db.execute(resource_tags_stmt).scalars().all()
-        counts["resources"] = sum(resource_tags)
-
-        # Count unique tags for prompts
-        prompt_tags_stmt = select(func.json_array_length(DbPrompt.tags)).where(DbPrompt.tags.isnot(None))
-        prompt_tags = db.execute(prompt_tags_stmt).scalars().all()
-        counts["prompts"] = sum(prompt_tags)
-
-        # Count unique tags for servers
-        server_tags_stmt = select(func.json_array_length(DbServer.tags)).where(DbServer.tags.isnot(None))
-        server_tags = db.execute(server_tags_stmt).scalars().all()
-        counts["servers"] = sum(server_tags)
-
-        # Count unique tags for gateways
-        gateway_tags_stmt = select(func.json_array_length(DbGateway.tags)).where(DbGateway.tags.isnot(None))
-        gateway_tags = db.execute(gateway_tags_stmt).scalars().all()
-        counts["gateways"] = sum(gateway_tags)
+        counts = {entity_type: 0 for entity_type in ENTITY_MODELS}
+
+        stmt = select(EntityTag.entity_type, func.count()).group_by(EntityTag.entity_type)  # pylint: disable=not-callable
+        for entity_type, count in db.execute(stmt):
+            if f"{entity_type}s" in counts:
+                counts[f"{entity_type}s"] = count
 
         return counts
@@ -25,6 +25,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailTeam, EmailTeamInvitation, EmailTeamMember, EmailUser, utc_now
 from mcpgateway.services.logging_service import LoggingService
@@ -314,6 +315,7 @@ class TeamInvitationService:
             invitation.is_active = False
 
             self.db.commit()
+            await get_permission_cache().invalidate_user(invitation.email)
 
             logger.info(f"User {invitation.email} accepted invitation to team {invitation.team_id}")
             return True
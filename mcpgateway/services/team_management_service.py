@@ -97,6 +97,22 @@ class TeamManagementService:
         self.db.add(history)
         self.db.commit()
 
+    @staticmethod
+    async def _invalidate_permissions(user_email: Optional[str] = None, team_id: Optional[str] = None) -> None:
+        """Drop cached RBAC lookups affected by a membership change on every worker.
+
+        Args:
+            user_email: User whose memberships changed
+            team_id: Team whose memberships all changed
+        """
+        # First-Party
+        from mcpgateway.cache.permission_cache import get_permission_cache  # pylint: disable=import-outside-toplevel
+
+        if user_email:
+            await get_permission_cache().invalidate_user(user_email)
+        if team_id:
+            await get_permission_cache().invalidate_team(team_id)
+
     async def create_team(self, name: str, description: Optional[str], created_by: str, visibility: Optional[str] = "public", max_members: Optional[int] = None) -> EmailTeam:
         """Create a new team.
 
@@ -216,6 +232,7 @@ class TeamManagementService:
                 self.db.add(membership)
 
             self.db.commit()
+            await self._invalidate_permissions(created_by)
 
             logger.info(f"Created team '{team.name}' by {created_by}")
             return team
@@ -382,6 +399,7 @@ class TeamManagementService:
                 self._log_team_member_action(membership.id, team_id, membership.user_email, membership.role, "team-deleted", deleted_by)
 
             self.db.commit()
+            await self._invalidate_permissions(team_id=team_id)
 
             logger.info(f"Deleted team {team_id} by {deleted_by}")
             return True
@@ -461,6 +479,7 @@ class TeamManagementService:
                 self.db.add(membership)
                 self.db.commit()
                 self._log_team_member_action(membership.id, team_id, user_email, role, "added", invited_by)
+            await self._invalidate_permissions(user_email)
 
             logger.info(f"Added {user_email} to team {team_id} with role {role}")
             return True
@@ -518,6 +537,7 @@ class TeamManagementService:
             membership.is_active = False
             self.db.commit()
             self._log_team_member_action(membership.id, team_id, user_email, membership.role, "removed", removed_by)
+            await self._invalidate_permissions(user_email)
             logger.info(f"Removed {user_email} from team {team_id} by {removed_by}")
             return True
 
@@ -580,6 +600,7 @@ class TeamManagementService:
             membership.role = new_role
             self.db.commit()
             self._log_team_member_action(membership.id, team_id, user_email, new_role, "role_changed", updated_by)
+            await self._invalidate_permissions(user_email)
 
             logger.info(f"Updated role of {user_email} in team {team_id} to {new_role} by {updated_by}")
             return True
@@ -891,6 +912,7 @@ class TeamManagementService:
             self._log_team_member_action(member.id, join_request.team_id, join_request.user_email, member.role, "added", approved_by)
 
             self.db.refresh(member)
+            await self._invalidate_permissions(join_request.user_email)
 
             logger.info(f"Approved join request {request_id}: user {join_request.user_email} joined team {join_request.team_id}")
             return member
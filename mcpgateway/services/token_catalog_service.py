@@ -25,6 +25,7 @@ from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import get_auth_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailApiToken, EmailUser, TokenRevocation, TokenUsageLog, utc_now
 from mcpgateway.services.logging_service import LoggingService
@@ -602,6 +603,7 @@ class TokenCatalogService:
 
         self.db.add(revocation)
         self.db.commit()
+        await get_auth_cache().invalidate_token(token.jti)
 
         logger.info(f"Revoked token '{token.name}' (JTI: {token.jti}) by {revoked_by}")
 
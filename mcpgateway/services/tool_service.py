@@ -22,7 +22,7 @@ import os
 import re
 import ssl
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, TYPE_CHECKING, Union
 from urllib.parse import parse_qs, urlparse
 import uuid
 
@@ -33,7 +33,7 @@ import jsonschema
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
-from sqlalchemy import and_, case, delete, desc, Float, func, not_, or_, select
+from sqlalchemy import and_, not_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, Session
 
@@ -65,6 +65,9 @@ from mcpgateway.plugins.framework.constants import GATEWAY_METADATA, TOOL_METADA
 from mcpgateway.schemas import ToolCreate, ToolRead, ToolUpdate, TopPerformer
 from mcpgateway.services.event_service import EventService
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.mcp_session_pool import get_mcp_session_pool
+from mcpgateway.services.metrics_buffer_service import get_metrics_buffer_service
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, record_metric_rollup, reset_rollups, top_performers_query
 from mcpgateway.services.oauth_manager import OAuthManager
 from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.utils.create_slug import slugify
@@ -74,9 +77,13 @@ from mcpgateway.utils.pagination import decode_cursor, encode_cursor
 from mcpgateway.utils.passthrough_headers import get_passthrough_headers
 from mcpgateway.utils.retry_manager import ResilientHttpClient
 from mcpgateway.utils.services_auth import decode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr
 from mcpgateway.utils.validate_signature import validate_signature
 
+if TYPE_CHECKING:
+    # First-Party
+    from mcpgateway.cache.tool_lookup_cache import ResolvedTool
+
 # Initialize logging service first
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
@@ -307,30 +314,7 @@ class ToolService:
                 - success_rate: Success rate percentage, or None if no metrics.
                 - last_execution: Timestamp of the last execution, or None if no metrics.
         """
-        query = (
-            db.query(
-                DbTool.id,
-                DbTool.name,
-                func.count(ToolMetric.id).label("execution_count"),  # pylint: disable=not-callable
-                func.avg(ToolMetric.response_time).label("avg_response_time"),  # pylint: disable=not-callable
-                case(
-                    (
-                        func.count(ToolMetric.id) > 0,  # pylint: disable=not-callable
-                        func.sum(case((ToolMetric.is_success.is_(True), 1), else_=0)).cast(Float) / func.count(ToolMetric.id) * 100,  # pylint: disable=not-callable
-                    ),
-                    else_=None,
-                ).label("success_rate"),
-                func.max(ToolMetric.timestamp).label("last_execution"),  # pylint: disable=not-callable
-            )
-            .outerjoin(ToolMetric)
-            .group_by(DbTool.id, DbTool.name)
-            .order_by(desc("execution_count"))
-        )
-
-        if limit is not None:
-            query = query.limit(limit)
-
-        results = query.all()
+        results = top_performers_query(db, "tool", limit)
 
         return build_top_performers(results)
 
@@ -408,7 +392,7 @@ class ToolService:
         tool_dict["team"] = getattr(tool, "team", None)
         return ToolRead.model_validate(tool_dict)
 
-    async def _record_tool_metric(self, db: Session, tool: DbTool, start_time: float, success: bool, error_message: Optional[str]) -> None:
+    async def _record_tool_metric(self, db: Session, tool: Union[DbTool, "ResolvedTool"], start_time: float, success: bool, error_message: Optional[str]) -> None:
         """
         Records a metric for a tool invocation.
 
@@ -418,13 +402,16 @@ class ToolService:
 
         Args:
             db (Session): The SQLAlchemy database session.
-            tool (DbTool): The tool that was invoked.
+            tool (Union[DbTool, "ResolvedTool"]): The tool that was invoked.
             start_time (float): The monotonic start time of the invocation.
             success (bool): True if the invocation succeeded; otherwise, False.
             error_message (Optional[str]): The error message if the invocation failed, otherwise None.
         """
         end_time = time.monotonic()
         response_time = end_time - start_time
+        if settings.metrics_buffer_enabled and get_metrics_buffer_service().record("tool", tool.id, response_time, success, error_message):
+            return
+
         metric = ToolMetric(
             tool_id=tool.id,
             response_time=response_time,
@@ -432,9 +419,10 @@ class ToolService:
             error_message=error_message,
         )
         db.add(metric)
+        record_metric_rollup(db, "tool", tool.id, response_time, success)
         db.commit()
 
-    def _extract_and_validate_structured_content(self, tool: DbTool, tool_result: "ToolResult", candidate: Optional[Any] = None) -> bool:
+    def _extract_and_validate_structured_content(self, tool: Union[DbTool, "ResolvedTool"], tool_result: "ToolResult", candidate: Optional[Any] = None) -> bool:
         """
         Extract structured content (if any) and validate it against ``tool.output_schema``.
 
@@ -780,7 +768,7 @@ class ToolService:
 
         # Add tag filtering if tags are provided
         if tags:
-            query = query.where(json_contains_expr(db, DbTool.tags, tags, match_any=True))
+            query = query.where(entity_tags_expr(DbTool.id, "tool", tags, match_any=True))
 
         # Fetch page_size + 1 to determine if there are more results
         query = query.limit(page_size + 1)
@@ -1119,6 +1107,68 @@ class ToolService:
             db.rollback()
             raise ToolError(f"Failed to toggle tool status: {str(e)}")
 
+    async def _resolve_tool(self, db: Session, name: str) -> "ResolvedTool":
+        """Resolve an enabled tool by name, serving repeat lookups from the tool lookup cache.
+
+        On a miss the tool and (for MCP tools) its enabled gateway are loaded and
+        copied into a ``ResolvedTool``; plugin metadata is built once here when
+        plugins are enabled.
+
+        Args:
+            db: Database session.
+            name: Name of tool to resolve.
+
+        Returns:
+            ResolvedTool: Detached snapshot of the tool and its gateway.
+
+        Raises:
+            ToolNotFoundError: If the tool does not exist or is inactive.
+            ToolInvocationError: If plugin metadata cannot be built for the tool.
+
+        Examples:
+            >>> from mcpgateway.services.tool_service import ToolService
+            >>> from unittest.mock import MagicMock
+            >>> service = ToolService()
+            >>> db = MagicMock()
+            >>> db.execute.return_value.scalar_one_or_none.return_value = None
+            >>> import asyncio
+            >>> asyncio.run(service._resolve_tool(db, 'missing'))
+            Traceback (most recent call last):
+            ...
+            mcpgateway.services.tool_service.ToolNotFoundError: Tool not found: missing
+        """
+        # pylint: disable=comparison-with-callable
+        # First-Party
+        from mcpgateway.cache.tool_lookup_cache import get_tool_lookup_cache, ResolvedTool  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        cache = get_tool_lookup_cache()
+        resolved = cache.get(name)
+        if resolved is not None and (self._plugin_manager is None or resolved.tool_metadata is not None):
+            return resolved
+
+        tool = db.execute(select(DbTool).where(DbTool.name == name).where(DbTool.enabled)).scalar_one_or_none()
+        if not tool:
+            inactive_tool = db.execute(select(DbTool).where(DbTool.name == name).where(not_(DbTool.enabled))).scalar_one_or_none()
+            if inactive_tool:
+                raise ToolNotFoundError(f"Tool '{name}' exists but is inactive")
+            raise ToolNotFoundError(f"Tool not found: {name}")
+
+        upstream = None
+        if tool.integration_type == "MCP":
+            upstream = db.execute(select(DbGateway).where(DbGateway.id == tool.gateway_id).where(DbGateway.enabled)).scalar_one_or_none()
+        resolved = ResolvedTool.from_db(tool, upstream)
+
+        if self._plugin_manager:
+            try:
+                resolved.tool_metadata = PydanticTool.model_validate(tool)
+                if upstream:
+                    resolved.gateway_metadata = PydanticGateway.model_validate(upstream)
+            except Exception as e:
+                raise ToolInvocationError(f"Tool invocation failed: {str(e)}")
+
+        cache.put(name, resolved)
+        return resolved
+
     async def invoke_tool(
         self,
         db: Session,
@@ -1165,14 +1215,8 @@ class ToolService:
             >>> isinstance(result, object)
             True
         """
-        # pylint: disable=comparison-with-callable
         logger.info(f"Invoking tool: {name} with arguments: {arguments.keys() if arguments else None} and headers: {request_headers.keys() if request_headers else None}")
-        tool = db.execute(select(DbTool).where(DbTool.name == name).where(DbTool.enabled)).scalar_one_or_none()
-        if not tool:
-            inactive_tool = db.execute(select(DbTool).where(DbTool.name == name).where(not_(DbTool.enabled))).scalar_one_or_none()
-            if inactive_tool:
-                raise ToolNotFoundError(f"Tool '{name}' exists but is inactive")
-            raise ToolNotFoundError(f"Tool not found: {name}")
+        tool = await self._resolve_tool(db, name)
 
         # is_reachable = db.execute(select(DbTool.reachable).where(slug_expr == name)).scalar_one_or_none()
         is_reachable = tool.reachable
@@ -1220,7 +1264,7 @@ class ToolService:
             try:
                 # Get combined headers for the tool including base headers, auth, and passthrough headers
                 # headers = self._get_combined_headers(db, tool, tool.headers or {}, request_headers)
-                headers = tool.headers or {}
+                headers = dict(tool.headers or {})
                 if tool.integration_type == "REST":
                     # Handle OAuth authentication for REST tools
                     if tool.auth_type == "oauth" and hasattr(tool, "oauth_config") and tool.oauth_config:
@@ -1231,18 +1275,18 @@ class ToolService:
                             logger.error(f"Failed to obtain OAuth access token for tool {tool.name}: {e}")
                             raise ToolInvocationError(f"OAuth authentication failed: {str(e)}")
                     else:
-                        credentials = decode_auth(tool.auth_value)
-                        # Filter out empty header names/values to avoid "Illegal header name" errors
-                        filtered_credentials = {k: v for k, v in credentials.items() if k and v}
-                        headers.update(filtered_credentials)
+                        if tool.auth_headers is None:
+                            credentials = decode_auth(tool.auth_value)
+                            # Filter out empty header names/values to avoid "Illegal header name" errors
+                            tool.auth_headers = {k: v for k, v in credentials.items() if k and v}
+                        headers.update(tool.auth_headers)
 
                     # Only call get_passthrough_headers if we actually have request headers to pass through
                     if request_headers:
                         headers = get_passthrough_headers(request_headers, headers, db)
 
                     if self._plugin_manager:
-                        tool_metadata = PydanticTool.model_validate(tool)
-                        global_context.metadata[TOOL_METADATA] = tool_metadata
+                        global_context.metadata[TOOL_METADATA] = tool.tool_metadata.model_copy(deep=True)
                         pre_result, context_table = await self._plugin_manager.invoke_hook(
                             ToolHookType.TOOL_PRE_INVOKE,
                             payload=ToolPreInvokePayload(name=name, args=arguments, headers=HttpHeaderPayload(root=headers)),
@@ -1289,6 +1333,9 @@ class ToolService:
                         response = await self._http_client.get(final_url, params=payload, headers=headers)
                     else:
                         response = await self._http_client.request(method, final_url, json=payload, headers=headers)
+                    if response.status_code == 401 and tool.auth_type == "oauth" and tool.oauth_config:
+                        # The cached access token was rejected; the next call fetches a new one
+                        await self.oauth_manager.invalidate_access_token(tool.oauth_config)
                     response.raise_for_status()
 
                     # Handle 204 No Content responses that have no body
@@ -1314,7 +1361,6 @@ class ToolService:
                             success = bool(valid)
                 elif tool.integration_type == "MCP":
                     transport = tool.request_type.lower()
-                    # gateway = db.execute(select(DbGateway).where(DbGateway.id == tool.gateway_id).where(DbGateway.enabled)).scalar_one_or_none()
                     gateway = tool.gateway
 
                     # Handle OAuth authentication for the gateway
@@ -1351,8 +1397,12 @@ class ToolService:
                             except Exception as e:
                                 logger.error(f"Failed to obtain OAuth access token for gateway {gateway.name}: {e}")
                                 raise ToolInvocationError(f"OAuth authentication failed for gateway: {str(e)}")
+                    elif gateway:
+                        if gateway.auth_headers is None:
+                            gateway.auth_headers = decode_auth(gateway.auth_value)
+                        headers = dict(gateway.auth_headers)
                     else:
-                        headers = decode_auth(gateway.auth_value if gateway else None)
+                        headers = decode_auth(None)
 
                     # Get combined headers including gateway auth and passthrough
                     if request_headers:
@@ -1418,6 +1468,9 @@ class ToolService:
                         Returns:
                             ToolResult: Result of tool call
                         """
+                        if settings.mcp_session_pool_enabled:
+                            async with get_mcp_session_pool().session(server_url, "sse", headers=headers, gateway_id=tool.gateway_id, httpx_client_factory=get_httpx_client_factory) as session:
+                                return await session.call_tool(tool.original_name, arguments)
                         async with sse_client(url=server_url, headers=headers, httpx_client_factory=get_httpx_client_factory) as streams:
                             async with ClientSession(*streams) as session:
                                 await session.initialize()
@@ -1434,21 +1487,23 @@ class ToolService:
                         Returns:
                             ToolResult: Result of tool call
                         """
+                        if settings.mcp_session_pool_enabled:
+                            async with get_mcp_session_pool().session(
+                                server_url, "streamablehttp", headers=headers, gateway_id=tool.gateway_id, httpx_client_factory=get_httpx_client_factory
+                            ) as session:
+                                return await session.call_tool(tool.original_name, arguments)
                         async with streamablehttp_client(url=server_url, headers=headers, httpx_client_factory=get_httpx_client_factory) as (read_stream, write_stream, _get_session_id):
                             async with ClientSession(read_stream, write_stream) as session:
                                 await session.initialize()
                                 tool_call_result = await session.call_tool(tool.original_name, arguments)
                         return tool_call_result
 
-                    tool_gateway_id = tool.gateway_id
-                    tool_gateway = db.execute(select(DbGateway).where(DbGateway.id == tool_gateway_id).where(DbGateway.enabled)).scalar_one_or_none()
+                    tool_gateway = tool.upstream
 
                     if self._plugin_manager:
-                        tool_metadata = PydanticTool.model_validate(tool)
-                        global_context.metadata[TOOL_METADATA] = tool_metadata
-                        if tool_gateway:
-                            gateway_metadata = PydanticGateway.model_validate(tool_gateway)
-                            global_context.metadata[GATEWAY_METADATA] = gateway_metadata
+                        global_context.metadata[TOOL_METADATA] = tool.tool_metadata.model_copy(deep=True)
+                        if tool.gateway_metadata is not None:
+                            global_context.metadata[GATEWAY_METADATA] = tool.gateway_metadata.model_copy(deep=True)
                         pre_result, context_table = await self._plugin_manager.invoke_hook(
                             ToolHookType.TOOL_PRE_INVOKE,
                             payload=ToolPreInvokePayload(name=name, args=arguments, headers=HttpHeaderPayload(root=headers)),
@@ -1810,9 +1865,21 @@ class ToolService:
         """
         Publish event to all subscribers via the EventService.
 
+        Every tool change is published through here, so it also drops the
+        tool from the lookup cache used by ``invoke_tool`` and the cached
+        ``tools/list`` snapshots.
+
         Args:
             event: Event to publish
         """
+        data = event.get("data")
+        if isinstance(data, dict) and data.get("id") is not None:
+            # First-Party
+            from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache  # pylint: disable=import-outside-toplevel
+            from mcpgateway.cache.tool_lookup_cache import get_tool_lookup_cache  # pylint: disable=import-outside-toplevel
+
+            await get_tool_lookup_cache().invalidate_tool(data["id"])
+            await get_catalog_snapshot_cache().invalidate("tools")
         await self._event_service.publish_event(event)
 
     async def _validate_tool_url(self, url: str) -> None:
@@ -1869,43 +1936,25 @@ class ToolService:
             db: Database session
 
         Returns:
-            Aggregated metrics computed from all ToolMetric records.
+            Aggregated metrics computed from the per-tool metric rollups.
 
         Examples:
             >>> from mcpgateway.services.tool_service import ToolService
             >>> from unittest.mock import MagicMock
             >>> service = ToolService()
             >>> db = MagicMock()
-            >>> db.execute.return_value.scalar.return_value = 0
+            >>> db.execute.return_value.one.return_value = (0, 0, 0, None, None, None, None)
             >>> import asyncio
             >>> result = asyncio.run(service.aggregate_metrics(db))
             >>> isinstance(result, dict)
             True
         """
 
-        total = db.execute(select(func.count(ToolMetric.id))).scalar() or 0  # pylint: disable=not-callable
-        successful = db.execute(select(func.count(ToolMetric.id)).where(ToolMetric.is_success.is_(True))).scalar() or 0  # pylint: disable=not-callable
-        failed = db.execute(select(func.count(ToolMetric.id)).where(ToolMetric.is_success.is_(False))).scalar() or 0  # pylint: disable=not-callable
-        failure_rate = failed / total if total > 0 else 0.0
-        min_rt = db.execute(select(func.min(ToolMetric.response_time))).scalar()
-        max_rt = db.execute(select(func.max(ToolMetric.response_time))).scalar()
-        avg_rt = db.execute(select(func.avg(ToolMetric.response_time))).scalar()
-        last_time = db.execute(select(func.max(ToolMetric.timestamp))).scalar()
-
-        return {
-            "total_executions": total,
-            "successful_executions": successful,
-            "failed_executions": failed,
-            "failure_rate": failure_rate,
-            "min_response_time": min_rt,
-            "max_response_time": max_rt,
-            "avg_response_time": avg_rt,
-            "last_execution_time": last_time,
-        }
+        return aggregate_rollups(db, "tool")
 
     async def reset_metrics(self, db: Session, tool_id: Optional[int] = None) -> None:
         """
-        Reset all tool metrics by deleting all records from the tool metrics table.
+        Reset all tool metrics by deleting raw metric records and rollups.
 
         Args:
             db: Database session
@@ -1922,10 +1971,7 @@ class ToolService:
             >>> asyncio.run(service.reset_metrics(db))
         """
 
-        if tool_id:
-            db.execute(delete(ToolMetric).where(ToolMetric.tool_id == tool_id))
-        else:
-            db.execute(delete(ToolMetric))
+        reset_rollups(db, "tool", tool_id or None)
         db.commit()
 
     async def create_tool_from_a2a_agent(
@@ -1998,7 +2044,7 @@ class ToolService:
             created_user_agent=created_user_agent,
         )
 
-    async def _invoke_a2a_tool(self, db: Session, tool: DbTool, arguments: Dict[str, Any]) -> ToolResult:
+    async def _invoke_a2a_tool(self, db: Session, tool: Union[DbTool, "ResolvedTool"], arguments: Dict[str, Any]) -> ToolResult:
         """Invoke an A2A agent through its corresponding tool.
 
         Args:
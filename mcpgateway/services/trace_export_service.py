@@ -0,0 +1,558 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/services/trace_export_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Trace Export Service.
+This module keeps the built-in observability store off the request path. While it
+is running, ``ObservabilityService`` hands traces, spans and events to an in-memory
+buffer instead of committing each one; a background task writes every completed
+trace (with its spans and events) in bulk inserts.
+
+Completed traces go through tail sampling: errors and traces slower than the
+latency threshold are always kept, the rest are kept at the tail sample rate.
+The buffer is bounded, so under overload new traces, spans and events are
+dropped and counted rather than growing memory without limit.
+
+Examples:
+    >>> exporter = TraceExportService(max_spans=100, batch_size=10, flush_interval=60)
+    >>> exporter.running
+    False
+    >>> exporter.get_metrics()["buffered"]
+    0
+"""
+
+# Standard
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import random
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Third-Party
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import ObservabilityEvent, ObservabilitySpan, ObservabilityTrace, SessionLocal
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+# Traces that never end (e.g. a worker died mid-request) are exported as-is after this long
+STALE_TRACE_SECONDS = 300
+
+
+def _utc_now() -> datetime:
+    """Return the current UTC time.
+
+    Returns:
+        datetime: Timezone-aware current time.
+    """
+    return datetime.now(timezone.utc)
+
+
+def _finish(row: Dict[str, Any], end_time: datetime, updates: Dict[str, Any], attributes: Optional[Dict[str, Any]], duration_ms: Optional[float] = None) -> None:
+    """Close a buffered trace or span row in place.
+
+    Args:
+        row: Column values of the trace or span
+        end_time: When the trace or span ended
+        updates: Column values to set (status, status message, ...)
+        attributes: Attributes to merge into the existing ones
+        duration_ms: Measured duration overriding ``end_time - start_time``
+
+    Examples:
+        >>> from datetime import timedelta
+        >>> start = _utc_now()
+        >>> row = {"start_time": start, "attributes": {"a": 1}}
+        >>> _finish(row, start + timedelta(milliseconds=5), {"status": "ok"}, {"b": 2})
+        >>> row["status"], row["duration_ms"], row["attributes"]
+        ('ok', 5.0, {'a': 1, 'b': 2})
+    """
+    start_time = row["start_time"]
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    row["end_time"] = end_time
+    row["duration_ms"] = duration_ms if duration_ms is not None else (end_time - start_time).total_seconds() * 1000
+    row.update(updates)
+    if attributes:
+        row["attributes"] = {**(row.get("attributes") or {}), **attributes}
+
+
+@dataclass
+class BufferedTrace:
+    """A trace held in memory together with its spans and events.
+
+    Attributes:
+        row: Column values of the trace
+        spans: Column values of the trace's spans
+        events: Column values of events attached to those spans
+        buffered_at: Monotonic time the trace entered the buffer
+    """
+
+    row: Dict[str, Any]
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    buffered_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        """Number of buffered rows (trace, spans and events).
+
+        Returns:
+            int: Rows this trace occupies in the buffer.
+        """
+        return 1 + len(self.spans) + len(self.events)
+
+
+@dataclass
+class ExportBatch:
+    """Everything collected from the buffer for one export.
+
+    Attributes:
+        traces: Completed (or stale) traces with their spans and events
+        spans: Spans whose trace was not buffered (started earlier or already exported)
+        events: Events whose span was not part of a buffered trace
+        trace_updates: Late ``end_trace`` calls for traces no longer buffered
+        span_updates: Late ``end_span`` calls for spans no longer buffered
+    """
+
+    traces: List[BufferedTrace] = field(default_factory=list)
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    trace_updates: List[Tuple[str, datetime, Dict[str, Any], Optional[Dict[str, Any]]]] = field(default_factory=list)
+    span_updates: List[Tuple[str, datetime, Dict[str, Any], Optional[Dict[str, Any]], Optional[float]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of rows and updates in the batch.
+
+        Returns:
+            int: Total rows and updates to write.
+        """
+        return sum(t.size for t in self.traces) + len(self.spans) + len(self.events) + len(self.trace_updates) + len(self.span_updates)
+
+
+class TraceExportService:
+    """Bounded in-memory trace buffer with a background bulk exporter.
+
+    The recording methods are thread-safe (the SQLAlchemy instrumentation records
+    spans from its own thread), never block on the database, and are only used while
+    the exporter is running; otherwise ``ObservabilityService`` writes directly.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> async def demo():
+        ...     exporter = TraceExportService(max_spans=100, batch_size=10, flush_interval=60, tail_sample_rate=1.0)
+        ...     with patch.object(exporter, "_write_batch") as write:
+        ...         await exporter.start()
+        ...         exporter.record_trace({"trace_id": "t1", "start_time": _utc_now(), "attributes": {}})
+        ...         exporter.record_span({"span_id": "s1", "trace_id": "t1", "start_time": _utc_now(), "attributes": {}})
+        ...         exporter.end_span("s1", {"status": "ok"})
+        ...         exporter.end_trace("t1", {"status": "ok"})
+        ...         await exporter.shutdown()
+        ...     batch = write.call_args.args[0]
+        ...     return [t.row["trace_id"] for t in batch.traces], batch.traces[0].spans[0]["status"]
+        >>> asyncio.run(demo())
+        (['t1'], 'ok')
+    """
+
+    def __init__(
+        self,
+        max_spans: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        tail_sample_rate: Optional[float] = None,
+        tail_latency_threshold_ms: Optional[float] = None,
+    ) -> None:
+        """Initialize the trace exporter.
+
+        Args:
+            max_spans: Maximum traces, spans and events held in memory
+            batch_size: Maximum traces written per transaction
+            flush_interval: Seconds between exports
+            tail_sample_rate: Fraction of successful, fast traces to keep
+            tail_latency_threshold_ms: Traces at least this slow are always kept
+        """
+        self.max_spans = max_spans or settings.observability_buffer_max_spans
+        self.batch_size = batch_size or settings.observability_export_batch_size
+        self.flush_interval = flush_interval or settings.observability_export_interval
+        self.tail_sample_rate = settings.observability_tail_sample_rate if tail_sample_rate is None else tail_sample_rate
+        self.tail_latency_threshold_ms = settings.observability_tail_latency_threshold_ms if tail_latency_threshold_ms is None else tail_latency_threshold_ms
+        self._lock = threading.Lock()
+        self._pending: Dict[str, BufferedTrace] = {}
+        self._ready: Deque[BufferedTrace] = deque()
+        self._spans: Dict[str, Dict[str, Any]] = {}
+        self._batch = ExportBatch()
+        self._size = 0
+        self._export_task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._counters = {"dropped": 0, "sampled_out": 0, "exported_traces": 0, "exported_rows": 0, "failed": 0, "exports": 0}
+
+    @property
+    def running(self) -> bool:
+        """Whether the background exporter is accepting traces.
+
+        Returns:
+            bool: True when ``ObservabilityService`` should buffer instead of writing.
+        """
+        return self._export_task is not None and not self._export_task.done()
+
+    async def start(self) -> None:
+        """Start the background export task."""
+        if self.running:
+            return
+        self._export_task = asyncio.create_task(self._export_loop())
+        logger.info(f"Trace exporter started (max buffered: {self.max_spans}, interval: {self.flush_interval}s, tail sample rate: {self.tail_sample_rate})")
+
+    async def shutdown(self) -> None:
+        """Stop the exporter and write everything still buffered, including unfinished traces."""
+        if self._export_task is None:
+            return
+        self._export_task.cancel()
+        try:
+            await self._export_task
+        except asyncio.CancelledError:
+            pass
+        self._export_task = None
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+        await self.flush(include_pending=True)
+        logger.info(f"Trace exporter shut down ({self._counters['exported_traces']} traces exported, {self._counters['dropped']} dropped, {self._counters['sampled_out']} sampled out)")
+
+    # ==============================
+    # Recording
+    # ==============================
+
+    def record_trace(self, row: Dict[str, Any]) -> None:
+        """Buffer a newly started trace.
+
+        Args:
+            row: Column values of the trace
+        """
+        with self._lock:
+            if self._size >= self.max_spans or row["trace_id"] in self._pending:
+                self._drop()
+                return
+            self._pending[row["trace_id"]] = BufferedTrace(row)
+            self._size += 1
+
+    def end_trace(self, trace_id: str, updates: Dict[str, Any], attributes: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Close a trace and queue it for export if tail sampling keeps it.
+
+        Args:
+            trace_id: Trace to close
+            updates: Column values to set (status, status message, HTTP status code)
+            attributes: Attributes to merge into the trace's attributes
+
+        Returns:
+            Optional[Dict[str, Any]]: The finished trace row, or None if the trace was no longer buffered.
+        """
+        end_time = _utc_now()
+        with self._lock:
+            trace = self._pending.pop(trace_id, None)
+            if trace is None:
+                self._queue_update(self._batch.trace_updates, (trace_id, end_time, updates, attributes))
+                return None
+            _finish(trace.row, end_time, updates, attributes)
+            if self._keep(trace.row):
+                self._ready.append(trace)
+            else:
+                self._counters["sampled_out"] += 1
+                self._size -= trace.size
+                for span in trace.spans:
+                    self._spans.pop(span["span_id"], None)
+        return trace.row
+
+    def record_span(self, row: Dict[str, Any]) -> None:
+        """Buffer a newly started span.
+
+        Args:
+            row: Column values of the span
+        """
+        with self._lock:
+            if self._size >= self.max_spans:
+                self._drop()
+                return
+            trace = self._pending.get(row["trace_id"])
+            if trace is not None:
+                trace.spans.append(row)
+            else:
+                self._batch.spans.append(row)
+            self._spans[row["span_id"]] = row
+            self._size += 1
+
+    def end_span(self, span_id: str, updates: Dict[str, Any], attributes: Optional[Dict[str, Any]] = None, duration_ms: Optional[float] = None) -> None:
+        """Close a span.
+
+        Args:
+            span_id: Span to close
+            updates: Column values to set (status, status message)
+            attributes: Attributes to merge into the span's attributes
+            duration_ms: Measured duration overriding ``end_time - start_time``
+        """
+        end_time = _utc_now()
+        with self._lock:
+            row = self._spans.get(span_id)
+            if row is None:
+                self._queue_update(self._batch.span_updates, (span_id, end_time, updates, attributes, duration_ms))
+                return
+            _finish(row, end_time, updates, attributes, duration_ms)
+
+    def record_event(self, row: Dict[str, Any]) -> None:
+        """Buffer a span event.
+
+        Args:
+            row: Column values of the event
+        """
+        with self._lock:
+            if self._size >= self.max_spans:
+                self._drop()
+                return
+            span = self._spans.get(row["span_id"])
+            trace = self._pending.get(span["trace_id"]) if span is not None else None
+            if trace is not None:
+                trace.events.append(row)
+            else:
+                self._batch.events.append(row)
+            self._size += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return exporter counters for the ``/metrics`` endpoint.
+
+        Returns:
+            Dict[str, Any]: Buffer occupancy and export/drop/sampling counters.
+
+        Examples:
+            >>> sorted(TraceExportService(max_spans=1, batch_size=1, flush_interval=1).get_metrics())
+            ['buffered', 'dropped', 'exported_rows', 'exported_traces', 'exports', 'failed', 'max_buffered', 'pending_traces', 'running', 'sampled_out']
+        """
+        with self._lock:
+            return {"running": self.running, "buffered": self._size, "max_buffered": self.max_spans, "pending_traces": len(self._pending), **self._counters}
+
+    # ==============================
+    # Export
+    # ==============================
+
+    async def flush(self, include_pending: bool = False) -> None:
+        """Export completed traces and orphaned rows, counting failures instead of raising.
+
+        Args:
+            include_pending: Also export traces that have not ended yet (used at shutdown)
+        """
+        batch = self._collect(include_pending)
+        if not len(batch):
+            return
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+            with self._lock:
+                self._counters["exports"] += 1
+        except Exception as e:
+            with self._lock:
+                self._counters["failed"] += len(batch)
+            logger.error(f"Failed to export {len(batch)} buffered trace rows: {e}")
+
+    async def _export_loop(self) -> None:
+        """Export buffered traces every flush interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            # Shielded so cancelling the loop at shutdown never abandons a half-written export
+            self._inflight = asyncio.ensure_future(self.flush())
+            await asyncio.shield(self._inflight)
+
+    def _collect(self, include_pending: bool) -> ExportBatch:
+        """Take everything that is ready for export out of the buffer.
+
+        Args:
+            include_pending: Also take traces that have not ended yet
+
+        Returns:
+            ExportBatch: Rows and updates to write.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for trace_id in [tid for tid, t in self._pending.items() if include_pending or now - t.buffered_at > STALE_TRACE_SECONDS]:
+                self._ready.append(self._pending.pop(trace_id))
+            batch, self._batch = self._batch, ExportBatch()
+            batch.traces = list(self._ready)
+            self._ready.clear()
+            for span in batch.spans + [s for t in batch.traces for s in t.spans]:
+                self._spans.pop(span["span_id"], None)
+            self._size -= len(batch)
+            return batch
+
+    def _write_batch(self, batch: ExportBatch) -> None:
+        """Bulk insert a batch of traces, spans and events.
+
+        Completed traces are written ``batch_size`` at a time, one transaction each. A
+        chunk that fails (e.g. a duplicate external trace id) is retried trace by trace
+        so one bad trace does not lose the rest. Orphaned spans and events are only
+        written when their parent row exists.
+
+        Args:
+            batch: Rows and updates to write
+        """
+        with SessionLocal() as db:
+            for i in range(0, len(batch.traces), self.batch_size):
+                chunk = batch.traces[i : i + self.batch_size]
+                try:
+                    self._insert_traces(db, chunk)
+                    db.commit()
+                    self._count_exported(chunk)
+                except Exception:
+                    db.rollback()
+                    for trace in chunk:
+                        try:
+                            self._insert_traces(db, [trace])
+                            db.commit()
+                            self._count_exported([trace])
+                        except Exception as e:
+                            db.rollback()
+                            with self._lock:
+                                self._counters["failed"] += trace.size
+                            logger.warning(f"Failed to export trace {trace.row['trace_id']}: {e}")
+            self._write_orphans(db, batch)
+            db.commit()
+
+    def _insert_traces(self, db: Session, traces: List[BufferedTrace]) -> None:
+        """Insert traces with their spans and events.
+
+        Args:
+            db: Database session
+            traces: Traces to insert
+        """
+        db.execute(insert(ObservabilityTrace), [t.row for t in traces])
+        # Parents start before their children, so start order satisfies the parent span foreign key
+        spans = sorted((s for t in traces for s in t.spans), key=lambda s: s["start_time"])
+        if spans:
+            db.execute(insert(ObservabilitySpan), spans)
+        events = [e for t in traces for e in t.events]
+        if events:
+            db.execute(insert(ObservabilityEvent), events)
+
+    def _count_exported(self, traces: List[BufferedTrace]) -> None:
+        """Count traces (and their rows) that were committed.
+
+        Args:
+            traces: Traces that were written
+        """
+        with self._lock:
+            self._counters["exported_traces"] += len(traces)
+            self._counters["exported_rows"] += sum(t.size for t in traces)
+
+    def _write_orphans(self, db: Session, batch: ExportBatch) -> None:
+        """Write spans, events and late updates that arrived outside a buffered trace.
+
+        Args:
+            db: Database session
+            batch: Rows and updates to write
+        """
+        if batch.spans:
+            known = set(db.execute(select(ObservabilityTrace.trace_id).where(ObservabilityTrace.trace_id.in_({s["trace_id"] for s in batch.spans}))).scalars())
+            spans = sorted((s for s in batch.spans if s["trace_id"] in known), key=lambda s: s["start_time"])
+            if spans:
+                db.execute(insert(ObservabilitySpan), spans)
+            with self._lock:
+                self._counters["exported_rows"] += len(spans)
+        if batch.events:
+            known = set(db.execute(select(ObservabilitySpan.span_id).where(ObservabilitySpan.span_id.in_({e["span_id"] for e in batch.events}))).scalars())
+            events = [e for e in batch.events if e["span_id"] in known]
+            if events:
+                db.execute(insert(ObservabilityEvent), events)
+            with self._lock:
+                self._counters["exported_rows"] += len(events)
+        for trace_id, end_time, updates, attributes in batch.trace_updates:
+            trace = db.query(ObservabilityTrace).filter_by(trace_id=trace_id).first()
+            if trace is not None:
+                self._apply_update(trace, end_time, updates, attributes)
+        for span_id, end_time, updates, attributes, duration_ms in batch.span_updates:
+            span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
+            if span is not None:
+                self._apply_update(span, end_time, updates, attributes, duration_ms)
+
+    @staticmethod
+    def _apply_update(obj: Any, end_time: datetime, updates: Dict[str, Any], attributes: Optional[Dict[str, Any]], duration_ms: Optional[float] = None) -> None:
+        """Apply a late end to a trace or span that has already been written.
+
+        Args:
+            obj: ORM trace or span
+            end_time: When it ended
+            updates: Column values to set
+            attributes: Attributes to merge
+            duration_ms: Measured duration overriding ``end_time - start_time``
+        """
+        row = {"start_time": obj.start_time, "attributes": obj.attributes}
+        _finish(row, end_time, updates, attributes, duration_ms)
+        for key, value in row.items():
+            if key != "start_time":
+                setattr(obj, key, value)
+
+    def _keep(self, row: Dict[str, Any]) -> bool:
+        """Tail sampling decision for a completed trace.
+
+        Args:
+            row: Column values of the completed trace
+
+        Returns:
+            bool: True if the trace should be exported.
+        """
+        if row.get("status") == "error" or self.tail_sample_rate >= 1.0:
+            return True
+        if self.tail_latency_threshold_ms and (row.get("duration_ms") or 0) >= self.tail_latency_threshold_ms:
+            return True
+        return random.random() < self.tail_sample_rate  # noqa: DUO102 # nosec B311 - sampling, not security
+
+    def _queue_update(self, updates: List[Any], update: Any) -> None:
+        """Queue a late end for a row that is no longer buffered (caller holds the lock).
+
+        Args:
+            updates: Queue to append to
+            update: The update to queue
+        """
+        if self._size >= self.max_spans:
+            self._drop()
+            return
+        updates.append(update)
+        self._size += 1
+
+    def _drop(self) -> None:
+        """Count a dropped row and warn periodically (caller holds the lock)."""
+        self._counters["dropped"] += 1
+        dropped = self._counters["dropped"]
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(f"Trace buffer full ({self.max_spans} rows); {dropped} trace rows dropped so far")
+
+
+_trace_export_service: Optional[TraceExportService] = None
+
+
+def get_trace_export_service() -> TraceExportService:
+    """Get the global TraceExportService singleton instance.
+
+    Returns:
+        The global TraceExportService instance
+    """
+    global _trace_export_service  # pylint: disable=global-statement
+    if _trace_export_service is None:
+        _trace_export_service = TraceExportService()
+    return _trace_export_service
+
+
+def set_trace_export_service(service: Optional[TraceExportService]) -> None:
+    """Set the global TraceExportService instance.
+
+    This is primarily used for testing to inject mock exporters.
+
+    Args:
+        service: The TraceExportService instance to use globally
+    """
+    global _trace_export_service  # pylint: disable=global-statement
+    _trace_export_service = service
@@ -118,13 +118,15 @@ from __future__ import annotations
 import argparse
 import asyncio
 from contextlib import suppress
+from dataclasses import dataclass, field
 import json
 import logging
 import os
 import shlex
 import signal
 import sys
-from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+import time
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 from urllib.parse import urlencode
 import uuid
 
@@ -493,6 +495,22 @@ class StdIOEndpoint:
         """
         return self._proc is not None
 
+    async def wait(self) -> Optional[int]:
+        """Wait for the subprocess to exit.
+
+        Returns:
+            The exit code, or None if no subprocess is running.
+
+        Examples:
+            >>> import asyncio
+            >>> asyncio.run(StdIOEndpoint("cat", _PubSub()).wait()) is None
+            True
+        """
+        proc = self._proc
+        if proc is None:
+            return None
+        return await proc.wait()
+
     async def send(self, raw: str) -> None:
         """Send data to the subprocess stdin.
 
@@ -550,6 +568,558 @@ class StdIOEndpoint:
             raise
 
 
+# ---------------------------------------------------------------------------#
+# StdIO worker pool (many sessions ↔ many child processes)                   #
+# ---------------------------------------------------------------------------#
+@dataclass
+class _PoolWorker:
+    """One child process of a ``StdIOPool``.
+
+    Attributes:
+        endpoint: The stdio endpoint running the child process.
+        pubsub: Private pub/sub the endpoint publishes stdout lines to.
+        env_vars: Extra environment the process was started with (sessions only share equal environments).
+        sessions: IDs of the sessions bound to this worker.
+        pending: Outstanding requests by rewritten id: ``(session_id, original_id, future)``.
+        next_id: Next rewritten request id.
+        last_used: Monotonic time of the last message sent or session released.
+        tasks: Router and supervisor tasks.
+        stopping: Set once the worker is being shut down on purpose.
+    """
+
+    endpoint: StdIOEndpoint
+    pubsub: _PubSub
+    env_vars: Dict[str, str]
+    sessions: Set[str] = field(default_factory=set)
+    pending: Dict[int, Tuple[str, Any, Optional["asyncio.Future[Any]"]]] = field(default_factory=dict)
+    next_id: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    tasks: List["asyncio.Task[None]"] = field(default_factory=list)
+    stopping: bool = False
+
+
+@dataclass
+class _PoolSession:
+    """A client session bound to a pool worker.
+
+    Attributes:
+        worker: The worker the session has affinity to.
+        queue: Queue receiving the session's messages, or None when responses are awaited per request.
+        last_used: Monotonic time of the last message sent.
+        dropped: Messages dropped because the session's queue was full.
+    """
+
+    worker: _PoolWorker
+    queue: Optional["asyncio.Queue[str]"]
+    last_used: float = field(default_factory=time.monotonic)
+    dropped: int = 0
+
+
+class StdIOPool:
+    """Serve many client sessions from a pool of stdio server processes.
+
+    Each session is bound to one worker process for its whole lifetime (session
+    affinity). A session gets an idle worker when there is one, a new worker while
+    the pool is below ``max_workers``, and otherwise shares the least-loaded worker.
+    Sessions that share a worker stay isolated on the wire: request ids are rewritten
+    to worker-unique ids on the way in and restored on the way out, so every response
+    reaches only the session that asked for it. Notifications and server-initiated
+    requests go to all sessions of the worker.
+
+    Sessions that carry dynamic environment variables (``header_mappings``) only share
+    workers started with the same environment. Workers that exit unexpectedly are
+    restarted and their outstanding requests are answered with an error; workers idle
+    for ``idle_timeout`` seconds are stopped down to ``min_workers``.
+
+    Examples:
+        >>> pool = StdIOPool("cat", min_workers=1, max_workers=4)
+        >>> pool.has_session("abc")
+        False
+        >>> StdIOPool("cat", min_workers=3, max_workers=2)
+        Traceback (most recent call last):
+        ...
+        ValueError: max_workers must be >= max(min_workers, 1)
+    """
+
+    def __init__(
+        self,
+        cmd: str,
+        min_workers: int = 1,
+        max_workers: int = 4,
+        idle_timeout: float = 300.0,
+        header_mappings: Optional[Dict[str, str]] = None,
+        restart_delay: float = 1.0,
+    ) -> None:
+        """Configure the pool; no process is started until ``start()``.
+
+        Args:
+            cmd: The command line of the stdio server.
+            min_workers: Workers kept running even when idle.
+            max_workers: Upper bound on concurrently running workers.
+            idle_timeout: Seconds a worker without sessions is kept before it is stopped.
+            header_mappings: Optional mapping of HTTP headers to environment variables.
+            restart_delay: Initial delay before restarting a crashed worker; doubles on repeated failures.
+
+        Raises:
+            ValueError: If the pool bounds are inconsistent.
+        """
+        if max_workers < max(min_workers, 1):
+            raise ValueError("max_workers must be >= max(min_workers, 1)")
+        self._cmd = cmd
+        self._min_workers = min_workers
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._header_mappings = header_mappings
+        self._restart_delay = restart_delay
+        self._workers: List[_PoolWorker] = []
+        self._sessions: Dict[str, _PoolSession] = {}
+        self._lock = asyncio.Lock()
+        self._reaper_task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+        self._dropped = 0
+
+    async def start(self) -> None:
+        """Start ``min_workers`` workers and the idle reaper."""
+        self._closed = False
+        async with self._lock:
+            while len(self._workers) < self._min_workers:
+                await self._spawn({})
+        self._reaper_task = asyncio.create_task(self._reap_idle())
+
+    async def stop(self) -> None:
+        """Stop every worker and the idle reaper."""
+        self._closed = True
+        if self._reaper_task:
+            self._reaper_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reaper_task
+            self._reaper_task = None
+        async with self._lock:
+            for worker in list(self._workers):
+                await self._stop_worker(worker)
+        self._sessions.clear()
+
+    def has_session(self, session_id: str) -> bool:
+        """Return whether a session is open.
+
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            bool: True if the session is bound to a worker.
+        """
+        return session_id in self._sessions
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool counters.
+
+        Returns:
+            Dict[str, int]: Running workers, open sessions and messages dropped for slow sessions.
+
+        Examples:
+            >>> StdIOPool("cat").stats()
+            {'workers': 0, 'sessions': 0, 'dropped_messages': 0}
+        """
+        return {"workers": len(self._workers), "sessions": len(self._sessions), "dropped_messages": self._dropped}
+
+    async def open_session(self, session_id: str, env_vars: Optional[Dict[str, str]] = None, stream: bool = True) -> Optional["asyncio.Queue[str]"]:
+        """Bind a new session to a worker.
+
+        Args:
+            session_id: Session identifier.
+            env_vars: Environment the session's worker must run with.
+            stream: Whether the session receives its messages through a queue; when False,
+                responses are only delivered to ``request()`` callers.
+
+        Returns:
+            The queue receiving the session's messages, or None when ``stream`` is False.
+
+        Raises:
+            RuntimeError: If every worker is busy with a different environment.
+        """
+        async with self._lock:
+            worker = await self._assign(env_vars or {})
+            worker.sessions.add(session_id)
+            queue: Optional[asyncio.Queue[str]] = asyncio.Queue(maxsize=1024) if stream else None
+            self._sessions[session_id] = _PoolSession(worker=worker, queue=queue)
+        return queue
+
+    def close_session(self, session_id: str) -> None:
+        """Release a session; its worker becomes idle when no other session uses it.
+
+        Args:
+            session_id: Session identifier (unknown ids are ignored).
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        worker = session.worker
+        worker.sessions.discard(session_id)
+        worker.last_used = time.monotonic()
+        for request_id, (owner, _original_id, future) in list(worker.pending.items()):
+            if owner == session_id and future is None:
+                del worker.pending[request_id]
+
+    async def send(self, session_id: str, message: Any) -> None:
+        """Send a JSON-RPC message or batch from a session to its worker.
+
+        Args:
+            session_id: Session identifier.
+            message: Parsed JSON-RPC message or batch.
+
+        Raises:
+            KeyError: If the session is not open.
+        """
+        session = self._sessions[session_id]
+        worker = session.worker
+        if isinstance(message, list):
+            outbound: Any = [self._outbound(worker, session_id, item) for item in message]
+        else:
+            outbound = self._outbound(worker, session_id, message)
+        await self._write(session, outbound)
+
+    async def request(self, session_id: str, message: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """Send a JSON-RPC request from a session and wait for its response.
+
+        Args:
+            session_id: Session identifier.
+            message: JSON-RPC request with ``method`` and ``id``.
+            timeout: Seconds to wait for the response.
+
+        Returns:
+            The response with the caller's original id, or None on timeout.
+
+        Raises:
+            KeyError: If the session is not open.
+        """
+        session = self._sessions[session_id]
+        worker = session.worker
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        request_id = self._register(worker, session_id, message["id"], future)
+        await self._write(session, {**message, "id": request_id})
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            worker.pending.pop(request_id, None)
+            return None
+
+    async def _write(self, session: _PoolSession, message: Any) -> None:
+        """Write a message to a session's worker.
+
+        Args:
+            session: The sending session.
+            message: The message with rewritten ids.
+        """
+        worker = session.worker
+        session.last_used = worker.last_used = time.monotonic()
+        try:
+            await worker.endpoint.send(json.dumps(message) + "\n")
+        except (OSError, RuntimeError) as exc:
+            # The process died (or is restarting); answer its requests instead of leaving them pending
+            LOGGER.warning(f"stdio pool: write to worker failed: {exc}")
+            self._fail_pending(worker, "stdio server unavailable")
+
+    @staticmethod
+    def _register(worker: _PoolWorker, session_id: str, original_id: Any, future: Optional["asyncio.Future[Any]"] = None) -> int:
+        """Allocate a worker-unique request id.
+
+        Args:
+            worker: The worker the request goes to.
+            session_id: The session the response belongs to.
+            original_id: The id the session used.
+            future: Optional future resolved with the response instead of queueing it.
+
+        Returns:
+            int: The rewritten id.
+        """
+        request_id = worker.next_id
+        worker.next_id += 1
+        worker.pending[request_id] = (session_id, original_id, future)
+        return request_id
+
+    def _outbound(self, worker: _PoolWorker, session_id: str, message: Any) -> Any:
+        """Rewrite the id of a request; other messages pass through unchanged.
+
+        Args:
+            worker: The worker the message goes to.
+            session_id: The sending session.
+            message: One JSON-RPC message.
+
+        Returns:
+            The message to write to the worker.
+        """
+        if isinstance(message, dict) and "method" in message and message.get("id") is not None:
+            return {**message, "id": self._register(worker, session_id, message["id"])}
+        return message
+
+    async def _assign(self, env_vars: Dict[str, str]) -> _PoolWorker:
+        """Pick the worker for a new session (the caller holds the lock).
+
+        Args:
+            env_vars: Environment the worker must run with.
+
+        Returns:
+            _PoolWorker: The chosen worker.
+
+        Raises:
+            RuntimeError: If every worker is busy with a different environment.
+        """
+        candidates = [worker for worker in self._workers if worker.env_vars == env_vars and not worker.stopping]
+        idle = [worker for worker in candidates if not worker.sessions]
+        if idle:
+            return idle[0]
+        if len(self._workers) < self._max_workers:
+            return await self._spawn(env_vars)
+        if candidates:
+            return min(candidates, key=lambda worker: len(worker.sessions))
+        # Replace an idle worker that runs with a different environment
+        for worker in self._workers:
+            if not worker.sessions:
+                await self._stop_worker(worker)
+                return await self._spawn(env_vars)
+        raise RuntimeError(f"All {self._max_workers} stdio workers are busy")
+
+    async def _spawn(self, env_vars: Dict[str, str]) -> _PoolWorker:
+        """Start a new worker (the caller holds the lock).
+
+        Args:
+            env_vars: Extra environment for the process.
+
+        Returns:
+            _PoolWorker: The running worker.
+        """
+        pubsub = _PubSub()
+        worker = _PoolWorker(endpoint=StdIOEndpoint(self._cmd, pubsub, header_mappings=self._header_mappings), pubsub=pubsub, env_vars=dict(env_vars))
+        output = pubsub.subscribe()  # subscribe first so no early output is missed
+        await worker.endpoint.start(env_vars or None)
+        worker.tasks = [asyncio.create_task(self._route(worker, output)), asyncio.create_task(self._supervise(worker))]
+        self._workers.append(worker)
+        LOGGER.info(f"stdio pool: started worker {len(self._workers)}/{self._max_workers}")
+        return worker
+
+    async def _stop_worker(self, worker: _PoolWorker) -> None:
+        """Stop a worker and answer its outstanding requests (the caller holds the lock).
+
+        Args:
+            worker: The worker to stop.
+        """
+        worker.stopping = True
+        with suppress(ValueError):
+            self._workers.remove(worker)
+        await worker.endpoint.stop()
+        for task in worker.tasks:
+            task.cancel()
+        for task in worker.tasks:
+            with suppress(BaseException):
+                await task
+        self._fail_pending(worker, "stdio server stopped")
+
+    def _deliver(self, session_id: str, data: str) -> None:
+        """Queue a message for a session, dropping it if the session is too slow.
+
+        Args:
+            session_id: Target session.
+            data: Serialized message.
+        """
+        session = self._sessions.get(session_id)
+        if session is None or session.queue is None:
+            return
+        try:
+            session.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            session.dropped += 1
+            self._dropped += 1
+            # Log the first drop and then every 100th so a stalled client cannot flood the log
+            if session.dropped % 100 == 1:
+                LOGGER.warning(f"stdio pool: session {session_id} is not reading its messages; dropped {session.dropped} so far")
+
+    def _resolve(self, worker: _PoolWorker, message: Any) -> Optional[Tuple[str, Optional["asyncio.Future[Any]"]]]:
+        """Match a response to its request and restore the original id.
+
+        Args:
+            worker: The worker that produced the message.
+            message: One JSON-RPC message from the worker.
+
+        Returns:
+            The owning session and optional waiting future, or None if the message is not a response to a pool request.
+        """
+        if not isinstance(message, dict) or "method" in message or not isinstance(message.get("id"), int):
+            return None
+        entry = worker.pending.pop(message["id"], None)
+        if entry is None:
+            return None
+        session_id, original_id, future = entry
+        message["id"] = original_id
+        return session_id, future
+
+    async def _route(self, worker: _PoolWorker, output: "asyncio.Queue[str]") -> None:
+        """Route a worker's stdout lines to the sessions they belong to.
+
+        Args:
+            worker: The worker to read from.
+            output: Subscription to the worker's stdout.
+        """
+        while True:
+            line = await output.get()
+            try:
+                parsed = json.loads(line)
+            except (json.JSONDecodeError, ValueError):
+                parsed = None
+
+            items = parsed if isinstance(parsed, list) else [parsed]
+            routed: Dict[str, List[Any]] = {}
+            unrouted: List[Any] = []
+            for item in items:
+                target = self._resolve(worker, item)
+                if target is None:
+                    unrouted.append(item)
+                    continue
+                session_id, future = target
+                if future is not None:
+                    if not future.done():
+                        future.set_result(item)
+                else:
+                    routed.setdefault(session_id, []).append(item)
+
+            for session_id, responses in routed.items():
+                self._deliver(session_id, json.dumps(responses if isinstance(parsed, list) else responses[0]))
+            if unrouted:
+                # Notifications, server requests and non-JSON output go to every session of the worker
+                data = line.rstrip() if parsed is None or len(unrouted) == len(items) else json.dumps(unrouted)
+                for session_id in list(worker.sessions):
+                    self._deliver(session_id, data)
+
+    def _fail_pending(self, worker: _PoolWorker, reason: str) -> None:
+        """Answer every outstanding request of a worker with an error.
+
+        Args:
+            worker: The worker whose requests are lost.
+            reason: Error message.
+        """
+        pending, worker.pending = worker.pending, {}
+        for session_id, original_id, future in pending.values():
+            error = {"jsonrpc": "2.0", "id": original_id, "error": {"code": -32603, "message": reason}}
+            if future is not None:
+                if not future.done():
+                    future.set_result(error)
+            else:
+                self._deliver(session_id, json.dumps(error))
+
+    async def _supervise(self, worker: _PoolWorker) -> None:
+        """Restart a worker whose process exits unexpectedly.
+
+        Args:
+            worker: The worker to watch.
+        """
+        delay = self._restart_delay
+        while not worker.stopping and not self._closed:
+            returncode = await worker.endpoint.wait()
+            if worker.stopping or self._closed:
+                return
+            LOGGER.warning(f"stdio pool: worker exited with code {returncode}, restarting in {delay:.1f}s")
+            self._fail_pending(worker, "stdio server exited")
+            await asyncio.sleep(delay)
+            if worker.stopping or self._closed:
+                return
+            try:
+                await worker.endpoint.start(worker.env_vars or None)
+                delay = self._restart_delay
+            except Exception as exc:
+                LOGGER.error(f"stdio pool: failed to restart worker: {exc}")
+                delay = min(delay * 2, 30.0)
+
+    async def _reap_idle(self) -> None:
+        """Stop idle workers above ``min_workers`` and expire idle request-only sessions."""
+        while True:
+            await asyncio.sleep(max(1.0, self._idle_timeout / 2))
+            now = time.monotonic()
+            for session_id, session in list(self._sessions.items()):
+                if session.queue is None and now - session.last_used > self._idle_timeout:
+                    self.close_session(session_id)
+            async with self._lock:
+                for worker in [worker for worker in self._workers if not worker.sessions and now - worker.last_used > self._idle_timeout]:
+                    if len(self._workers) <= self._min_workers:
+                        break
+                    LOGGER.info("stdio pool: stopping idle worker")
+                    await self._stop_worker(worker)
+
+
+def _is_initialize(message: Any) -> bool:
+    """Return whether a JSON-RPC message or batch contains an ``initialize`` request.
+
+    Args:
+        message: Parsed JSON-RPC message or batch.
+
+    Returns:
+        bool: True if a session should be created for the message.
+
+    Examples:
+        >>> _is_initialize({"jsonrpc": "2.0", "id": 1, "method": "initialize"})
+        True
+        >>> _is_initialize([{"jsonrpc": "2.0", "id": 1, "method": "initialize"}])
+        True
+        >>> _is_initialize({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+        False
+    """
+    items = message if isinstance(message, list) else [message]
+    return any(isinstance(item, dict) and item.get("method") == "initialize" for item in items)
+
+
+async def _pool_streamable_post(
+    pool: StdIOPool,
+    headers: Mapping[str, str],
+    message: Any,
+    header_mappings: Optional[Dict[str, str]] = None,
+    stateless: bool = False,
+    timeout: float = 10.0,
+) -> Response:
+    """Forward a streamable HTTP POST through the worker pool.
+
+    An ``initialize`` request without an ``Mcp-Session-Id`` opens a session and
+    returns its id in the ``Mcp-Session-Id`` response header; later requests that
+    carry the id keep affinity to the same worker. Other requests without an id
+    (and every request when ``stateless``) use a one-off session.
+
+    Args:
+        pool: The running worker pool.
+        headers: Request headers (case-insensitive lookups of lower-case names).
+        message: The parsed JSON-RPC message or batch.
+        header_mappings: Optional mapping of HTTP headers to environment variables.
+        stateless: Whether to skip session creation.
+        timeout: Seconds to wait for the response of a request.
+
+    Returns:
+        Response: The matched JSON response, or 202 Accepted.
+    """
+    session_key = headers.get("mcp-session-id")
+    created = session_key is None and not stateless and _is_initialize(message)
+    transient = session_key is None and not created
+    session_key = session_key or uuid.uuid4().hex
+    if not pool.has_session(session_key):
+        env_vars = extract_env_vars_from_headers(dict(headers), header_mappings) if header_mappings else {}
+        try:
+            await pool.open_session(session_key, env_vars, stream=False)
+        except RuntimeError as exc:
+            return PlainTextResponse(str(exc), status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        response: Response
+        if isinstance(message, dict) and "method" in message and message.get("id") is not None:
+            result = await pool.request(session_key, message, timeout=timeout)
+            if result is not None:
+                response = JSONResponse(result)
+            else:
+                response = PlainTextResponse("accepted (no response yet)", status_code=status.HTTP_202_ACCEPTED)
+        else:
+            await pool.send(session_key, message)
+            response = PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
+        if created:
+            response.headers["mcp-session-id"] = session_key
+        return response
+    finally:
+        if transient:
+            pool.close_session(session_key)
+
+
 # ---------------------------------------------------------------------------#
 # SSE Event Parser                                                           #
 # ---------------------------------------------------------------------------#
@@ -957,6 +1527,11 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         >>> args = _parse_args(["--connect-sse", "http://example.com/sse"])
         >>> args.stdioCommand is None
         True
+
+        >>> # Test stdio worker pool
+        >>> args = _parse_args(["--stdio", "cat", "--pool-max-workers", "8", "--pool-min-workers", "2"])
+        >>> args.pool_max_workers, args.pool_min_workers, args.pool_idle_timeout
+        (8, 2, 300.0)
     """
     p = argparse.ArgumentParser(
         prog="mcpgateway.translate",
@@ -1038,6 +1613,11 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         help="Return JSON responses instead of SSE streams for streamable HTTP (default: False)",
     )
 
+    # stdio worker pool
+    p.add_argument("--pool-max-workers", type=int, default=0, help="Run up to N stdio server processes with per-session routing (default: 0, one shared process)")
+    p.add_argument("--pool-min-workers", type=int, default=1, help="stdio worker processes kept running when idle (default: 1)")
+    p.add_argument("--pool-idle-timeout", type=float, default=300.0, help="Seconds before an idle stdio worker is stopped (default: 300)")
+
     args = p.parse_args(argv)
     # streamableHttp is now supported, no need to raise NotImplementedError
     return args
@@ -1778,9 +2358,17 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     stateless: bool = False,
     json_response: bool = False,
     header_mappings: Optional[Dict[str, str]] = None,
+    pool_min_workers: int = 1,
+    pool_max_workers: int = 0,
+    pool_idle_timeout: float = 300.0,
 ) -> None:
     """Run a stdio server and expose it via multiple protocols simultaneously.
 
+    With ``pool_max_workers`` > 0 the command runs in a ``StdIOPool``: every SSE
+    session (and every streamable HTTP ``Mcp-Session-Id``) is bound to one of up to
+    ``pool_max_workers`` processes and only receives its own responses. Otherwise a
+    single process is shared and its output is broadcast to every SSE client.
+
     Args:
         cmd: The command to run as a stdio subprocess.
         port: The port to bind the HTTP server to.
@@ -1795,12 +2383,18 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         stateless: Whether to use stateless mode for streamable HTTP.
         json_response: Whether to return JSON responses for streamable HTTP.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        pool_min_workers: Pool workers kept running when idle.
+        pool_max_workers: Maximum pool workers; 0 disables the pool.
+        pool_idle_timeout: Seconds before an idle pool worker is stopped.
     """
     LOGGER.info(f"Starting multi-protocol server for command: {cmd}")
     LOGGER.info(f"Protocols: SSE={expose_sse}, StreamableHTTP={expose_streamable_http}")
 
+    # A worker pool replaces the single shared process when configured
+    pool = StdIOPool(cmd, pool_min_workers, pool_max_workers, pool_idle_timeout, header_mappings=header_mappings) if pool_max_workers > 0 and (expose_sse or expose_streamable_http) else None
+
     # Create a shared pubsub whenever either protocol needs stdout observations
-    pubsub = _PubSub() if (expose_sse or expose_streamable_http) else None
+    pubsub = _PubSub() if (expose_sse or expose_streamable_http) and not pool else None
 
     # Create the stdio endpoint
     stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings) if (expose_sse or expose_streamable_http) and pubsub else None
@@ -1821,9 +2415,11 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     # Start stdio if at least one transport requires it
     if stdio:
         await stdio.start()
+    if pool:
+        await pool.start()
 
     # SSE endpoints
-    if expose_sse and stdio and pubsub:
+    if expose_sse and (pool or (stdio and pubsub)):
 
         @app.get(sse_path)
         async def get_sse(request: Request) -> EventSourceResponse:
@@ -1834,24 +2430,35 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
 
             Returns:
                 EventSourceResponse: Server-sent events stream.
+
+            Raises:
+                RuntimeError: If neither a pool nor a shared stdio endpoint is available.
             """
-            if not pubsub:
-                raise RuntimeError("PubSub not available")
+            session_id = uuid.uuid4().hex
+            if pool:
+                # The session gets its own worker (or a share of one) for its lifetime
+                env_vars = extract_env_vars_from_headers(dict(request.headers), header_mappings) if header_mappings else {}
+                try:
+                    queue = await pool.open_session(session_id, env_vars)
+                except RuntimeError as exc:
+                    return PlainTextResponse(str(exc), status_code=status.HTTP_503_SERVICE_UNAVAILABLE)  # type: ignore[return-value]
+            else:
+                if not pubsub:
+                    raise RuntimeError("PubSub not available")
 
-            # Extract environment variables from headers if dynamic env is enabled
-            additional_env_vars = {}
-            if header_mappings and stdio:
-                request_headers = dict(request.headers)
-                additional_env_vars = extract_env_vars_from_headers(request_headers, header_mappings)
+                # Extract environment variables from headers if dynamic env is enabled
+                additional_env_vars = {}
+                if header_mappings and stdio:
+                    request_headers = dict(request.headers)
+                    additional_env_vars = extract_env_vars_from_headers(request_headers, header_mappings)
 
-                # Restart stdio endpoint with new environment variables
-                if additional_env_vars:
-                    LOGGER.info(f"Restarting stdio endpoint with {len(additional_env_vars)} environment variables")
-                    await stdio.stop()  # Stop existing process
-                    await stdio.start(additional_env_vars)  # Start with new env vars
+                    # Restart stdio endpoint with new environment variables
+                    if additional_env_vars:
+                        LOGGER.info(f"Restarting stdio endpoint with {len(additional_env_vars)} environment variables")
+                        await stdio.stop()  # Stop existing process
+                        await stdio.start(additional_env_vars)  # Start with new env vars
 
-            queue = pubsub.subscribe()
-            session_id = uuid.uuid4().hex
+                queue = pubsub.subscribe()
 
             async def event_gen() -> AsyncIterator[Dict[str, Any]]:
                 """Generate SSE events for the client.
@@ -1886,7 +2493,9 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                                     "retry": keep_alive * 1000,
                                 }
                 finally:
-                    if pubsub:
+                    if pool:
+                        pool.close_session(session_id)
+                    elif pubsub:
                         pubsub.unsubscribe(queue)
 
             return EventSourceResponse(
@@ -1909,7 +2518,16 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             Returns:
                 Response: Acknowledgement of message receipt.
             """
-            _ = session_id
+            if pool:
+                payload = await raw.body()
+                try:
+                    message = json.loads(payload)
+                except Exception as exc:
+                    return PlainTextResponse(f"Invalid JSON payload: {exc}", status_code=status.HTTP_400_BAD_REQUEST)
+                if not session_id or not pool.has_session(session_id):
+                    return PlainTextResponse("Unknown session", status_code=status.HTTP_404_NOT_FOUND)
+                await pool.send(session_id, message)
+                return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
             # Extract environment variables from headers if dynamic env is enabled
             additional_env_vars = {}
@@ -2009,6 +2627,9 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             except Exception as exc:
                 return PlainTextResponse(f"Invalid JSON payload: {exc}", status_code=status.HTTP_400_BAD_REQUEST)
 
+            if pool:
+                return await _pool_streamable_post(pool, request.headers, obj, header_mappings, stateless)
+
             # Forward raw newline-delimited JSON to stdio
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
@@ -2054,6 +2675,24 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             # Notification -> return 202
             return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
 
+        if pool:
+
+            @original_app.delete("/mcp")
+            async def mcp_delete(request: Request) -> Response:
+                """Close the pool session named by the ``Mcp-Session-Id`` header.
+
+                Args:
+                    request: The incoming request.
+
+                Returns:
+                    Response: 204 No Content, or 404 if the session is unknown.
+                """
+                session_key = request.headers.get("mcp-session-id")
+                if not session_key or not pool.has_session(session_key):
+                    return PlainTextResponse("Session not found", status_code=status.HTTP_404_NOT_FOUND)
+                pool.close_session(session_key)
+                return Response(status_code=status.HTTP_204_NO_CONTENT)
+
         # ASGI wrapper to route GET/other /mcp scopes to streamable_manager.handle_request
         async def mcp_asgi_wrapper(scope: Scope, receive: Receive, send: Send) -> None:
             """
@@ -2099,6 +2738,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         LOGGER.info("Shutting down multi-protocol server...")
         if stdio:
             await stdio.stop()
+        if pool:
+            await pool.stop()
         # Streamable HTTP cleanup handled by server shutdown
         # Graceful shutdown by setting the shutdown event
         # Use getattr to safely access should_exit attribute
@@ -2385,6 +3026,9 @@ def main(argv: Optional[Sequence[str]] | None = None) -> None:
                     stateless=getattr(args, "stateless", False),
                     json_response=getattr(args, "jsonResponse", False),
                     header_mappings=header_mappings,
+                    pool_min_workers=getattr(args, "pool_min_workers", 1),
+                    pool_max_workers=getattr(args, "pool_max_workers", 0),
+                    pool_idle_timeout=getattr(args, "pool_idle_timeout", 300.0),
                 )
             )
 
@@ -13,6 +13,7 @@ Key components include:
         1. stateful/stateless operation
         2. JSON response mode or SSE streams
 - InMemoryEventStore: A simple in-memory event storage system for maintaining session state
+- RedisEventStore / DatabaseEventStore: Durable event stores so Last-Event-ID replay works across workers
 
 Examples:
     >>> # Test module imports
@@ -30,11 +31,14 @@ Examples:
 """
 
 # Standard
+import asyncio
 from collections import deque
 from contextlib import asynccontextmanager, AsyncExitStack
 import contextvars
 from dataclasses import dataclass
+from datetime import timedelta
 import re
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import uuid4
 
@@ -46,16 +50,19 @@ from mcp.server.lowlevel import Server
 from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import JSONRPCMessage
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
+from sse_starlette.sse import EventSourceResponse
 from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
 from starlette.status import HTTP_401_UNAUTHORIZED
 from starlette.types import Receive, Scope, Send
 
 # First-Party
+from mcpgateway.cache.catalog_snapshot import get_catalog_snapshot_cache
 from mcpgateway.common.models import LogLevel
 from mcpgateway.config import settings
-from mcpgateway.db import SessionLocal
+from mcpgateway.db import SessionLocal, StreamEventRecord, utc_now
 from mcpgateway.services.completion_service import CompletionService
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.prompt_service import PromptService
@@ -63,6 +70,14 @@ from mcpgateway.services.resource_service import ResourceService
 from mcpgateway.services.tool_service import ToolService
 from mcpgateway.utils.verify_credentials import verify_credentials
 
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Initialize logging service first
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
@@ -78,6 +93,8 @@ mcp_app: Server[Any] = Server("mcp-streamable-http")
 server_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("server_id", default="default_server_id")
 request_headers_var: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar("request_headers", default={})
 user_context_var: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar("user_context", default={})
+# Set for requests that create a session; the session's message router inherits it, so durable event stores can namespace its streams
+event_scope_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("event_scope", default=None)
 
 # ------------------------------ Event store ------------------------------
 
@@ -312,6 +329,359 @@ class InMemoryEventStore(EventStore):
         return stream_id
 
 
+def encode_event_id(scope: str, position: Union[int, str], stream_id: StreamId) -> EventId:
+    """Build an event id that carries everything a durable store needs to replay after it.
+
+    The id is ``<scope>.<position>.<stream_id>``: the opaque per-session scope, the
+    store-specific position (Redis stream entry id or database row id) and the SDK
+    stream id, so any worker can locate the stream without a lookup table.
+
+    Args:
+        scope: Opaque per-session scope token.
+        position: Store-specific, monotonically increasing position of the event.
+        stream_id: SDK stream id the event belongs to.
+
+    Returns:
+        EventId: The encoded event id.
+
+    Examples:
+        >>> encode_event_id("abc", "1700000000000-0", "_GET_stream")
+        'abc.1700000000000-0._GET_stream'
+        >>> encode_event_id("abc", 42, "req.1")
+        'abc.42.req.1'
+    """
+    return f"{scope}.{position}.{stream_id}"
+
+
+def decode_event_id(event_id: EventId) -> Optional[tuple[str, str, StreamId]]:
+    """Split an event id produced by :func:`encode_event_id`.
+
+    Args:
+        event_id: Event id received in a ``Last-Event-ID`` header.
+
+    Returns:
+        Optional[tuple[str, str, StreamId]]: ``(scope, position, stream_id)``, or None if the id is malformed.
+
+    Examples:
+        >>> decode_event_id("abc.42.req.1")
+        ('abc', '42', 'req.1')
+        >>> decode_event_id("not-an-event-id") is None
+        True
+        >>> decode_event_id("..x") is None
+        True
+    """
+    parts = event_id.split(".", 2)
+    if len(parts) != 3 or not all(parts):
+        return None
+    return parts[0], parts[1], parts[2]
+
+
+class DurableEventStore(EventStore):
+    """
+    Base class for event stores shared by every worker.
+
+    The SDK session manager hands a single event store to all sessions and uses
+    request ids (or ``_GET_stream``) as stream ids, so stream ids alone are not
+    unique across sessions. Durable stores therefore namespace streams with the
+    scope token set in :data:`event_scope_var` when a session is created; the token
+    is random, which also keeps event ids unguessable across sessions.
+
+    Examples:
+        >>> store = DatabaseEventStore(max_events_per_stream=10, ttl=60)
+        >>> isinstance(store, DurableEventStore)
+        True
+        >>> token = event_scope_var.set("scope-1")
+        >>> store.current_scope()
+        'scope-1'
+        >>> event_scope_var.reset(token)
+        >>> store.current_scope() == store.current_scope() != "scope-1"
+        True
+    """
+
+    def __init__(self, max_events_per_stream: int = 100, ttl: int = 3600):
+        """Initialize retention settings.
+
+        Args:
+            max_events_per_stream: Maximum number of events to keep per stream
+            ttl: Seconds events are kept before they expire
+        """
+        self.max_events_per_stream = max_events_per_stream
+        self.ttl = ttl
+        # Used when an event is stored outside a request that set a scope
+        self._default_scope = uuid4().hex
+
+    def current_scope(self) -> str:
+        """Return the scope of the session storing events in the current context.
+
+        Returns:
+            str: Scope token for the current session.
+        """
+        return event_scope_var.get() or self._default_scope
+
+    async def aclose(self) -> None:
+        """Release resources held by the store."""
+
+
+class RedisEventStore(DurableEventStore):
+    """
+    Event store backed by Redis streams.
+
+    Each (scope, stream) pair maps to one Redis stream trimmed to roughly
+    ``max_events_per_stream`` entries on every write and expiring ``ttl`` seconds
+    after its last event. Replay uses ``XRANGE`` from the exclusive entry id, which
+    Redis serves in O(log n) plus the number of events returned.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> with patch("mcpgateway.transports.streamablehttp_transport.REDIS_AVAILABLE", False):
+        ...     RedisEventStore("redis://localhost:6379/0")
+        Traceback (most recent call last):
+        ...
+        ValueError: Redis event store requested but redis package not installed
+    """
+
+    def __init__(self, redis_url: str, max_events_per_stream: int = 100, ttl: int = 3600, prefix: str = "mcpgw:"):
+        """Initialize the store.
+
+        Args:
+            redis_url: Redis connection URL
+            max_events_per_stream: Maximum number of events to keep per stream
+            ttl: Seconds a stream is kept after its last event
+            prefix: Key prefix shared with the gateway cache
+
+        Raises:
+            ValueError: If the redis package is not installed
+        """
+        if not REDIS_AVAILABLE:
+            raise ValueError("Redis event store requested but redis package not installed")
+        super().__init__(max_events_per_stream=max_events_per_stream, ttl=ttl)
+        self._prefix = prefix
+        self._redis = Redis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, scope: str, stream_id: StreamId) -> str:
+        """Return the Redis key of a stream.
+
+        Args:
+            scope: Session scope token
+            stream_id: SDK stream id
+
+        Returns:
+            str: The Redis stream key.
+        """
+        return f"{self._prefix}stream_events:{scope}:{stream_id}"
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """
+        Append an event to the Redis stream, trimming and refreshing its expiry.
+
+        Args:
+            stream_id (StreamId): The ID of the stream.
+            message (JSONRPCMessage): The message to store.
+
+        Returns:
+            EventId: The ID of the stored event.
+        """
+        scope = self.current_scope()
+        key = self._key(scope, stream_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"message": message.model_dump_json(by_alias=True, exclude_none=True)}, maxlen=self.max_events_per_stream, approximate=True)
+            pipe.expire(key, self.ttl)
+            entry_id, _ = await pipe.execute()
+        return encode_event_id(scope, entry_id, stream_id)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> Union[StreamId, None]:
+        """
+        Replays events that occurred after the specified event ID.
+
+        Args:
+            last_event_id (EventId): The ID of the last received event. Replay starts after this event.
+            send_callback (EventCallback): Async callback to send each replayed event.
+
+        Returns:
+            StreamId | None: The stream ID if the stream is still stored, otherwise None.
+        """
+        decoded = decode_event_id(last_event_id)
+        if decoded is None:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+        scope, entry_id, stream_id = decoded
+        key = self._key(scope, stream_id)
+        if not await self._redis.exists(key):
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        for next_id, fields in await self._redis.xrange(key, min=f"({entry_id}", max="+"):
+            await send_callback(EventMessage(JSONRPCMessage.model_validate_json(fields["message"]), encode_event_id(scope, next_id, stream_id)))
+        return stream_id
+
+    async def aclose(self) -> None:
+        """Close the Redis connection."""
+        await self._redis.aclose()
+
+
+class DatabaseEventStore(DurableEventStore):
+    """
+    Event store backed by the ``mcp_stream_events`` table.
+
+    Used when Redis is not available. Each write trims its stream to
+    ``max_events_per_stream`` rows, and rows older than ``ttl`` are swept at most
+    once per :attr:`SWEEP_INTERVAL`. Replay is an index range scan on
+    ``(scope, stream_id, id)``.
+
+    Examples:
+        >>> store = DatabaseEventStore(max_events_per_stream=5, ttl=30)
+        >>> (store.max_events_per_stream, store.ttl)
+        (5, 30)
+    """
+
+    SWEEP_INTERVAL = 60.0
+
+    def __init__(self, max_events_per_stream: int = 100, ttl: int = 3600):
+        """Initialize the store.
+
+        Args:
+            max_events_per_stream: Maximum number of events to keep per stream
+            ttl: Seconds events are kept before they expire
+        """
+        super().__init__(max_events_per_stream=max_events_per_stream, ttl=ttl)
+        self._last_sweep = 0.0
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """
+        Insert an event row and trim the stream to its retention limit.
+
+        Args:
+            stream_id (StreamId): The ID of the stream.
+            message (JSONRPCMessage): The message to store.
+
+        Returns:
+            EventId: The ID of the stored event.
+        """
+        scope = self.current_scope()
+        payload = message.model_dump_json(by_alias=True, exclude_none=True)
+        sweep = time.monotonic() - self._last_sweep >= self.SWEEP_INTERVAL
+        if sweep:
+            self._last_sweep = time.monotonic()
+
+        def _db_store() -> int:
+            """Insert the event, trim its stream and sweep expired rows.
+
+            Returns:
+                int: Row id of the stored event.
+
+            Raises:
+                Exception: Any database error is re-raised after rollback.
+            """
+            db = SessionLocal()
+            try:
+                record = StreamEventRecord(scope=scope, stream_id=stream_id, message=payload)
+                db.add(record)
+                db.flush()
+                in_stream = (StreamEventRecord.scope == scope, StreamEventRecord.stream_id == stream_id)
+                cutoff = db.execute(select(StreamEventRecord.id).where(*in_stream).order_by(StreamEventRecord.id.desc()).offset(self.max_events_per_stream).limit(1)).scalar()
+                if cutoff is not None:
+                    db.execute(delete(StreamEventRecord).where(*in_stream, StreamEventRecord.id <= cutoff))
+                if sweep:
+                    db.execute(delete(StreamEventRecord).where(StreamEventRecord.created_at < utc_now() - timedelta(seconds=self.ttl)))
+                db.commit()
+                return record.id
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+        return encode_event_id(scope, await asyncio.to_thread(_db_store), stream_id)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> Union[StreamId, None]:
+        """
+        Replays events that occurred after the specified event ID.
+
+        Args:
+            last_event_id (EventId): The ID of the last received event. Replay starts after this event.
+            send_callback (EventCallback): Async callback to send each replayed event.
+
+        Returns:
+            StreamId | None: The stream ID if the stream is still stored, otherwise None.
+        """
+        decoded = decode_event_id(last_event_id)
+        if decoded is None or not decoded[1].isdigit():
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+        scope, position, stream_id = decoded
+        expired_before = utc_now() - timedelta(seconds=self.ttl)
+
+        def _db_replay() -> Optional[list[tuple[int, str]]]:
+            """Read the events after ``position`` in the stream.
+
+            Returns:
+                Optional[list[tuple[int, str]]]: ``(id, message)`` pairs, or None if the stream has expired.
+            """
+            db = SessionLocal()
+            try:
+                rows = db.execute(
+                    select(StreamEventRecord.id, StreamEventRecord.message)
+                    .where(StreamEventRecord.scope == scope, StreamEventRecord.stream_id == stream_id, StreamEventRecord.id >= int(position), StreamEventRecord.created_at >= expired_before)
+                    .order_by(StreamEventRecord.id)
+                ).all()
+            finally:
+                db.close()
+            if not rows:
+                return None
+            return [(row_id, message) for row_id, message in rows if row_id > int(position)]
+
+        rows = await asyncio.to_thread(_db_replay)
+        if rows is None:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+        for row_id, payload in rows:
+            await send_callback(EventMessage(JSONRPCMessage.model_validate_json(payload), encode_event_id(scope, row_id, stream_id)))
+        return stream_id
+
+
+def create_event_store() -> Optional[EventStore]:
+    """Build the event store selected by ``streamable_http_event_store``.
+
+    ``auto`` follows ``cache_type``: Redis when the cache is Redis, the database when
+    the cache is the database, and the per-process memory store otherwise. Stateless
+    mode needs no event store.
+
+    Returns:
+        Optional[EventStore]: The configured store, or None in stateless mode.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> with patch("mcpgateway.transports.streamablehttp_transport.settings") as s:
+        ...     s.use_stateful_sessions = True
+        ...     s.streamable_http_event_store = "auto"
+        ...     s.cache_type = "memory"
+        ...     type(create_event_store()).__name__
+        'InMemoryEventStore'
+        >>> with patch("mcpgateway.transports.streamablehttp_transport.settings") as s:
+        ...     s.use_stateful_sessions = True
+        ...     s.streamable_http_event_store = "database"
+        ...     type(create_event_store()).__name__
+        'DatabaseEventStore'
+        >>> with patch("mcpgateway.transports.streamablehttp_transport.settings") as s:
+        ...     s.use_stateful_sessions = False
+        ...     create_event_store() is None
+        True
+    """
+    if not settings.use_stateful_sessions:
+        return None
+
+    backend = settings.streamable_http_event_store
+    if backend == "auto":
+        backend = settings.cache_type if settings.cache_type in ("redis", "database") else "memory"
+
+    max_events = settings.streamable_http_max_events_per_stream
+    if backend == "redis":
+        return RedisEventStore(settings.redis_url, max_events_per_stream=max_events, ttl=settings.streamable_http_event_ttl, prefix=settings.cache_prefix)
+    if backend == "database":
+        return DatabaseEventStore(max_events_per_stream=max_events, ttl=settings.streamable_http_event_ttl)
+    return InMemoryEventStore(max_events_per_stream=max_events)
+
+
 # ------------------------------ Streamable HTTP Transport ------------------------------
 
 
@@ -450,25 +820,20 @@ async def list_tools() -> List[types.Tool]:
         >>> sig.return_annotation
         typing.List[mcp.types.Tool]
     """
-    server_id = server_id_var.get()
-    request_headers = request_headers_var.get()
-
-    if server_id:
-        try:
-            async with get_db() as db:
-                tools = await tool_service.list_server_tools(db, server_id, _request_headers=request_headers)
-                return [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools]
-        except Exception as e:
-            logger.exception(f"Error listing tools:{e}")
-            return []
-    else:
-        try:
-            async with get_db() as db:
-                tools, _ = await tool_service.list_tools(db, False, None, None, request_headers)
-                return [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools]
-        except Exception as e:
-            logger.exception(f"Error listing tools:{e}")
-            return []
+    try:
+        async with get_db() as db:
+            snapshot = await get_catalog_snapshot_cache().get(db, "tools", server_id_var.get(), None, tool_service)
+        return list(
+            snapshot.derive(
+                "mcp",
+                lambda tools: [
+                    types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools
+                ],
+            )
+        )
+    except Exception as e:
+        logger.exception(f"Error listing tools:{e}")
+        return []
 
 
 @mcp_app.list_prompts()
@@ -488,25 +853,14 @@ async def list_prompts() -> List[types.Prompt]:
         >>> sig.return_annotation
         typing.List[mcp.types.Prompt]
     """
-
     server_id = server_id_var.get()
-
-    if server_id:
-        try:
-            async with get_db() as db:
-                prompts = await prompt_service.list_server_prompts(db, server_id)
-                return [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts]
-        except Exception as e:
-            logger.exception(f"Error listing Prompts:{e}")
-            return []
-    else:
-        try:
-            async with get_db() as db:
-                prompts, _ = await prompt_service.list_prompts(db, False, None, None)
-                return [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts]
-        except Exception as e:
-            logger.exception(f"Error listing prompts:{e}")
-            return []
+    try:
+        async with get_db() as db:
+            snapshot = await get_catalog_snapshot_cache().get(db, "prompts", server_id, None, prompt_service)
+        return list(snapshot.derive("mcp", lambda prompts: [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts]))
+    except Exception as e:
+        logger.exception(f"Error listing Prompts:{e}" if server_id else f"Error listing prompts:{e}")
+        return []
 
 
 @mcp_app.get_prompt()
@@ -566,25 +920,16 @@ async def list_resources() -> List[types.Resource]:
         >>> sig.return_annotation
         typing.List[mcp.types.Resource]
     """
-
     server_id = server_id_var.get()
-
-    if server_id:
-        try:
-            async with get_db() as db:
-                resources = await resource_service.list_server_resources(db, server_id)
-                return [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources]
-        except Exception as e:
-            logger.exception(f"Error listing Resources:{e}")
-            return []
-    else:
-        try:
-            async with get_db() as db:
-                resources, _ = await resource_service.list_resources(db, False)
-                return [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources]
-        except Exception as e:
-            logger.exception(f"Error listing resources:{e}")
-            return []
+    try:
+        async with get_db() as db:
+            snapshot = await get_catalog_snapshot_cache().get(db, "resources", server_id, None, resource_service)
+        return list(
+            snapshot.derive("mcp", lambda resources: [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources])
+        )
+    except Exception as e:
+        logger.exception(f"Error listing Resources:{e}" if server_id else f"Error listing resources:{e}")
+        return []
 
 
 @mcp_app.read_resource()
@@ -803,18 +1148,12 @@ class SessionManagerWrapper:
             True
         """
 
-        if settings.use_stateful_sessions:
-            event_store = InMemoryEventStore()
-            stateless = False
-        else:
-            event_store = None
-            stateless = True
-
+        self.event_store = create_event_store()
         self.session_manager = StreamableHTTPSessionManager(
             app=mcp_app,
-            event_store=event_store,
+            event_store=self.event_store,
             json_response=settings.json_response_enabled,
-            stateless=stateless,
+            stateless=not settings.use_stateful_sessions,
         )
         self.stack = AsyncExitStack()
 
@@ -847,6 +1186,8 @@ class SessionManagerWrapper:
         """
         logger.info("Stopping Streamable HTTP Session Manager...")
         await self.stack.aclose()
+        if isinstance(self.event_store, DurableEventStore):
+            await self.event_store.aclose()
 
     async def handle_streamable_http(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -891,6 +1232,14 @@ class SessionManagerWrapper:
         else:
             server_id_var.set(None)
 
+        session_id = headers.get("mcp-session-id")
+        if session_id is None:
+            # A new session: give its event streams their own namespace in durable stores
+            event_scope_var.set(uuid4().hex)
+        elif self._owned_elsewhere(scope, headers):
+            await self._replay_detached(scope, receive, send)
+            return
+
         try:
             await self.session_manager.handle_request(scope, receive, send)
         except anyio.ClosedResourceError:
@@ -900,6 +1249,57 @@ class SessionManagerWrapper:
             logger.exception(f"Error handling streamable HTTP request: {e}")
             raise
 
+    def _owned_elsewhere(self, scope: Scope, headers: dict[str, str]) -> bool:
+        """Check whether a resumption request targets a session that lives on another worker.
+
+        Args:
+            scope (Scope): ASGI scope object containing connection information.
+            headers (dict[str, str]): Lower-cased request headers.
+
+        Returns:
+            bool: True for a GET with ``Last-Event-ID`` for a session this worker does not host, when a durable event store can replay it.
+
+        Examples:
+            >>> wrapper = SessionManagerWrapper()
+            >>> wrapper._owned_elsewhere({"method": "GET"}, {"mcp-session-id": "s1", "last-event-id": "a.1.b"})
+            False
+        """
+        if scope.get("method") != "GET" or "last-event-id" not in headers or not isinstance(self.event_store, DurableEventStore):
+            return False
+        # The SDK rejects session ids it did not create; only this worker's sessions are in its table
+        return headers.get("mcp-session-id") not in self.session_manager._server_instances  # pylint: disable=protected-access
+
+    async def _replay_detached(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Replay missed events from the durable store for a session hosted by another worker.
+
+        The events are streamed back as SSE and the stream ends; live messages keep
+        flowing from the worker that owns the session once the client reconnects there.
+        An unknown or expired event id yields 404 so the client starts a new session.
+
+        Args:
+            scope (Scope): ASGI scope object containing connection information.
+            receive (Receive): ASGI receive callable.
+            send (Send): ASGI send callable.
+        """
+        headers = Headers(scope=scope)
+        events: list[dict[str, str]] = []
+
+        async def collect(event_message: EventMessage) -> None:
+            """Buffer one replayed event as SSE data.
+
+            Args:
+                event_message: Event returned by the store.
+            """
+            events.append({"event": "message", "id": event_message.event_id, "data": event_message.message.model_dump_json(by_alias=True, exclude_none=True)})
+
+        stream_id = await self.event_store.replay_events_after(headers["last-event-id"], collect)
+        if stream_id is None:
+            response = JSONResponse({"detail": "Session not found"}, status_code=404)
+        else:
+            logger.debug(f"Replayed {len(events)} events of stream {stream_id} for session {headers['mcp-session-id']} hosted by another worker")
+            response = EventSourceResponse(events, headers={"mcp-session-id": headers["mcp-session-id"], "Cache-Control": "no-cache, no-transform"})
+        await response(scope, receive, send)
+
 
 # ------------------------- Authentication for /mcp routes ------------------------------
 
@@ -8,9 +8,10 @@ Common utilities for metrics handling across service modules.
 """
 
 # Standard
-from typing import List
+from typing import Any, Dict, List
 
 # First-Party
+from mcpgateway.db import MetricRollupMixin
 from mcpgateway.schemas import TopPerformer
 
 
@@ -63,3 +64,47 @@ def build_top_performers(results: List) -> List[TopPerformer]:
         )
         for result in results
     ]
+
+
+def summarize_metrics(entity: Any) -> Dict[str, Any]:
+    """
+    Build the aggregated metrics dict for a single tool, resource, prompt, server or agent.
+
+    The entity's pre-aggregated ``metrics_rollup`` is used when present so that
+    converting an entity never loads its raw metric rows. Entities without a
+    rollup (e.g. plain objects in tests) fall back to the ``metrics`` list.
+
+    Args:
+        entity: ORM entity (or compatible object) with ``metrics_rollup`` and/or ``metrics``
+
+    Returns:
+        Dict[str, Any]: Metrics in the shape of the ``*Metrics`` schemas.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> m1 = SimpleNamespace(is_success=True, response_time=0.2, timestamp=1)
+        >>> m2 = SimpleNamespace(is_success=False, response_time=0.4, timestamp=2)
+        >>> summary = summarize_metrics(SimpleNamespace(metrics=[m1, m2]))
+        >>> summary["total_executions"], summary["failure_rate"], summary["max_response_time"], summary["last_execution_time"]
+        (2, 0.5, 0.4, 2)
+        >>> summarize_metrics(SimpleNamespace(metrics=[]))["avg_response_time"] is None
+        True
+    """
+    rollup = getattr(entity, "metrics_rollup", None)
+    if isinstance(rollup, MetricRollupMixin):
+        return rollup.summary()
+
+    metrics = getattr(entity, "metrics", None) or []
+    total = len(metrics)
+    successful = sum(1 for m in metrics if m.is_success)
+    failed = total - successful
+    return {
+        "total_executions": total,
+        "successful_executions": successful,
+        "failed_executions": failed,
+        "failure_rate": failed / total if total > 0 else 0.0,
+        "min_response_time": min((m.response_time for m in metrics), default=None),
+        "max_response_time": max((m.response_time for m in metrics), default=None),
+        "avg_response_time": sum(m.response_time for m in metrics) / total if total > 0 else None,
+        "last_execution_time": max((m.timestamp for m in metrics), default=None),
+    }
@@ -7,6 +7,8 @@ Authors: Madhav Kandukuri
 SQLAlchemy modifiers
 
 - json_contains_expr: handles json_contains logic for different dialects
+- entity_tags_expr: indexed tag filtering through the entity_tags table
+- entity_tag_key: entity_tags.entity_id expression comparable to a primary key
 """
 
 # Standard
@@ -15,7 +17,10 @@ from typing import Any, Iterable, List, Union
 import uuid
 
 # Third-Party
-from sqlalchemy import and_, func, or_, text
+from sqlalchemy import and_, cast, func, or_, select, String, text
+
+# First-Party
+from mcpgateway.db import EntityTag
 
 
 def _ensure_list(values: Union[str, Iterable[str]]) -> List[str]:
@@ -123,3 +128,68 @@ def json_contains_expr(session, col, values: Union[str, Iterable[str]], match_an
         return and_(*exists_clauses)
 
     raise RuntimeError(f"Unsupported dialect for json_contains: {dialect}")
+
+
+def entity_tags_expr(id_col, entity_type: str, values: Union[str, Iterable[str]], match_any: bool = True) -> Any:
+    """
+    Return a SQLAlchemy expression that is True when the entity whose primary
+    key is `id_col` has the given tags, looked up through the indexed
+    ``entity_tags`` table instead of scanning each row's JSON ``tags`` column.
+
+    Args:
+        id_col: primary key column of the tagged model
+        entity_type: entity type recorded in ``entity_tags`` (``tool``, ``resource``, ...)
+        values: list of tags to match
+        match_any: Boolean to set OR or AND matching
+
+    Returns:
+        Any: SQLAlchemy boolean expression suitable for use in .where()
+
+    Raises:
+        ValueError: If values is empty
+
+    Examples:
+        >>> from mcpgateway.db import Resource, Tool
+        >>> sql = str(entity_tags_expr(Tool.id, "tool", ["api"]))
+        >>> sql.startswith("tools.id IN (SELECT entity_tags.entity_id")
+        True
+        >>> str(entity_tags_expr(Resource.id, "resource", ["a", "b"], match_any=False)).startswith("resources.id IN (SELECT CAST(entity_tags.entity_id AS INTEGER)")
+        True
+        >>> entity_tags_expr(Tool.id, "tool", [])
+        Traceback (most recent call last):
+        ...
+        ValueError: values must be non-empty
+    """
+    values_list = _ensure_list(values)
+    if not values_list:
+        raise ValueError("values must be non-empty")
+
+    tagged = select(entity_tag_key(id_col)).where(EntityTag.entity_type == entity_type, EntityTag.tag.in_(values_list))
+    if not match_any:
+        # all-of: the entity must have one index row per distinct requested tag
+        tagged = tagged.group_by(EntityTag.entity_id).having(func.count(func.distinct(EntityTag.tag)) == len(set(values_list)))
+
+    return id_col.in_(tagged)
+
+
+def entity_tag_key(id_col) -> Any:
+    """
+    Return ``EntityTag.entity_id`` as an expression comparable to a primary key column.
+
+    ``entity_tags`` stores ids as strings. For integer primary keys the index
+    column is cast rather than the key, so lookups stay on the primary key index.
+
+    Args:
+        id_col: primary key column of the tagged model
+
+    Returns:
+        Any: ``EntityTag.entity_id`` for string keys, otherwise cast to the key's type
+
+    Examples:
+        >>> from mcpgateway.db import EntityTag, Prompt, Server
+        >>> entity_tag_key(Server.id) is EntityTag.entity_id
+        True
+        >>> str(entity_tag_key(Prompt.id))
+        'CAST(entity_tags.entity_id AS INTEGER)'
+    """
+    return EntityTag.entity_id if isinstance(id_col.type, String) else cast(EntityTag.entity_id, id_col.type)
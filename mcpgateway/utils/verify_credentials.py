@@ -90,15 +90,6 @@ async def verify_jwt_token(token: str) -> dict:
         # First-Party
         from mcpgateway.utils.jwt_config_helper import get_jwt_public_key_or_secret
 
-        # First decode to check claims
-        unverified = jwt.decode(token, options={"verify_signature": False})
-
-        # Check for expiration claim
-        if "exp" not in unverified:
-            logger.warning(f"JWT token without expiration accepted. Consider enabling REQUIRE_TOKEN_EXPIRATION for better security. Token sub: {unverified.get('sub', 'unknown')}")
-            if settings.require_token_expiration:
-                raise jwt.MissingRequiredClaimError("exp")
-
         options = {}
 
         if settings.require_token_expiration:
@@ -114,7 +105,10 @@ async def verify_jwt_token(token: str) -> dict:
             "issuer": settings.jwt_issuer,
         }
 
+        # Single verified decode; a missing exp is rejected via options["require"] when required
         payload = jwt.decode(token, **decode_kwargs)
+        if "exp" not in payload:
+            logger.warning(f"JWT token without expiration accepted. Consider enabling REQUIRE_TOKEN_EXPIRATION for better security. Token sub: {payload.get('sub', 'unknown')}")
         return payload
 
     except jwt.MissingRequiredClaimError:
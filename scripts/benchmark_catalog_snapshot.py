@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Location: ./scripts/benchmark_catalog_snapshot.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Benchmark tools/list Snapshots
+
+Compares answering ``tools/list`` for a virtual server the way ``/rpc`` did
+before catalog snapshots (query, convert every row to ``ToolRead``, dump and
+encode the response) with serving the cached snapshot bytes. Tools live in an
+in-memory SQLite database, so the uncached numbers exclude network round trips
+to a real database and understate the saving.
+
+Usage:
+    python scripts/benchmark_catalog_snapshot.py [--iterations 50] [--sizes 10 100 1000]
+"""
+
+# Standard
+import argparse
+import asyncio
+import time
+
+# Third-Party
+from fastapi.encoders import jsonable_encoder
+import orjson
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.cache.catalog_snapshot import CatalogSnapshotCache
+from mcpgateway.db import Base
+from mcpgateway.db import Server as DbServer
+from mcpgateway.db import Tool as DbTool
+from mcpgateway.services.tool_service import ToolService
+
+
+def make_db(count: int):
+    """Create a database holding one server with ``count`` tools.
+
+    Args:
+        count: Number of tools
+
+    Returns:
+        Tuple of the session and the server id
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    schema = {"type": "object", "properties": {"query": {"type": "string", "description": "Search text"}, "limit": {"type": "integer", "default": 10}}, "required": ["query"]}
+    tools = [
+        DbTool(original_name=f"tool_{i}", url=f"https://api.example.com/tools/{i}", description=f"Tool number {i}", integration_type="REST", request_type="POST", input_schema=schema, tags=["bench"])
+        for i in range(count)
+    ]
+    server = DbServer(name="bench", tools=tools)
+    db.add(server)
+    db.commit()
+    return db, server.id
+
+
+async def uncached(service: ToolService, db, server_id: str) -> bytes:
+    """Answer tools/list the way /rpc did before snapshots.
+
+    Args:
+        service: Tool service
+        db: Database session
+        server_id: Virtual server id
+
+    Returns:
+        Response body
+    """
+    tools = await service.list_server_tools(db, server_id)
+    result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+    return orjson.dumps(jsonable_encoder({"jsonrpc": "2.0", "result": result, "id": 1}))
+
+
+async def mean_us(fn, iterations: int) -> float:
+    """Return the mean microseconds per call of an async callable.
+
+    Args:
+        fn: Coroutine function without arguments
+        iterations: Number of calls
+
+    Returns:
+        Mean time per call in microseconds
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def run(args) -> None:
+    """Run the benchmark and print a table.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    print(f"{'Tools':>6} {'body KB':>8} {'uncached us':>12} {'rebuild us':>11} {'snapshot us':>12} {'speedup':>8}")
+    print("-" * 62)
+    for size in args.sizes:
+        db, server_id = make_db(size)
+        service = ToolService()
+        cache = CatalogSnapshotCache(ttl=3600)
+
+        async def snapshot():
+            return (await cache.get(db, "tools", server_id, None, service)).envelope(1)
+
+        async def rebuild():
+            cache.invalidate_local("tools")
+            return await snapshot()
+
+        body = await uncached(service, db, server_id)
+        assert orjson.loads(await snapshot())["result"]["tools"][0]["name"] == orjson.loads(body)["result"]["tools"][0]["name"]
+
+        before = await mean_us(lambda: uncached(service, db, server_id), args.iterations)
+        rebuilt = await mean_us(rebuild, args.iterations)
+        after = await mean_us(snapshot, args.iterations * 100)
+        print(f"{size:>6} {len(body) / 1024:>8.1f} {before:>12.1f} {rebuilt:>11.1f} {after:>12.2f} {before / after:>7.0f}x")
+        db.close()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark tools/list snapshots")
+    parser.add_argument("--iterations", type=int, default=50, help="Uncached calls per catalog size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Tools per server")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
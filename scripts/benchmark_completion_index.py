@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Location: ./scripts/benchmark_completion_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Benchmark Resource URI Completion
+
+Compares answering completion/complete for a resource URI from the completion
+index with the linear lowercase substring scan it replaces, for catalogs of
+increasing size. Queries mix prefixes, path fragments and misses and are sent
+one keystroke at a time, as clients do. The first pass over the keystrokes
+(which builds the n-gram postings) is reported separately from later passes.
+Index build and single-resource update costs are reported too.
+
+Usage:
+    python scripts/benchmark_completion_index.py [--iterations 20] [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from mcpgateway.cache.completion_index import CompletionIndex, MAX_COMPLETIONS
+
+QUERIES = ["f", "file://", "file://docs/", "docs/re", "report", "q2-2025", ".json", "xyz-missing", "users/ab"]
+
+
+def make_uris(count: int) -> list:
+    """Build realistic resource URIs.
+
+    Args:
+        count: Number of URIs
+
+    Returns:
+        Resource URIs
+    """
+    rng = random.Random(42)
+    schemes = ["file://docs/", "file://data/", "https://api.example.com/api/v2/users/", "db://warehouse/", "s3://bucket/reports/"]
+    uris = []
+    for i in range(count):
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        quarter = f"q{rng.randint(1, 4)}-{rng.randint(2023, 2025)}"
+        uris.append(f"{rng.choice(schemes)}{word}-{quarter}-{i}.{rng.choice(['md', 'json', 'csv', 'txt'])}")
+    return uris
+
+
+def linear_scan(uris: list, query: str) -> dict:
+    """Complete the way the service did before the index: scan every URI.
+
+    Args:
+        uris: Resource URIs
+        query: Text typed so far
+
+    Returns:
+        Completion payload
+    """
+    matches = [uri for uri in uris if query.lower() in uri.lower()]
+    return {"values": matches[:MAX_COMPLETIONS], "total": len(matches), "hasMore": len(matches) > MAX_COMPLETIONS}
+
+
+def keystrokes(query: str) -> list:
+    """Return what a client sends while typing a query.
+
+    Args:
+        query: Full query
+
+    Returns:
+        Each prefix of the query, shortest first
+    """
+    return [query[:i] for i in range(1, len(query) + 1)]
+
+
+def mean_us(fn, iterations: int) -> float:
+    """Return the mean microseconds per call of ``fn`` over every keystroke of every query.
+
+    Args:
+        fn: Callable taking a query
+        iterations: Passes over the query list
+
+    Returns:
+        Mean time per keystroke in microseconds
+    """
+    typed = [prefix for query in QUERIES for prefix in keystrokes(query)]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for prefix in typed:
+            fn(prefix)
+    return (time.perf_counter() - start) / (iterations * len(typed)) * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description="Benchmark resource URI completion")
+    parser.add_argument("--iterations", type=int, default=20, help="Passes over the keystrokes per catalog size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Catalog sizes")
+    args = parser.parse_args()
+
+    print(f"{'Resources':>10} {'build ms':>9} {'update us':>10} {'scan us/q':>10} {'first us/q':>11} {'index us/q':>11} {'speedup':>8}")
+    print("-" * 75)
+    for size in args.sizes:
+        uris = make_uris(size)
+        index = CompletionIndex(ttl=60)
+
+        start = time.perf_counter()
+        index.load_resources(enumerate(uris))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        first = mean_us(index.complete_resource_uri, 1)
+        for query in QUERIES:
+            for prefix in keystrokes(query):
+                assert index.complete_resource_uri(prefix)["total"] == linear_scan(uris, prefix)["total"], prefix
+
+        start = time.perf_counter()
+        for i in range(1000):
+            index.update_resource_local(i, uris[i] + ".bak", active=True)
+        update_us = (time.perf_counter() - start) / 1000 * 1_000_000
+
+        scan = mean_us(lambda query: linear_scan(uris, query), max(1, args.iterations * 100 // size))
+        indexed = mean_us(index.complete_resource_uri, args.iterations)
+        print(f"{size:>10} {build_ms:>9.1f} {update_us:>10.1f} {scan:>10.1f} {first:>11.1f} {indexed:>11.1f} {scan / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Location: ./scripts/benchmark_event_fanout.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Benchmark Event Fan-out
+
+Compares publishing a local event to N subscribers the way ``EventService`` did
+before bounded subscriptions (``await queue.put`` into an unbounded
+``asyncio.Queue`` per subscriber) with ``EventFanout.deliver``. Every subscriber
+stays idle, as a stalled admin UI tab would, so the table also shows how much
+each approach keeps buffered per subscriber afterwards.
+
+Usage:
+    python scripts/benchmark_event_fanout.py [--events 5000] [--subscribers 1 10 100]
+"""
+
+# Standard
+import argparse
+import asyncio
+import logging
+import time
+
+# First-Party
+from mcpgateway.services.event_service import EventFanout
+
+
+async def unbounded(subscribers: int, events: list) -> tuple:
+    """Publish into one unbounded queue per subscriber.
+
+    Args:
+        subscribers: Number of idle subscribers
+        events: Events to publish
+
+    Returns:
+        Tuple of mean microseconds per publish and events buffered per subscriber
+    """
+    queues = [asyncio.Queue() for _ in range(subscribers)]
+    start = time.perf_counter()
+    for event in events:
+        for queue in queues:
+            await queue.put(event)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(events) * 1_000_000, queues[0].qsize()
+
+
+async def bounded(subscribers: int, events: list, max_size: int, policy: str) -> tuple:
+    """Publish through the fan-out hub with bounded subscriptions.
+
+    Args:
+        subscribers: Number of idle subscribers
+        events: Events to publish
+        max_size: Pending events per subscriber
+        policy: Overflow policy
+
+    Returns:
+        Tuple of mean microseconds per publish and events buffered per subscriber
+    """
+    fanout = EventFanout()
+    subscriptions = [fanout.subscribe("bench", max_size=max_size, policy=policy) for _ in range(subscribers)]
+    start = time.perf_counter()
+    for event in events:
+        fanout.deliver("bench", event)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(events) * 1_000_000, subscriptions[0].pending
+
+
+async def run(args) -> None:
+    """Run the benchmark and print a table.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    # Tool updates for a small set of tools, as bulk imports and health checks produce
+    events = [{"type": "tool_updated", "data": {"id": f"tool-{i % 200}", "version": i}} for i in range(args.events)]
+    print(f"{'Subs':>5} {'queue us':>9} {'buffered':>9} {'drop_oldest us':>15} {'buffered':>9} {'coalesce us':>12} {'buffered':>9}")
+    print("-" * 74)
+    for subscribers in args.subscribers:
+        before, before_size = await unbounded(subscribers, events)
+        dropped, dropped_size = await bounded(subscribers, events, args.max_size, "drop_oldest")
+        coalesced, coalesced_size = await bounded(subscribers, events, args.max_size, "coalesce")
+        print(f"{subscribers:>5} {before:>9.1f} {before_size:>9} {dropped:>15.1f} {dropped_size:>9} {coalesced:>12.1f} {coalesced_size:>9}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    logging.getLogger("mcpgateway.services.event_service").setLevel(logging.ERROR)  # expected overflow warnings
+    parser = argparse.ArgumentParser(description="Benchmark event fan-out")
+    parser.add_argument("--events", type=int, default=5000, help="Events published per run")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 10, 100], help="Idle subscribers per run")
+    parser.add_argument("--max-size", type=int, default=1000, help="Pending events per bounded subscription")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
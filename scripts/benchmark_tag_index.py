@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Location: ./scripts/benchmark_tag_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Benchmark Entity Tag Index
+
+Compares tag filters and tag counts served from the ``entity_tags`` index with
+the JSON column scans they replace, on a catalog shaped like the tests/load
+"large" profile. Entity counts are derived from the profile's ``scale`` section
+(gateways x tools per gateway, users x resources/prompts/servers per user) and
+multiplied by ``--scale``, since the full profile (~700M rows) needs a dedicated
+PostgreSQL host. The load generators leave ``tags`` empty, so every entity gets
+0-4 tags drawn from a skewed vocabulary here; filters are timed for the most
+common and for a rare tag.
+
+The catalog is written through the ORM so the mapper events fill the index the
+same way the gateway does. Point ``--database-url`` at an empty database to
+measure PostgreSQL or MySQL instead of in-memory SQLite.
+
+Usage:
+    python scripts/benchmark_tag_index.py [--scale 0.002] [--tags 500] [--iterations 20] [--database-url sqlite://]
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from pathlib import Path
+import random
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+import yaml
+
+from mcpgateway.db import Base, EntityTag, Gateway, Prompt, Resource, Server, Tool
+from mcpgateway.services.tag_service import TagService
+from mcpgateway.utils.sqlalchemy_modifier import entity_tags_expr, json_contains_expr
+
+PROFILE = Path(__file__).resolve().parent.parent / "tests" / "load" / "configs" / "large.yaml"
+MODELS = {"tool": Tool, "resource": Resource, "prompt": Prompt, "server": Server, "gateway": Gateway}
+
+
+def profile_counts(path: Path, scale: float) -> dict:
+    """Derive per-entity counts from a load profile.
+
+    Args:
+        path: Load profile YAML
+        scale: Fraction of the profile to generate
+
+    Returns:
+        Entity type to number of entities
+    """
+    config = yaml.safe_load(path.read_text())["scale"]
+    users, gateways = config["users"], config["gateways"]
+    full = {
+        "gateway": gateways,
+        "tool": gateways * config["tools_per_gateway_avg"],
+        "resource": users * config["resources_per_user_avg"],
+        "prompt": users * config["prompts_per_user_avg"],
+        "server": users * config["servers_per_user_avg"],
+    }
+    return {entity_type: max(1, int(count * scale)) for entity_type, count in full.items()}
+
+
+def make_entity(entity_type: str, i: int, tags: list):
+    """Build one tagged entity.
+
+    Args:
+        entity_type: Key of ``MODELS``
+        i: Sequence number, used for unique names
+        tags: Tags of the entity
+
+    Returns:
+        Unsaved ORM instance
+    """
+    name = f"{entity_type}-{i}"
+    if entity_type == "tool":
+        return Tool(original_name=name, custom_name=name, custom_name_slug=name, url="http://example.com", input_schema={}, integration_type="REST", request_type="POST", tags=tags)
+    if entity_type == "resource":
+        return Resource(uri=f"file://docs/{name}.md", name=name, text_content="", tags=tags)
+    if entity_type == "prompt":
+        return Prompt(name=name, template="t", argument_schema={}, tags=tags)
+    if entity_type == "server":
+        return Server(name=name, tags=tags)
+    return Gateway(name=name, slug=name, url=f"http://{name}.example.com", capabilities={}, transport="SSE", tags=tags)
+
+
+def populate(session_factory, counts: dict, vocabulary: list) -> float:
+    """Write the catalog; the mapper events index the tags.
+
+    Args:
+        session_factory: Session factory bound to the benchmark database
+        counts: Entity type to number of entities
+        vocabulary: Tag names, most common first
+
+    Returns:
+        Seconds spent writing
+    """
+    rng = random.Random(42)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    start = time.perf_counter()
+    with session_factory() as db:
+        for entity_type, count in counts.items():
+            for offset in range(0, count, 1000):
+                for i in range(offset, min(offset + 1000, count)):
+                    db.add(make_entity(entity_type, i, sorted(set(rng.choices(vocabulary, weights, k=rng.randint(0, 4))))))
+                db.commit()
+    return time.perf_counter() - start
+
+
+def mean_ms(fn, iterations: int) -> float:
+    """Return the mean milliseconds per call of ``fn``.
+
+    Args:
+        fn: Callable without arguments
+        iterations: Number of calls
+
+    Returns:
+        Mean time per call in milliseconds
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def scan_tag_counts(db) -> Counter:
+    """Count tags the way the tag service did before the index: walk every entity's JSON.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tag to number of tagged entities
+    """
+    counts: Counter = Counter()
+    for model in MODELS.values():
+        for tags in db.execute(select(model.tags)).scalars():
+            counts.update(tags or [])
+    return counts
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description="Benchmark the entity tag index")
+    parser.add_argument("--scale", type=float, default=0.002, help="Fraction of the tests/load large profile to generate")
+    parser.add_argument("--tags", type=int, default=500, help="Size of the tag vocabulary")
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per measurement")
+    parser.add_argument("--database-url", default="sqlite://", help="Empty database to populate (default: in-memory SQLite)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool) if args.database_url == "sqlite://" else create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    vocabulary = [f"tag-{rank}" for rank in range(args.tags)]
+    counts = profile_counts(PROFILE, args.scale)
+
+    seconds = populate(session_factory, counts, vocabulary)
+    with session_factory() as db:
+        index_rows = db.query(EntityTag).count()
+    print(f"Catalog: {', '.join(f'{count} {entity_type}s' for entity_type, count in counts.items())}")
+    print(f"Written in {seconds:.1f}s, {index_rows} index rows")
+    print()
+
+    service = TagService()
+    rows = []
+    with session_factory() as db:
+        for label, tag in (("common", vocabulary[0]), ("rare", vocabulary[-1])):
+            for entity_type in ("tool", "resource", "prompt"):
+                model = MODELS[entity_type]
+                scan_query = select(model.id).where(json_contains_expr(db, model.tags, [tag]))
+                index_query = select(model.id).where(entity_tags_expr(model.id, entity_type, [tag]))
+                matches = set(db.execute(index_query).scalars())
+                assert matches == set(db.execute(scan_query).scalars()), (entity_type, tag)
+                scan = mean_ms(lambda query=scan_query: db.execute(query).scalars().all(), args.iterations)
+                index = mean_ms(lambda query=index_query: db.execute(query).scalars().all(), args.iterations)
+                rows.append((f"filter {entity_type}s by {label} tag ({len(matches)})", scan, index))
+
+        indexed_counts = {info.name: info.stats.total for info in asyncio.run(service.get_all_tags(db))}
+        assert indexed_counts == dict(scan_tag_counts(db))
+        scan = mean_ms(lambda: scan_tag_counts(db), max(1, args.iterations // 4))
+        index = mean_ms(lambda: asyncio.run(service.get_all_tags(db)), max(1, args.iterations // 4))
+        rows.append(("count all tags", scan, index))
+
+    print(f"{'Operation':<40} {'scan ms':>9} {'index ms':>9} {'speedup':>8}")
+    print("-" * 69)
+    for operation, scan, index in rows:
+        print(f"{operation:<40} {scan:>9.2f} {index:>9.2f} {scan / index:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,19 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 # First-Party
+from mcpgateway.cache.auth_cache import set_auth_cache
+from mcpgateway.cache.catalog_snapshot import set_catalog_snapshot_cache
+from mcpgateway.cache.completion_index import set_completion_index
+from mcpgateway.cache.permission_cache import set_permission_cache
+from mcpgateway.cache.tool_lookup_cache import set_tool_lookup_cache
+from mcpgateway.services.encryption_service import clear_derived_key_cache
+from mcpgateway.services.event_service import set_event_fanout
+from mcpgateway.services.latency_sketch_service import set_latency_sketch_service
+from mcpgateway.services.mcp_session_pool import set_mcp_session_pool
+from mcpgateway.services.metrics_buffer_service import set_metrics_buffer_service
+from mcpgateway.services.oauth_manager import set_oauth_token_cache
+from mcpgateway.services.permission_audit_service import set_permission_audit_buffer
+from mcpgateway.services.trace_export_service import set_trace_export_service
 from mcpgateway.config import Settings
 from mcpgateway.db import Base
 
@@ -27,6 +40,7 @@ from mcpgateway.db import Base
 # Skip session-level RBAC patching for now - let individual tests handle it
 # _session_rbac_originals = patch_rbac_decorators()
 
+
 def resolve_test_db_url():
     """Return DB URL based on GitHub Actions matrix or default to SQLite."""
     db = os.getenv("DB", "sqlite").lower()
@@ -139,6 +153,35 @@ def app():
     os.unlink(path)
 
 
+# Process-wide singletons that tests may populate; each is dropped before and
+# after every test so state never leaks between tests or xdist workers.
+SINGLETON_RESETS = [
+    lambda: set_auth_cache(None),
+    lambda: set_tool_lookup_cache(None),
+    lambda: set_permission_cache(None),
+    lambda: set_completion_index(None),
+    lambda: set_catalog_snapshot_cache(None),
+    lambda: set_event_fanout(None),
+    lambda: set_oauth_token_cache(None),
+    lambda: set_mcp_session_pool(None),
+    lambda: set_metrics_buffer_service(None),
+    lambda: set_permission_audit_buffer(None),
+    lambda: set_latency_sketch_service(None),
+    lambda: set_trace_export_service(None),
+    clear_derived_key_cache,
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    """Start and finish every test with fresh process-wide caches and services."""
+    for reset in SINGLETON_RESETS:
+        reset()
+    yield
+    for reset in SINGLETON_RESETS:
+        reset()
+
+
 @pytest.fixture
 def mock_http_client():
     """Create a mock HTTP client."""
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_auth_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for the authentication decision cache.
+"""
+
+# Standard
+from datetime import datetime, timedelta, timezone
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+from fastapi.security import HTTPAuthorizationCredentials
+import pytest
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.auth import get_current_user
+from mcpgateway.cache.auth_cache import AuthCache, AuthDecision, get_auth_cache, set_auth_cache
+from mcpgateway.db import EmailUser
+
+
+@pytest.fixture
+def user():
+    return EmailUser(
+        email="test@example.com",
+        password_hash="hash",
+        full_name="Test User",
+        is_admin=False,
+        is_active=True,
+        is_email_verified=True,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def test_put_get_and_ttl_expiry():
+    cache = AuthCache(max_size=10, ttl=60)
+    cache.put("tok", AuthDecision(email="a@example.com"))
+    assert cache.get("tok").email == "a@example.com"
+
+    with patch("mcpgateway.cache.auth_cache.time.time", return_value=time.time() + 61):
+        assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_never_outlives_token():
+    cache = AuthCache(max_size=10, ttl=3600)
+    cache.put("tok", AuthDecision(email="a@example.com", token_expires_at=time.time() + 5))
+    assert cache.get("tok") is not None
+    with patch("mcpgateway.cache.auth_cache.time.time", return_value=time.time() + 6):
+        assert cache.get("tok") is None
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = AuthCache(max_size=2, ttl=60)
+    cache.put("t1", AuthDecision(email="a@example.com"))
+    cache.put("t2", AuthDecision(email="b@example.com"))
+    cache.get("t1")
+    cache.put("t3", AuthDecision(email="c@example.com"))
+    assert cache.get("t1") is not None
+    assert cache.get("t2") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_raw_token_not_stored():
+    cache = AuthCache(max_size=10, ttl=60)
+    cache.put("secret-token", AuthDecision(email="a@example.com"))
+    assert "secret-token" not in cache._entries
+
+
+def test_disabled_cache_is_noop(monkeypatch):
+    monkeypatch.setattr("mcpgateway.cache.auth_cache.settings.auth_cache_enabled", False)
+    cache = AuthCache(max_size=10, ttl=60)
+    cache.put("tok", AuthDecision(email="a@example.com"))
+    assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_token_and_user():
+    cache = AuthCache(max_size=10, ttl=60)
+    cache.put("t1", AuthDecision(email="a@example.com", jti="j1"))
+    cache.put("t2", AuthDecision(email="a@example.com", jti="j2"))
+    cache.put("t3", AuthDecision(email="b@example.com", jti="j3"))
+
+    await cache.invalidate_token("j1")
+    assert cache.get("t1") is None
+    assert cache.get("t2") is not None
+
+    await cache.invalidate_user("a@example.com")
+    assert cache.get("t2") is None
+    assert cache.get("t3") is not None
+    assert cache.stats()["invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_published_and_applied_across_workers():
+    publisher = AuthCache(max_size=10, ttl=60)
+    publisher._channel._redis = MagicMock(publish=AsyncMock())
+    await publisher.invalidate_user("a@example.com")
+    channel, raw = publisher._channel._redis.publish.await_args.args
+    assert channel.endswith("auth_invalidate")
+
+    other = AuthCache(max_size=10, ttl=60)
+    other.put("t1", AuthDecision(email="a@example.com"))
+
+    async def listen():
+        yield {"type": "subscribe", "data": 1}
+        yield {"type": "message", "data": raw}
+
+    other._channel._pubsub = MagicMock(listen=listen)
+    await other._channel._listen()
+    assert other.get("t1") is None
+
+    # A worker ignores its own messages; it already invalidated locally
+    publisher.put("t1", AuthDecision(email="a@example.com"))
+    assert publisher._channel.apply(json.loads(raw)) is False
+    assert publisher.get("t1") is not None
+
+
+class TestGetCurrentUserCaching:
+    @pytest.mark.asyncio
+    async def test_second_request_skips_verification(self, user):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="jwt")
+        payload = {"sub": "test@example.com", "jti": "j1", "exp": (datetime.now(timezone.utc) + timedelta(hours=1)).timestamp()}
+        verify = AsyncMock(return_value=payload)
+
+        with (
+            patch("mcpgateway.auth.verify_jwt_token", verify),
+            patch("mcpgateway.auth.get_team_from_token", AsyncMock(return_value="team-1")),
+            patch("mcpgateway.services.token_catalog_service.TokenCatalogService") as token_service_class,
+            patch("mcpgateway.services.email_auth_service.EmailAuthService") as auth_service_class,
+        ):
+            token_service_class.return_value.is_token_revoked = AsyncMock(return_value=False)
+            auth_service_class.return_value.get_user_by_email = AsyncMock(return_value=user)
+
+            request = MagicMock()
+            assert await get_current_user(credentials=credentials, db=MagicMock(spec=Session), request=request) == user
+            assert await get_current_user(credentials=credentials, db=MagicMock(spec=Session), request=request) == user
+
+            assert verify.await_count == 1
+            assert token_service_class.return_value.is_token_revoked.await_count == 1
+            assert auth_service_class.return_value.get_user_by_email.await_count == 2
+            assert request.state.team_id == "team-1"
+            assert get_auth_cache().stats()["hits"] == 1
+
+            await get_auth_cache().invalidate_token("j1")
+            await get_current_user(credentials=credentials, db=MagicMock(spec=Session))
+            assert verify.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchecked_revocation_not_cached(self, user):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="jwt")
+        payload = {"sub": "test@example.com", "jti": "j1"}
+        verify = AsyncMock(return_value=payload)
+
+        with (
+            patch("mcpgateway.auth.verify_jwt_token", verify),
+            patch("mcpgateway.auth.get_team_from_token", AsyncMock(return_value=None)),
+            patch("mcpgateway.services.token_catalog_service.TokenCatalogService") as token_service_class,
+            patch("mcpgateway.services.email_auth_service.EmailAuthService") as auth_service_class,
+        ):
+            token_service_class.return_value.is_token_revoked = AsyncMock(side_effect=RuntimeError("db down"))
+            auth_service_class.return_value.get_user_by_email = AsyncMock(return_value=user)
+
+            await get_current_user(credentials=credentials, db=MagicMock(spec=Session))
+            await get_current_user(credentials=credentials, db=MagicMock(spec=Session))
+
+            assert verify.await_count == 2
+            assert get_auth_cache().stats()["size"] == 0
+
+
+def test_set_auth_cache_replaces_singleton():
+    cache = AuthCache(max_size=1, ttl=1)
+    set_auth_cache(cache)
+    assert get_auth_cache() is cache
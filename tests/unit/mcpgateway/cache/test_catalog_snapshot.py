@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_catalog_snapshot.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for the pre-serialized catalog snapshots behind the MCP list methods.
+"""
+
+# Standard
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+import pytest
+
+# First-Party
+from mcpgateway.cache.catalog_snapshot import CatalogSnapshotCache, get_catalog_snapshot_cache
+from mcpgateway.main import app
+from mcpgateway.services.gateway_service import GatewayService
+from mcpgateway.services.server_service import ServerService
+from mcpgateway.services.tool_service import ToolService
+
+
+class _Tool(BaseModel):
+    name: str
+    input_schema: dict = Field(default_factory=dict, alias="inputSchema")
+    created_at: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    description: Optional[str] = None
+    output_schema: Optional[dict] = None
+    annotations: Optional[dict] = None
+
+
+def _tools(*names):
+    return [_Tool(name=name, inputSchema={"type": "object"}) for name in names]
+
+
+def _rpc(client, method="tools/list", params=None, headers=None):
+    with patch("mcpgateway.config.settings.auth_required", False):
+        return client.post("/rpc", json={"jsonrpc": "2.0", "method": method, "params": params or {}, "id": 7}, headers=headers or {})
+
+
+def test_rpc_list_is_served_from_snapshot_with_etag():
+    client = TestClient(app)
+    with patch("mcpgateway.main.tool_service.list_tools", new_callable=AsyncMock, return_value=(_tools("echo"), "next")) as list_tools:
+        first = _rpc(client)
+        second = _rpc(client)
+        not_modified = _rpc(client, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.json() == {
+        "jsonrpc": "2.0",
+        "result": {"tools": [{"name": "echo", "inputSchema": {"type": "object"}, "created_at": "2025-01-01T00:00:00Z"}], "nextCursor": "next"},
+        "id": 7,
+    }
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert list_tools.await_count == 1
+
+
+def test_rpc_pages_and_servers_are_cached_separately():
+    client = TestClient(app)
+    with (
+        patch("mcpgateway.main.tool_service.list_tools", new_callable=AsyncMock, side_effect=[(_tools("a"), "c1"), (_tools("b"), None)]) as list_tools,
+        patch("mcpgateway.main.tool_service.list_server_tools", new_callable=AsyncMock, return_value=_tools("s")) as list_server_tools,
+    ):
+        page1 = _rpc(client)
+        page2 = _rpc(client, params={"cursor": "c1"})
+        server = _rpc(client, params={"server_id": "srv"})
+        _rpc(client, params={"cursor": "c1"})
+
+    assert [tool["name"] for tool in page2.json()["result"]["tools"]] == ["b"]
+    assert server.json()["result"] == {"tools": [{"name": "s", "inputSchema": {"type": "object"}, "created_at": "2025-01-01T00:00:00Z"}]}
+    assert len({page1.headers["etag"], page2.headers["etag"], server.headers["etag"]}) == 3
+    assert list_tools.await_count == 2
+    list_server_tools.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_catalog_events_drop_affected_snapshots():
+    cache = get_catalog_snapshot_cache()
+    service = MagicMock(
+        list_tools=AsyncMock(return_value=(_tools("a"), None)),
+        list_server_tools=AsyncMock(return_value=_tools("a")),
+        list_prompts=AsyncMock(return_value=([], None)),
+    )
+    for server_id in (None, "s1", "s2"):
+        await cache.get(None, "tools", server_id, None, service)
+    await cache.get(None, "prompts", None, None, service)
+
+    servers = ServerService()
+    await servers._notify_server_deleted({"id": "s1", "name": "one"})
+    assert cache.stats()["size"] == 3
+
+    tools = ToolService()
+    tools._event_service = MagicMock(publish_event=AsyncMock())
+    await tools._publish_event({"type": "tool_updated", "data": {"id": "t1"}})
+    assert cache.stats()["size"] == 1  # only prompts/list is left
+
+    # A change on another worker arrives through the invalidation channel
+    assert cache._channel.apply({"origin": "other-worker", "kind": "prompts", "value": None})
+    assert cache.stats()["size"] == 0
+
+    await cache.get(None, "tools", "s2", None, service)
+    gateways = GatewayService()
+    gateways._event_service = MagicMock(publish_event=AsyncMock())
+    await gateways._publish_event({"type": "gateway_deactivated", "data": {"id": "g1"}})
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_build_and_racing_changes_are_not_cached():
+    cache = CatalogSnapshotCache(ttl=60)
+    release = asyncio.Event()
+
+    async def list_tools(db, cursor=None):
+        await release.wait()
+        return _tools("a"), None
+
+    service = SimpleNamespace(list_tools=AsyncMock(side_effect=list_tools))
+    pending = [asyncio.create_task(cache.get(None, "tools", None, None, service)) for _ in range(5)]
+    await asyncio.sleep(0)
+    cache.invalidate_local("tools")  # the catalog changes while the page is being built
+    release.set()
+    snapshots = await asyncio.gather(*pending)
+
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert service.list_tools.await_count == 1
+    assert cache.stats()["shared_builds"] == 4
+    assert cache.stats()["size"] == 0
+
+    # Failures reach every waiter and nothing is cached
+    service.list_tools = AsyncMock(side_effect=RuntimeError("db down"))
+    with pytest.raises(RuntimeError, match="db down"):
+        await cache.get(None, "tools", None, None, service)
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_streamable_http_lists_share_snapshot_and_mcp_types():
+    # First-Party
+    from mcpgateway.transports import streamablehttp_transport as transport
+
+    db = MagicMock()
+    db.__aenter__ = AsyncMock(return_value=db)
+    db.__aexit__ = AsyncMock(return_value=False)
+    token = transport.server_id_var.set(None)
+    try:
+        with (
+            patch.object(transport, "get_db", return_value=db),
+            patch.object(transport.tool_service, "list_tools", new_callable=AsyncMock, return_value=(_tools("echo"), None)) as list_tools,
+        ):
+            first = await transport.list_tools()
+            second = await transport.list_tools()
+    finally:
+        transport.server_id_var.reset(token)
+
+    assert [tool.name for tool in first] == ["echo"]
+    assert first[0] is second[0]
+    list_tools.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_lists_every_time():
+    service = SimpleNamespace(list_prompts=AsyncMock(return_value=([], None)))
+    with patch("mcpgateway.cache.catalog_snapshot.settings.catalog_snapshot_enabled", False):
+        cache = CatalogSnapshotCache(ttl=60)
+        await cache.get(None, "prompts", None, None, service)
+        snapshot = await cache.get(None, "prompts", None, None, service)
+
+    assert snapshot.payload() == {"prompts": []}
+    assert service.list_prompts.await_count == 2
+    assert cache.stats()["size"] == 0
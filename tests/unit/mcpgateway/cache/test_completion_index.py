@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_completion_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for the in-memory completion index behind completion/complete.
+"""
+
+# Standard
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.completion_index import get_completion_index, TermIndex
+from mcpgateway.services.completion_service import CompletionError, CompletionService
+from mcpgateway.services.prompt_service import PromptService
+from mcpgateway.services.resource_service import ResourceService
+
+
+def _db(resources=(), prompt=None):
+    db = MagicMock()
+    db.execute.return_value.scalars.return_value.all.return_value = list(resources)
+    db.execute.return_value.scalar_one_or_none.return_value = prompt
+    return db
+
+
+def test_search_matches_linear_scan():
+    rng = random.Random(7)
+    values = ["".join(rng.choice("abcAB/:.") for _ in range(rng.randint(1, 12))) for _ in range(500)]
+    queries = ["", "a", "B", "ab", "a/b", "ab:c", "zz", "a.b.a"] + [rng.choice(values)[1:5] for _ in range(50)]
+    terms = TermIndex(values[:400])
+    for query in queries:  # index n-grams before the updates below
+        terms.search(query)
+    for value in values[400:]:
+        terms.add(value)
+    for value in values[:100]:
+        terms.discard(value)
+    remaining = set(values[100:])  # values are reference counted
+
+    for query in queries:
+        found, total = terms.search(query, limit=1000)
+        expected = {value for value in remaining if query.lower() in value.lower()}
+        assert set(found) == expected
+        assert total == len(expected)
+
+        # A short page holds the earliest matches: prefix matches, then by match position
+        top, _ = terms.search(query, limit=10)
+        positions = sorted(value.lower().find(query.lower()) for value in expected)
+        assert sorted(value.lower().find(query.lower()) for value in top) == positions[:10]
+
+
+def test_ranking_and_limit():
+    terms = TermIndex(["api/users", "API", "v1/api", "apis", "x-api"] + [f"zz-{i}" for i in range(150)])
+
+    assert terms.search("api") == (["API", "api/users", "apis", "x-api", "v1/api"], 5)
+    assert terms.search("api", limit=2) == (["API", "api/users"], 5)
+    assert terms.complete("zz") == {"values": terms.search("zz")[0], "total": 150, "hasMore": True}
+    assert len(terms.complete("zz")["values"]) == 100
+
+
+@pytest.mark.asyncio
+async def test_resource_uris_load_once_and_follow_resource_events():
+    db = _db([SimpleNamespace(id=1, uri="file://readme.md"), SimpleNamespace(id=2, uri="file://notes.md")])
+    service = CompletionService()
+    ref = {"uri": "file://{path}"}
+
+    assert (await service._complete_resource_uri(db, ref, "md")).completion["total"] == 2
+    assert (await service._complete_resource_uri(db, ref, "read")).completion["values"] == ["file://readme.md"]
+    assert db.execute.call_count == 1
+
+    resources = ResourceService()
+    resources._event_service = MagicMock(publish_event=AsyncMock())
+    await resources._notify_resource_added(SimpleNamespace(id=3, uri="file://todo.md", name="todo", description=None, is_active=True))
+    await resources._notify_resource_updated(SimpleNamespace(id=1, uri="file://README.rst", content="", is_active=True))
+    await resources._notify_resource_deleted({"id": 2, "uri": "file://notes.md", "name": "notes"})
+
+    result = await service._complete_resource_uri(db, ref, "")
+    assert result.completion["values"] == ["file://todo.md", "file://README.rst"]
+    assert db.execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_resource_uris_reload_after_ttl_or_remote_change():
+    index = get_completion_index()
+    db = _db([SimpleNamespace(id=1, uri="a://x")])
+    service = CompletionService()
+
+    await service._complete_resource_uri(db, {"uri": "t"}, "x")
+    with patch("mcpgateway.cache.completion_index.time.time", return_value=time.time() + index.ttl + 1):
+        await service._complete_resource_uri(db, {"uri": "t"}, "x")
+    assert db.execute.call_count == 2
+
+    # Another worker changed a resource: the next request reloads
+    assert index._channel.apply({"origin": "other-worker", "kind": "resource", "value": "9"})
+    await service._complete_resource_uri(db, {"uri": "t"}, "x")
+    assert db.execute.call_count == 3
+    assert index.stats()["reloads"] == 3
+
+
+@pytest.mark.asyncio
+async def test_prompt_arguments_are_indexed_until_prompt_changes():
+    prompt = SimpleNamespace(id=5, name="greet", argument_schema={"properties": {"p": {"name": "tone", "enum": ["formal", "Friendly", "informal"]}}})
+    db = _db(prompt=prompt)
+    service = CompletionService()
+
+    assert (await service._complete_prompt_argument(db, {"name": "greet"}, "tone", "f")).completion["values"] == ["formal", "Friendly", "informal"]
+    with pytest.raises(CompletionError, match="Argument not found: style"):
+        await service._complete_prompt_argument(db, {"name": "greet"}, "style", "")
+    assert db.execute.call_count == 1
+
+    prompts = PromptService()
+    prompts._event_service = MagicMock(publish_event=AsyncMock())
+    await prompts._notify_prompt_deactivated(prompt)
+    db.execute.return_value.scalar_one_or_none.return_value = None
+    with pytest.raises(CompletionError, match="Prompt not found: greet"):
+        await service._complete_prompt_argument(db, {"name": "greet"}, "tone", "f")
+
+
+@pytest.mark.asyncio
+async def test_disabled_index_reads_the_database_every_time():
+    db = _db([SimpleNamespace(id=1, uri="a://x")])
+    with patch("mcpgateway.cache.completion_index.settings.completion_index_enabled", False):
+        service = CompletionService()
+        await service._complete_resource_uri(db, {"uri": "t"}, "x")
+        result = await service._complete_resource_uri(db, {"uri": "t"}, "x")
+    assert result.completion["values"] == ["a://x"]
+    assert db.execute.call_count == 2
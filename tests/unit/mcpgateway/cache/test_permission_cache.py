@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_permission_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for the process-wide RBAC permission cache and batched permission audit writes.
+"""
+
+# Standard
+import asyncio
+from datetime import timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache, PermissionCache
+from mcpgateway.db import utc_now
+from mcpgateway.services.permission_audit_service import PermissionAuditBuffer, set_permission_audit_buffer
+from mcpgateway.services.permission_service import PermissionService
+from mcpgateway.services.role_service import RoleService
+
+
+def _user_role(permissions, expires_at=None, role_id="r1"):
+    role = MagicMock()
+    role.name = f"role-{role_id}"
+    role.permissions = list(permissions)
+    role.get_effective_permissions.return_value = sorted(permissions)
+    return MagicMock(role=role, role_id=role_id, scope="global", expires_at=expires_at)
+
+
+def _db(*rows):
+    """Mock session whose queries return ``rows`` as ``scalars().all()``."""
+    db = MagicMock(spec=Session)
+    db.execute.return_value.scalars.return_value.all.return_value = list(rows)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_resolved_permissions_are_shared_between_service_instances():
+    first_db, second_db = _db(_user_role({"tools.read"})), _db()
+
+    assert await PermissionService(first_db).get_user_permissions("alice@example.com") == {"tools.read"}
+    assert await PermissionService(second_db).get_user_permissions("alice@example.com") == {"tools.read"}
+
+    second_db.execute.assert_not_called()
+    assert get_permission_cache().stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_with_earliest_role_assignment():
+    db = _db(_user_role({"tools.read"}, expires_at=utc_now() + timedelta(seconds=10)))
+    await PermissionService(db).get_user_permissions("alice@example.com")
+
+    with patch("mcpgateway.cache.permission_cache.time.time", return_value=time.time() + 11):
+        await PermissionService(db).get_user_permissions("alice@example.com")
+    assert db.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_role_revocation_invalidates_user_entries():
+    await PermissionService(_db(_user_role({"tools.read"}))).get_user_permissions("alice@example.com", "team-1")
+    await PermissionService(_db(_user_role({"tools.read"}))).get_user_permissions("bob@example.com")
+
+    assignment = MagicMock(is_active=True)
+    with patch.object(RoleService, "get_user_role_assignment", new=AsyncMock(return_value=assignment)):
+        assert await RoleService(MagicMock()).revoke_role_from_user("alice@example.com", "r1", "team", "team-1")
+
+    revoked_db = _db()
+    assert await PermissionService(revoked_db).get_user_permissions("alice@example.com", "team-1") == set()
+    revoked_db.execute.assert_called_once()
+    assert get_permission_cache().stats()["size"] == 2  # bob's entry and alice's fresh one
+
+
+@pytest.mark.asyncio
+async def test_admin_flag_and_team_role_are_cached_until_team_invalidation():
+    db = MagicMock(spec=Session)
+    db.execute.return_value.scalar_one_or_none.return_value = MagicMock(is_admin=False, role="owner")
+    service = PermissionService(db)
+
+    assert await service._is_user_admin("alice@example.com") is False
+    assert await service._is_team_member("alice@example.com", "team-1")
+    assert await PermissionService(db)._get_user_team_role("alice@example.com", "team-1") == "owner"
+    assert db.execute.call_count == 2
+
+    await get_permission_cache().invalidate_team("team-1")
+    assert await service._get_user_team_role("alice@example.com", "team-1") == "owner"
+    assert await service._is_user_admin("alice@example.com") is False
+    assert db.execute.call_count == 3
+
+
+def test_disabled_cache_is_a_pass_through():
+    cache = PermissionCache(max_size=10, ttl=0)
+    cache.put(cache.admin_key("a"), True, user="a")
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_audit_records_are_written_in_batches():
+    buffer = PermissionAuditBuffer(max_size=100, batch_size=100, flush_interval=60)
+    set_permission_audit_buffer(buffer)
+    db = _db(_user_role({"tools.read"}))
+    db.execute.return_value.scalar_one_or_none.return_value = None
+    try:
+        with patch.object(buffer, "_write_batch") as write:
+            await buffer.start()
+            service = PermissionService(db, audit_enabled=True)
+            assert await service.check_permission("alice@example.com", "tools.read")
+            assert not await service.check_permission("alice@example.com", "tools.delete")
+            db.add.assert_not_called()
+            db.commit.assert_not_called()
+            await buffer.shutdown()
+
+        (batch,) = write.call_args[0]
+        assert [(record["permission"], record["granted"]) for record in batch] == [("tools.read", True), ("tools.delete", False)]
+        assert batch[0]["roles_checked"] == {"roles": [{"id": "r1", "name": "role-r1", "scope": "global", "permissions": ["tools.read"]}]}
+    finally:
+        set_permission_audit_buffer(None)
+
+
+@pytest.mark.asyncio
+async def test_audit_shutdown_flushes_partial_batch():
+    buffer = PermissionAuditBuffer(max_size=100, batch_size=100, flush_interval=30)
+    with patch.object(buffer, "_write_batch") as write:
+        await buffer.start()
+        for i in range(5):
+            buffer.record({"user_email": "a@example.com", "permission": f"p{i}", "granted": True})
+        await asyncio.sleep(0.05)  # the writer takes the records off the queue and waits for more
+        assert buffer.get_metrics()["queued"] == 0
+        await buffer.shutdown()
+
+    assert [record["permission"] for call in write.call_args_list for record in call.args[0]] == ["p0", "p1", "p2", "p3", "p4"]
+    assert (buffer.get_metrics()["flushed"], buffer.get_metrics()["failed"]) == (5, 0)
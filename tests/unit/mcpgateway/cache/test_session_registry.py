@@ -203,8 +203,11 @@ async def test_broadcast_and_respond(payload, monkeypatch, registry: SessionRegi
 
     monkeypatch.setattr(registry, "generate_response", fake_generate_response)
 
+    consumer = asyncio.create_task(registry.respond(server_id=None, user={}, session_id="B", base_url="http://localhost"))
     await registry.broadcast("B", payload)
-    await registry.respond(server_id=None, user={}, session_id="B", base_url="http://localhost")
+    await asyncio.sleep(0)
+    await registry.remove_session("B")
+    await asyncio.wait_for(consumer, timeout=1)
 
     assert captured["transport"] is tr
     assert captured["message"] == payload
@@ -844,6 +847,73 @@ async def test_generate_response_no_method_or_id(registry: SessionRegistry):
     assert len(tr.sent) == 0
 
 
+@pytest.mark.asyncio
+async def test_generate_response_in_process_dispatch(registry: SessionRegistry):
+    """With a dispatcher registered, messages skip the /rpc loopback call."""
+    tr = FakeSSETransport("inproc")
+    await registry.add_session("inproc", tr)
+    calls = []
+
+    async def dispatcher(message, user):
+        calls.append((message, user))
+        return {"jsonrpc": "2.0", "result": {"tools": []}, "id": message["id"]}
+
+    registry.set_rpc_dispatcher(dispatcher)
+    user = {"email": "user@example.com"}
+    with patch("mcpgateway.cache.session_registry.ResilientHttpClient") as mock_client, patch("mcpgateway.cache.session_registry.create_jwt_token") as mock_token:
+        await registry.generate_response(message={"method": "tools/list", "id": 5, "params": {}}, transport=tr, server_id="srv", user=user, base_url="http://host/servers/srv")
+        mock_client.assert_not_called()
+        mock_token.assert_not_called()
+
+    assert calls == [({"jsonrpc": "2.0", "method": "tools/list", "params": {"server_id": "srv"}, "id": 5}, user)]
+    assert tr.sent == [{"jsonrpc": "2.0", "result": {"tools": []}, "id": 5}]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_in_process_dispatch_initialize_and_errors(registry: SessionRegistry):
+    """Initialize notifications still follow, and dispatcher failures become JSON-RPC errors."""
+    tr = FakeSSETransport("inproc-init")
+    await registry.add_session("inproc-init", tr)
+
+    async def dispatcher(message, _user):
+        if message["method"] == "initialize":
+            return {"jsonrpc": "2.0", "result": {"protocolVersion": settings.protocol_version}, "id": message["id"]}
+        raise RuntimeError("boom")
+
+    registry.set_rpc_dispatcher(dispatcher)
+    await registry.generate_response(message={"method": "initialize", "id": 1, "params": {}}, transport=tr, server_id=None, user={}, base_url="http://host")
+    assert tr.sent[0]["result"]["protocolVersion"] == settings.protocol_version
+    assert [m["method"] for m in tr.sent[1:]] == ["notifications/initialized", "notifications/tools/list_changed", "notifications/resources/list_changed", "notifications/prompts/list_changed"]
+
+    tr.sent.clear()
+    await registry.generate_response(message={"method": "ping", "id": 2}, transport=tr, server_id=None, user={}, base_url="http://host")
+    assert tr.sent == [{"jsonrpc": "2.0", "error": {"code": -32000, "message": "Internal error", "data": "boom"}, "id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_in_process_dispatch_batch(registry: SessionRegistry):
+    """A batch is dispatched as one call with every request scoped to the server."""
+    tr = FakeSSETransport("inproc-batch")
+    await registry.add_session("inproc-batch", tr)
+    calls = []
+
+    async def dispatcher(message, _user):
+        calls.append(message)
+        return [{"jsonrpc": "2.0", "result": {}, "id": item["id"]} for item in message if "id" in item] or None
+
+    registry.set_rpc_dispatcher(dispatcher)
+    batch = [{"jsonrpc": "2.0", "method": "ping", "id": 1}, {"jsonrpc": "2.0", "method": "tools/list", "id": 2, "params": {"cursor": "c"}}]
+    await registry.generate_response(message=batch, transport=tr, server_id="srv", user={}, base_url="http://host")
+
+    assert calls[0][1]["params"] == {"cursor": "c", "server_id": "srv"}
+    assert calls[0][0]["params"] == {"server_id": "srv"}
+    assert tr.sent == [[{"jsonrpc": "2.0", "result": {}, "id": 1}, {"jsonrpc": "2.0", "result": {}, "id": 2}]]
+
+    # A batch of notifications produces no response
+    await registry.generate_response(message=[{"jsonrpc": "2.0", "method": "notifications/initialized"}], transport=tr, server_id=None, user={}, base_url="http://host")
+    assert len(tr.sent) == 1
+
+
 # --------------------------------------------------------------------------- #
 # handle_initialize_logic success & errors                                    #
 # --------------------------------------------------------------------------- #
@@ -1325,9 +1395,13 @@ async def test_full_memory_workflow(stub_db, stub_services):
             async def __aexit__(self, exc_type, exc_val, exc_tb):
                 return None
 
-        # Respond to message
+        # Respond to message, then let the consumer exit
         with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-            await registry.respond(server_id=None, user={"token": "test"}, session_id="workflow_test", base_url="http://localhost")
+            consumer = asyncio.create_task(registry.respond(server_id=None, user={"token": "test"}, session_id="workflow_test", base_url="http://localhost"))
+            for _ in range(100):
+                if len(transport.sent) >= 5:
+                    break
+                await asyncio.sleep(0.01)
 
         # Should have received initialize response + notifications
         assert len(transport.sent) >= 5
@@ -1339,6 +1413,7 @@ async def test_full_memory_workflow(stub_db, stub_services):
 
         # Clean up
         await registry.remove_session("workflow_test")
+        await asyncio.wait_for(consumer, timeout=1)
         assert transport.disconnect_called
 
     finally:
@@ -1462,51 +1537,73 @@ async def test_remove_session_transport_disconnect_error(registry: SessionRegist
 
 
 @pytest.mark.asyncio
-async def test_respond_memory_backend_no_message(registry: SessionRegistry):
-    """Test respond with memory backend when no message is stored."""
-    tr = FakeSSETransport("test_session")
-    await registry.add_session("test_session", tr)
+async def test_respond_memory_backend_unknown_session(registry: SessionRegistry):
+    """respond returns immediately for a session without a queue; broadcasts to it are dropped."""
+    await registry.broadcast("missing_session", {"method": "ping", "id": 1})
 
-    # Ensure no message is stored
-    registry._session_message = None
+    with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
+        await asyncio.wait_for(registry.respond(server_id=None, user={"token": "test"}, session_id="missing_session", base_url="http://localhost"), timeout=1)
 
-    # The respond method should handle None _session_message gracefully
-    # Since the actual code has a bug, we'll test that it doesn't crash
-    try:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
-    except AttributeError:
-        # This is expected due to the bug in the source code
-        pass
+        mock_gen.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_respond_memory_backend_with_message_no_transport(registry: SessionRegistry):
-    """Test respond with memory backend when message exists but no transport."""
-    registry._session_message = {"session_id": "missing_session", "message": json.dumps({"method": "ping", "id": 1})}
+async def test_respond_memory_backend_delivers_concurrent_broadcasts(registry: SessionRegistry):
+    """Concurrent broadcasts are all delivered, in order, and the consumer exits on removal."""
+    tr = FakeSSETransport("test_session")
+    await registry.add_session("test_session", tr)
 
     with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="missing_session", base_url="http://localhost")
+        consumer = asyncio.create_task(registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost"))
+        await asyncio.gather(*(registry.broadcast("test_session", {"method": "ping", "id": i}) for i in range(50)))
+        for _ in range(100):
+            if mock_gen.await_count == 50:
+                break
+            await asyncio.sleep(0.01)
 
-        mock_gen.assert_not_called()
+        assert [c.kwargs["message"]["id"] for c in mock_gen.await_args_list] == list(range(50))
+        assert all(c.kwargs["transport"] is tr for c in mock_gen.await_args_list)
+
+        await registry.remove_session("test_session")
+        await asyncio.wait_for(consumer, timeout=1)
 
 
 @pytest.mark.asyncio
-async def test_respond_memory_backend_with_session_message_check(registry: SessionRegistry):
-    """Test respond memory backend checks _session_message properly."""
-    tr = FakeSSETransport("test_session")
-    await registry.add_session("test_session", tr)
+@pytest.mark.parametrize("policy, expected", [("drop_oldest", [1, 2]), ("drop_newest", [0, 1])])
+async def test_broadcast_memory_queue_overflow(monkeypatch, registry: SessionRegistry, policy, expected):
+    """A full queue applies the configured drop policy and counts the drop."""
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_queue_maxsize", 2)
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_queue_overflow", policy)
+    await registry.add_session("full", FakeSSETransport("full"))
 
-    # Set up a message but without transport
-    registry._session_message = {"session_id": "test_session", "message": json.dumps({"method": "ping", "id": 1})}
+    for i in range(3):
+        await registry.broadcast("full", {"id": i})
+
+    queue = registry._session_queues["full"]
+    assert [queue.get_nowait()["id"] for _ in range(queue.qsize())] == expected
+    assert registry._dropped_messages == 1
 
-    with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
 
-        # Should call generate_response since transport exists
-        mock_gen.assert_called_once()
-        args, kwargs = mock_gen.call_args
-        assert kwargs["message"] == {"method": "ping", "id": 1}
-        assert kwargs["transport"] is tr
+@pytest.mark.asyncio
+async def test_broadcast_memory_queue_blocks_then_times_out(monkeypatch, registry: SessionRegistry):
+    """The block policy waits for room, then drops once the put timeout passes."""
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_queue_maxsize", 1)
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_queue_overflow", "block")
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_queue_put_timeout", 0.05)
+    await registry.add_session("slow", FakeSSETransport("slow"))
+    queue = registry._session_queues["slow"]
+
+    await registry.broadcast("slow", {"id": 0})
+    pending = asyncio.create_task(registry.broadcast("slow", {"id": 1}))
+    await asyncio.sleep(0)
+    assert not pending.done()
+    assert queue.get_nowait()["id"] == 0
+    await pending
+    assert queue.get_nowait()["id"] == 1
+
+    await registry.broadcast("slow", {"id": 2})
+    await registry.broadcast("slow", {"id": 3})
+    assert registry._dropped_messages == 1
 
 
 @pytest.mark.asyncio
@@ -15,7 +15,6 @@ from __future__ import annotations
 # Standard
 import asyncio
 import json
-import logging
 import sys
 import time
 from asyncio import Lock
@@ -298,167 +297,95 @@ class TestRedisBackendRespond:
 
 
 class TestDatabaseBackendRespond:
-    """Test Database backend respond method."""
+    """Test the per-worker database message poller behind respond()."""
 
-    @pytest.mark.asyncio
-    async def test_database_respond_message_check_loop(self, monkeypatch, mock_sse_transport):
-        """Test Database backend respond method with message polling."""
-        mock_db_session = Mock()
-        call_count = 0
-
-        def mock_get_db():
-            yield mock_db_session
-
-        def mock_db_read(session_id):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # Return a message on first call
-                mock_record = Mock()
-                mock_record.message = json.dumps({"method": "ping", "id": 1})
-                return mock_record
-            else:
-                # No message on subsequent calls
-                return None
-
-        def mock_db_read_session(session_id):
-            if call_count < 3:  # Session exists for first few calls
-                return Mock()  # Non-None session record
-            else:
-                return None  # Session doesn't exist, break loop
-
-        def mock_db_remove(session_id, message):
-            pass  # Mock message removal
-
-        with patch("mcpgateway.cache.session_registry.SQLALCHEMY_AVAILABLE", True):
-            with patch("mcpgateway.cache.session_registry.get_db", mock_get_db):
-                with patch("asyncio.to_thread") as mock_to_thread:
-                    # Map asyncio.to_thread calls to appropriate functions
-                    def side_effect(func, *args):
-                        if func.__name__ == "_db_read":
-                            return mock_db_read(*args)
-                        elif func.__name__ == "_db_read_session":
-                            return mock_db_read_session(*args)
-                        elif func.__name__ == "_db_remove":
-                            return mock_db_remove(*args)
-                        else:
-                            return func(*args)
-
-                    mock_to_thread.side_effect = side_effect
+    @pytest.fixture
+    def sqlite_db(self, monkeypatch):
+        """Point the registry's get_db at an in-memory SQLite database."""
+        # Third-Party
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
 
-                    registry = SessionRegistry(backend="database", database_url="sqlite:///test.db")
-
-                    await registry.add_session("test_session", mock_sse_transport)
+        # First-Party
+        from mcpgateway.db import Base
 
-                    # Mock generate_response to track calls
-                    with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-                        # Start respond - this will create the message_check_loop task
-                        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
 
-                        # Give some time for the background task to run
-                        await asyncio.sleep(0.2)
+        def fake_get_db():
+            yield factory()
 
-                        # Verify generate_response was called
-                        mock_gen.assert_called()
+        monkeypatch.setattr("mcpgateway.cache.session_registry.SQLALCHEMY_AVAILABLE", True)
+        monkeypatch.setattr("mcpgateway.cache.session_registry.get_db", fake_get_db)
+        monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_poll_min_interval", 0.01)
+        monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_poll_max_interval", 0.05)
+        yield factory
+        engine.dispose()
 
     @pytest.mark.asyncio
-    async def test_database_respond_ready_to_respond_logging(self, monkeypatch, caplog, mock_sse_transport):
-        """Test database respond logs 'Ready to respond'."""
-        mock_db_session = Mock()
-
-        def mock_get_db():
-            yield mock_db_session
-
-        def mock_db_read(session_id):
-            # Return a message
-            mock_record = Mock()
-            mock_record.message = json.dumps({"method": "ping", "id": 1})
-            return mock_record
-
-        def mock_db_read_session(session_id):
-            return None  # Session doesn't exist, break loop immediately
-
-        def mock_db_remove(session_id, message):
-            pass
-
-        with patch("mcpgateway.cache.session_registry.SQLALCHEMY_AVAILABLE", True):
-            with patch("mcpgateway.cache.session_registry.get_db", mock_get_db):
-                with patch("asyncio.to_thread") as mock_to_thread:
-
-                    def side_effect(func, *args):
-                        if func.__name__ == "_db_read":
-                            return mock_db_read(*args)
-                        elif func.__name__ == "_db_read_session":
-                            return mock_db_read_session(*args)
-                        elif func.__name__ == "_db_remove":
-                            return mock_db_remove(*args)
-                        else:
-                            return func(*args)
+    async def test_database_respond_delivers_broadcast(self, sqlite_db, mock_sse_transport):
+        """A broadcast to a local session is claimed once and delivered in order."""
+        # First-Party
+        from mcpgateway.db import SessionMessageRecord
+
+        registry = SessionRegistry(backend="database", database_url="sqlite://")
+        await registry.add_session("test_session", mock_sse_transport)
+
+        with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
+            await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
+            await registry.broadcast("test_session", {"method": "ping", "id": 1})
+            await registry.broadcast("test_session", {"method": "ping", "id": 2})
+            for _ in range(50):
+                if mock_gen.await_count == 2:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert [c.kwargs["message"]["id"] for c in mock_gen.await_args_list] == [1, 2]
+            assert mock_gen.await_args_list[0].kwargs["base_url"] == "http://localhost"
+            with sqlite_db() as db:
+                assert db.query(SessionMessageRecord).count() == 0
 
-                    mock_to_thread.side_effect = side_effect
-
-                    registry = SessionRegistry(backend="database", database_url="sqlite:///test.db")
-
-                    await registry.add_session("test_session", mock_sse_transport)
-
-                    # Mock generate_response
-                    with patch.object(registry, "generate_response", new_callable=AsyncMock):
-                        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
-
-                        # Give time for background task
-                        await asyncio.sleep(0.1)
-
-                        # Should log "Ready to respond"
-                        assert "Ready to respond" in caplog.text
+        await registry.shutdown()
 
     @pytest.mark.asyncio
-    async def test_database_respond_message_remove_logging(self, monkeypatch, caplog, mock_sse_transport):
-        """Test database message removal logs correctly."""
-        mock_db_session = Mock()
-
-        def mock_get_db():
-            yield mock_db_session
-
-        def mock_db_remove_with_logging(session_id, message):
-            # Simulate the actual function that logs
-            logger = logging.getLogger("mcpgateway.cache.session_registry")
-            logger.info("Removed message from mcp_messages table")
-
-        def mock_db_read(session_id):
-            mock_record = Mock()
-            mock_record.message = json.dumps({"method": "ping", "id": 1})
-            return mock_record
-
-        def mock_db_read_session(session_id):
-            return None  # Break loop after first iteration
-
-        with patch("mcpgateway.cache.session_registry.SQLALCHEMY_AVAILABLE", True):
-            with patch("mcpgateway.cache.session_registry.get_db", mock_get_db):
-                with patch("asyncio.to_thread") as mock_to_thread:
-
-                    def side_effect(func, *args):
-                        if func.__name__ == "_db_read":
-                            return mock_db_read(*args)
-                        elif func.__name__ == "_db_read_session":
-                            return mock_db_read_session(*args)
-                        elif func.__name__ == "_db_remove":
-                            return mock_db_remove_with_logging(*args)
-                        else:
-                            return func(*args)
-
-                    mock_to_thread.side_effect = side_effect
-
-                    registry = SessionRegistry(backend="database", database_url="sqlite:///test.db")
-
-                    await registry.add_session("test_session", mock_sse_transport)
-
-                    with patch.object(registry, "generate_response", new_callable=AsyncMock):
-                        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
-
-                        await asyncio.sleep(0.1)
+    async def test_database_poller_cost_independent_of_session_count(self, sqlite_db, mock_sse_transport):
+        """Idle sessions share one poll; the old loop issued two queries per session every 100 ms."""
+        registry = SessionRegistry(backend="database", database_url="sqlite://")
+        for i in range(200):
+            await registry.add_session(f"s{i}", mock_sse_transport)
+            await registry.respond(server_id=None, user={"token": "test"}, session_id=f"s{i}", base_url="http://localhost")
+
+        claim = registry._db_claim_messages
+        with patch.object(registry, "_db_claim_messages", side_effect=claim) as spy:
+            registry._db_poll_wakeup.set()
+            await asyncio.sleep(0.3)
+
+        # With 200 sessions the previous design ran ~1200 queries in 0.3 s
+        assert 1 <= spy.call_count <= 12
+        assert all(len(c.args[0]) == 200 for c in spy.call_args_list)
+        await registry.shutdown()
 
-                        # Should log message removal
-                        assert "Removed message from mcp_messages table" in caplog.text
+    @pytest.mark.asyncio
+    async def test_database_poller_drops_removed_sessions(self, sqlite_db, mock_sse_transport):
+        """Sessions deleted from the database (e.g. by another worker) stop being polled."""
+        # First-Party
+        from mcpgateway.db import SessionRecord
+
+        registry = SessionRegistry(backend="database", database_url="sqlite://")
+        await registry.add_session("gone", mock_sse_transport)
+        await registry.respond(server_id=None, user={"token": "test"}, session_id="gone", base_url="http://localhost")
+        with sqlite_db() as db:
+            db.query(SessionRecord).delete()
+            db.commit()
+
+        for _ in range(50):
+            if "gone" not in registry._db_listeners:
+                break
+            await asyncio.sleep(0.01)
+        assert registry._db_listeners == {}
+        await registry.shutdown()
 
 
 class TestDatabaseCleanupTask:
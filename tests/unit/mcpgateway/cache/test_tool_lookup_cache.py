@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_tool_lookup_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for the tool lookup cache used by tools/call.
+"""
+
+# Standard
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.tool_lookup_cache import get_tool_lookup_cache, ResolvedTool, ToolLookupCache
+from mcpgateway.services.gateway_service import GatewayService
+from mcpgateway.services.tool_service import ToolService
+
+
+def _rest_tool(**overrides):
+    fields = dict(
+        id="t1",
+        name="weather",
+        original_name="weather",
+        gateway_id=None,
+        gateway=None,
+        integration_type="REST",
+        request_type="GET",
+        url="http://api.example.com/weather",
+        description="Current weather",
+        headers={"Accept": "application/json"},
+        auth_type="bearer",
+        auth_value="encrypted",
+        oauth_config=None,
+        annotations={},
+        jsonpath_filter="",
+        output_schema=None,
+        reachable=True,
+        enabled=True,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def tool_service():
+    service = ToolService()
+    service._http_client = AsyncMock()
+    response = Mock(status_code=200, raise_for_status=Mock(), json=Mock(return_value={"ok": True}))
+    service._http_client.get = AsyncMock(return_value=response)
+    service._record_tool_metric = AsyncMock()
+    service._event_service = AsyncMock()
+    return service
+
+
+def test_ttl_expiry():
+    cache = ToolLookupCache(max_size=10, ttl=60)
+    cache.put("weather", ResolvedTool(id="t1"))
+    with patch("mcpgateway.cache.tool_lookup_cache.time.time", return_value=time.time() + 61):
+        assert cache.get("weather") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_by_tool_and_gateway():
+    cache = ToolLookupCache(max_size=10, ttl=60)
+    cache.put("a", ResolvedTool(id="t1", gateway_id="g1"))
+    cache.put("b", ResolvedTool(id="t2", gateway_id="g1"))
+    cache.put("c", ResolvedTool(id="t3", gateway_id="g2"))
+
+    assert cache.invalidate_local("tool", "t1") == 1
+    assert cache.invalidate_local("gateway", "g1") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_snapshot_headers_are_copied():
+    row = _rest_tool()
+    resolved = ResolvedTool.from_db(row)
+    resolved.headers["Authorization"] = "Bearer x"
+    assert "Authorization" not in row.headers
+
+
+@pytest.mark.asyncio
+async def test_repeat_invocations_skip_catalog_and_decrypt(tool_service):
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = _rest_tool()
+
+    with patch("mcpgateway.services.tool_service.decode_auth", return_value={"Authorization": "Bearer secret"}) as decode:
+        await tool_service.invoke_tool(db, "weather", {})
+        await tool_service.invoke_tool(db, "weather", {})
+
+    assert db.execute.call_count == 1
+    assert decode.call_count == 1
+    for call in tool_service._http_client.get.await_args_list:
+        assert call.kwargs["headers"] == {"Accept": "application/json", "Authorization": "Bearer secret"}
+    assert get_tool_lookup_cache().stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_event_invalidates(tool_service):
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = _rest_tool()
+
+    with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+        await tool_service.invoke_tool(db, "weather", {})
+        await tool_service._notify_tool_updated(_rest_tool(url="http://api.example.com/v2/weather"))
+        db.execute.return_value.scalar_one_or_none.return_value = _rest_tool(url="http://api.example.com/v2/weather")
+        await tool_service.invoke_tool(db, "weather", {})
+
+    assert db.execute.call_count == 2
+    assert tool_service._http_client.get.await_args.args[0] == "http://api.example.com/v2/weather"
+
+
+@pytest.mark.asyncio
+async def test_gateway_event_invalidates_its_tools(tool_service):
+    gateway = SimpleNamespace(id="g1", name="gw", url="http://gw/mcp", enabled=True, auth_type=None, auth_value=None)
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = _rest_tool(gateway_id="g1", gateway=gateway)
+
+    with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+        await tool_service.invoke_tool(db, "weather", {})
+        gateway_service = GatewayService()
+        gateway_service._event_service = AsyncMock()
+        await gateway_service._publish_event({"type": "gateway_updated", "data": {"id": "g1"}})
+        await tool_service.invoke_tool(db, "weather", {})
+
+    assert db.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_queries(tool_service, monkeypatch):
+    monkeypatch.setattr("mcpgateway.cache.tool_lookup_cache.settings.tool_lookup_cache_enabled", False)
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = _rest_tool()
+
+    with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+        await tool_service.invoke_tool(db, "weather", {})
+        await tool_service.invoke_tool(db, "weather", {})
+
+    assert db.execute.call_count == 2
@@ -17,6 +17,7 @@ Tests verify:
 
 # Standard
 import importlib
+import json
 import inspect as pyinspect
 import re
 
@@ -372,3 +373,42 @@ class TestMigrationChain:
         revisions = [m["revision"] for m in OBSERVABILITY_MIGRATIONS]
 
         assert len(revisions) == len(set(revisions)), "Duplicate revision IDs found"
+
+
+class TestLatencySketchesMigration:
+    """Test migration m7g8h9i0j1k2 (add observability latency sketches)."""
+
+    def test_upgrade_backfills_sketches_from_stored_traces(self):
+        """Traces stored before the upgrade are folded into one sketch row per bucket."""
+        # Standard
+        from datetime import datetime, timedelta, timezone
+        from unittest.mock import patch
+
+        # Third-Party
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+        from sqlalchemy import create_engine, insert, text
+
+        # First-Party
+        from mcpgateway.db import ObservabilityTrace
+        from mcpgateway.services.latency_sketch_service import LatencySketch
+
+        module = importlib.import_module("mcpgateway.alembic.versions.m7g8h9i0j1k2_add_observability_latency_sketches")
+        engine = create_engine("sqlite://")
+        ObservabilityTrace.__table__.create(engine)
+        base = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+        traces = [(1, 10.0, "ok"), (2, None, "unset"), (3, 30.0, "error"), (7, 20.0, "ok")]
+
+        with engine.begin() as conn:
+            conn.execute(
+                insert(ObservabilityTrace.__table__),
+                [{"trace_id": f"t{minute}", "name": "GET /tools", "start_time": base + timedelta(minutes=minute), "duration_ms": duration, "status": status} for minute, duration, status in traces],
+            )
+            with patch("mcpgateway.config.settings.observability_sketch_bucket_seconds", 300):
+                with Operations.context(MigrationContext.configure(conn)):
+                    module.upgrade()
+            rows = conn.execute(text("SELECT entity_type, entity_id, count, success_count, error_count, sketch FROM observability_latency_sketches ORDER BY bucket_start")).all()
+
+        assert [row[:5] for row in rows] == [("trace", "*", 2, 1, 1), ("trace", "*", 1, 1, 0)]
+        first = LatencySketch.from_dict(json.loads(rows[0][5]))
+        assert (first.min, first.max) == (10.0, 30.0)
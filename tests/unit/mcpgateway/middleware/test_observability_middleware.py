@@ -114,3 +114,31 @@ async def test_dispatch_close_db_failure(mock_request, mock_call_next):
          patch.object(middleware.service, "end_trace"):
         response = await middleware.dispatch(mock_request, mock_call_next)
         assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_dispatch_head_sampling_skips_trace(mock_request, mock_call_next):
+    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    with patch("mcpgateway.middleware.observability_middleware.settings") as mock_settings, \
+         patch.object(middleware.service, "start_trace") as mock_start_trace:
+        mock_settings.observability_sample_rate = 0.0
+        response = await middleware.dispatch(mock_request, mock_call_next)
+        assert response.status_code == 200
+        mock_start_trace.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_buffered_needs_no_session(mock_request, mock_call_next):
+    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    exporter = MagicMock(running=True)
+    with patch("mcpgateway.middleware.observability_middleware.get_trace_export_service", return_value=exporter), \
+         patch("mcpgateway.middleware.observability_middleware.SessionLocal") as mock_session, \
+         patch.object(middleware.service, "start_trace", return_value="trace123") as mock_start_trace, \
+         patch.object(middleware.service, "start_span", return_value="span123"), \
+         patch.object(middleware.service, "end_span"), \
+         patch.object(middleware.service, "end_trace") as mock_end_trace:
+        response = await middleware.dispatch(mock_request, mock_call_next)
+        assert response.status_code == 200
+        mock_session.assert_not_called()
+        assert mock_start_trace.call_args.kwargs["db"] is None
+        mock_end_trace.assert_called_once()
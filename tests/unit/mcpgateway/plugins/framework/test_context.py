@@ -140,3 +140,46 @@ async def test_shared_context_across_pre_post_hooks_multi_plugins():
     assert result.modified_payload is None
     """
     await manager.shutdown()
+
+
+def test_global_context_fork_is_isolated_until_merged():
+    tool = {"name": "search", "schema": {"properties": {"q": {"type": "string"}}}}
+    global_context = GlobalContext(request_id="1", state={"hits": [1]}, metadata={"tool": tool, "flag": True})
+    fork = global_context.fork()
+
+    # Reads of untouched values do not copy; mutations stay in the fork
+    assert fork.metadata["flag"] is True
+    fork.state["hits"].append(2)
+    fork.metadata["tool"]["schema"]["properties"]["q"]["type"] = "int"
+    fork.state["new"] = {"a": 1}
+    del fork.metadata["flag"]
+    assert global_context.state == {"hits": [1]}
+    assert tool["schema"]["properties"]["q"]["type"] == "string"
+    assert dict(fork.state) == {"hits": [1, 2], "new": {"a": 1}}
+    assert list(fork.metadata.items()) == [("tool", {"name": "search", "schema": {"properties": {"q": {"type": "int"}}}})]
+
+    # Merging applies writes and touched values; deletions are not propagated
+    global_context.merge(fork)
+    assert global_context.state == {"hits": [1, 2], "new": {"a": 1}}
+    assert global_context.metadata["tool"]["schema"]["properties"]["q"]["type"] == "int"
+    assert global_context.metadata["flag"] is True
+
+
+def test_global_context_fork_exposes_no_shared_values():
+    nested = {"inner": [1]}
+    readers = [
+        lambda state: {**state}["a"],
+        lambda state: dict(state)["a"],
+        lambda state: state.get("a"),
+        lambda state: state.setdefault("a"),
+        lambda state: next(iter(state.values())),
+        lambda state: state.copy()["a"],
+        lambda state: state.pop("a"),
+        lambda state: state.popitem()[1],
+    ]
+    for read in readers:
+        fork = GlobalContext(request_id="1", state={"a": nested}).fork()
+        value = read(fork.state)
+        assert value == nested and value is not nested
+        value["inner"].append(2)
+    assert nested == {"inner": [1]}
@@ -968,3 +968,73 @@ async def test_manager_tool_post_invoke_coverage():
         assert result.modified_payload.result["original"] == "data"
 
     await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_manager_parallel_band_non_modifying_plugins():
+    """Same-priority plugins that do not modify the payload run concurrently and merge in priority order."""
+
+    class SlowObserver(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            await asyncio.sleep(self.config.config["delay"])
+            context.global_context.state[self.name] = True
+            return PluginResult(metadata={self.name: True, "shared": self.name}, modified_payload=PromptPrehookPayload(prompt_id="ignored", args={}))
+
+    class Rewriter(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            return PluginResult(modified_payload=PromptPrehookPayload(prompt_id=payload.prompt_id, args={"seen": ",".join(sorted(context.global_context.state))}))
+
+    manager = PluginManager("./tests/unit/mcpgateway/plugins/fixtures/configs/valid_no_plugin.yaml")
+    await manager.initialize()
+
+    def config(name, delay=0.0, modifies=False):
+        return PluginConfig(name=name, kind=name, hooks=["prompt_pre_fetch"], priority=10, modifies_payload=modifies, config={"delay": delay})
+
+    refs = [
+        HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(SlowObserver(config("first", delay=0.3)))),
+        HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(SlowObserver(config("second", delay=0.3)))),
+        HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(Rewriter(config("rewriter", modifies=True)))),
+    ]
+    with patch.object(manager._registry, "get_hook_refs_for_hook", return_value=refs):
+        start = asyncio.get_running_loop().time()
+        result, contexts = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, PromptPrehookPayload(prompt_id="p", args={}), global_context=GlobalContext(request_id="1"))
+        elapsed = asyncio.get_running_loop().time() - start
+
+    assert elapsed < 0.55
+    assert result.continue_processing
+    assert result.metadata == {"first": True, "second": True, "shared": "second"}
+    # The modifying plugin runs after the band and sees both observers' state; observers' payloads are ignored
+    assert result.modified_payload.prompt_id == "p"
+    assert result.modified_payload.args == {"seen": "first,second"}
+    assert len(contexts) == 3
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_manager_parallel_band_first_block_in_order_wins():
+    """A block from a concurrent band is reported for the first blocking plugin in priority order."""
+
+    class Blocker(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            await asyncio.sleep(self.config.config["delay"])
+            return PluginResult(continue_processing=False, violation=PluginViolation(reason="blocked", description=self.name, code=self.name.upper(), details={}))
+
+    manager = PluginManager("./tests/unit/mcpgateway/plugins/fixtures/configs/valid_no_plugin.yaml")
+    await manager.initialize()
+
+    refs = [
+        HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(Blocker(PluginConfig(name=name, kind=name, hooks=["prompt_pre_fetch"], modifies_payload=False, config={"delay": delay}))))
+        for name, delay in (("slow", 0.05), ("fast", 0.0))
+    ]
+    with patch.object(manager._registry, "get_hook_refs_for_hook", return_value=refs):
+        payload = PromptPrehookPayload(prompt_id="p", args={})
+        result, _ = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, payload, global_context=GlobalContext(request_id="1"))
+        assert not result.continue_processing
+        assert result.violation.code == "SLOW"
+
+        with pytest.raises(PluginViolationError) as pve:
+            await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, payload, global_context=GlobalContext(request_id="2"), violations_as_exceptions=True)
+        assert pve.value.violation.plugin_name == "slow"
+
+    await manager.shutdown()
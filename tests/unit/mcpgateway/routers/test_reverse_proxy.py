@@ -26,6 +26,8 @@ from mcpgateway.routers.reverse_proxy import (
     ReverseProxyManager,
     ReverseProxySession,
     router,
+    SessionBusyError,
+    SessionNotFoundError,
 )
 from mcpgateway.utils.verify_credentials import require_auth
 
@@ -572,6 +574,35 @@ class TestHTTPEndpoints:
             # Clean up
             manager.sessions.clear()
 
+    def test_send_request_to_session_wait_returns_response(self, client, mock_auth):
+        """Test waiting for the session's JSON-RPC response."""
+        session = ReverseProxySession("test-session", _answering_websocket(lambda: session, result={"tools": []}), "test-user")
+        manager.sessions["test-session"] = session
+
+        try:
+            response = client.post("/reverse-proxy/sessions/test-session/request?wait=true", json={"jsonrpc": "2.0", "method": "tools/list", "id": 1})
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "completed"
+            assert data["response"] == {"jsonrpc": "2.0", "id": 1, "result": {"tools": []}}
+
+            listed = client.get("/reverse-proxy/sessions").json()["sessions"][0]
+            assert listed["metrics"]["requests"] == 1
+        finally:
+            manager.sessions.clear()
+
+    def test_send_request_to_session_wait_timeout(self, client, mock_auth, mock_websocket):
+        """Test a session that never answers."""
+        manager.sessions["test-session"] = ReverseProxySession("test-session", mock_websocket, "test-user")
+
+        try:
+            response = client.post("/reverse-proxy/sessions/test-session/request?wait=true&timeout=0.05", json={"method": "tools/list", "id": 1})
+
+            assert response.status_code == 504
+        finally:
+            manager.sessions.clear()
+
     def test_send_request_to_session_not_found(self, client, mock_auth):
         """Test sending request to non-existent session."""
         mcp_request = {"method": "tools/list", "id": 1}
@@ -623,6 +654,181 @@ class TestHTTPEndpoints:
         assert "not found" in data["detail"]
 
 
+# --------------------------------------------------------------------------- #
+# Request/Response Correlation Tests                                         #
+# --------------------------------------------------------------------------- #
+
+
+def _answering_websocket(get_session, result=None):
+    """WebSocket whose client answers every forwarded request with ``result``."""
+    ws = Mock(spec=WebSocket)
+    ws.close = AsyncMock()
+
+    async def send_text(data):
+        payload = json.loads(data)["payload"]
+        if "id" in payload:
+            response = {"type": "response", "payload": {"jsonrpc": "2.0", "id": payload["id"], "result": result or {"method": payload["method"]}}}
+            asyncio.get_running_loop().call_soon(get_session().resolve, response)
+
+    ws.send_text = AsyncMock(side_effect=send_text)
+    return ws
+
+
+class FakeRedis:
+    """Shared key/value store and pub/sub bus standing in for Redis between relays."""
+
+    def __init__(self):
+        self.data = {}
+        self.subscribers = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def publish(self, channel, message):
+        relay = self.subscribers.get(channel)
+        if relay is None:
+            return 0
+        relay.dispatch(json.loads(message))
+        return 1
+
+
+def _connect_relay(redis, worker):
+    """Attach a manager's relay to the fake bus as if ``start`` had subscribed."""
+    worker.relay._redis = redis
+    worker.relay._listener = Mock()
+    redis.subscribers[worker.relay.channel] = worker.relay
+
+
+class TestRequestCorrelation:
+    """Test waiting for responses to forwarded requests."""
+
+    @pytest.mark.asyncio
+    async def test_request_restores_caller_id_and_records_latency(self):
+        session = None
+        ws = _answering_websocket(lambda: session)
+        session = ReverseProxySession("corr", ws)
+
+        first, second = await asyncio.gather(
+            session.request({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}, timeout=1),
+            session.request({"jsonrpc": "2.0", "id": 1, "method": "prompts/list"}, timeout=1),
+        )
+
+        assert first == {"jsonrpc": "2.0", "id": 1, "result": {"method": "tools/list"}}
+        assert second["result"] == {"method": "prompts/list"}
+        sent_ids = {json.loads(call.args[0])["payload"]["id"] for call in ws.send_text.call_args_list}
+        assert len(sent_ids) == 2 and 1 not in sent_ids
+        metrics = session.get_metrics()
+        assert (metrics["requests"], metrics["inflight"], metrics["errors"]) == (2, 0, 0)
+        assert metrics["max_latency_ms"] >= metrics["avg_latency_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_notification_is_not_awaited(self, mock_websocket):
+        session = ReverseProxySession("corr", mock_websocket)
+
+        assert await session.request({"jsonrpc": "2.0", "method": "notifications/initialized"}, timeout=1) is None
+        assert session.get_metrics()["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_inflight_limit_and_timeout(self, mock_websocket):
+        session = ReverseProxySession("corr", mock_websocket, max_inflight=1)
+        waiting = asyncio.create_task(session.request({"jsonrpc": "2.0", "id": 1, "method": "slow"}, timeout=0.2))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SessionBusyError):
+            await session.request({"jsonrpc": "2.0", "id": 2, "method": "ping"}, timeout=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await waiting
+
+        metrics = session.get_metrics()
+        assert (metrics["requests"], metrics["timeouts"], metrics["rejected"], metrics["inflight"]) == (1, 1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_remove_session_fails_pending_requests(self, reverse_proxy_manager, mock_websocket):
+        session = ReverseProxySession("corr", mock_websocket)
+        await reverse_proxy_manager.add_session(session)
+        waiting = asyncio.create_task(reverse_proxy_manager.request("corr", {"jsonrpc": "2.0", "id": 1, "method": "ping"}, timeout=5))
+        await asyncio.sleep(0)
+
+        await reverse_proxy_manager.remove_session("corr")
+
+        with pytest.raises(ConnectionError):
+            await waiting
+        assert session.get_metrics()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_websocket_response_resolves_pending_request(self, mock_websocket):
+        mock_websocket.headers = {"X-Session-ID": "ws-corr"}
+        inbound = asyncio.Queue()
+        mock_websocket.receive_text.side_effect = inbound.get
+
+        # First-Party
+        from mcpgateway.routers.reverse_proxy import websocket_endpoint
+
+        endpoint = asyncio.create_task(websocket_endpoint(mock_websocket, Mock()))
+        try:
+            while manager.get_session("ws-corr") is None:
+                await asyncio.sleep(0)
+            pending = asyncio.create_task(manager.request("ws-corr", {"jsonrpc": "2.0", "id": "abc", "method": "ping"}, timeout=1))
+            while not mock_websocket.send_text.called:
+                await asyncio.sleep(0)
+            relay_id = json.loads(mock_websocket.send_text.call_args[0][0])["payload"]["id"]
+            await inbound.put(json.dumps({"type": "response", "sessionId": "ws-corr", "payload": {"jsonrpc": "2.0", "id": relay_id, "result": {}}}))
+
+            assert await pending == {"jsonrpc": "2.0", "id": "abc", "result": {}}
+        finally:
+            await inbound.put(json.dumps({"type": "unregister"}))
+            await endpoint
+        assert manager.get_session("ws-corr") is None
+
+
+class TestCrossWorkerRelay:
+    """Test relaying requests to the worker holding a session."""
+
+    @pytest.mark.asyncio
+    async def test_request_is_relayed_to_owning_worker(self):
+        redis = FakeRedis()
+        owner, other = ReverseProxyManager(), ReverseProxyManager()
+        _connect_relay(redis, owner)
+        _connect_relay(redis, other)
+        session = None
+        ws = _answering_websocket(lambda: session, result={"tools": []})
+        session = ReverseProxySession("remote", ws)
+        await owner.add_session(session)
+
+        response = await other.request("remote", {"jsonrpc": "2.0", "id": 9, "method": "tools/list"}, timeout=1)
+        assert response == {"jsonrpc": "2.0", "id": 9, "result": {"tools": []}}
+        assert await other.request("remote", {"jsonrpc": "2.0", "id": 10, "method": "tools/list"}, timeout=1, wait=False) is None
+        assert ws.send_text.call_count == 2
+        assert other.relay.get_metrics()["relayed"] == 2
+        assert owner.relay.get_metrics()["served"] == 2
+
+        # Errors raised on the owner are raised again on the caller
+        session.max_inflight = 0
+        with pytest.raises(SessionBusyError):
+            await other.request("remote", {"jsonrpc": "2.0", "id": 11, "method": "tools/list"}, timeout=1)
+
+        await owner.remove_session("remote")
+        assert redis.data == {}
+        with pytest.raises(SessionNotFoundError):
+            await other.request("remote", {"jsonrpc": "2.0", "id": 12, "method": "tools/list"}, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_stale_owner_is_reported_as_not_found(self):
+        redis = FakeRedis()
+        caller = ReverseProxyManager()
+        _connect_relay(redis, caller)
+        redis.data[caller.relay.session_key("orphan")] = "exited-worker"
+
+        with pytest.raises(SessionNotFoundError):
+            await caller.request("orphan", {"jsonrpc": "2.0", "id": 1, "method": "ping"}, timeout=1)
+
+
 # --------------------------------------------------------------------------- #
 # Integration Tests                                                          #
 # --------------------------------------------------------------------------- #
@@ -360,13 +360,9 @@ class TestA2AAgentService:
         """Test metrics aggregation."""
         # Mock database queries
         mock_db.execute.return_value.scalar.side_effect = [5, 3]  # total_agents, active_agents
-        mock_db.execute.return_value.first.return_value = MagicMock(
-            total_interactions=100,
-            successful_interactions=90,
-            avg_response_time=1.5,
-            min_response_time=0.5,
-            max_response_time=3.0,
-        )
+        # Aggregate row over the agent metric rollups:
+        # (total, successful, failed, min_rt, max_rt, total_rt, last_execution_time)
+        mock_db.execute.return_value.one.return_value = (100, 90, 10, 0.5, 3.0, 150.0, None)
 
         # Execute
         result = await service.aggregate_metrics(mock_db)
@@ -389,7 +385,8 @@ class TestA2AAgentService:
         await service.reset_metrics(mock_db)
 
         # Verify
-        mock_db.execute.assert_called_once()
+        # Raw metrics and rollups are both cleared
+        assert mock_db.execute.call_count == 2
         mock_db.commit.assert_called_once()
 
     async def test_reset_metrics_specific_agent(self, service, mock_db):
@@ -402,7 +399,8 @@ class TestA2AAgentService:
         await service.reset_metrics(mock_db, agent_id)
 
         # Verify
-        mock_db.execute.assert_called_once()
+        # Raw metrics and rollups are both cleared
+        assert mock_db.execute.call_count == 2
         mock_db.commit.assert_called_once()
 
     def test_db_to_schema_conversion(self, service, sample_db_agent):
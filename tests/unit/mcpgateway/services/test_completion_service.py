@@ -39,6 +39,7 @@ class FakeScalarsAllResult:
 
 class DummyPrompt:
     def __init__(self, name, argument_schema):
+        self.id = name
         self.name = name
         self.argument_schema = argument_schema
         self.is_active = True
@@ -46,6 +47,7 @@ class DummyPrompt:
 
 class DummyResource:
     def __init__(self, uri):
+        self.id = uri
         self.uri = uri
         self.is_active = True
 
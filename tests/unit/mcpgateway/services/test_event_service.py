@@ -28,6 +28,8 @@ class TestEventService:
         with patch("mcpgateway.services.event_service.settings") as mock_settings:
             mock_settings.redis_url = "redis://localhost:6379"
             mock_settings.cache_type = "redis"
+            mock_settings.event_queue_maxsize = 1000
+            mock_settings.event_queue_overflow = "coalesce"
             yield mock_settings
 
     @pytest.fixture
@@ -158,10 +160,8 @@ class TestEventService:
 
                 service = EventService("test:channel")
 
-                queue1 = asyncio.Queue()
-                queue2 = asyncio.Queue()
-                service._event_subscribers.append(queue1)
-                service._event_subscribers.append(queue2)
+                sub1 = service.subscribe()
+                sub2 = service.subscribe()
 
                 event_data = {"event": "test_event", "data": "test_data"}
 
@@ -169,8 +169,8 @@ class TestEventService:
                     mock_to_thread.side_effect = Exception("Redis publish failed")
                     await service.publish_event(event_data)
 
-                assert await queue1.get() == event_data
-                assert await queue2.get() == event_data
+                assert await sub1.get() == event_data
+                assert await sub2.get() == event_data
                 mock_logger.error.assert_called_once()
                 assert "Failed to publish event" in str(mock_logger.error.call_args)
 
@@ -181,16 +181,14 @@ class TestEventService:
 
         service = EventService("test:channel")
 
-        queue1 = asyncio.Queue()
-        queue2 = asyncio.Queue()
-        service._event_subscribers.append(queue1)
-        service._event_subscribers.append(queue2)
+        sub1 = service.subscribe()
+        sub2 = service.subscribe()
 
         event_data = {"event": "test_event", "data": "test_data"}
         await service.publish_event(event_data)
 
-        assert await queue1.get() == event_data
-        assert await queue2.get() == event_data
+        assert await sub1.get() == event_data
+        assert await sub2.get() == event_data
 
     @pytest.mark.asyncio
     async def test_publish_event_with_empty_subscribers(self, mock_settings, mock_redis_unavailable):
@@ -203,206 +201,123 @@ class TestEventService:
 
     # Test subscribe_events method - Redis tests
 
-    @pytest.mark.skip
+    @staticmethod
+    def _mock_aioredis(listen):
+        """Patch redis.asyncio.from_url with a client whose pub/sub yields from ``listen``."""
+        pubsub = MagicMock()
+        pubsub.listen = MagicMock(side_effect=listen)
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+        client.aclose = AsyncMock()
+        return patch("redis.asyncio.from_url", return_value=client), pubsub
+
     @pytest.mark.asyncio
     @pytest.mark.timeout(5)
-    async def test_subscribe_events_with_redis(self, mock_settings, mock_redis_available):
-        """Test event subscription via Redis PubSub."""
+    async def test_subscribe_events_with_redis_shares_one_subscription(self, mock_settings, mock_redis_available):
+        """Subscribers on any channel share one Redis pub/sub connection per worker."""
         with patch("mcpgateway.services.event_service.redis") as mock_redis_module:
-            mock_redis_client = MagicMock()
-            mock_redis_client.ping.return_value = True
-            mock_redis_module.from_url.return_value = mock_redis_client
-
-            from mcpgateway.services.event_service import EventService
-
-            service = EventService("test:channel")
-
-            mock_aioredis_module = MagicMock()
-            mock_async_client = AsyncMock()
-            mock_pubsub = AsyncMock()
-
-            async def mock_listen():
-                yield {"type": "subscribe", "data": None}
-                yield {"type": "message", "data": json.dumps({"event": "test1"})}
-                yield {"type": "message", "data": json.dumps({"event": "test2"})}
-                return
-
-            mock_pubsub.listen.return_value = mock_listen()
-            mock_pubsub.subscribe = AsyncMock()
-            mock_pubsub.unsubscribe = AsyncMock()
-            mock_async_client.pubsub.return_value = mock_pubsub
-            mock_async_client.aclose = AsyncMock()
-            mock_aioredis_module.from_url.return_value = mock_async_client
-
-            sys.modules["redis.asyncio"] = mock_aioredis_module
+            mock_redis_module.from_url.return_value = MagicMock()
+
+            from mcpgateway.services.event_service import EventService, get_event_fanout
+
+            tools, gateways = EventService("test:tools"), EventService("test:gateways")
+            messages = asyncio.Queue()
+
+            async def listen():
+                while True:
+                    yield await messages.get()
+
+            from_url, pubsub = self._mock_aioredis(listen)
+            with from_url as mock_from_url:
+                streams = [tools.subscribe_events(), tools.subscribe_events(), gateways.subscribe_events()]
+                pending = [asyncio.ensure_future(stream.__anext__()) for stream in streams]
+                await asyncio.sleep(0.05)
+                messages.put_nowait({"type": "subscribe", "channel": "test:tools", "data": 1})
+                messages.put_nowait({"type": "message", "channel": "test:tools", "data": json.dumps({"event": "t"})})
+                messages.put_nowait({"type": "message", "channel": "test:gateways", "data": json.dumps({"event": "g"})})
+                received = await asyncio.gather(*pending)
+                for stream in streams:
+                    await stream.aclose()
+
+                assert received == [{"event": "t"}, {"event": "t"}, {"event": "g"}]
+                mock_from_url.assert_called_once_with("redis://localhost:6379", decode_responses=True)
+                assert pubsub.subscribe.await_args_list == [call("test:tools"), call("test:gateways")]
+                pubsub.listen.assert_called_once()
+                stats = get_event_fanout().stats()
+                assert stats["redis_channels"] == 2
+                assert stats["channels"]["test:tools"]["subscribers"] == 0
+                assert stats["channels"]["test:tools"]["delivered"] == 2
+
+                await get_event_fanout().shutdown()
+                pubsub.aclose.assert_awaited_once()
 
-            try:
-                events = []
-                async for event in service.subscribe_events():
-                    events.append(event)
-
-                assert len(events) == 2
-                assert events[0] == {"event": "test1"}
-                assert events[1] == {"event": "test2"}
-                mock_pubsub.subscribe.assert_called_once_with("test:channel")
-                mock_pubsub.unsubscribe.assert_called_once_with("test:channel")
-                mock_async_client.aclose.assert_called_once()
-            finally:
-                if "redis.asyncio" in sys.modules:
-                    del sys.modules["redis.asyncio"]
-
-    @pytest.mark.skip
     @pytest.mark.asyncio
     @pytest.mark.timeout(5)
-    async def test_subscribe_events_with_redis_cancellation(
-        self, mock_settings, mock_redis_available
-    ):
-        """Test event subscription cancellation with Redis."""
+    async def test_subscribe_events_with_redis_cancellation(self, mock_settings, mock_redis_available):
+        """Cancelling a Redis-backed subscriber logs the disconnect and releases its buffer."""
         with patch("mcpgateway.services.event_service.redis") as mock_redis_module:
             with patch("mcpgateway.services.event_service.logger") as mock_logger:
-                mock_redis_client = MagicMock()
-                mock_redis_client.ping.return_value = True
-                mock_redis_module.from_url.return_value = mock_redis_client
+                mock_redis_module.from_url.return_value = MagicMock()
 
-                from mcpgateway.services.event_service import EventService
+                from mcpgateway.services.event_service import EventService, get_event_fanout
 
                 service = EventService("test:channel")
 
-                mock_aioredis_module = MagicMock()
-                mock_async_client = AsyncMock()
-                mock_pubsub = AsyncMock()
-
-                async def mock_listen():
-                    yield {"type": "message", "data": json.dumps({"event": "test"})}
-                    while True:
-                        await asyncio.sleep(1)
+                async def listen():
+                    await asyncio.Event().wait()
+                    yield {}
 
-                mock_pubsub.listen.return_value = mock_listen()
-                mock_pubsub.subscribe = AsyncMock()
-                mock_pubsub.unsubscribe = AsyncMock()
-                mock_async_client.pubsub.return_value = mock_pubsub
-                mock_async_client.aclose = AsyncMock()
-                mock_aioredis_module.from_url.return_value = mock_async_client
+                from_url, _ = self._mock_aioredis(listen)
+                with from_url:
 
-                sys.modules["redis.asyncio"] = mock_aioredis_module
-
-                try:
                     async def consume():
-                        async for event in service.subscribe_events():
+                        async for _ in service.subscribe_events():
                             pass
 
                     task = asyncio.create_task(consume())
-                    await asyncio.sleep(0.3)
+                    await asyncio.sleep(0.05)
                     task.cancel()
-
-                    try:
+                    with pytest.raises(asyncio.CancelledError):
                         await task
-                    except asyncio.CancelledError:
-                        pass
-
-                    await asyncio.sleep(0.1)
 
-                    mock_pubsub.unsubscribe.assert_called_once_with("test:channel")
-                    mock_async_client.aclose.assert_called_once()
-                    mock_logger.error.assert_called()
-                    assert "Client disconnected" in str(mock_logger.error.call_args)
-                finally:
-                    if "redis.asyncio" in sys.modules:
-                        del sys.modules["redis.asyncio"]
+                    assert "Client disconnected from Redis subscription" in str(mock_logger.error.call_args)
+                    assert service._event_subscribers == []
+                    # The worker keeps listening for the next subscriber
+                    assert get_event_fanout().stats()["redis_subscribed"] is True
+                    await get_event_fanout().shutdown()
 
-    @pytest.mark.skip
     @pytest.mark.asyncio
     @pytest.mark.timeout(5)
-    async def test_subscribe_events_with_redis_exception(self, mock_settings, mock_redis_available):
-        """Test event subscription with Redis exception."""
-        with patch("mcpgateway.services.event_service.redis") as mock_redis_module:
-            with patch("mcpgateway.services.event_service.logger") as mock_logger:
-                mock_redis_client = MagicMock()
-                mock_redis_client.ping.return_value = True
-                mock_redis_module.from_url.return_value = mock_redis_client
-
-                from mcpgateway.services.event_service import EventService
-
-                service = EventService("test:channel")
-
-                mock_aioredis_module = MagicMock()
-                mock_async_client = AsyncMock()
-                mock_pubsub = AsyncMock()
-
-                async def mock_listen():
-                    yield {"type": "message", "data": json.dumps({"event": "test"})}
-                    raise Exception("Redis error")
-
-                mock_pubsub.listen.return_value = mock_listen()
-                mock_pubsub.subscribe = AsyncMock()
-                mock_pubsub.unsubscribe = AsyncMock()
-                mock_async_client.pubsub.return_value = mock_pubsub
-                mock_async_client.aclose = AsyncMock()
-                mock_aioredis_module.from_url.return_value = mock_async_client
-
-                sys.modules["redis.asyncio"] = mock_aioredis_module
-
-                try:
-                    with pytest.raises(Exception) as exc_info:
-                        async for _ in service.subscribe_events():
-                            pass
-
-                    assert str(exc_info.value) == "Redis error"
-                    mock_logger.error.assert_called()
-                    mock_pubsub.unsubscribe.assert_called_once()
-                    mock_async_client.aclose.assert_called_once()
-                finally:
-                    if "redis.asyncio" in sys.modules:
-                        del sys.modules["redis.asyncio"]
-
-    @pytest.mark.skip
-    @pytest.mark.asyncio
-    @pytest.mark.timeout(5)
-    async def test_subscribe_events_with_redis_cleanup_error(
-        self, mock_settings, mock_redis_available
-    ):
-        """Test event subscription with Redis cleanup error."""
+    async def test_redis_listener_reconnects_and_resubscribes(self, mock_settings, mock_redis_available):
+        """A dropped Redis connection is reopened and every channel resubscribed."""
         with patch("mcpgateway.services.event_service.redis") as mock_redis_module:
-            with patch("mcpgateway.services.event_service.logger") as mock_logger:
-                mock_redis_client = MagicMock()
-                mock_redis_client.ping.return_value = True
-                mock_redis_module.from_url.return_value = mock_redis_client
-
-                from mcpgateway.services.event_service import EventService
-
-                service = EventService("test:channel")
-
-                mock_aioredis_module = MagicMock()
-                mock_async_client = AsyncMock()
-                mock_pubsub = AsyncMock()
-
-                async def mock_listen():
-                    raise Exception("Connection error")
-
-                mock_pubsub.listen.return_value = mock_listen()
-                mock_pubsub.subscribe = AsyncMock()
-                mock_pubsub.unsubscribe = AsyncMock(side_effect=Exception("Cleanup error"))
-                mock_async_client.pubsub.return_value = mock_pubsub
-                mock_async_client.aclose = AsyncMock()
-                mock_aioredis_module.from_url.return_value = mock_async_client
+            mock_redis_module.from_url.return_value = MagicMock()
 
-                sys.modules["redis.asyncio"] = mock_aioredis_module
+            from mcpgateway.services.event_service import EventService, get_event_fanout
 
-                try:
-                    with pytest.raises(Exception) as exc_info:
-                        async for _ in service.subscribe_events():
-                            pass
-
-                    assert str(exc_info.value) == "Connection error"
-                    warning_calls = [str(call) for call in mock_logger.warning.call_args_list]
-                    assert any(
-                        "Error closing Redis subscription" in call_str for call_str in warning_calls
-                    )
-                finally:
-                    if "redis.asyncio" in sys.modules:
-                        del sys.modules["redis.asyncio"]
+            service = EventService("test:channel")
+            attempts = []
+
+            async def listen():
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise ConnectionError("connection reset")
+                yield {"type": "message", "channel": "test:channel", "data": json.dumps({"event": "after"})}
+                await asyncio.Event().wait()
+
+            from_url, pubsub = self._mock_aioredis(listen)
+            with from_url as mock_from_url, patch("mcpgateway.services.event_service.asyncio.sleep", new=AsyncMock()):
+                stream = service.subscribe_events()
+                assert await stream.__anext__() == {"event": "after"}
+                await stream.aclose()
+
+            assert mock_from_url.call_count == 2
+            assert pubsub.subscribe.await_args_list == [call("test:channel"), call("test:channel")]
+            assert get_event_fanout().stats()["redis_reconnects"] == 1
+            await get_event_fanout().shutdown()
 
-    @pytest.mark.skip
     @pytest.mark.asyncio
     @pytest.mark.timeout(5)
     async def test_subscribe_events_with_redis_import_error(
@@ -410,35 +325,23 @@ class TestEventService:
     ):
         """Test event subscription when redis.asyncio import fails."""
         with patch("mcpgateway.services.event_service.redis") as mock_redis_module:
-            mock_redis_client = MagicMock()
-            mock_redis_client.ping.return_value = True
-            mock_redis_module.from_url.return_value = mock_redis_client
-
-            from mcpgateway.services.event_service import EventService
-
-            service = EventService("test:channel")
-
-            if "redis.asyncio" in sys.modules:
-                del sys.modules["redis.asyncio"]
-
-            service._redis_client = None
+            with patch("mcpgateway.services.event_service.logger") as mock_logger:
+                mock_redis_module.from_url.return_value = MagicMock()
 
-            async def subscriber():
-                events = []
-                async for event in service.subscribe_events():
-                    events.append(event)
-                    if len(events) == 1:
-                        break
-                return events
+                from mcpgateway.services.event_service import EventService, get_event_fanout
 
-            async def publisher():
-                await asyncio.sleep(0.1)
-                await service.publish_event({"event": "local_test"})
+                service = EventService("test:channel")
 
-            events, _ = await asyncio.gather(subscriber(), publisher())
+                with patch.dict(sys.modules, {"redis.asyncio": None}):
+                    stream = service.subscribe_events()
+                    pending = asyncio.ensure_future(stream.__anext__())
+                    await asyncio.sleep(0.05)
+                    get_event_fanout().deliver("test:channel", {"event": "local_test"})
+                    assert await pending == {"event": "local_test"}
+                    await stream.aclose()
 
-            assert len(events) == 1
-            assert events[0] == {"event": "local_test"}
+                assert "does not support asyncio" in str(mock_logger.error.call_args)
+                assert get_event_fanout().stats()["redis_subscribed"] is False
 
     # Test subscribe_events method - Local mode tests
 
@@ -611,8 +514,8 @@ class TestEventService:
 
             service = EventService("test:channel")
 
-            service._event_subscribers.append(asyncio.Queue())
-            service._event_subscribers.append(asyncio.Queue())
+            service.subscribe()
+            service.subscribe()
 
             await service.shutdown()
 
@@ -626,8 +529,8 @@ class TestEventService:
 
         service = EventService("test:channel")
 
-        service._event_subscribers.append(asyncio.Queue())
-        service._event_subscribers.append(asyncio.Queue())
+        service.subscribe()
+        service.subscribe()
 
         await service.shutdown()
 
@@ -730,3 +633,54 @@ class TestEventService:
         received_event, _ = await asyncio.gather(subscriber(), publisher())
 
         assert received_event == complex_event
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "policy, expected, dropped, coalesced",
+        [
+            ("drop_oldest", [("tool_updated", 2), ("tool_added", 3), ("tool_updated", 4)], 2, 0),
+            ("drop_newest", [("tool_updated", 0), ("tool_added", 1), ("tool_updated", 2)], 2, 0),
+            ("coalesce", [("tool_added", 1), ("tool_added", 3), ("tool_updated", 4)], 0, 2),
+        ],
+    )
+    async def test_slow_subscriber_is_bounded_and_reports_lag(self, mock_settings, mock_redis_unavailable, policy, expected, dropped, coalesced):
+        """A subscriber that never reads keeps at most max_size events and never blocks publishers."""
+        from mcpgateway.services.event_service import EventService, get_event_fanout
+
+        service = EventService("test:channel")
+        slow = service.subscribe(max_size=3, policy=policy)
+        fast = service.subscribe(max_size=10, policy=policy)
+
+        for n, kind in enumerate(["tool_updated", "tool_added", "tool_updated", "tool_added", "tool_updated"]):
+            await asyncio.wait_for(service.publish_event({"type": kind, "data": {"id": "t1" if kind == "tool_updated" else f"t{n}", "n": n}}), 1)
+
+        assert [(event["type"], event["data"]["n"]) for event in slow.drain()] == expected
+        assert (slow.dropped, slow.coalesced, slow.max_pending) == (dropped, coalesced, 3)
+        assert fast.pending == (3 if policy == "coalesce" else 5)
+
+        stats = get_event_fanout().stats()["channels"]["test:channel"]
+        assert stats["subscribers"] == 2
+        assert stats["published"] == 5
+        assert stats["dropped"] == dropped
+        assert stats["max_lag_seconds"] >= 0.0
+
+        await service.shutdown()
+        assert await fast.get() is not None  # pending events stay readable after close
+        assert get_event_fanout().stats()["channels"]["test:channel"]["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_final_state_of_an_entity(self, mock_settings, mock_redis_unavailable):
+        """Coalescing never delivers an entity's events out of order."""
+        from mcpgateway.services.event_service import EventService
+
+        service = EventService("test:channel")
+        sub = service.subscribe(max_size=10, policy="coalesce")
+        for kind in ("tool_activated", "tool_deactivated", "tool_activated"):
+            await service.publish_event({"type": kind, "data": {"id": "t1"}})
+        await service.publish_event({"type": "tool_activated", "data": {"id": "t2"}})
+        await service.publish_event({"type": "tool_deactivated", "data": {"id": "t1"}})
+
+        events = [(event["type"], event["data"]["id"]) for event in sub.drain()]
+        assert events == [("tool_activated", "t1"), ("tool_activated", "t2"), ("tool_deactivated", "t1")]
+        assert sub.coalesced == 2
+        await service.shutdown()
@@ -672,10 +672,15 @@ class TestGatewayService:
         mock_gateway_read.masked.return_value = mock_gateway_read  # Ensure .masked() returns the same object
 
         # Patch the model_validate call in the service
-        with patch("mcpgateway.services.gateway_service.GatewayRead.model_validate", return_value=mock_gateway_read):
+        with (
+            patch("mcpgateway.services.gateway_service.GatewayRead.model_validate", return_value=mock_gateway_read),
+            patch("mcpgateway.services.gateway_service.get_mcp_session_pool") as get_pool,
+        ):
+            get_pool.return_value.evict_gateway = AsyncMock()
             result = await gateway_service.update_gateway(test_db, 1, gateway_update)
 
         # Assertions
+        get_pool.return_value.evict_gateway.assert_awaited_once_with(mock_gateway.id)
         test_db.commit.assert_called_once()
         test_db.refresh.assert_called_once()
         gateway_service._initialize_gateway.assert_called_once()
@@ -1067,10 +1072,15 @@ class TestGatewayService:
         mock_gateway_read = MagicMock()
         mock_gateway_read.masked.return_value = mock_gateway_read
 
-        with patch("mcpgateway.services.gateway_service.GatewayRead.model_validate", return_value=mock_gateway_read):
+        with (
+            patch("mcpgateway.services.gateway_service.GatewayRead.model_validate", return_value=mock_gateway_read),
+            patch("mcpgateway.services.gateway_service.get_mcp_session_pool") as get_pool,
+        ):
+            get_pool.return_value.evict_gateway = AsyncMock()
             result = await gateway_service.toggle_gateway_status(test_db, 1, activate=False)
 
         assert mock_gateway.enabled is False
+        get_pool.return_value.evict_gateway.assert_awaited_once_with(mock_gateway.id)
         gateway_service._notify_gateway_deactivated.assert_called_once()
         assert tool_service_stub.toggle_tool_status.called
         assert result == mock_gateway_read
@@ -1169,8 +1179,11 @@ class TestGatewayService:
 
         gateway_service._notify_gateway_deleted = AsyncMock()
 
-        await gateway_service.delete_gateway(test_db, 1)
+        with patch("mcpgateway.services.gateway_service.get_mcp_session_pool") as get_pool:
+            get_pool.return_value.evict_gateway = AsyncMock()
+            await gateway_service.delete_gateway(test_db, 1)
 
+        get_pool.return_value.evict_gateway.assert_awaited_once_with(mock_gateway.id)
         test_db.delete.assert_called_once_with(mock_gateway)
         gateway_service._notify_gateway_deleted.assert_called_once()
 
@@ -1588,20 +1601,20 @@ class TestGatewayService:
         mocked_gateway_read.masked.return_value = "masked_result"
 
         with patch("mcpgateway.services.gateway_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.gateway_service.json_contains_expr") as mock_json_contains:
+            with patch("mcpgateway.services.gateway_service.entity_tags_expr") as mock_entity_tags:
                 with patch(
                     "mcpgateway.services.gateway_service.GatewayRead.model_validate",
                     return_value=mocked_gateway_read,
                 ) as mock_model_validate:
                     fake_condition = MagicMock()
-                    mock_json_contains.return_value = fake_condition
+                    mock_entity_tags.return_value = fake_condition
 
                     result = await gateway_service.list_gateways(session, tags=["test", "production"])
 
-                    mock_json_contains.assert_called_once()  # called exactly once
-                    called_args = mock_json_contains.call_args[0]  # positional args tuple
-                    assert called_args[0] is session  # session passed through
-                    # third positional arg is the tags list (signature: session, col, values, match_any=True)
+                    mock_entity_tags.assert_called_once()  # called exactly once
+                    called_args = mock_entity_tags.call_args[0]  # positional args tuple
+                    assert called_args[1] == "gateway"  # entity type recorded in entity_tags
+                    # third positional arg is the tags list (signature: id_col, entity_type, values, match_any=True)
                     assert called_args[2] == ["test", "production"]
                     # and the fake condition returned must have been passed to where()
                     mock_query.where.assert_called_with(fake_condition)
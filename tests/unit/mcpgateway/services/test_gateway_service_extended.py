@@ -15,6 +15,7 @@ from __future__ import annotations
 # Standard
 import asyncio
 from datetime import datetime, timezone
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
@@ -348,6 +349,139 @@ class TestGatewayServiceExtended:
         # Verify health checks were called
         assert service.check_health_of_gateways.called
 
+    @pytest.mark.asyncio
+    async def test_check_health_of_gateways_bounded_concurrency_and_batched_writes(self):
+        """Gateways are checked concurrently up to the limit and last_seen is written once."""
+        service = GatewayService()
+        service._health_check_concurrency = 2
+        running = 0
+        peak = 0
+
+        async def fake_check(db, gateway, user_email=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return gateway.id != "gw3"
+
+        gateways = [MagicMock(id=f"gw{i}", auth_type=None, enabled=True, reachable=True) for i in range(5)]
+        service._check_gateway_health = fake_check
+        service._handle_gateway_failure = AsyncMock()
+        mock_db = MagicMock()
+
+        assert await service.check_health_of_gateways(mock_db, gateways) is True
+
+        assert peak == 2
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+        assert gateways[3].last_seen != gateways[0].last_seen
+        assert service._health_schedules["gw3"].healthy is False
+        assert service._health_schedules["gw0"].healthy is True
+
+    @pytest.mark.asyncio
+    async def test_check_health_of_gateways_timeout_counts_as_failure(self):
+        """A gateway exceeding the per-gateway timeout does not hold up the others."""
+        service = GatewayService()
+
+        async def fake_check(db, gateway, user_email=None):
+            if gateway.id == "slow":
+                await asyncio.sleep(10)
+            return True
+
+        slow = MagicMock(id="slow", auth_type=None, enabled=True, reachable=True)
+        fast = MagicMock(id="fast", auth_type=None, enabled=True, reachable=False)
+        service._check_gateway_health = fake_check
+        service._handle_gateway_failure = AsyncMock()
+        service.toggle_gateway_status = AsyncMock()
+
+        with patch("mcpgateway.services.gateway_service.settings") as mock_settings:
+            mock_settings.health_check_timeout = 0.05
+            await service.check_health_of_gateways(MagicMock(), [slow, fast])
+
+        service._handle_gateway_failure.assert_awaited_once_with(slow)
+        service.toggle_gateway_status.assert_awaited_once()
+        assert service.toggle_gateway_status.call_args.args[1] == "fast"
+
+    @pytest.mark.asyncio
+    async def test_check_health_of_gateways_batches_deactivations(self):
+        """Gateways reaching the failure threshold are marked unreachable in the same commit as last_seen."""
+        # Third-Party
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        # First-Party
+        from mcpgateway.db import Base
+        from mcpgateway.db import Gateway as DbGateway
+        from mcpgateway.db import Tool as DbTool
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        for name in ("up", "down1", "down2"):
+            db.add(DbGateway(id=name, name=name, slug=name, url=f"http://{name}.example.com", capabilities={}, transport="SSE", enabled=True, reachable=True))
+            db.add(DbTool(id=f"{name}-tool", original_name=f"{name}-tool", url="http://example.com", input_schema={}, integration_type="MCP", request_type="SSE", gateway_id=name))
+        db.commit()
+        gateways = [MagicMock(id=name, auth_type=None, enabled=True, reachable=True) for name in ("up", "down1", "down2")]
+
+        service = GatewayService()
+
+        async def fake_check(db, gateway, user_email=None):
+            if gateway.id == "up":
+                return True
+            await service._handle_gateway_failure(gateway)
+            return False
+
+        service._check_gateway_health = fake_check
+        service.toggle_gateway_status = AsyncMock()
+        service._notify_gateway_offline = AsyncMock()
+        service.tool_service._notify_tool_offline = AsyncMock()
+        pool = MagicMock(evict_gateway=AsyncMock())
+
+        with (
+            patch("mcpgateway.services.gateway_service.GW_FAILURE_THRESHOLD", 1),
+            patch("mcpgateway.services.gateway_service.get_mcp_session_pool", return_value=pool),
+            patch.object(db, "commit", wraps=db.commit) as commit,
+        ):
+            await service.check_health_of_gateways(db, gateways)
+
+        commit.assert_called_once()
+        service.toggle_gateway_status.assert_not_awaited()
+        assert {row.id: row.reachable for row in db.query(DbGateway)} == {"up": True, "down1": False, "down2": False}
+        assert {row.id: row.reachable for row in db.query(DbTool)} == {"up-tool": True, "down1-tool": False, "down2-tool": False}
+        assert db.get(DbGateway, "up").last_seen is not None
+        assert [call.args[0].id for call in service._notify_gateway_offline.await_args_list] == ["down1", "down2"]
+        assert sorted(call.args[0].id for call in service.tool_service._notify_tool_offline.await_args_list) == ["down1-tool", "down2-tool"]
+        assert pool.evict_gateway.await_count == 2
+        assert not service._pending_unreachable
+        db.close()
+        engine.dispose()
+
+    def test_health_schedule_adapts_to_results(self):
+        """Healthy gateways back off, status changes are rechecked sooner, due selection honours schedules."""
+        service = GatewayService()
+        service._health_check_interval = 60
+        service._health_check_max_interval = 200
+        service._health_check_min_interval = 10
+        service._health_check_jitter = 0.1
+        gateways = [MagicMock(id="a"), MagicMock(id="b")]
+
+        assert service._due_gateways(gateways) == gateways
+        assert service._due_gateways(gateways) == []
+
+        for _ in range(5):
+            service._reschedule_health_check("a", True)
+        assert service._health_schedules["a"].interval == 200
+        service._reschedule_health_check("a", False)
+        assert service._health_schedules["a"].interval == 10
+        assert 9 <= service._health_schedules["a"].next_due - time.monotonic() <= 11
+
+        service._health_schedules["b"].next_due = 0
+        assert service._due_gateways(gateways[1:]) == gateways[1:]
+        assert "a" not in service._health_schedules
+        assert 0 < service._next_health_check_delay() <= 60
+
     @pytest.mark.asyncio
     async def test_handle_gateway_failure(self):
         """Test _handle_gateway_failure method exists."""
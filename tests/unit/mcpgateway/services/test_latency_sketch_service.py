@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_latency_sketch_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tests for latency quantile sketches and their background writer.
+"""
+
+# Standard
+from datetime import datetime, timedelta, timezone
+import random
+from unittest.mock import patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import Base, ObservabilityLatencySketch
+from mcpgateway.services.latency_sketch_service import LatencySketch, LatencySketchService, RELATIVE_ACCURACY, set_latency_sketch_service
+from mcpgateway.services.observability_service import ObservabilityService
+from mcpgateway.services.trace_export_service import set_trace_export_service, TraceExportService
+
+
+@pytest.fixture
+def session_factory():
+    """In-memory SQLite database patched in as the sketch writer's SessionLocal."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with patch("mcpgateway.services.latency_sketch_service.SessionLocal", factory), patch("mcpgateway.services.trace_export_service.SessionLocal", factory):
+        yield factory
+    engine.dispose()
+
+
+def _exact(values, q):
+    """Percentile with the rank convention of the admin percentile views."""
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * q) - 1)]
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(42)
+    values = [rng.lognormvariate(3, 1.2) for _ in range(20000)]
+    sketch = LatencySketch()
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert abs(sketch.quantile(q) - exact) <= exact * RELATIVE_ACCURACY * 1.01
+
+
+def test_merged_sketches_match_single_sketch():
+    rng = random.Random(7)
+    values = [rng.uniform(0, 500) for _ in range(5000)]
+    whole, merged = LatencySketch(), LatencySketch()
+    for value in values:
+        whole.add(value)
+    for chunk in range(5):
+        part = LatencySketch()
+        for value in values[chunk::5]:
+            part.add(value)
+        merged.merge(LatencySketch.from_dict(part.to_dict()))
+
+    assert merged.to_dict() == {**whole.to_dict(), "sum": merged.total}
+    assert merged.total == pytest.approx(whole.total)
+    assert merged.quantile(0.99) == whole.quantile(0.99)
+
+
+@pytest.mark.asyncio
+async def test_closed_buckets_are_written_and_merged_with_pending(session_factory):
+    service = LatencySketchService(bucket_seconds=300, flush_interval=3600)
+    await service.start()
+    try:
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(minutes=10)
+        for duration in (10.0, 20.0, 30.0):
+            service.record(old, duration, "ok")
+        service.record(old, 40.0, "error")
+        service.record(now, 99.0, "ok")
+
+        await service.flush()
+
+        with session_factory() as db:
+            rows = db.execute(select(ObservabilityLatencySketch)).scalars().all()
+            assert len(rows) == 1
+            assert (rows[0].count, rows[0].success_count, rows[0].error_count) == (4, 3, 1)
+
+            merged = service.query(db, now - timedelta(hours=1))
+        assert sorted(bucket.count for bucket in merged.values()) == [1, 4]
+        closed = merged[service.bucket_start(old)]
+        assert closed.sketch.max == 40.0
+        assert merged[service.bucket_start(now)].sketch.quantile(0.5) == 99.0
+    finally:
+        await service.shutdown()
+
+    # Shutdown writes the open bucket too
+    with session_factory() as db:
+        assert db.execute(select(func.count()).select_from(ObservabilityLatencySketch)).scalar() == 2
+
+
+@pytest.mark.asyncio
+async def test_end_trace_sketches_traces_dropped_by_tail_sampling(session_factory):
+    sketches = LatencySketchService(bucket_seconds=300, flush_interval=3600)
+    exporter = TraceExportService(max_spans=100, batch_size=10, flush_interval=3600, tail_sample_rate=0.0, tail_latency_threshold_ms=10_000)
+    set_latency_sketch_service(sketches)
+    set_trace_export_service(exporter)
+    await sketches.start()
+    await exporter.start()
+    try:
+        service = ObservabilityService()
+        for _ in range(3):
+            trace_id = service.start_trace(None, "GET /tools")
+            service.end_trace(None, trace_id, status="ok")
+
+        assert exporter.get_metrics()["sampled_out"] == 3
+        with session_factory() as db:
+            buckets = sketches.query(db, datetime.now(timezone.utc) - timedelta(hours=1))
+        assert sum(bucket.success_count for bucket in buckets.values()) == 3
+    finally:
+        await exporter.shutdown()
+        await sketches.shutdown()
+        set_trace_export_service(None)
+        set_latency_sketch_service(None)
@@ -9,6 +9,7 @@ Unit tests for LogStorageService.
 
 # Standard
 import asyncio
+from collections import deque
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -555,13 +556,14 @@ async def test_remove_from_indices_value_error():
         entry = LogEntry(level=LogLevel.INFO, message="Test", entity_type="tool", entity_id="tool-1", request_id="req-1")
 
         # Add to indices manually
-        service._entity_index["tool:tool-1"] = ["other-id"]  # Wrong ID
-        service._request_index["req-1"] = ["other-id"]  # Wrong ID
+        other = LogEntry(level=LogLevel.INFO, message="Other")
+        service._entity_index["tool:tool-1"] = deque([other])  # Wrong entry
+        service._request_index["req-1"] = deque([other])  # Wrong entry
 
         # Should not raise ValueError
         service._remove_from_indices(entry)
 
-        # Indices should still have the other ID
+        # Indices should still have the other entry
         assert "tool:tool-1" in service._entity_index
         assert "req-1" in service._request_index
 
@@ -577,9 +579,9 @@ async def test_remove_from_indices_empty_cleanup():
         # Create a log entry
         entry = LogEntry(level=LogLevel.INFO, message="Test", entity_type="tool", entity_id="tool-1", request_id="req-1")
 
-        # Add to indices with the correct ID
-        service._entity_index["tool:tool-1"] = [entry.id]
-        service._request_index["req-1"] = [entry.id]
+        # Add to indices with the correct entry
+        service._entity_index["tool:tool-1"] = deque([entry])
+        service._request_index["req-1"] = deque([entry])
 
         # Remove from indices
         service._remove_from_indices(entry)
@@ -609,7 +611,7 @@ async def test_notify_subscribers_queue_full():
         entry = LogEntry(level=LogLevel.INFO, message="Test")
 
         # Should not raise even though queue is full
-        await service._notify_subscribers(entry)
+        service._notify_subscribers(entry)
 
         # Queue should still be in subscribers
         assert queue in service._subscribers
@@ -636,7 +638,7 @@ async def test_notify_subscribers_dead_queue():
         entry = LogEntry(level=LogLevel.INFO, message="Test")
 
         # Should not raise
-        await service._notify_subscribers(entry)
+        service._notify_subscribers(entry)
 
         # Dead queue should be removed
         assert mock_queue not in service._subscribers
@@ -682,3 +684,53 @@ async def test_log_entry_to_dict():
     assert result["data"] == {"custom": "data"}
     assert result["request_id"] == "req-abc"
     assert "timestamp" in result
+
+
+@pytest.mark.asyncio
+async def test_get_logs_level_index_paging():
+    """Test paging through logs served from the merged per-level indices."""
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 1.0
+
+        service = LogStorageService()
+
+        levels = [LogLevel.DEBUG, LogLevel.WARNING, LogLevel.ERROR, LogLevel.CRITICAL]
+        for i in range(20):
+            service.append_log(level=levels[i % 4], message=f"Log {i}")
+
+        # WARNING and above interleaves three level buckets back into insertion order
+        result = await service.get_logs(level=LogLevel.WARNING, limit=4, offset=2)
+        assert [log["message"] for log in result] == ["Log 17", "Log 15", "Log 14", "Log 13"]
+
+        result = await service.get_logs(level=LogLevel.WARNING, limit=3, order="asc")
+        assert [log["message"] for log in result] == ["Log 1", "Log 2", "Log 3"]
+
+
+@pytest.mark.asyncio
+async def test_append_log_from_threads():
+    """Test synchronous appends from several threads keep indices consistent."""
+    # Standard
+    import threading
+
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 0.01  # Force eviction while threads append
+
+        service = LogStorageService()
+
+        def worker(n: int) -> None:
+            for i in range(200):
+                service.append_log(level=LogLevel.INFO, message=f"Thread {n} log {i}", entity_type="tool", entity_id=f"tool-{n}", request_id=f"req-{n}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = service.get_stats()
+        assert 0 < stats["total_logs"] < 800
+        assert stats["level_distribution"][LogLevel.INFO] == len(service._buffer)
+        assert stats["entity_distribution"]["tool"] == len(service._buffer)
+        assert sum(len(bucket) for bucket in service._entity_index.values()) == len(service._buffer)
+        assert sum(len(bucket) for bucket in service._request_index.values()) == len(service._buffer)
+        assert service._current_size_bytes <= service._max_size_bytes
@@ -487,15 +487,11 @@ async def test_file_handler_no_folder():
 @pytest.mark.asyncio
 async def test_storage_handler_emit():
     """Test StorageHandler emit function."""
-    # Standard
-    import asyncio
-    from unittest.mock import AsyncMock
-
     # First-Party
     from mcpgateway.services.logging_service import StorageHandler
 
     # Create mock storage
-    mock_storage = AsyncMock()
+    mock_storage = MagicMock()
     handler = StorageHandler(mock_storage)
 
     # Create a log record
@@ -507,14 +503,13 @@ async def test_storage_handler_emit():
     record.entity_name = "Test Tool"
     record.request_id = "req-123"
 
-    # Emit the record - handler will auto-detect the running event loop
+    # Emit the record - the entry is stored synchronously
     handler.emit(record)
 
-    # Give the event loop a chance to process the scheduled coroutine
-    await asyncio.sleep(0.01)
-
     # Verify the storage method was called
-    mock_storage.add_log.assert_called_once()
+    mock_storage.append_log.assert_called_once_with(
+        level=LogLevel.INFO, message="Test message", entity_type="tool", entity_id="tool-1", entity_name="Test Tool", logger="test.logger", request_id="req-123"
+    )
 
 
 @pytest.mark.asyncio
@@ -535,13 +530,10 @@ async def test_storage_handler_emit_no_storage():
 @pytest.mark.asyncio
 async def test_storage_handler_emit_no_loop():
     """Test StorageHandler emit without a running event loop."""
-    # Standard
-    from unittest.mock import AsyncMock
-
     # First-Party
     from mcpgateway.services.logging_service import StorageHandler
 
-    mock_storage = AsyncMock()
+    mock_storage = MagicMock()
     handler = StorageHandler(mock_storage)
 
     # Create a log record
@@ -549,21 +541,19 @@ async def test_storage_handler_emit_no_loop():
 
     # Mock no running loop
     with patch("asyncio.get_running_loop", side_effect=RuntimeError("No loop")):
-        # Should not raise
+        # Should not raise, and the record is still stored
         handler.emit(record)
 
+    mock_storage.append_log.assert_called_once()
+
 
 @pytest.mark.asyncio
 async def test_storage_handler_emit_format_error():
     """Test StorageHandler emit with format error."""
-    # Standard
-    import asyncio
-    from unittest.mock import AsyncMock, MagicMock
-
     # First-Party
     from mcpgateway.services.logging_service import StorageHandler
 
-    mock_storage = AsyncMock()
+    mock_storage = MagicMock()
     handler = StorageHandler(mock_storage)
 
     # Create a log record
@@ -580,15 +570,11 @@ async def test_storage_handler_emit_format_error():
     # Mock format to raise
     handler.format = MagicMock(side_effect=Exception("Format error"))
 
-    # Emit the record - handler will auto-detect the running event loop
     # Should not raise even with format error
     handler.emit(record)
 
-    # Give the event loop a chance to process the scheduled coroutine
-    await asyncio.sleep(0.01)
-
     # Verify the storage method was called with the fallback message
-    mock_storage.add_log.assert_called_once()
+    mock_storage.append_log.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_mcp_session_pool.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tests for the upstream MCP client session pool.
+"""
+
+# Standard
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import anyio
+import pytest
+
+# First-Party
+from mcpgateway.services.mcp_session_pool import MCPSessionPool
+
+
+class FakeClientSession:
+    """Minimal stand-in for mcp.ClientSession."""
+
+    instances = []
+
+    def __init__(self, read_stream, write_stream):
+        self.initialize = AsyncMock()
+        self.call_tool = AsyncMock(return_value="result")
+        self.send_ping = AsyncMock()
+        FakeClientSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_transport():
+    """Patch the transports and ClientSession used by the pool."""
+    FakeClientSession.instances = []
+    opened = []
+
+    @asynccontextmanager
+    async def fake_client(url, headers=None, httpx_client_factory=None):
+        opened.append(url)
+        yield (MagicMock(), MagicMock(), MagicMock())
+
+    with (
+        patch("mcpgateway.services.mcp_session_pool.sse_client", side_effect=fake_client),
+        patch("mcpgateway.services.mcp_session_pool.streamablehttp_client", side_effect=fake_client),
+        patch("mcpgateway.services.mcp_session_pool.ClientSession", FakeClientSession),
+    ):
+        yield opened
+
+
+@pytest.mark.asyncio
+async def test_session_reused_for_same_key(fake_transport):
+    pool = MCPSessionPool()
+    for _ in range(3):
+        async with pool.session("http://up/sse", "sse", headers={"Authorization": "Bearer a"}, gateway_id="gw") as session:
+            await session.call_tool("t", {})
+
+    assert fake_transport == ["http://up/sse"]
+    assert len(FakeClientSession.instances) == 1
+    FakeClientSession.instances[0].initialize.assert_awaited_once()
+    metrics = pool.get_metrics()
+    assert metrics["size"] == 1
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 1
+    await pool.shutdown()
+    assert pool.get_metrics()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_different_identity_gets_separate_session(fake_transport):
+    pool = MCPSessionPool()
+    async with pool.session("http://up/mcp", "streamablehttp", headers={"Authorization": "Bearer a"}, gateway_id="gw"):
+        pass
+    async with pool.session("http://up/mcp", "streamablehttp", headers={"Authorization": "Bearer b"}, gateway_id="gw"):
+        pass
+
+    assert len(FakeClientSession.instances) == 2
+    assert pool.get_metrics()["size"] == 2
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_single_handshake(fake_transport):
+    pool = MCPSessionPool()
+
+    async def call():
+        async with pool.session("http://up/sse", "sse", gateway_id="gw") as session:
+            await asyncio.sleep(0)
+            return await session.call_tool("t", {})
+
+    results = await asyncio.gather(*(call() for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert len(FakeClientSession.instances) == 1
+    assert FakeClientSession.instances[0].call_tool.await_count == 10
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_transport_error_evicts_session(fake_transport):
+    pool = MCPSessionPool()
+    with pytest.raises(anyio.ClosedResourceError):
+        async with pool.session("http://up/sse", "sse", gateway_id="gw"):
+            raise anyio.ClosedResourceError()
+
+    metrics = pool.get_metrics()
+    assert metrics["size"] == 0
+    assert metrics["failures"] == 1
+    assert metrics["evictions"] == 1
+    assert pool._key_locks == {}
+
+    async with pool.session("http://up/sse", "sse", gateway_id="gw"):
+        pass
+    assert len(FakeClientSession.instances) == 2
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_idle_and_unhealthy_sessions(fake_transport):
+    pool = MCPSessionPool(idle_timeout=1000, health_check_interval=0.0001)
+    async with pool.session("http://up/a", "sse", gateway_id="gw"):
+        pass
+    async with pool.session("http://up/b", "sse", gateway_id="gw"):
+        pass
+    FakeClientSession.instances[1].send_ping.side_effect = RuntimeError("dead")
+    await asyncio.sleep(0.001)
+
+    await pool._sweep()
+
+    assert pool.get_metrics()["size"] == 1
+    FakeClientSession.instances[0].send_ping.assert_awaited()
+
+    pool.idle_timeout = 0
+    await pool._sweep()
+    assert pool.get_metrics()["size"] == 0
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_pool_evicts_lru_idle_session(fake_transport):
+    pool = MCPSessionPool(max_sessions=1)
+    async with pool.session("http://up/a", "sse", gateway_id="gw"):
+        pass
+    async with pool.session("http://up/b", "sse", gateway_id="gw"):
+        pass
+
+    metrics = pool.get_metrics()
+    assert metrics["size"] == 1
+    assert metrics["evictions"] == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_pool_of_busy_sessions_falls_back_to_one_shot(fake_transport):
+    pool = MCPSessionPool(max_sessions=1)
+    async with pool.session("http://up/a", "sse", gateway_id="gw"):
+        async with pool.session("http://up/b", "sse", gateway_id="gw") as session:
+            assert await session.call_tool("t", {}) == "result"
+
+    metrics = pool.get_metrics()
+    assert metrics["size"] == 1
+    assert metrics["overflow"] == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_connect_failure_is_raised_and_not_pooled():
+    @asynccontextmanager
+    async def failing_client(url, headers=None, httpx_client_factory=None):
+        raise ConnectionError("refused")
+        yield  # pragma: no cover
+
+    pool = MCPSessionPool()
+    with patch("mcpgateway.services.mcp_session_pool.sse_client", side_effect=failing_client):
+        with pytest.raises(ConnectionError):
+            async with pool.session("http://up/sse", "sse", gateway_id="gw"):
+                pass
+
+    metrics = pool.get_metrics()
+    assert metrics["size"] == 0
+    assert metrics["failures"] == 1
+    assert pool._key_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_call_error_keeps_shared_session(fake_transport):
+    pool = MCPSessionPool()
+    async with pool.session("http://up/sse", "sse", gateway_id="gw") as other_caller:
+        with pytest.raises(ValueError):
+            async with pool.session("http://up/sse", "sse", gateway_id="gw"):
+                raise ValueError("tool rejected the arguments")
+        assert await other_caller.call_tool("t", {}) == "result"
+
+    metrics = pool.get_metrics()
+    assert (metrics["size"], metrics["failures"], metrics["evictions"]) == (1, 0, 0)
+    assert len(FakeClientSession.instances) == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_evict_gateway(fake_transport):
+    pool = MCPSessionPool()
+    async with pool.session("http://up/a", "sse", gateway_id="gw1"):
+        pass
+    async with pool.session("http://up/b", "sse", gateway_id="gw2"):
+        pass
+
+    assert await pool.evict_gateway("gw1") == 1
+    assert pool.get_metrics()["size"] == 1
+    assert [key[0] for key in pool._key_locks] == ["gw2"]
+    await pool.shutdown()
+
+
+def test_unsupported_transport():
+    with pytest.raises(ValueError):
+        MCPSessionPool._transport("http://up", "stdio", None, None)
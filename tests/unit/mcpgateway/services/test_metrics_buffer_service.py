@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_metrics_buffer_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tests for the batched background metric writer.
+"""
+
+# Standard
+import asyncio
+from unittest.mock import MagicMock, patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import A2AAgentMetric, Base, Tool, ToolMetric, ToolMetricRollup
+from mcpgateway.services.metrics_buffer_service import MetricsBufferService
+
+
+@pytest.fixture
+def session_factory():
+    """In-memory SQLite session factory patched into the buffer module."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(Tool(id="t1", original_name="alpha", custom_name="alpha", custom_name_slug="alpha", url="http://example.com", input_schema={}, integration_type="REST", request_type="POST"))
+        db.commit()
+    with patch("mcpgateway.services.metrics_buffer_service.SessionLocal", factory):
+        yield factory
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_record_returns_false_when_not_running():
+    buffer = MetricsBufferService(max_size=10, batch_size=10, flush_interval=60)
+    assert buffer.record("tool", "t1", 0.1, True) is False
+    assert buffer.get_metrics()["enqueued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_on_batch_size(session_factory):
+    buffer = MetricsBufferService(max_size=100, batch_size=3, flush_interval=60)
+    await buffer.start()
+    for i in range(3):
+        assert buffer.record("tool", "t1", 0.1 * (i + 1), i != 2, "boom" if i == 2 else None)
+
+    for _ in range(100):
+        if buffer.get_metrics()["flushed"] == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    with session_factory() as db:
+        metrics = db.execute(select(ToolMetric)).scalars().all()
+        rollup = db.get(ToolMetricRollup, "t1")
+    assert len(metrics) == 3
+    assert [m.error_message for m in metrics].count("boom") == 1
+    assert rollup.total_executions == 3
+    assert rollup.failed_executions == 1
+    assert buffer.get_metrics()["flushes"] == 1
+    await buffer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_interval(session_factory):
+    buffer = MetricsBufferService(max_size=100, batch_size=1000, flush_interval=0.05)
+    await buffer.start()
+    buffer.record("tool", "t1", 0.2, True)
+
+    for _ in range(100):
+        if buffer.get_metrics()["flushed"] == 1:
+            break
+        await asyncio.sleep(0.01)
+
+    assert buffer.get_metrics()["flushed"] == 1
+    assert buffer.get_metrics()["queued"] == 0
+    await buffer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_records(session_factory):
+    buffer = MetricsBufferService(max_size=100, batch_size=1000, flush_interval=60)
+    await buffer.start()
+    for _ in range(5):
+        buffer.record("tool", "t1", 0.1, True)
+    buffer.record("a2a_agent", "agent-1", 0.3, False, "timeout", interaction_type="query")
+
+    await buffer.shutdown()
+
+    assert not buffer.running
+    with session_factory() as db:
+        assert len(db.execute(select(ToolMetric)).scalars().all()) == 5
+        agent_metric = db.execute(select(A2AAgentMetric)).scalar_one()
+    assert agent_metric.interaction_type == "query"
+    assert buffer.get_metrics()["flushed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_batch_being_collected(session_factory):
+    buffer = MetricsBufferService(max_size=100, batch_size=100, flush_interval=30)
+    await buffer.start()
+    for _ in range(5):
+        buffer.record("tool", "t1", 0.1, True)
+    await asyncio.sleep(0.05)  # the writer takes the records off the queue and waits for more
+    assert buffer.get_metrics()["queued"] == 0
+
+    await buffer.shutdown()
+
+    with session_factory() as db:
+        assert len(db.execute(select(ToolMetric)).scalars().all()) == 5
+    assert buffer.get_metrics()["flushed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_stale_entity_does_not_discard_batch(session_factory):
+    # SQLite only enforces foreign keys when asked to, as PostgreSQL and MySQL always do
+    with session_factory() as db:
+        db.connection().exec_driver_sql("PRAGMA foreign_keys=ON")
+    buffer = MetricsBufferService(max_size=100, batch_size=1000, flush_interval=60)
+    await buffer.start()
+    buffer.record("tool", "t1", 0.1, True)
+    buffer.record("tool", "deleted-tool", 0.2, True)
+    buffer.record("tool", "t1", 0.3, False, "boom")
+    buffer.record("a2a_agent", "deleted-agent", 0.4, True, interaction_type="query")
+
+    await buffer.shutdown()
+
+    with session_factory() as db:
+        metrics = db.execute(select(ToolMetric)).scalars().all()
+        rollup = db.get(ToolMetricRollup, "t1")
+    assert sorted(m.response_time for m in metrics) == [0.1, 0.3]
+    assert rollup.total_executions == 2
+    assert buffer.get_metrics()["flushed"] == 2
+    assert buffer.get_metrics()["failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_counts():
+    buffer = MetricsBufferService(max_size=2, batch_size=1000, flush_interval=60)
+    with patch.object(buffer, "_write_batch", return_value=0) as write:
+        await buffer.start()
+        results = [buffer.record("tool", "t1", 0.1, True) for _ in range(5)]
+        metrics = buffer.get_metrics()
+        await buffer.shutdown()
+
+    # The writer takes one record off the queue only after it gets scheduled
+    assert all(results)
+    assert metrics["dropped"] == 3
+    assert metrics["enqueued"] == 2
+    assert sum(len(call.args[0]) for call in write.call_args_list) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_failure_is_counted_not_raised():
+    buffer = MetricsBufferService(max_size=10, batch_size=1, flush_interval=60)
+    with patch.object(buffer, "_write_batch", MagicMock(side_effect=RuntimeError("db down"))):
+        await buffer.start()
+        buffer.record("tool", "t1", 0.1, True)
+        for _ in range(100):
+            if buffer.get_metrics()["failed"]:
+                break
+            await asyncio.sleep(0.01)
+        assert buffer.running
+        await buffer.shutdown()
+
+    assert buffer.get_metrics()["failed"] == 1
+    assert buffer.get_metrics()["flushed"] == 0
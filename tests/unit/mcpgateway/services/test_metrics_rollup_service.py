@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_metrics_rollup_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tests for the metric rollup service.
+"""
+
+# Standard
+from datetime import datetime, timedelta, timezone
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import Base, Prompt, PromptMetric, Tool, ToolMetric, ToolMetricRollup
+from mcpgateway.services.metrics_rollup_service import aggregate_rollups, MetricsRollupService, record_metric_rollup, record_metric_rollups, reset_rollups, top_performers_query
+
+
+@pytest.fixture
+def db():
+    """Fresh in-memory SQLite session with the full schema."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _add_tool(db, tool_id: str, name: str) -> Tool:
+    tool = Tool(id=tool_id, original_name=name, custom_name=name, custom_name_slug=name, url="http://example.com", input_schema={}, integration_type="REST", request_type="POST")
+    db.add(tool)
+    db.commit()
+    return tool
+
+
+def test_rollup_created_and_incremented(db):
+    _add_tool(db, "t1", "alpha")
+    record_metric_rollup(db, "tool", "t1", 0.5, True)
+    record_metric_rollups(db, "tool", [("t1", 1.5, False, None), ("t1", 0.25, True, None)])
+    db.commit()
+
+    rollup = db.get(ToolMetricRollup, "t1")
+    assert rollup.total_executions == 3
+    assert rollup.successful_executions == 2
+    assert rollup.failed_executions == 1
+    assert rollup.min_response_time == 0.25
+    assert rollup.max_response_time == 1.5
+    assert rollup.avg_response_time == pytest.approx(0.75)
+    assert rollup.last_execution_time is not None
+
+
+def test_entity_properties_read_from_rollup(db):
+    tool = _add_tool(db, "t1", "alpha")
+    record_metric_rollups(db, "tool", [("t1", 0.2, True, None), ("t1", 0.4, False, None)])
+    db.commit()
+    db.refresh(tool)
+
+    assert tool.execution_count == 2
+    assert tool.failed_executions == 1
+    assert tool.failure_rate == 0.5
+    assert tool.metrics_summary["max_response_time"] == 0.4
+    assert db.execute(select(Tool.execution_count)).scalar() == 2
+
+
+def test_batches_keep_latest_execution_time(db):
+    _add_tool(db, "t1", "alpha")
+    base = datetime(2025, 1, 1, 10, 15, tzinfo=timezone.utc)
+    record_metric_rollups(db, "tool", [("t1", 0.1, True, base + timedelta(hours=1)), ("t1", 0.3, True, base)])
+    record_metric_rollups(db, "tool", [("t1", 0.2, False, base + timedelta(minutes=10))])
+    db.commit()
+
+    rollup = db.get(ToolMetricRollup, "t1")
+    assert (rollup.total_executions, rollup.failed_executions) == (3, 1)
+    assert rollup.last_execution_time.replace(tzinfo=timezone.utc) == base + timedelta(hours=1)
+
+
+def test_aggregate_and_top_performers(db):
+    _add_tool(db, "t1", "alpha")
+    _add_tool(db, "t2", "beta")
+    _add_tool(db, "t3", "idle")
+    record_metric_rollups(db, "tool", [("t1", 1.0, True, None), ("t2", 0.5, True, None), ("t2", 1.5, False, None)])
+    db.commit()
+
+    totals = aggregate_rollups(db, "tool")
+    assert totals["total_executions"] == 3
+    assert totals["failed_executions"] == 1
+    assert totals["min_response_time"] == 0.5
+    assert totals["max_response_time"] == 1.5
+    assert totals["avg_response_time"] == pytest.approx(1.0)
+
+    top = top_performers_query(db, "tool", limit=None)
+    assert [row.name for row in top] == ["beta", "alpha", "idle"]
+    assert top[0].execution_count == 2
+    assert top[0].success_rate == pytest.approx(50.0)
+    assert top[2].execution_count == 0
+    assert top[2].avg_response_time is None
+
+
+def test_aggregate_with_no_rollups(db):
+    totals = aggregate_rollups(db, "prompt")
+    assert totals["total_executions"] == 0
+    assert totals["failure_rate"] == 0.0
+    assert totals["avg_response_time"] is None
+
+
+def test_reset_single_entity(db):
+    _add_tool(db, "t1", "alpha")
+    _add_tool(db, "t2", "beta")
+    db.add_all([ToolMetric(tool_id="t1", response_time=0.1, is_success=True), ToolMetric(tool_id="t2", response_time=0.1, is_success=True)])
+    record_metric_rollups(db, "tool", [("t1", 0.1, True, None), ("t2", 0.1, True, None)])
+    db.commit()
+
+    reset_rollups(db, "tool", "t1")
+    db.commit()
+
+    assert db.get(ToolMetricRollup, "t1") is None
+    assert db.get(ToolMetricRollup, "t2") is not None
+    assert db.execute(select(ToolMetric.tool_id)).scalars().all() == ["t2"]
+
+
+def test_compaction_keeps_rollup_totals(db):
+    db.add(Prompt(id=1, name="p", template="t", argument_schema={}))
+    db.commit()
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    db.add_all([PromptMetric(prompt_id=1, response_time=0.1, is_success=True, timestamp=old), PromptMetric(prompt_id=1, response_time=0.1, is_success=True)])
+    record_metric_rollups(db, "prompt", [(1, 0.1, True, old), (1, 0.1, True, None)])
+    db.commit()
+
+    deleted = MetricsRollupService(raw_retention_days=5).compact(db)
+
+    assert deleted["prompt_metrics"] == 1
+    assert "metric_buckets" not in deleted
+    assert db.execute(select(PromptMetric)).scalars().all()[0].timestamp > old.replace(tzinfo=None)
+    assert aggregate_rollups(db, "prompt")["total_executions"] == 2
@@ -501,24 +501,18 @@ class TestPromptService:
 
     @pytest.mark.asyncio
     async def test_aggregate_and_reset_metrics(self, prompt_service, test_db):
-        # Metrics numbers to be returned by scalar() calls
-        test_db.execute = Mock(
-            side_effect=[
-                _make_execute_result(scalar=10),  # total
-                _make_execute_result(scalar=8),  # successful
-                _make_execute_result(scalar=2),  # failed
-                _make_execute_result(scalar=0.1),  # min_rt
-                _make_execute_result(scalar=0.9),  # max_rt
-                _make_execute_result(scalar=0.5),  # avg_rt
-                _make_execute_result(scalar=datetime(2025, 1, 1, tzinfo=timezone.utc)),  # last_time
-            ]
-        )
+        # Single aggregate row over the prompt metric rollups:
+        # (total, successful, failed, min_rt, max_rt, total_rt, last_time)
+        result = MagicMock()
+        result.one.return_value = (10, 8, 2, 0.1, 0.9, 5.0, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        test_db.execute = Mock(return_value=result)
 
         metrics = await prompt_service.aggregate_metrics(test_db)
         assert metrics["total_executions"] == 10
         assert metrics["successful_executions"] == 8
         assert metrics["failed_executions"] == 2
         assert metrics["failure_rate"] == 0.2
+        assert metrics["avg_response_time"] == 0.5
 
         # reset_metrics
         test_db.execute = Mock()
@@ -547,18 +541,18 @@ class TestPromptService:
         session.get_bind.return_value = bind
 
         with patch("mcpgateway.services.prompt_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.prompt_service.json_contains_expr") as mock_json_contains:
+            with patch("mcpgateway.services.prompt_service.entity_tags_expr") as mock_entity_tags:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tags.return_value = fake_condition
 
                 result, _ = await prompt_service.list_prompts(session, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
+                mock_entity_tags.assert_called_once()  # called exactly once
+                called_args = mock_entity_tags.call_args[0]  # positional args tuple
+                assert called_args[1] == "prompt"  # entity type recorded in entity_tags
+                # third positional arg is the tags list (signature: id_col, entity_type, values, match_any=True)
                 assert called_args[2] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_called_with(fake_condition)
@@ -1184,16 +1184,9 @@ class TestResourceMetrics:
     @pytest.mark.asyncio
     async def test_aggregate_metrics(self, resource_service, mock_db):
         """Test metrics aggregation."""
-        # Mock database responses for metrics queries
-        mock_db.execute.side_effect = [
-            MagicMock(scalar=MagicMock(return_value=100)),  # total_executions
-            MagicMock(scalar=MagicMock(return_value=80)),  # successful_executions
-            MagicMock(scalar=MagicMock(return_value=20)),  # failed_executions
-            MagicMock(scalar=MagicMock(return_value=0.1)),  # min_response_time
-            MagicMock(scalar=MagicMock(return_value=2.5)),  # max_response_time
-            MagicMock(scalar=MagicMock(return_value=1.2)),  # avg_response_time
-            MagicMock(scalar=MagicMock(return_value=datetime.now(timezone.utc))),  # last_execution_time
-        ]
+        # Mock the single aggregate row over the resource metric rollups:
+        # (total, successful, failed, min_rt, max_rt, total_rt, last_execution_time)
+        mock_db.execute.return_value.one.return_value = (100, 80, 20, 0.1, 2.5, 120.0, datetime.now(timezone.utc))
 
         result = await resource_service.aggregate_metrics(mock_db)
 
@@ -1208,16 +1201,8 @@ class TestResourceMetrics:
     @pytest.mark.asyncio
     async def test_aggregate_metrics_empty(self, resource_service, mock_db):
         """Test metrics aggregation with no data."""
-        # Mock empty database responses
-        mock_db.execute.side_effect = [
-            MagicMock(scalar=MagicMock(return_value=0)),  # total_executions
-            MagicMock(scalar=MagicMock(return_value=0)),  # successful_executions
-            MagicMock(scalar=MagicMock(return_value=0)),  # failed_executions
-            MagicMock(scalar=MagicMock(return_value=None)),  # min_response_time
-            MagicMock(scalar=MagicMock(return_value=None)),  # max_response_time
-            MagicMock(scalar=MagicMock(return_value=None)),  # avg_response_time
-            MagicMock(scalar=MagicMock(return_value=None)),  # last_execution_time
-        ]
+        # Aggregates over an empty rollup table are NULL
+        mock_db.execute.return_value.one.return_value = (None, None, None, None, None, None, None)
 
         result = await resource_service.aggregate_metrics(mock_db)
 
@@ -1230,7 +1215,8 @@ class TestResourceMetrics:
         """Test metrics reset."""
         await resource_service.reset_metrics(mock_db)
 
-        mock_db.execute.assert_called_once()
+        # Raw metrics and rollups are both cleared
+        assert mock_db.execute.call_count == 2
         mock_db.commit.assert_called_once()
 
 
@@ -1493,10 +1479,10 @@ class TestResourceServiceMetricsExtended:
         mock_db.get_bind.return_value = bind
 
         with patch("mcpgateway.services.resource_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.resource_service.json_contains_expr") as mock_json_contains:
+            with patch("mcpgateway.services.resource_service.entity_tags_expr") as mock_entity_tags:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tags.return_value = fake_condition
                 # Patch team name lookup to return a real string, not a MagicMock
                 mock_team = MagicMock()
                 mock_team.name = "test-team"
@@ -1505,10 +1491,10 @@ class TestResourceServiceMetricsExtended:
                 result, _ = await resource_service.list_resources(mock_db, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is mock_db  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
+                mock_entity_tags.assert_called_once()  # called exactly once
+                called_args = mock_entity_tags.call_args[0]  # positional args tuple
+                assert called_args[1] == "resource"  # entity type recorded in entity_tags
+                # third positional arg is the tags list (signature: id_col, entity_type, values, match_any=True)
                 assert called_args[2] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_called_with(fake_condition)
@@ -773,7 +773,8 @@ class TestServerService:
         test_db.execute = Mock()
         test_db.commit = Mock()
         await server_service.reset_metrics(test_db)
-        test_db.execute.assert_called_once()
+        # Raw metrics and rollups are both cleared
+        assert test_db.execute.call_count == 2
         test_db.commit.assert_called_once()
 
     # --------------------------- UUID normalization -------------------- #
@@ -1117,10 +1118,10 @@ class TestServerService:
         session.get_bind.return_value = bind
 
         with patch("mcpgateway.services.server_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.server_service.json_contains_expr") as mock_json_contains:
+            with patch("mcpgateway.services.server_service.entity_tags_expr") as mock_entity_tags:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tags.return_value = fake_condition
                 mock_team = MagicMock()
                 mock_team.name = "test-team"
                 session.query().filter().first.return_value = mock_team
@@ -1128,10 +1129,10 @@ class TestServerService:
                 result = await server_service.list_servers(session, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
+                mock_entity_tags.assert_called_once()  # called exactly once
+                called_args = mock_entity_tags.call_args[0]  # positional args tuple
+                assert called_args[1] == "server"  # entity type recorded in entity_tags
+                # third positional arg is the tags list (signature: id_col, entity_type, values, match_any=True)
                 assert called_args[2] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_called_with(fake_condition)
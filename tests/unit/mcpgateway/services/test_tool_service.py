@@ -867,23 +867,21 @@ class TestToolService:
 
         assert calls[3][0][0]["data"] == tool_info
 
-
     @pytest.mark.asyncio
     async def test_publish_event_with_real_queue(self, tool_service):
         # Arrange
-        q = asyncio.Queue()
         # Force local mode (no Redis) and seed one subscriber via EventService
         tool_service._event_service._redis_client = None
-        tool_service._event_service._event_subscribers = [q]
+        subscription = tool_service._event_service.subscribe()
         event = {"type": "test", "data": 123}
 
         # Act
         await tool_service._publish_event(event)
 
-        # Assert - the event was put on the queue
-        queued_event = await q.get()
+        # Assert - the event was buffered for the subscriber
+        queued_event = await subscription.get()
         assert queued_event == event
-        assert q.empty()
+        assert subscription.pending == 0
 
     @pytest.mark.asyncio
     async def test_toggle_tool_status_no_change(self, tool_service, mock_tool, test_db):
@@ -1250,7 +1248,8 @@ class TestToolService:
             headers=mock_tool.headers,
         )
         assert result.content[0].text == '{\n  "result": "REST tool response"\n}'
-        tool_service._record_tool_metric.assert_called_once_with(test_db, mock_tool, ANY, True, None)
+        tool_service._record_tool_metric.assert_called_once_with(test_db, ANY, ANY, True, None)
+        assert tool_service._record_tool_metric.call_args.args[1].id == mock_tool.id
 
         # Test 204 status
         mock_response = AsyncMock()
@@ -1328,11 +1327,12 @@ class TestToolService:
         # Verify metrics recorded
         tool_service._record_tool_metric.assert_called_once_with(
             test_db,
-            mock_tool,
+            ANY,  # Resolved tool
             ANY,  # Start time
             True,  # Success
             None,  # No error
         )
+        assert tool_service._record_tool_metric.call_args.args[1].id == mock_tool.id
 
     @pytest.mark.asyncio
     async def test_invoke_tool_rest_parameter_substitution(self, tool_service, mock_tool, test_db):
@@ -1629,7 +1629,7 @@ class TestToolService:
         mock_gateway.enabled = True
         mock_gateway.reachable = True
         mock_gateway.id = mock_tool.gateway_id
-        mock_gateway.slug="test-gateway"
+        mock_gateway.slug = "test-gateway"
         mock_gateway.capabilities = {"tools": {"listChanged": True}}
         mock_gateway.transport = "SSE"
         mock_gateway.passthrough_headers = []
@@ -1650,6 +1650,8 @@ class TestToolService:
 
             # Return an object whose scalar_one_or_none() returns the real value
             class Result:
+                rowcount = 1
+
                 def scalar_one_or_none(self_inner):
                     return value
 
@@ -1695,6 +1697,44 @@ class TestToolService:
             httpx_client_factory=ANY,
         )
 
+    @pytest.mark.asyncio
+    async def test_invoke_tool_mcp_uses_session_pool(self, tool_service, mock_tool, mock_gateway, test_db):
+        """Test that MCP tool calls borrow a pooled session when pooling is enabled."""
+        mock_tool.integration_type = "MCP"
+        mock_tool.request_type = "StreamableHTTP"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_type = None
+        mock_tool.auth_value = None
+        mock_tool.gateway_id = mock_gateway.id
+        mock_tool.gateway = mock_gateway
+        mock_gateway.url = "http://example.com/mcp"
+
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.side_effect = [mock_tool, mock_gateway]
+        test_db.execute = Mock(return_value=mock_scalar)
+
+        session_mock = AsyncMock()
+        session_mock.call_tool = AsyncMock(return_value=ToolResult(content=[TextContent(type="text", text="pooled")]))
+
+        @asynccontextmanager
+        async def pooled_session(*_args, **_kwargs):
+            yield session_mock
+
+        pool = MagicMock()
+        pool.session = MagicMock(side_effect=pooled_session)
+
+        with (
+            patch("mcpgateway.services.tool_service.settings.mcp_session_pool_enabled", True),
+            patch("mcpgateway.services.tool_service.get_mcp_session_pool", return_value=pool),
+            patch("mcpgateway.services.tool_service.streamablehttp_client") as streamable_client_mock,
+        ):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None)
+
+        streamable_client_mock.assert_not_called()
+        pool.session.assert_called_once_with("http://example.com/mcp", "streamablehttp", headers={}, gateway_id=mock_gateway.id, httpx_client_factory=ANY)
+        session_mock.call_tool.assert_awaited_once_with(mock_tool.original_name, {"param": "value"})
+        assert result.content[0].text == "pooled"
+
     @pytest.mark.asyncio
     async def test_invoke_tool_error(self, tool_service, mock_tool, test_db):
         """Test invoking a tool that returns an error."""
@@ -1725,11 +1765,12 @@ class TestToolService:
             # Verify metrics recorded with error
             tool_service._record_tool_metric.assert_called_once_with(
                 test_db,
-                mock_tool,
+                ANY,  # Resolved tool
                 ANY,  # Start time
                 False,  # Failed
                 "HTTP error",  # Error message
             )
+            assert tool_service._record_tool_metric.call_args.args[1].id == mock_tool.id
 
     @pytest.mark.asyncio
     async def test_reset_metrics(self, tool_service, test_db):
@@ -1741,8 +1782,8 @@ class TestToolService:
         # Reset all metrics
         await tool_service.reset_metrics(test_db)
 
-        # Verify DB operations
-        test_db.execute.assert_called_once()
+        # Verify DB operations (raw metrics and rollups)
+        assert test_db.execute.call_count == 2
         test_db.commit.assert_called_once()
 
         # Reset metrics for specific tool
@@ -1752,7 +1793,7 @@ class TestToolService:
         await tool_service.reset_metrics(test_db, tool_id=1)
 
         # Verify DB operations with tool_id
-        test_db.execute.assert_called_once()
+        assert test_db.execute.call_count == 2
         test_db.commit.assert_called_once()
 
     async def test_record_tool_metric(self, tool_service, mock_tool):
@@ -1787,6 +1828,20 @@ class TestToolService:
                 mock_db.add.assert_called_once_with(mock_metric_instance)
                 mock_db.commit.assert_called_once()
 
+    async def test_record_tool_metric_buffered(self, tool_service, mock_tool):
+        """Test that a running metrics buffer takes the write off the request path."""
+        mock_db = MagicMock()
+        mock_buffer = MagicMock()
+        mock_buffer.record.return_value = True
+
+        with patch("mcpgateway.services.tool_service.get_metrics_buffer_service", return_value=mock_buffer):
+            with patch("mcpgateway.services.tool_service.time.monotonic", return_value=105.0):
+                await tool_service._record_tool_metric(mock_db, mock_tool, 100.0, False, "boom")
+
+        mock_buffer.record.assert_called_once_with("tool", mock_tool.id, 5.0, False, "boom")
+        mock_db.add.assert_not_called()
+        mock_db.commit.assert_not_called()
+
     async def test_record_tool_metric_with_error(self, tool_service, mock_tool):
         """Test recording tool invocation metrics with error."""
         start_time = 100.0
@@ -1814,17 +1869,17 @@ class TestToolService:
         # Mock database
         mock_db = MagicMock()
 
-        # Create a mock that returns scalar values
+        # Single aggregate row over the tool metric rollups
         mock_execute_result = MagicMock()
-        mock_execute_result.scalar.side_effect = [
-            10,  # total count
-            8,  # successful count
-            2,  # failed count
+        mock_execute_result.one.return_value = (
+            10,  # total executions
+            8,  # successful executions
+            2,  # failed executions
             0.5,  # min response time
             5.0,  # max response time
-            2.3,  # avg response time
+            23.0,  # total response time
             "2025-01-10T12:00:00",  # last execution time
-        ]
+        )
         mock_db.execute.return_value = mock_execute_result
 
         result = await tool_service.aggregate_metrics(mock_db)
@@ -1840,25 +1895,17 @@ class TestToolService:
             "last_execution_time": "2025-01-10T12:00:00",
         }
 
-        # Verify all expected queries were made
-        assert mock_db.execute.call_count == 7
+        # Verify a single aggregate query was made
+        assert mock_db.execute.call_count == 1
 
     async def test_aggregate_metrics_no_data(self, tool_service):
         """Test aggregating metrics when no data exists."""
         # Mock database
         mock_db = MagicMock()
 
-        # Create a mock that returns scalar values
+        # Aggregates over an empty rollup table are NULL
         mock_execute_result = MagicMock()
-        mock_execute_result.scalar.side_effect = [
-            0,  # total count
-            0,  # successful count
-            0,  # failed count
-            None,  # min response time
-            None,  # max response time
-            None,  # avg response time
-            None,  # last execution time
-        ]
+        mock_execute_result.one.return_value = (None, None, None, None, None, None, None)
         mock_db.execute.return_value = mock_execute_result
 
         result = await tool_service.aggregate_metrics(mock_db)
@@ -1977,7 +2024,7 @@ class TestToolService:
 
         # Create a proper mock chain for the query
         mock_query_chain = Mock()
-        mock_query_chain.outerjoin.return_value.group_by.return_value.order_by.return_value.limit.return_value.all.return_value = mock_results
+        mock_query_chain.outerjoin.return_value.order_by.return_value.limit.return_value.all.return_value = mock_results
         test_db.query = Mock(return_value=mock_query_chain)
 
         with patch("mcpgateway.services.tool_service.build_top_performers") as mock_build:
@@ -2008,10 +2055,10 @@ class TestToolService:
         session.get_bind.return_value = bind
 
         with patch("mcpgateway.services.tool_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.tool_service.json_contains_expr") as mock_json_contains:
+            with patch("mcpgateway.services.tool_service.entity_tags_expr") as mock_entity_tags:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tags.return_value = fake_condition
 
                 # Patch team name lookup to return a real string, not a MagicMock
                 mock_team = MagicMock()
@@ -2021,10 +2068,10 @@ class TestToolService:
                 result, _ = await tool_service.list_tools(session, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
+                mock_entity_tags.assert_called_once()  # called exactly once
+                called_args = mock_entity_tags.call_args[0]  # positional args tuple
+                assert called_args[1] == "tool"  # entity type recorded in entity_tags
+                # third positional arg is the tags list (signature: id_col, entity_type, values, match_any=True)
                 assert called_args[2] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_called_with(fake_condition)
@@ -2116,7 +2163,7 @@ class TestToolService:
         mock_scalar3 = Mock()
         mock_scalar3.scalar_one_or_none.return_value = mock_gateway
 
-        test_db.execute = Mock(side_effect=[mock_scalar1, mock_scalar2, mock_scalar3])
+        test_db.execute = Mock(side_effect=[mock_scalar1, mock_scalar2, mock_scalar3, Mock(rowcount=1), Mock(rowcount=1)])  # + metric rollup and bucket updates
 
         # Mock OAuth manager
         tool_service.oauth_manager.get_access_token = AsyncMock(return_value="oauth_access_token")
@@ -2204,7 +2251,7 @@ class TestToolService:
         mock_scalar3 = Mock()
         mock_scalar3.scalar_one_or_none.return_value = mock_gateway
 
-        test_db.execute = Mock(side_effect=[mock_scalar1, mock_scalar2, mock_scalar3])
+        test_db.execute = Mock(side_effect=[mock_scalar1, mock_scalar2, mock_scalar3, Mock(rowcount=1), Mock(rowcount=1)])  # + metric rollup and bucket updates
 
         # Mock MCP connection
         expected_result = ToolResult(content=[TextContent(type="text", text="MCP with headers")])
@@ -2291,6 +2338,49 @@ class TestToolService:
         # Verify result
         assert result.content[0].text == '{\n  "result": "original response"\n}'
 
+    async def test_invoke_tool_plugin_metadata_changes_do_not_leak_into_cache(self, tool_service, mock_tool, test_db):
+        """Test that plugins mutating tool metadata do not change the cached tool."""
+        # First-Party
+        from mcpgateway.plugins.framework import ToolHookType
+        from mcpgateway.plugins.framework.constants import TOOL_METADATA
+        from mcpgateway.plugins.framework.models import PluginResult
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        mock_tool.annotations = {"title": "original"}
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "ok"})
+        tool_service._http_client.request.return_value = mock_response
+
+        seen = []
+
+        def invoke_hook_side_effect(hook_type, payload, global_context, local_contexts=None, **kwargs):
+            if hook_type == ToolHookType.TOOL_PRE_INVOKE:
+                metadata = global_context.metadata[TOOL_METADATA]
+                seen.append(dict(metadata.annotations))
+                metadata.annotations["title"] = "mutated by plugin"
+            return (PluginResult(continue_processing=True, violation=None, modified_payload=None), None)
+
+        tool_service._plugin_manager = Mock()
+        tool_service._plugin_manager.invoke_hook = AsyncMock(side_effect=invoke_hook_side_effect)
+
+        with (
+            patch("mcpgateway.services.tool_service.decode_auth", return_value={}),
+            patch("mcpgateway.services.tool_service.extract_using_jq", return_value={"result": "ok"}),
+        ):
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None)
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None)
+
+        # The second call is served from the tool lookup cache and sees the original metadata
+        assert seen == [{"title": "original"}, {"title": "original"}]
+
     async def test_invoke_tool_with_plugin_post_invoke_modified_payload(self, tool_service, mock_tool, test_db):
         """Test invoking tool with plugin post-invoke hook modifying payload."""
         # Configure tool as REST
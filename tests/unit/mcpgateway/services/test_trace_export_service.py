@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_trace_export_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Tests for the buffered trace exporter.
+"""
+
+# Standard
+from unittest.mock import patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import Base, ObservabilityEvent, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services.observability_service import ObservabilityService
+from mcpgateway.services.trace_export_service import set_trace_export_service, TraceExportService
+
+
+@pytest.fixture
+def session_factory():
+    """In-memory SQLite database patched in as the exporter's SessionLocal."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with patch("mcpgateway.services.trace_export_service.SessionLocal", factory):
+        yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+async def exporter(session_factory):
+    """A running exporter installed as the global instance."""
+    service = TraceExportService(max_spans=100, batch_size=2, flush_interval=3600, tail_sample_rate=1.0, tail_latency_threshold_ms=0)
+    set_trace_export_service(service)
+    await service.start()
+    try:
+        yield service
+    finally:
+        await service.shutdown()
+        set_trace_export_service(None)
+
+
+@pytest.mark.asyncio
+async def test_trace_buffered_until_flush(exporter, session_factory):
+    service = ObservabilityService()
+    trace_id = service.start_trace(None, "GET /tools")
+    span_id = service.start_span(None, trace_id, "tool.invoke")
+    assert service.add_event(None, span_id, "retry", severity="warning") is None
+    service.end_span(None, span_id, status="ok", attributes={"tool.result": "done"})
+    service.end_trace(None, trace_id, status="ok", http_status_code=200)
+
+    with session_factory() as db:
+        assert db.execute(select(ObservabilityTrace)).first() is None
+
+    await exporter.flush()
+
+    with session_factory() as db:
+        trace = db.get(ObservabilityTrace, trace_id)
+        span = db.get(ObservabilitySpan, span_id)
+        event = db.execute(select(ObservabilityEvent)).scalar_one()
+        assert (trace.status, trace.http_status_code) == ("ok", 200)
+        assert trace.duration_ms is not None
+        assert span.status == "ok" and span.attributes == {"tool.result": "done"}
+        assert event.span_id == span_id and event.name == "retry"
+    assert exporter.get_metrics()["exported_traces"] == 1
+    assert exporter.get_metrics()["buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_in_batches(exporter, session_factory):
+    service = ObservabilityService()
+    for i in range(5):
+        trace_id = service.start_trace(None, f"GET /{i}")
+        service.end_span(None, service.start_span(None, trace_id, "http.request"), status="ok")
+        service.end_trace(None, trace_id, status="ok")
+
+    await exporter.flush()
+
+    with session_factory() as db:
+        assert len(db.execute(select(ObservabilityTrace)).all()) == 5
+        assert len(db.execute(select(ObservabilitySpan)).all()) == 5
+
+
+@pytest.mark.asyncio
+async def test_tail_sampling_keeps_errors(exporter, session_factory):
+    exporter.tail_sample_rate = 0.0
+    service = ObservabilityService()
+    ok_trace = service.start_trace(None, "GET /ok")
+    service.start_span(None, ok_trace, "http.request")
+    service.end_trace(None, ok_trace, status="ok")
+    error_trace = service.start_trace(None, "GET /error")
+    service.end_trace(None, error_trace, status="error")
+
+    await exporter.flush()
+
+    with session_factory() as db:
+        assert db.execute(select(ObservabilityTrace.trace_id)).scalars().all() == [error_trace]
+        assert db.execute(select(ObservabilitySpan)).first() is None
+    assert exporter.get_metrics()["sampled_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tail_sampling_keeps_slow_traces(exporter):
+    exporter.tail_sample_rate = 0.0
+    exporter.tail_latency_threshold_ms = 100
+    assert exporter._keep({"status": "ok", "duration_ms": 250})
+    assert not exporter._keep({"status": "ok", "duration_ms": 5})
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_bounded(session_factory):
+    exporter = TraceExportService(max_spans=2, batch_size=10, flush_interval=3600, tail_sample_rate=1.0)
+    exporter.record_trace({"trace_id": "t1", "name": "a", "start_time": None, "attributes": {}})
+    exporter.record_span({"span_id": "s1", "trace_id": "t1", "name": "b", "start_time": None, "attributes": {}})
+    exporter.record_span({"span_id": "s2", "trace_id": "t1", "name": "c", "start_time": None, "attributes": {}})
+    exporter.record_trace({"trace_id": "t2", "name": "d", "start_time": None, "attributes": {}})
+
+    metrics = exporter.get_metrics()
+    assert metrics["buffered"] == 2
+    assert metrics["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_late_span_end_and_orphans(exporter, session_factory):
+    service = ObservabilityService()
+    trace_id = service.start_trace(None, "GET /slow")
+    span_id = service.start_span(None, trace_id, "background")
+    service.end_trace(None, trace_id, status="ok")
+    await exporter.flush()
+
+    # The span ends after its trace was exported; a span for an unknown trace is discarded
+    service.end_span(None, span_id, status="error", status_message="late")
+    orphan_id = service.start_span(None, trace_id, "after-export")
+    service.start_span(None, "missing-trace", "lost")
+    await exporter.flush()
+
+    with session_factory() as db:
+        span = db.get(ObservabilitySpan, span_id)
+        assert (span.status, span.status_message) == ("error", "late")
+        assert span.duration_ms is not None
+        assert db.execute(select(ObservabilitySpan.span_id).order_by(ObservabilitySpan.name)).scalars().all() == [orphan_id, span_id]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_exports_unfinished_traces(session_factory):
+    exporter = TraceExportService(max_spans=100, batch_size=10, flush_interval=3600, tail_sample_rate=1.0)
+    set_trace_export_service(exporter)
+    try:
+        await exporter.start()
+        trace_id = ObservabilityService().start_trace(None, "GET /stream")
+        await exporter.shutdown()
+    finally:
+        set_trace_export_service(None)
+
+    with session_factory() as db:
+        assert db.get(ObservabilityTrace, trace_id).status == "unset"
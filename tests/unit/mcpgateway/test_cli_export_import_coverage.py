@@ -323,11 +323,8 @@ def test_make_authenticated_request_bearer_auth_logic():
 
 
 @pytest.mark.asyncio
-async def test_export_command_success():
+async def test_export_command_success(monkeypatch):
     """Test successful export command execution."""
-    # Standard
-    import os
-
     # First-Party
     from mcpgateway.cli_export_import import export_command
 
@@ -357,7 +354,7 @@ async def test_export_command_success():
 
             with patch("builtins.print") as mock_print:
                 with tempfile.TemporaryDirectory() as temp_dir:
-                    os.chdir(temp_dir)
+                    monkeypatch.chdir(temp_dir)
                     await export_command(args)
 
                     # Verify print statements
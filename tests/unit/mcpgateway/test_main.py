@@ -10,11 +10,12 @@ Comprehensive tests for the main API endpoints with full coverage.
 """
 
 # Standard
+import asyncio
 from copy import deepcopy
 import datetime
 import json
 import os
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 # Third-Party
 from fastapi import HTTPException
@@ -1187,6 +1188,87 @@ class TestRPCEndpoints:
         body = response.json()
         assert "Method invalid" in body.get("message")
 
+    @pytest.mark.asyncio
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    async def test_dispatch_rpc_message(self, mock_invoke_tool):
+        """In-process dispatch returns JSON-RPC envelopes for results and plugin violations."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_message
+        from mcpgateway.plugins.framework import PluginViolationError
+        from mcpgateway.plugins.framework.models import PluginViolation
+
+        mock_invoke_tool.return_value = {"content": [], "is_error": False}
+        message = {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "t", "arguments": {"a": 1}}}
+        response = await dispatch_rpc_message(message, {"email": "user@example.com"}, request_headers={"X-Tenant": "acme"})
+
+        assert response == {"jsonrpc": "2.0", "result": {"content": [], "is_error": False}, "id": 3}
+        kwargs = mock_invoke_tool.call_args.kwargs
+        assert kwargs["app_user_email"] == "user@example.com"
+        assert kwargs["request_headers"] == {"x-tenant": "acme"}
+
+        violation = PluginViolation(reason="Denied", description="Blocked by policy", code="DENY", details={})
+        mock_invoke_tool.side_effect = PluginViolationError(message="denied", violation=violation)
+        response = await dispatch_rpc_message(message, "anonymous")
+        assert response["id"] == 3
+        assert response["error"]["message"] == "Plugin Violation: Blocked by policy"
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_rpc_batch(self, mock_list_tools, test_client, auth_headers):
+        """A JSON-RPC batch returns responses in order and skips notifications."""
+        mock_list_tools.return_value = ([], None)
+
+        batch = [
+            {"jsonrpc": "2.0", "id": "a", "method": "tools/list", "params": {}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": "b", "method": "ping"},
+            {"jsonrpc": "2.0", "id": "c"},
+        ]
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["id"] for item in body] == ["a", "b", "c"]
+        assert body[0]["result"] == {"tools": []}
+        assert body[1]["result"] == {}
+        assert body[2]["error"]["code"] == -32600
+
+        response = test_client.post("/rpc/", json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}], headers=auth_headers)
+        assert response.status_code == 204
+
+        response = test_client.post("/rpc/", json=[], headers=auth_headers)
+        assert response.json()["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    async def test_dispatch_rpc_batch_runs_calls_concurrently(self, mock_invoke_tool):
+        """Batch calls overlap up to the concurrency cap and keep request order."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_batch
+
+        running = 0
+        peak = 0
+
+        async def invoke(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (5 - kwargs["arguments"]["n"]))
+            running -= 1
+            return {"content": [], "n": kwargs["arguments"]["n"]}
+
+        mock_invoke_tool.side_effect = invoke
+        batch = [{"jsonrpc": "2.0", "id": n, "method": "tools/call", "params": {"name": "t", "arguments": {"n": n}}} for n in range(5)]
+        with patch("mcpgateway.main.settings.rpc_batch_concurrency", 3):
+            responses = await dispatch_rpc_batch(batch, {"email": "user@example.com"})
+
+        assert peak == 3
+        assert [r["result"]["n"] for r in responses] == [0, 1, 2, 3, 4]
+        assert {call.kwargs["app_user_email"] for call in mock_invoke_tool.call_args_list} == {"user@example.com"}
+
+        with patch("mcpgateway.main.settings.rpc_batch_max_size", 2):
+            response = await dispatch_rpc_batch(batch, "anonymous")
+        assert response["error"]["message"] == "Batch too large"
+
     @patch("mcpgateway.main.logging_service.set_level")
     def test_set_log_level_endpoint(self, mock_set_level, test_client, auth_headers):
         """Test setting the application log level."""
@@ -1203,36 +1285,123 @@ class TestRealtimeEndpoints:
     """Tests for real-time communication: WebSocket, SSE, message handling, etc."""
 
     @patch("mcpgateway.main.settings")
-    @patch("mcpgateway.main.ResilientHttpClient")  # stub network calls
-    def test_websocket_endpoint(self, mock_client, mock_settings, test_client):
-        # Standard
-        from types import SimpleNamespace
-
+    def test_websocket_endpoint(self, mock_settings, test_client):
         """Test WebSocket connection and message handling."""
         # Configure mock settings for auth disabled
         mock_settings.mcp_client_auth_enabled = False
         mock_settings.auth_required = False
-        mock_settings.federation_timeout = 30
-        mock_settings.skip_ssl_verify = False
-        mock_settings.port = 4444
-
-        # ----- set up async context-manager dummy -----
-        mock_instance = mock_client.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = False
-
-        async def dummy_post(*_args, **_kwargs):
-            # minimal object that looks like an httpx.Response
-            return SimpleNamespace(text='{"jsonrpc":"2.0","id":1,"result":{}}')
-
-        mock_instance.post = dummy_post
-        # ---------------------------------------------
 
         with test_client.websocket_connect("/ws") as websocket:
             websocket.send_text('{"jsonrpc":"2.0","method":"ping","id":1}')
             data = websocket.receive_text()
             response = json.loads(data)
-            assert response == {"jsonrpc": "2.0", "id": 1, "result": {}}
+            assert response == {"jsonrpc": "2.0", "result": {}, "id": 1}
+
+    @patch("mcpgateway.main.settings")
+    @patch("mcpgateway.main.dispatch_rpc", new_callable=AsyncMock)
+    def test_websocket_dispatches_in_process(self, mock_dispatch, mock_settings, test_client):
+        """WebSocket messages are dispatched in-process with the connection's user and headers."""
+        mock_settings.mcp_client_auth_enabled = False
+        mock_settings.auth_required = False
+        mock_dispatch.return_value = {"tools": []}
+
+        with test_client.websocket_connect("/ws", headers={"X-Trace": "abc"}) as websocket:
+            websocket.send_text('{"jsonrpc":"2.0","method":"tools/list","params":{"server_id":"s1"},"id":7}')
+            response = json.loads(websocket.receive_text())
+
+        assert response == {"jsonrpc": "2.0", "result": {"tools": []}, "id": 7}
+        _db, method, params, user = mock_dispatch.call_args.args
+        assert (method, params, user) == ("tools/list", {"server_id": "s1"}, "anonymous")
+        assert mock_dispatch.call_args.kwargs["request_headers"]["x-trace"] == "abc"
+
+    @patch("mcpgateway.main.settings")
+    @patch("mcpgateway.main.dispatch_rpc", new_callable=AsyncMock)
+    @patch("mcpgateway.main.get_current_user", new_callable=AsyncMock)
+    def test_websocket_verifies_token_when_auth_required(self, mock_get_user, mock_dispatch, mock_settings, test_client):
+        """With client auth disabled but auth required, a token is still verified and its identity used."""
+        # Third-Party
+        from starlette.websockets import WebSocketDisconnect
+
+        mock_settings.mcp_client_auth_enabled = False
+        mock_settings.trust_proxy_auth = False
+        mock_settings.auth_required = True
+        mock_get_user.side_effect = HTTPException(status_code=401, detail="Invalid token")
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with test_client.websocket_connect("/ws?token=forged") as websocket:
+                websocket.receive_text()
+        assert exc_info.value.code == 1008
+        mock_dispatch.assert_not_called()
+
+        mock_get_user.side_effect = None
+        mock_get_user.return_value = MagicMock(email="alice@example.com", is_admin=False)
+        mock_dispatch.return_value = {}
+        with test_client.websocket_connect("/ws", headers={"Authorization": "Bearer good"}) as websocket:
+            websocket.send_text('{"jsonrpc":"2.0","method":"ping","id":1}')
+            websocket.receive_text()
+        assert mock_get_user.call_args.args[0].credentials == "good"
+        assert mock_dispatch.call_args.args[3] == {"sub": "alice@example.com", "email": "alice@example.com", "is_admin": False}
+
+    @patch("mcpgateway.main.settings")
+    @patch("mcpgateway.main.dispatch_rpc", new_callable=AsyncMock)
+    def test_websocket_accepts_api_token_of_active_user(self, mock_dispatch, mock_settings, test_client):
+        """API tokens are accepted on /ws, and are refused once their user is deactivated."""
+        # Third-Party
+        from starlette.websockets import WebSocketDisconnect
+
+        # First-Party
+        from mcpgateway.db import EmailUser
+        import mcpgateway.main as main_mod
+        from mcpgateway.services.token_catalog_service import TokenCatalogService
+
+        mock_settings.mcp_client_auth_enabled = True
+        mock_settings.trust_proxy_auth = False
+        mock_settings.auth_required = True
+        mock_dispatch.return_value = {}
+        with main_mod.SessionLocal() as db:
+            db.add(EmailUser(email="ws-api@example.com", password_hash="x", full_name="WS API", is_active=True))
+            db.commit()
+            _, token = asyncio.run(TokenCatalogService(db).create_token(user_email="ws-api@example.com", name="ws"))
+
+        with test_client.websocket_connect(f"/ws?token={token}") as websocket:
+            websocket.send_text('{"jsonrpc":"2.0","method":"ping","id":1}')
+            websocket.receive_text()
+        assert mock_dispatch.call_args.args[3]["email"] == "ws-api@example.com"
+
+        with main_mod.SessionLocal() as db:
+            db.get(EmailUser, "ws-api@example.com").is_active = False
+            db.commit()
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with test_client.websocket_connect(f"/ws?token={token}") as websocket:
+                websocket.receive_text()
+        assert exc_info.value.code == 1008
+
+    @patch("mcpgateway.main.settings")
+    @patch("mcpgateway.main.dispatch_rpc", new_callable=AsyncMock)
+    def test_websocket_rejects_revoked_token(self, mock_dispatch, mock_settings, test_client):
+        """A correctly signed token that has been revoked cannot open a socket."""
+        # Third-Party
+        from starlette.websockets import WebSocketDisconnect
+
+        # First-Party
+        from mcpgateway.db import EmailUser
+        import mcpgateway.main as main_mod
+        from mcpgateway.services.token_catalog_service import TokenCatalogService
+
+        mock_settings.mcp_client_auth_enabled = True
+        mock_settings.trust_proxy_auth = False
+        mock_settings.auth_required = True
+        with main_mod.SessionLocal() as db:
+            db.add(EmailUser(email="ws-revoked@example.com", password_hash="x", full_name="WS Revoked", is_active=True))
+            db.commit()
+            api_token, token = asyncio.run(TokenCatalogService(db).create_token(user_email="ws-revoked@example.com", name="ws"))
+            asyncio.run(TokenCatalogService(db).revoke_token(api_token.id, revoked_by="ws-revoked@example.com"))
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with test_client.websocket_connect("/ws", headers={"Authorization": f"Bearer {token}"}) as websocket:
+                websocket.receive_text()
+        assert exc_info.value.code == 1008
+        mock_dispatch.assert_not_called()
 
     @patch("mcpgateway.main.update_url_protocol", new=lambda url: url)
     @patch("mcpgateway.main.session_registry.add_session")
@@ -8,7 +8,9 @@ Unit tests for OAuth Manager and Token Storage Service.
 """
 
 # Standard
+import asyncio
 from datetime import datetime, timedelta, timezone
+import time
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 # Third-Party
@@ -18,7 +20,7 @@ import pytest
 
 # First-Party
 from mcpgateway.db import OAuthToken
-from mcpgateway.services.oauth_manager import OAuthError, OAuthManager
+from mcpgateway.services.oauth_manager import get_oauth_token_cache, OAuthError, OAuthManager, OAuthTokenCache, set_oauth_token_cache
 from mcpgateway.services.token_storage_service import TokenStorageService
 from mcpgateway.services.encryption_service import EncryptionService
 
@@ -1649,6 +1651,123 @@ class TestOAuthManager:
             assert "No access_token in refresh response" in str(exc_info.value)
 
 
+class TestOAuthTokenCache:
+    """Test cases for the machine-to-machine access token cache."""
+
+    CREDENTIALS = {"grant_type": "client_credentials", "client_id": "c", "client_secret": "s", "token_url": "https://oauth.example.com/token", "scopes": ["read"]}
+
+    @pytest.mark.asyncio
+    async def test_token_reused_until_expiry(self):
+        manager = OAuthManager()
+        manager._request_client_credentials_token = AsyncMock(return_value={"access_token": "tok", "expires_in": 3600})
+
+        assert await manager.get_access_token(self.CREDENTIALS) == "tok"
+        assert await manager.get_access_token(self.CREDENTIALS) == "tok"
+        assert manager._request_client_credentials_token.await_count == 1
+
+        # Another manager instance (e.g. the gateway service's) shares the cache
+        other = OAuthManager()
+        other._request_client_credentials_token = AsyncMock()
+        assert await other.get_access_token(self.CREDENTIALS) == "tok"
+        other._request_client_credentials_token.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_different_scope_gets_its_own_token(self):
+        manager = OAuthManager()
+        manager._request_client_credentials_token = AsyncMock(side_effect=[{"access_token": "read"}, {"access_token": "write"}])
+
+        assert await manager.get_access_token(self.CREDENTIALS) == "read"
+        assert await manager.get_access_token({**self.CREDENTIALS, "scopes": ["write"]}) == "write"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self):
+        manager = OAuthManager()
+        calls = 0
+
+        async def request(_credentials):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"access_token": "tok", "expires_in": 3600}
+
+        manager._request_client_credentials_token = request
+        tokens = await asyncio.gather(*(manager.get_access_token(self.CREDENTIALS) for _ in range(20)))
+
+        assert tokens == ["tok"] * 20
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expiry_margin_forces_new_token(self):
+        set_oauth_token_cache(OAuthTokenCache(margin=60))
+        manager = OAuthManager()
+        manager._request_client_credentials_token = AsyncMock(side_effect=[{"access_token": "old", "expires_in": 100}, {"access_token": "new", "expires_in": 100}])
+
+        assert await manager.get_access_token(self.CREDENTIALS) == "old"
+        with patch("mcpgateway.services.oauth_manager.time.time", return_value=time.time() + 51):
+            assert await manager.get_access_token(self.CREDENTIALS) == "new"
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self):
+        set_oauth_token_cache(OAuthTokenCache(margin=0))
+        manager = OAuthManager()
+        manager._request_client_credentials_token = AsyncMock(side_effect=[{"access_token": "old", "expires_in": 100}, {"access_token": "new", "expires_in": 100}])
+
+        assert await manager.get_access_token(self.CREDENTIALS) == "old"
+        with patch("mcpgateway.services.oauth_manager.time.time", return_value=time.time() + 80):
+            # Still valid: served immediately while the replacement is fetched
+            assert await manager.get_access_token(self.CREDENTIALS) == "old"
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert await manager.get_access_token(self.CREDENTIALS) == "new"
+        assert get_oauth_token_cache().stats()["background_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_disabled(self, monkeypatch):
+        manager = OAuthManager()
+        manager._request_client_credentials_token = AsyncMock(return_value={"access_token": "tok"})
+
+        await manager.get_access_token(self.CREDENTIALS)
+        await manager.invalidate_access_token(self.CREDENTIALS)
+        await manager.get_access_token(self.CREDENTIALS)
+        assert manager._request_client_credentials_token.await_count == 2
+
+        monkeypatch.setattr(manager.settings, "oauth_token_cache_enabled", False)
+        await manager.get_access_token(self.CREDENTIALS)
+        await manager.get_access_token(self.CREDENTIALS)
+        assert manager._request_client_credentials_token.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_tokens_shared_between_workers_through_redis(self):
+        store = {}
+
+        class FakeRedis:
+            async def get(self, key):
+                return store.get(key)
+
+            async def setex(self, key, _ttl, value):
+                store[key] = value
+
+            async def set(self, key, value, nx=False, ex=None):
+                if nx and key in store:
+                    return None
+                store[key] = value
+                return True
+
+            async def delete(self, key):
+                store.pop(key, None)
+
+        with patch("mcpgateway.services.oauth_manager._get_redis_client", AsyncMock(return_value=FakeRedis())):
+            worker_a = OAuthTokenCache()
+            assert await worker_a.get("k", AsyncMock(return_value={"access_token": "shared", "expires_in": 3600})) == "shared"
+            assert "shared" not in store["oauth:token:k"]  # stored encrypted
+            assert "oauth:token_lock:k" not in store
+
+            worker_b = OAuthTokenCache()
+            fetch = AsyncMock()
+            assert await worker_b.get("k", fetch) == "shared"
+            fetch.assert_not_awaited()
+
+
 class TestTokenStorageService:
     """Test cases for TokenStorageService class."""
 
@@ -2701,3 +2820,47 @@ class TestEncryptionService:
         decrypted = encryption.decrypt_secret(encrypted)
 
         assert decrypted == "test_data"
+
+    def test_decrypt_reuses_derived_key(self):
+        """Repeat decrypts of a secret skip Argon2id."""
+        encryption = EncryptionService(SecretStr("test_key"), time_cost=1, memory_cost=8)
+        encrypted = encryption.encrypt_secret("cached")
+
+        with patch("mcpgateway.services.encryption_service.hash_secret_raw") as mock_kdf:
+            assert encryption.decrypt_secret(encrypted) == "cached"
+            assert encryption.decrypt_secret(encrypted) == "cached"
+            mock_kdf.assert_not_called()
+
+    def test_derived_key_cache_ignores_other_passphrases(self):
+        """A cached key is never used for a different passphrase."""
+        encrypted = EncryptionService(SecretStr("key1"), time_cost=1, memory_cost=8).encrypt_secret("secret")
+
+        assert EncryptionService(SecretStr("key2"), time_cost=1, memory_cost=8).decrypt_secret(encrypted) is None
+
+    def test_derived_key_cache_is_bounded(self):
+        """The least recently used keys are evicted beyond encryption_key_cache_size."""
+        # First-Party
+        from mcpgateway.services import encryption_service
+
+        encryption = EncryptionService(SecretStr("test_key"), time_cost=1, memory_cost=8)
+        with patch.object(encryption_service.settings, "encryption_key_cache_size", 2):
+            for _ in range(4):
+                encryption.encrypt_secret("x")
+            assert len(encryption_service._derived_keys) == 2
+        with patch.object(encryption_service.settings, "encryption_key_cache_size", 0):
+            encryption_service.clear_derived_key_cache()
+            encryption.encrypt_secret("x")
+            assert len(encryption_service._derived_keys) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip_runs_kdf_off_loop(self):
+        """Async variants derive in a worker thread on a miss and inline on a hit."""
+        encryption = EncryptionService(SecretStr("test_key"), time_cost=1, memory_cost=8)
+
+        with patch("mcpgateway.services.encryption_service.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            encrypted = await encryption.encrypt_secret_async("async")
+            assert mock_to_thread.call_count == 1
+            assert await encryption.decrypt_secret_async(encrypted) == "async"
+            assert mock_to_thread.call_count == 1
+
+        assert await encryption.decrypt_secret_async("not-a-bundle") is None
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the StdIOPool session-aware worker pool.
+
+Location: ./tests/unit/mcpgateway/test_translate_stdio_pool.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for routing responses of sessions that share a stdio worker, worker
+scale-out, crash recovery, idle reaping and streamable HTTP session handling.
+"""
+
+# Standard
+import asyncio
+import json
+import shlex
+import sys
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.translate import _pool_streamable_post, StdIOPool
+
+SERVER_SCRIPT = """
+import json, os, sys
+
+def reply(msg):
+    if msg.get("method") == "crash":
+        sys.exit(1)
+    if msg.get("method") == "hang" or "id" not in msg:
+        return None
+    result = {"pid": os.getpid(), "env": os.environ.get("POOL_TENANT"), "echo": msg.get("params")}
+    return {"jsonrpc": "2.0", "id": msg["id"], "result": result}
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    out = [r for r in map(reply, msg) if r] if isinstance(msg, list) else reply(msg)
+    if out:
+        print(json.dumps(out), flush=True)
+"""
+
+
+@pytest.fixture
+def server_cmd(tmp_path, monkeypatch):
+    """Write a JSON-RPC echo server and return the command that runs it."""
+    script = tmp_path / "echo_server.py"
+    script.write_text(SERVER_SCRIPT)
+    # Workers inherit the cwd; a directory removed by an earlier test would make the child exit at startup
+    monkeypatch.chdir(tmp_path)
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+
+
+async def _next(queue, timeout: float = 5.0):
+    return json.loads(await asyncio.wait_for(queue.get(), timeout=timeout))
+
+
+@pytest.mark.asyncio
+async def test_shared_worker_routes_responses_by_session(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=1)
+    await pool.start()
+    try:
+        first = await pool.open_session("a")
+        second = await pool.open_session("b")
+        # Both sessions use the same request id on the same process
+        await pool.send("a", {"jsonrpc": "2.0", "id": 1, "method": "echo", "params": "from-a"})
+        await pool.send("b", {"jsonrpc": "2.0", "id": 1, "method": "echo", "params": "from-b"})
+
+        response_a, response_b = await _next(first), await _next(second)
+        assert response_a["id"] == response_b["id"] == 1
+        assert response_a["result"]["echo"] == "from-a"
+        assert response_b["result"]["echo"] == "from-b"
+        assert response_a["result"]["pid"] == response_b["result"]["pid"]
+        assert first.empty() and second.empty()
+
+        batch = [{"jsonrpc": "2.0", "id": "x", "method": "echo", "params": 1}, {"jsonrpc": "2.0", "method": "notifications/initialized"}]
+        await pool.send("a", batch)
+        assert await _next(first) == [{"jsonrpc": "2.0", "id": "x", "result": {"pid": response_a["result"]["pid"], "env": None, "echo": 1}}]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_sessions_spread_over_workers_and_env_is_isolated(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=2, header_mappings={"X-Tenant": "POOL_TENANT"})
+    await pool.start()
+    try:
+        await pool.open_session("a", stream=False)
+        await pool.open_session("b", {"POOL_TENANT": "acme"}, stream=False)
+        response_a = await pool.request("a", {"jsonrpc": "2.0", "id": 7, "method": "echo"}, timeout=5.0)
+        response_b = await pool.request("b", {"jsonrpc": "2.0", "id": 7, "method": "echo"}, timeout=5.0)
+
+        assert response_a["id"] == response_b["id"] == 7
+        assert response_a["result"]["pid"] != response_b["result"]["pid"]
+        assert response_a["result"]["env"] is None
+        assert response_b["result"]["env"] == "acme"
+
+        # Both workers are busy and neither runs with this environment
+        with pytest.raises(RuntimeError):
+            await pool.open_session("c", {"POOL_TENANT": "other"})
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_fails_pending_and_restarts(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=1, restart_delay=0.05)
+    await pool.start()
+    try:
+        queue = await pool.open_session("a")
+        await pool.send("a", {"jsonrpc": "2.0", "id": 1, "method": "hang"})
+        before = await pool.request("a", {"jsonrpc": "2.0", "id": 2, "method": "echo"}, timeout=5.0)
+
+        await pool.send("a", {"jsonrpc": "2.0", "id": 3, "method": "crash"})
+        failed = [await _next(queue), await _next(queue)]
+        assert {message["id"] for message in failed} == {1, 3}
+        assert all(message["error"]["code"] == -32603 for message in failed)
+
+        after = None
+        for _ in range(50):
+            after = await pool.request("a", {"jsonrpc": "2.0", "id": 4, "method": "echo"}, timeout=1.0)
+            if after is not None and "result" in after:
+                break
+            await asyncio.sleep(0.05)
+        assert after["id"] == 4
+        assert after["result"]["pid"] != before["result"]["pid"]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_workers_are_reaped_down_to_min(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=3, idle_timeout=0.01)
+    await pool.start()
+    try:
+        for session_id in ("a", "b", "c"):
+            await pool.open_session(session_id)
+        assert len(pool._workers) == 3
+        for session_id in ("a", "b", "c"):
+            pool.close_session(session_id)
+
+        # The reaper wakes up at most once per second
+        for _ in range(40):
+            if len(pool._workers) == 1:
+                break
+            await asyncio.sleep(0.1)
+        assert len(pool._workers) == 1
+        assert not pool.has_session("a")
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_initialize_creates_session_with_affinity(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=2)
+    await pool.start()
+    try:
+        initialize = {"jsonrpc": "2.0", "id": 1, "method": "initialize"}
+        response = await _pool_streamable_post(pool, {}, initialize)
+        session_id = response.headers["mcp-session-id"]
+        assert pool.has_session(session_id)
+        pid = json.loads(response.body)["result"]["pid"]
+
+        # A second client occupies the other worker; the first stays on its own
+        await _pool_streamable_post(pool, {}, initialize)
+        for request_id in (2, 3):
+            follow_up = await _pool_streamable_post(pool, {"mcp-session-id": session_id}, {"jsonrpc": "2.0", "id": request_id, "method": "echo"})
+            assert "mcp-session-id" not in follow_up.headers
+            assert json.loads(follow_up.body)["result"]["pid"] == pid
+        assert pool.stats()["sessions"] == 2
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_requests_without_session_are_transient(server_cmd):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=1)
+    await pool.start()
+    try:
+        response = await _pool_streamable_post(pool, {}, {"jsonrpc": "2.0", "id": 1, "method": "echo"})
+        assert json.loads(response.body)["id"] == 1
+        assert "mcp-session-id" not in response.headers
+
+        stateless = await _pool_streamable_post(pool, {}, {"jsonrpc": "2.0", "id": 1, "method": "initialize"}, stateless=True)
+        assert "mcp-session-id" not in stateless.headers
+        assert pool.stats()["sessions"] == 0
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_session_drops_are_counted(server_cmd, caplog):
+    pool = StdIOPool(server_cmd, min_workers=1, max_workers=1)
+    await pool.start()
+    try:
+        queue = await pool.open_session("slow")
+        for _ in range(queue.maxsize + 101):
+            pool._deliver("slow", "{}")
+
+        assert queue.full()
+        assert pool.stats()["dropped_messages"] == 101
+        assert pool._sessions["slow"].dropped == 101
+        # Only the first and the 101st drop are logged
+        assert sum("dropped" in record.getMessage() for record in caplog.records) == 2
+    finally:
+        await pool.stop()
@@ -132,6 +132,150 @@ async def test_event_store_replay_events_after_multiple():
     assert sent[1].event_id == eid3
 
 
+# ---------------------------------------------------------------------------
+# Durable event store tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def stream_event_db():
+    """In-memory SQLite database patched in as the transport's SessionLocal."""
+    # Third-Party
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    # First-Party
+    from mcpgateway.db import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with patch.object(tr, "SessionLocal", sessionmaker(bind=engine)):
+        yield
+    engine.dispose()
+
+
+def _message(method: str) -> tr.JSONRPCMessage:
+    return tr.JSONRPCMessage(jsonrpc="2.0", method=method, id=1)
+
+
+@pytest.mark.asyncio
+async def test_database_event_store_replay_across_instances(stream_event_db):
+    writer = tr.DatabaseEventStore(max_events_per_stream=10)
+    token = tr.event_scope_var.set("session-a")
+    try:
+        eid1 = await writer.store_event("_GET_stream", _message("m1"))
+        eid2 = await writer.store_event("_GET_stream", _message("m2"))
+        eid3 = await writer.store_event("_GET_stream", _message("m3"))
+    finally:
+        tr.event_scope_var.reset(token)
+    # Same stream id in another session must not leak into the replay
+    tr.event_scope_var.set("session-b")
+    await writer.store_event("_GET_stream", _message("other"))
+
+    sent: List[tr.EventMessage] = []
+
+    async def collector(msg):
+        sent.append(msg)
+
+    # A store on another worker replays from the shared table
+    reader = tr.DatabaseEventStore(max_events_per_stream=10)
+    assert await reader.replay_events_after(eid1, collector) == "_GET_stream"
+    assert [m.event_id for m in sent] == [eid2, eid3]
+    assert sent[0].message.root.method == "m2"
+    assert await reader.replay_events_after("bogus", collector) is None
+
+
+@pytest.mark.asyncio
+async def test_database_event_store_retention(stream_event_db):
+    store = tr.DatabaseEventStore(max_events_per_stream=2)
+    ids = [await store.store_event("s", _message(f"m{i}")) for i in range(4)]
+
+    sent: List[tr.EventMessage] = []
+
+    async def collector(msg):
+        sent.append(msg)
+
+    # Only the last two events survive; replay after a trimmed event yields what is left
+    assert await store.replay_events_after(ids[0], collector) == "s"
+    assert [m.event_id for m in sent] == ids[2:]
+
+    store.ttl = 0
+    assert await store.replay_events_after(ids[2], collector) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_event_store_uses_bounded_streams():
+    redis = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["1700000000000-0", True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    redis.pipeline.return_value = pipe
+    redis.exists = AsyncMock(return_value=1)
+    redis.xrange = AsyncMock(return_value=[("1700000000001-0", {"message": _message("next").model_dump_json(by_alias=True, exclude_none=True)})])
+
+    with patch.object(tr, "REDIS_AVAILABLE", True), patch.object(tr, "Redis", create=True) as redis_cls:
+        redis_cls.from_url.return_value = redis
+        store = tr.RedisEventStore("redis://localhost:6379/0", max_events_per_stream=5, ttl=30)
+
+    token = tr.event_scope_var.set("scope1")
+    try:
+        event_id = await store.store_event("req-1", _message("first"))
+    finally:
+        tr.event_scope_var.reset(token)
+    assert event_id == "scope1.1700000000000-0.req-1"
+    key = "mcpgw:stream_events:scope1:req-1"
+    assert pipe.xadd.call_args.kwargs == {"maxlen": 5, "approximate": True}
+    pipe.expire.assert_called_once_with(key, 30)
+
+    sent: List[tr.EventMessage] = []
+
+    async def collector(msg):
+        sent.append(msg)
+
+    assert await store.replay_events_after(event_id, collector) == "req-1"
+    redis.xrange.assert_awaited_once_with(key, min="(1700000000000-0", max="+")
+    assert sent[0].event_id == "scope1.1700000000001-0.req-1"
+
+
+@pytest.mark.asyncio
+async def test_session_manager_wrapper_replays_session_from_other_worker(monkeypatch, stream_event_db):
+    monkeypatch.setattr(tr.settings, "use_stateful_sessions", True)
+    monkeypatch.setattr(tr.settings, "streamable_http_event_store", "database")
+    wrapper = SessionManagerWrapper()
+    wrapper.session_manager.handle_request = AsyncMock()
+
+    tr.event_scope_var.set("remote-session")
+    first = await wrapper.event_store.store_event("_GET_stream", _message("m1"))
+    await wrapper.event_store.store_event("_GET_stream", _message("m2"))
+
+    sent = []
+
+    async def send(msg):
+        sent.append(msg)
+
+    async def receive():
+        # Third-Party
+        import anyio
+
+        await anyio.sleep_forever()
+
+    headers = [(b"mcp-session-id", b"unknown-here"), (b"last-event-id", first.encode())]
+    scope = {**_make_scope("/mcp", headers), "method": "GET"}
+    await wrapper.handle_streamable_http(scope, receive, send)
+
+    wrapper.session_manager.handle_request.assert_not_called()
+    assert sent[0]["status"] == 200
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    assert b'"method":"m2"' in body and b'"method":"m1"' not in body
+
+    sent.clear()
+    scope = {**_make_scope("/mcp", [(b"mcp-session-id", b"unknown-here"), (b"last-event-id", b"x.1.gone")]), "method": "GET"}
+    await wrapper.handle_streamable_http(scope, receive, send)
+    assert sent[0]["status"] == 404
+
+
 # ---------------------------------------------------------------------------
 # get_db, call_tool & list_tools tests
 # ---------------------------------------------------------------------------
@@ -1099,6 +1243,7 @@ async def test_session_manager_wrapper_initialization_stateful(monkeypatch):
     # Mock settings to enable stateful sessions
     monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.use_stateful_sessions", True)
     monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.json_response_enabled", False)
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.streamable_http_event_store", "memory")
     monkeypatch.setattr(tr, "StreamableHTTPSessionManager", capture_manager)
 
     wrapper = SessionManagerWrapper()
@@ -10,7 +10,7 @@ Tests the new MCP_CLIENT_AUTH_ENABLED and proxy authentication features.
 """
 
 # Standard
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 # Third-Party
 from fastapi import HTTPException, Request
@@ -209,8 +209,8 @@ class TestWebSocketAuthentication:
             mock_settings.auth_required = True
             mock_settings.port = 8000
 
-            # Mock verify_jwt_token to succeed
-            with patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "test-user"})):
+            # Mock token verification (JWT/API token, revocation and active user) to succeed
+            with patch("mcpgateway.main.get_current_user", new=AsyncMock(return_value=MagicMock(email="test-user", is_admin=False))):
                 # First-Party
                 from mcpgateway.main import websocket_endpoint
 